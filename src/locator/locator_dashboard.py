@@ -1,18 +1,22 @@
 from playwright.sync_api import Page
 
+from src.utils.registro_locators import RegistroLocators, locator_cacheado
+
 class DasboardLocatorsPage:
     
     def __init__(self, page: Page):
         self.page = page
+        # Cada locator se construye una sola vez por instancia (ver RegistroLocators).
+        self.locators = RegistroLocators(page, self)
         
-    @property    
+    @locator_cacheado    
     def labelSaludo(self):
         return self.page.get_by_text("Hi, ")
     
-    @property    
+    @locator_cacheado    
     def botonProfile(self):
         return self.page.get_by_role("link", name="Profile")
     
-    @property    
+    @locator_cacheado    
     def botonLogout(self):
         return self.page.get_by_role("link", name="Logout")
\ No newline at end of file
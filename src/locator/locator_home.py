@@ -1,85 +1,89 @@
 from playwright.sync_api import Page
 
+from src.utils.registro_locators import RegistroLocators, locator_cacheado
+
 class HomeLocatorsPage:
     
     def __init__(self, page: Page):
         self.page = page
+        # Cada locator se construye una sola vez por instancia (ver RegistroLocators).
+        self.locators = RegistroLocators(page, self)
         
     #Selector de nombre home
-    @property
+    @locator_cacheado
     def nombreHome(self):
         return self.page.get_by_role("link", name="Buggy Rating")
     
     #Selector de campo username
-    @property
+    @locator_cacheado
     def campoUsername(self):
         return self.page.get_by_role("textbox", name="Login")
     
     #Selector de campo password
-    @property
+    @locator_cacheado
     def campoPassword(self):
         return self.page.locator("input[name='password']")
     
     #Selector de boton login
-    @property
+    @locator_cacheado
     def botonLogin(self):
         return self.page.get_by_role("button", name="Login")
 
     #Selector de boton resgistrarse
-    @property
+    @locator_cacheado
     def botonRegistrarse(self):
         return self.page.get_by_role("link", name="Register")
     
     #Selector de nombre banner central
-    @property
+    @locator_cacheado
     def nombreBannerCentral(self):
         return self.page.get_by_role("heading", name="Buggy Cars Rating")
 
     #Selector de imagen banner central
-    @property
+    @locator_cacheado
     def imagenBannerCentral(self):
         return self.page.get_by_role("banner").get_by_role("img")
     
     #Selector de contenedores de div popular make
-    @property
+    @locator_cacheado
     def contenedoresDeOpcionesPopularMake(self):
         return self.page.locator("div").filter(has_text="Popular Make Lamborghini(").nth(2)
     
     #Selector de nombre div popular make
-    @property
+    @locator_cacheado
     def nombreDivPopularMake(self):
         return self.page.get_by_role("heading", name="Popular Make")
     #Selector de imagen div popular make
-    @property
+    @locator_cacheado
     def imagenDivPopularMake(self):
         return self.page.locator("div").filter(has_text="Popular Make Lamborghini(").nth(2).get_by_role("img")
     
     #Selector de contenedores de div popular model
-    @property
+    @locator_cacheado
     def contenedoresDeOpcionesModel(self):
         return self.page.locator("div").filter(has_text="Popular Model Lamborghini").nth(2)
     
     #Selector de nombre div popular model
-    @property
+    @locator_cacheado
     def nombreDivPopularModel(self):
         return self.page.get_by_role("heading", name="Popular Model")
     
     #Selector de imagen div popular model
-    @property
+    @locator_cacheado
     def imagenDivPopularModel(self):
         return self.page.locator("div").filter(has_text="Popular Model Lamborghini").nth(2).get_by_role("img")
     
     #Selector de contenedores de div overall rating
-    @property
+    @locator_cacheado
     def contenedoresDeOpcionesOverallRating(self):
         return self.page.locator("div").filter(has_text="Overall Rating List of all").nth(2)
     
     #Selector de nombre div overall rating
-    @property
+    @locator_cacheado
     def nombreDivOverallRating(self):
         return self.page.get_by_role("heading", name="Overall Rating")
     
     #Selector de imagen div overall rating
-    @property
+    @locator_cacheado
     def imagenDivOverallRating(self):
         return self.page.locator("div").filter(has_text="Overall Rating List of all").nth(2).get_by_role("img")
\ No newline at end of file
@@ -1,13 +1,17 @@
 from playwright.sync_api import Page
 import re
 
+from src.utils.registro_locators import RegistroLocators, locator_cacheado
+
 class LoginLocatorsPage:
     
     def __init__(self, page: Page):
         self.page = page
+        # Cada locator se construye una sola vez por instancia (ver RegistroLocators).
+        self.locators = RegistroLocators(page, self)
     
     #Selector label apellido
-    @property
+    @locator_cacheado
     def labelDatoLoginInvalido(self):
         # Usamos una expresión regular para que la búsqueda sea insensible a mayúsculas y minúsculas.
         # Esto asegura que el localizador encuentre el elemento sin importar la capitalización.
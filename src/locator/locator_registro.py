@@ -1,116 +1,120 @@
 from playwright.sync_api import Page
 
+from src.utils.registro_locators import RegistroLocators, locator_cacheado
+
 class RegistroLocatorsPage:
     
     def __init__(self, page: Page):
         self.page = page
+        # Cada locator se construye una sola vez por instancia (ver RegistroLocators).
+        self.locators = RegistroLocators(page, self)
         
     #Selector de titulo formulario
-    @property
+    @locator_cacheado
     def tituloFormulario(self):
         return self.page.get_by_role("heading", name="Register with Buggy Cars")
         
     #Selector label userName
-    @property
+    @locator_cacheado
     def labelUserName(self):
         return self.page.locator("label").filter(has_text="Login")
     
     #Selector de campo userName
-    @property
+    @locator_cacheado
     def campoUserName(self):
         return self.page.get_by_label("Login")
     
     #Selector label nombre
-    @property
+    @locator_cacheado
     def labelNombre(self):
         return self.page.get_by_text("First Name", exact=True)
     
     #Selector de campo nombre
-    @property
+    @locator_cacheado
     def campoNombre(self):
         return self.page.get_by_role("textbox", name="First Name")
     
     #Selector label apellido
-    @property
+    @locator_cacheado
     def labelApellido(self):
         return self.page.get_by_text("Last Name")
     
     #Selector de campo apellido
-    @property
+    @locator_cacheado
     def campoApellido(self):
         return self.page.get_by_role("textbox", name="Last Name")
     
     #Selector label password
-    @property
+    @locator_cacheado
     def labelPassword(self):
         return self.page.get_by_text("Password", exact=True)
     
     #Selector de campo password
-    @property
+    @locator_cacheado
     def campoPassword(self):
         return self.page.get_by_role("textbox", name="Password", exact=True)
     
     #Selector label confirmar password
-    @property
+    @locator_cacheado
     def labelConfirmPassword(self):
         return self.page.get_by_text("Confirm Password")
     
     #Selector de campo confirmar password
-    @property
+    @locator_cacheado
     def campoConfirmPassword(self):
         return self.page.get_by_role("textbox", name="Confirm Password")
     
     #Selector de botón registrar
-    @property
+    @locator_cacheado
     def botonRegistrar(self):
         return self.page.get_by_role("button", name="Register")
     
     #Selector de botón cancelar
-    @property
+    @locator_cacheado
     def botonCancelar(self):
         return self.page.get_by_role("button", name="Cancel")
     
     #Selector de mensaje campo userName vacío
-    @property
+    @locator_cacheado
     def mensajeUserNameVacio(self):
         return self.page.get_by_text("Login is required")
     
     #Selector de mensaje campo nombre vacío
-    @property
+    @locator_cacheado
     def mensajeNombreVacio(self):
         return self.page.locator("my-register form div").filter(has_text="First Name First Name is").locator("div")
     
     #Selector de mensaje campo apellido vacío
-    @property
+    @locator_cacheado
     def mensajeApellidoVacio(self):
         return self.page.locator("my-register form div").filter(has_text="Last Name First Name is").locator("div")
     
     #Selector de mensaje campo password vacío
-    @property
+    @locator_cacheado
     def mensajePasswordVacio(self):
         return self.page.get_by_text("Password is required")
     
     #Selector de mensaje campo confirmar password vacío
-    @property
+    @locator_cacheado
     def mensajeConfirmPasswordVacio(self):
         return self.page.get_by_text("Passwords do not match")
     
     #Selector de mensaje caracteres mínimos
-    @property
+    @locator_cacheado
     def mensajeCaracteresMinimos(self):
         return self.page.get_by_text("InvalidParameter")
 
     #Selector de mensaje usuario ya existente
-    @property
+    @locator_cacheado
     def mensajeUsuarioExistente(self):
         return self.page.get_by_text("UsernameExistsException: User")
     
     #Selector de mensaje regla de password no cumplida
-    @property
+    @locator_cacheado
     def mensajePoliticaPassword(self):
         return self.page.get_by_text("InvalidPasswordException:")
     
     #Selector de mensaje confirmación registro exitoso
-    @property
+    @locator_cacheado
     def mensajeRegistroExitoso(self):
         return self.page.get_by_text("Registration is successful")
\ No newline at end of file
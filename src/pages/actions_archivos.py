@@ -10,12 +10,15 @@ from openpyxl.utils.exceptions import InvalidFileException
 import pandas as pd
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+
 class FileActions:
     def __init__(self, base_page):
         self.base = base_page
         self.page: Page = base_page.page
         self.logger = base_page.logger
         
+    @medir_accion
     def cargar_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, base_dir: str, file_names: Union[str, List[str]], tiempo: Union[int, float] = 0.5) -> bool:
         """
         Carga uno o varios archivos en un elemento de entrada de tipo 'file' en la página.
@@ -51,19 +54,19 @@ class FileActions:
         # Normalizar `file_names` a una lista para manejar consistentemente uno o varios archivos
         file_names_list = [file_names] if isinstance(file_names, str) else file_names
 
-        self.logger.info(f"\nIntentando cargar archivo(s) '{file_names_list}' en el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando cargar archivo(s) '%s' en el selector: '%s'. Tiempo máximo de espera: %ss.", file_names_list, selector, tiempo)
 
         # Construir las rutas completas de los archivos y verificar su existencia localmente
         full_file_paths = []
         for name in file_names_list:
             full_path = os.path.join(base_dir, name)
             full_file_paths.append(full_path)
-            self.logger.debug(f"\nConstruida ruta completa para archivo: '{full_path}'")
+            self.logger.debug("\nConstruida ruta completa para archivo: '%s'", full_path)
 
             if not os.path.exists(full_path):
                 error_msg = f"\n❌ Error: El archivo no existe en la ruta especificada: '{full_path}'."
                 self.logger.error(error_msg, exc_info=True)
-                self.base.tomar_captura(f"{nombre_base}_archivo_no_encontrado", directorio)
+                self.base.tomar_captura(f"{nombre_base}_archivo_no_encontrado", directorio, es_fallo=True)
                 raise FileNotFoundError(error_msg) # Elevar un error específico si el archivo no se encuentra.
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -74,32 +77,33 @@ class FileActions:
 
         # --- Medición de rendimiento: Inicio de la operación de carga de archivos ---
         # Registra el tiempo justo antes de iniciar la interacción con el elemento de entrada de archivo.
-        start_time_file_upload = time.time()
+        start_time_file_upload = time.perf_counter()
 
         try:
             # 1. Esperar a que el elemento de entrada de archivo esté visible y habilitado
             # Es fundamental asegurar que el elemento está listo para interactuar.
-            self.logger.debug(f"\nEsperando que el selector '{selector}' esté visible y habilitado (timeout: {tiempo}s).")
+            self.logger.debug("\nEsperando que el selector '%s' esté visible y habilitado (timeout: %ss).", selector, tiempo)
             expect(locator).to_be_visible()
             expect(locator).to_be_enabled() # También se puede usar to_be_editable() si es un input
-            self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
+            self.logger.info("\nEl selector '%s' está visible y habilitado.", selector)
 
             # 2. Opcional: Resaltar el elemento para depuración visual
-            locator.highlight()
-            self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
+            self.base.resaltar_elemento(locator)
+            self.logger.debug("\nElemento con selector '%s' resaltado.", selector)
             self.base.tomar_captura(f"{nombre_base}_antes_cargar_archivos", directorio) # Captura antes de adjuntar los archivos.
 
             # 3. Usar set_input_files para adjuntar el archivo(s)
             # Playwright maneja la interacción con el diálogo de carga de archivos.
             # Se le pasa una lista de rutas completas de los archivos a adjuntar.
-            self.logger.info(f"\nAdjuntando archivo(s) {file_names_list} al selector '{selector}'.")
+            self.logger.info("\nAdjuntando archivo(s) %s al selector '%s'.", file_names_list, selector)
             locator.set_input_files(full_file_paths)
 
             # --- Medición de rendimiento: Fin de la operación de carga de archivos ---
             # Registra el tiempo una vez que Playwright ha adjuntado los archivos.
-            end_time_file_upload = time.time()
+            end_time_file_upload = time.perf_counter()
             duration_file_upload = end_time_file_upload - start_time_file_upload
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en cargar el archivo(s) '{file_names_list}' en el selector '{selector}': {duration_file_upload:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en cargar el archivo(s) '%s' en el selector '%s': %.4f segundos.", file_names_list, selector, duration_file_upload)
+            self.base.registrar_metrica("cargar_archivo", duration_file_upload, medicion="file_upload", locator=selector)
 
             # Construir mensaje de éxito basado en si es uno o varios archivos
             if len(file_names_list) == 1:
@@ -108,13 +112,13 @@ class FileActions:
                 success_msg = f"\n✅ Archivos {file_names_list} cargados exitosamente desde '{base_dir}' en el selector '{selector}'."
             self.logger.info(success_msg)
             
-            self.base.tomar_captura(f"{nombre_base}_archivos_cargados", directorio)
+            self.base.tomar_captura(f"{nombre_base}_archivos_cargados", directorio, locator=locator)
             return True
 
         except TimeoutError as e:
             # Captura si el elemento no se hace visible o habilitado a tiempo.
             error_files_info = file_names_list[0] if len(file_names_list) == 1 else file_names_list
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_file_upload # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible o habilitado "
@@ -122,7 +126,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout al cargar archivos es un fallo crítico.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -135,7 +139,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque es un fallo de ejecución.
 
         except Exception as e:
@@ -147,9 +151,10 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
         
+    @medir_accion
     def remover_carga_de_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Remueve la carga de archivo(s) de un elemento de entrada de tipo 'file'
@@ -177,7 +182,7 @@ class FileActions:
                    elemento no es un input de tipo file, timeout de visibilidad/habilitación).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando remover la carga de archivo para el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando remover la carga de archivo para el selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -187,39 +192,40 @@ class FileActions:
 
         # --- Medición de rendimiento: Inicio de la operación de remoción de archivos ---
         # Registra el tiempo justo antes de iniciar la interacción con el elemento.
-        start_time_file_removal = time.time()
+        start_time_file_removal = time.perf_counter()
 
         try:
             # 1. Esperar a que el elemento de entrada de archivo esté visible y habilitado
             # Es fundamental asegurar que el elemento está listo para interactuar y aceptar la limpieza.
-            self.logger.debug(f"\nEsperando que el selector '{selector}' esté visible y habilitado (timeout: {tiempo}s) para remover la carga.")
+            self.logger.debug("\nEsperando que el selector '%s' esté visible y habilitado (timeout: %ss) para remover la carga.", selector, tiempo)
             expect(locator).to_be_visible()
             expect(locator).to_be_enabled() # O to_be_editable()
-            self.logger.info(f"\nEl selector '{selector}' está visible y habilitado.")
+            self.logger.info("\nEl selector '%s' está visible y habilitado.", selector)
 
             # 2. Resaltar el elemento para depuración visual
-            locator.highlight()
-            self.logger.debug(f"\nElemento con selector '{selector}' resaltado.")
+            self.base.resaltar_elemento(locator)
+            self.logger.debug("\nElemento con selector '%s' resaltado.", selector)
             self.base.tomar_captura(f"{nombre_base}_antes_remover_carga", directorio) # Captura antes de remover.
 
             # 3. Usar set_input_files con una lista vacía para remover el archivo
             # Esto simula el usuario cancelando o limpiando la selección de archivos.
-            self.logger.info(f"\nEstableciendo input files a vacío para el selector '{selector}'.")
+            self.logger.info("\nEstableciendo input files a vacío para el selector '%s'.", selector)
             locator.set_input_files([])
 
             # --- Medición de rendimiento: Fin de la operación de remoción de archivos ---
             # Registra el tiempo una vez que Playwright ha limpiado el input de archivos.
-            end_time_file_removal = time.time()
+            end_time_file_removal = time.perf_counter()
             duration_file_removal = end_time_file_removal - start_time_file_removal
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en remover la carga de archivo para el selector '{selector}': {duration_file_removal:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en remover la carga de archivo para el selector '%s': %.4f segundos.", selector, duration_file_removal)
+            self.base.registrar_metrica("remover_carga_de_archivo", duration_file_removal, medicion="file_removal", locator=selector)
 
-            self.logger.info(f"\n✅ Carga de archivo removida exitosamente para el selector '{selector}'.")
-            self.base.tomar_captura(f"{nombre_base}_remocion_completa", directorio)
+            self.logger.info("\n✅ Carga de archivo removida exitosamente para el selector '%s'.", selector)
+            self.base.tomar_captura(f"{nombre_base}_remocion_completa", directorio, locator=locator)
             return True
 
         except TimeoutError as e:
             # Captura si el elemento no se hace visible o habilitado a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_file_removal # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible o habilitado "
@@ -227,7 +233,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout es un fallo crítico.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_remocion_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_remocion_archivo", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -239,7 +245,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_remocion_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_remocion_archivo", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque es un fallo de ejecución.
 
         except Exception as e:
@@ -250,9 +256,10 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_remocion_archivo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_remocion_archivo", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def descargar_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio_capturas: str, directorio_descargas: str, tiempo: Union[int, float] = 30.0) -> str:
         """
         Descarga un archivo al hacer clic en un selector específico.
@@ -281,15 +288,15 @@ class FileActions:
         """
         # 1. Asegurar que el selector sea un objeto Locator para un uso uniforme.
         locator = self.page.locator(selector) if isinstance(selector, str) else selector
-        self.logger.info(f"\nIntentando descargar archivo desde el selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando descargar archivo desde el selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # 2. Configurar la escucha de la descarga ANTES de la acción que la desencadena.
         #    La declaración `with` asegura que la escucha se active antes de hacer clic.
-        start_time_download = time.time()
+        start_time_download = time.perf_counter()
         try:
             with self.page.expect_download() as download_info:
                 # 3. Realizar la acción que inicia la descarga (ej. hacer clic en un enlace).
-                self.logger.info(f"\nRealizando la acción de clic en el selector '{selector}' para iniciar la descarga.")
+                self.logger.info("\nRealizando la acción de clic en el selector '%s' para iniciar la descarga.", selector)
                 locator.click()
 
             # 4. Obtener el objeto de descarga y la ruta temporal del archivo.
@@ -303,19 +310,20 @@ class FileActions:
             ruta_completa_del_archivo = os.path.join(directorio_descargas, file_name)
             os.makedirs(directorio_descargas, exist_ok=True) # Crea el directorio si no existe.
             download.save_as(ruta_completa_del_archivo)
-            self.logger.info(f"\nArchivo guardado exitosamente: '{ruta_completa_del_archivo}'.")
+            self.logger.info("\nArchivo guardado exitosamente: '%s'.", ruta_completa_del_archivo)
 
             # 6. Medición de rendimiento y registro de éxito.
-            end_time_download = time.time()
+            end_time_download = time.perf_counter()
             duration_download = end_time_download - start_time_download
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en descargar el archivo '{file_name}': {duration_download:.4f} segundos.")
-            self.logger.info(f"\n✅ Archivo descargado exitosamente y guardado en '{ruta_completa_del_archivo}'.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en descargar el archivo '%s': %.4f segundos.", file_name, duration_download)
+            self.base.registrar_metrica("descargar_archivo", duration_download, medicion="download", locator=selector)
+            self.logger.info("\n✅ Archivo descargado exitosamente y guardado en '%s'.", ruta_completa_del_archivo)
             self.base.tomar_captura(f"{nombre_base}_archivo_descargado", directorio_capturas)
             return ruta_completa_del_archivo
 
         except TimeoutError as e:
             # Manejo de error: la descarga no se inició o no se completó a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_download
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento '{selector}' no estuvo visible/habilitado o "
@@ -323,7 +331,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_descargar_archivo", directorio_capturas)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_descargar_archivo", directorio_capturas, es_fallo=True)
             return None
 
         except Error as e:
@@ -334,7 +342,7 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_descarga", directorio_capturas)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_descarga", directorio_capturas, es_fallo=True)
             raise # Re-lanzar la excepción para que el test falle.
 
         except Exception as e:
@@ -345,9 +353,10 @@ class FileActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_descarga", directorio_capturas)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_descarga", directorio_capturas, es_fallo=True)
             raise # Re-lanzar la excepción.
         
+    @medir_accion
     def num_Filas_excel(self, archivo_excel_path: str, hoja: str, has_header: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo Excel.
@@ -367,18 +376,18 @@ class FileActions:
             int: El **número de filas de datos** en la hoja especificada.
                  Retorna `0` si el archivo no se encuentra, la hoja no existe, o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando obtener el número de filas para la hoja '{hoja}' en el archivo '{archivo_excel_path}' (tiene encabezado: {has_header}). ---")
+        self.logger.info("\n--- %s: Intentando obtener el número de filas para la hoja '%s' en el archivo '%s' (tiene encabezado: %s). ---", nombre_paso, hoja, archivo_excel_path, has_header)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         num_physical_rows = 0
         num_data_rows = 0
 
         try:
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
+            self.logger.info("\n⏳ Cargando el libro de trabajo Excel: '%s'...", archivo_excel_path)
             workbook = openpyxl.load_workbook(archivo_excel_path) # Carga el libro de trabajo Excel
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
+            self.logger.info("\n✅ Libro de trabajo cargado. Seleccionando la hoja '%s'...", hoja)
             sheet = workbook[hoja] # Selecciona la hoja específica del libro
             
             # Obtiene el número total de filas con contenido.
@@ -388,13 +397,13 @@ class FileActions:
             if has_header and num_physical_rows > 0:
                 # Si tiene encabezado y hay al menos una fila (el encabezado)
                 num_data_rows = num_physical_rows - 1 # Resta 1 para no contar el encabezado
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en la hoja '{hoja}'.")
+                self.logger.info("\n✅ Se encontraron %s filas de datos (descontando encabezado) en la hoja '%s'.", num_data_rows, hoja)
                 return num_data_rows
             else:
                 # Para hojas sin encabezado, o si num_physical_rows es 0 (hoja vacía),
                 # el número de filas de datos es igual al número de filas físicas.
                 num_data_rows = num_physical_rows
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en la hoja '{hoja}'.")
+                self.logger.info("\n✅ Se encontraron %s filas ocupadas en la hoja '%s'.", num_data_rows, hoja)
                 return num_data_rows
 
         except FileNotFoundError:
@@ -415,14 +424,16 @@ class FileActions:
             return 0
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_excel): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (num_Filas_excel): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("num_Filas_excel", duration_total_operation, medicion="total_operation")
             # Es importante cerrar el workbook si se ha abierto explícitamente y no con 'with open()'
             # Sin embargo, openpyxl.load_workbook no requiere un cierre explícito en la mayoría de los casos
             # ya que maneja el archivo internamente. Aun así, se puede añadir un log de depuración.
             self.logger.debug("\nFinalizada la operación de lectura de Excel.")
 
+    @medir_accion
     def dato_Columna_excel(self, archivo_excel_path: str, hoja: str, numero_fila_logica: int, nombre_o_indice_columna: Union[str, int], has_header_excel: bool = False, nombre_paso: str = "") -> Union[str, int, float, None]:
         """
         Obtiene el valor de una celda específica de una hoja de un archivo Excel.
@@ -450,29 +461,30 @@ class FileActions:
                                           Retorna `None` si el archivo no se encuentra, la hoja/columna no existe,
                                           la fila/columna está fuera de rango, o si ocurre un error.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando obtener dato de la celda (Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna}) de la hoja '{hoja}' en el archivo '{archivo_excel_path}' (tiene encabezado: {has_header_excel}). ---")
+        self.logger.info("\n--- %s: Intentando obtener dato de la celda (Fila lógica: %s, Columna: %s) de la hoja '%s' en el archivo '%s' (tiene encabezado: %s). ---", nombre_paso, numero_fila_logica, nombre_o_indice_columna, hoja, archivo_excel_path, has_header_excel)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         cell_value: Any = None # Inicializamos el valor de la celda
 
         try:
             # --- Medición de rendimiento: Carga del Workbook y selección de hoja ---
-            start_time_load_workbook = time.time()
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
+            start_time_load_workbook = time.perf_counter()
+            self.logger.info("\n⏳ Cargando el libro de trabajo Excel: '%s'...", archivo_excel_path)
             workbook = openpyxl.load_workbook(archivo_excel_path)
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
+            self.logger.info("\n✅ Libro de trabajo cargado. Seleccionando la hoja '%s'...", hoja)
             sheet = workbook[hoja]
-            end_time_load_workbook = time.time()
+            end_time_load_workbook = time.perf_counter()
             duration_load_workbook = end_time_load_workbook - start_time_load_workbook
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del workbook y selección de hoja: {duration_load_workbook:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de carga del workbook y selección de hoja: %.4f segundos.", duration_load_workbook)
+            self.base.registrar_metrica("dato_Columna_excel", duration_load_workbook, medicion="load_workbook")
 
             # 1. Determinar el índice físico de la columna
             col_index: int = -1
             if isinstance(nombre_o_indice_columna, str):
                 # --- Medición de rendimiento: Búsqueda de columna por nombre ---
-                start_time_find_column = time.time()
-                self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el encabezado de la hoja '{hoja}'...")
+                start_time_find_column = time.perf_counter()
+                self.logger.info("\n🔎 Buscando columna por nombre: '%s' en el encabezado de la hoja '%s'...", nombre_o_indice_columna, hoja)
                 header_found = False
                 # sheet[1] se refiere a la primera fila física del Excel
                 for col_idx, cell in enumerate(sheet[1], 1):
@@ -480,9 +492,10 @@ class FileActions:
                         col_index = col_idx
                         header_found = True
                         break
-                end_time_find_column = time.time()
+                end_time_find_column = time.perf_counter()
                 duration_find_column = end_time_find_column - start_time_find_column
-                self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de columna por nombre: {duration_find_column:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de búsqueda de columna por nombre: %.4f segundos.", duration_find_column)
+                self.base.registrar_metrica("dato_Columna_excel", duration_find_column, medicion="find_column")
 
                 if not header_found:
                     self.logger.error(f"\n❌ Error: La columna '{nombre_o_indice_columna}' no fue encontrada en el encabezado de la hoja '{hoja}'.")
@@ -509,19 +522,20 @@ class FileActions:
                 self.logger.warning(f"\n⚠️ Advertencia: La fila física {actual_fila_fisica} (lógica: {numero_fila_logica}) está fuera del rango de filas de la hoja '{hoja}' (máximo: {sheet.max_row}). Retornando None.")
                 return None
             
-            self.logger.info(f"\n🔎 Intentando obtener el dato de la celda (Fila lógica: {numero_fila_logica}, Fila física: {actual_fila_fisica}, Columna: {nombre_o_indice_columna}) de la hoja '{hoja}'.")
+            self.logger.info("\n🔎 Intentando obtener el dato de la celda (Fila lógica: %s, Fila física: %s, Columna: %s) de la hoja '%s'.", numero_fila_logica, actual_fila_fisica, nombre_o_indice_columna, hoja)
             
             # --- Medición de rendimiento: Lectura de la celda ---
-            start_time_read_cell = time.time()
+            start_time_read_cell = time.perf_counter()
             cell_value = sheet.cell(row=actual_fila_fisica, column=col_index).value
-            end_time_read_cell = time.time()
+            end_time_read_cell = time.perf_counter()
             duration_read_cell = end_time_read_cell - start_time_read_cell
-            self.logger.info(f"PERFORMANCE: Tiempo de lectura de la celda: {duration_read_cell:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de lectura de la celda: %.4f segundos.", duration_read_cell)
+            self.base.registrar_metrica("dato_Columna_excel", duration_read_cell, medicion="read_cell")
             
             # Convertir a string para asegurar que 'rellenar_campo_de_texto' u otras funciones siempre reciban un str
             if cell_value is not None:
                 valor_retorno = str(cell_value)
-                self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna}) en '{hoja}': '{valor_retorno}'.")
+                self.logger.info("\n✅ Dato obtenido de (Fila lógica: %s, Columna: %s) en '%s': '%s'.", numero_fila_logica, nombre_o_indice_columna, hoja, valor_retorno)
                 return valor_retorno
             else:
                 self.logger.warning(f"\n⚠️ La celda en Fila lógica: {numero_fila_logica}, Columna: {nombre_o_indice_columna} en '{hoja}' está vacía. Retornando None.")
@@ -545,12 +559,14 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (dato_Columna_excel): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (dato_Columna_excel): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("dato_Columna_excel", duration_total_operation, medicion="total_operation")
             # Aunque openpyxl maneja la liberación de recursos, un log final es útil.
             self.logger.debug("\nFinalizada la operación de lectura de dato de Excel.")
     
+    @medir_accion
     def num_Filas_csv(self, archivo_csv_path: str, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> int:
         """
         Detecta y devuelve el número total de filas de datos en un archivo CSV.
@@ -573,15 +589,15 @@ class FileActions:
                  Retorna `0` si el archivo no se encuentra, ocurre un error de formato CSV,
                  o si hay un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando obtener el número de filas para el archivo CSV '{archivo_csv_path}' con delimitador '{delimiter}' (tiene encabezado: {has_header}). ---")
+        self.logger.info("\n--- %s: Intentando obtener el número de filas para el archivo CSV '%s' con delimitador '%s' (tiene encabezado: %s). ---", nombre_paso, archivo_csv_path, delimiter, has_header)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         row_count = 0 # Inicializamos el contador de filas
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{archivo_csv_path}'...")
+            self.logger.info("\n⏳ Abriendo y leyendo el archivo CSV: '%s'...", archivo_csv_path)
             with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
                 # Crea un objeto reader para iterar sobre las líneas del CSV, usando el delimitador especificado.
                 # 'newline=''' es crucial para evitar problemas con saltos de línea en diferentes SO.
@@ -591,17 +607,17 @@ class FileActions:
                 # Cuenta todas las filas en el CSV. sum(1 for row in csv_reader) es una forma eficiente.
                 row_count = sum(1 for row in csv_reader)
 
-            self.logger.info(f"\n✅ Lectura de archivo CSV completada. Filas totales encontradas: {row_count}.")
+            self.logger.info("\n✅ Lectura de archivo CSV completada. Filas totales encontradas: %s.", row_count)
 
             if has_header and row_count > 0:
                 # Si tiene encabezado y el archivo no está vacío (es decir, hay al menos el encabezado)
                 num_data_rows = row_count - 1 # Resta 1 para no contar el encabezado, obteniendo solo las filas de datos
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas de datos (descontando encabezado) en el archivo CSV '{archivo_csv_path}'.")
+                self.logger.info("\n✅ Se encontraron %s filas de datos (descontando encabezado) en el archivo CSV '%s'.", num_data_rows, archivo_csv_path)
                 return num_data_rows
             else:
                 # Si no tiene encabezado o el archivo está vacío (row_count es 0 o 1 si solo es un encabezado sin datos)
                 num_data_rows = row_count
-                self.logger.info(f"\n✅ Se encontraron {num_data_rows} filas ocupadas en el archivo CSV '{archivo_csv_path}'.")
+                self.logger.info("\n✅ Se encontraron %s filas ocupadas en el archivo CSV '%s'.", num_data_rows, archivo_csv_path)
                 return num_data_rows
 
         except FileNotFoundError:
@@ -622,11 +638,13 @@ class FileActions:
             return 0
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_csv): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (num_Filas_csv): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("num_Filas_csv", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nFinalizada la operación de lectura de CSV.")
 
+    @medir_accion
     def dato_Columna_csv(self, archivo_csv_path: str, fila_logica: int, columna_logica: int, delimiter: str = ',', has_header: bool = False, nombre_paso: str = "") -> Optional[str]:
         """
         Obtiene el valor de una "celda" específica de un archivo CSV, ajustando el índice de la fila
@@ -652,10 +670,10 @@ class FileActions:
                            los índices de fila/columna están fuera de rango, hay un error de formato CSV,
                            o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando obtener dato de la celda (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) del archivo CSV '{archivo_csv_path}' con delimitador '{delimiter}' (tiene encabezado: {has_header}). ---")
+        self.logger.info("\n--- %s: Intentando obtener dato de la celda (Fila lógica: %s, Columna lógica: %s) del archivo CSV '%s' con delimitador '%s' (tiene encabezado: %s). ---", nombre_paso, fila_logica, columna_logica, archivo_csv_path, delimiter, has_header)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         cell_value: Optional[str] = None # Inicializamos el valor de la celda
 
         try:
@@ -669,19 +687,20 @@ class FileActions:
             # Convierte el número de columna lógica (1-basada) a un índice 0-basado para Python
             actual_col_0_indexed = columna_logica - 1
 
-            self.logger.info(f"\n🔎 Calculando índices físicos: Fila física (0-indexed): {actual_fila_0_indexed}, Columna física (0-indexed): {actual_col_0_indexed}.")
+            self.logger.info("\n🔎 Calculando índices físicos: Fila física (0-indexed): %s, Columna física (0-indexed): %s.", actual_fila_0_indexed, actual_col_0_indexed)
 
             # --- Medición de rendimiento: Carga del archivo CSV y lectura de todas las filas ---
-            start_time_load_csv = time.time()
-            self.logger.info(f"\n⏳ Abriendo y leyendo todas las filas del archivo CSV: '{archivo_csv_path}'...")
+            start_time_load_csv = time.perf_counter()
+            self.logger.info("\n⏳ Abriendo y leyendo todas las filas del archivo CSV: '%s'...", archivo_csv_path)
             with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
                 csv_reader = csv.reader(csvfile, delimiter=delimiter)
                 rows = list(csv_reader) # Lee todas las filas del CSV en una lista de listas (cada sublista es una fila)
-            end_time_load_csv = time.time()
+            end_time_load_csv = time.perf_counter()
             duration_load_csv = end_time_load_csv - start_time_load_csv
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del archivo CSV y lectura de todas las filas: {duration_load_csv:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de carga del archivo CSV y lectura de todas las filas: %.4f segundos.", duration_load_csv)
+            self.base.registrar_metrica("dato_Columna_csv", duration_load_csv, medicion="load_csv")
             
-            self.logger.info(f"\n✅ Archivo CSV leído. Total de filas físicas encontradas: {len(rows)}.")
+            self.logger.info("\n✅ Archivo CSV leído. Total de filas físicas encontradas: %s.", len(rows))
 
             # Validación de límites para la fila
             if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= len(rows):
@@ -696,7 +715,7 @@ class FileActions:
             # Obtiene el valor de la celda especificada
             cell_value = rows[actual_fila_0_indexed][actual_col_0_indexed]
             
-            self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) en '{archivo_csv_path}': '{cell_value}'.")
+            self.logger.info("\n✅ Dato obtenido de (Fila lógica: %s, Columna lógica: %s) en '%s': '%s'.", fila_logica, columna_logica, archivo_csv_path, cell_value)
             return cell_value
         
         except FileNotFoundError:
@@ -723,11 +742,13 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (dato_Columna_csv): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (dato_Columna_csv): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("dato_Columna_csv", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nFinalizada la operación de lectura de dato de CSV.")
     
+    @medir_accion
     def leer_json(self, json_file_path: str, nombre_paso: str = "") -> Union[Dict, List, None]:
         """
         Lee y parsea un archivo JSON, devolviendo su contenido como un diccionario o lista de Python.
@@ -744,20 +765,20 @@ class FileActions:
                                      o **None** si el archivo no se encuentra, el formato JSON es inválido,
                                      o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo JSON: '{json_file_path}'. ---")
+        self.logger.info("\n--- %s: Intentando leer el archivo JSON: '%s'. ---", nombre_paso, json_file_path)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         data_content: Union[Dict, List, None] = None # Inicializamos a None
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo JSON: '{json_file_path}'...")
+            self.logger.info("\n⏳ Abriendo y leyendo el archivo JSON: '%s'...", json_file_path)
             with open(json_file_path, 'r', encoding='utf-8') as file:
                 # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
                 data_content = json.load(file) # Carga (parsea) el contenido del archivo JSON
             
-            self.logger.info(f"\n✅ Archivo JSON '{json_file_path}' leído y parseado exitosamente.")
+            self.logger.info("\n✅ Archivo JSON '%s' leído y parseado exitosamente.", json_file_path)
             return data_content
 
         except FileNotFoundError:
@@ -778,11 +799,13 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_json): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (leer_json): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("leer_json", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de lectura de archivo JSON finalizada.")
             
+    @medir_accion
     def leer_csv_diccionario(self, csv_file_path: str, nombre_paso: str = "") -> Union[List[Dict[str, str]], None]:
         """
         Lee y parsea un archivo CSV, devolviendo su contenido como una lista de diccionarios,
@@ -800,22 +823,22 @@ class FileActions:
                                                o **None** si el archivo no se encuentra, el formato CSV es inválido,
                                                o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo CSV: '{csv_file_path}'. ---")
+        self.logger.info("\n--- %s: Intentando leer el archivo CSV: '%s'. ---", nombre_paso, csv_file_path)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         data_content: Union[List[Dict[str, str]], None] = None  # Inicializamos a None
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{csv_file_path}'...")
+            self.logger.info("\n⏳ Abriendo y leyendo el archivo CSV: '%s'...", csv_file_path)
             with open(csv_file_path, mode='r', newline='', encoding='utf-8') as file:
                 # csv.DictReader lee cada fila como un diccionario usando los encabezados como claves
                 reader = csv.DictReader(file)
                 # Convertimos el iterador en una lista de diccionarios
                 data_content = list(reader)
             
-            self.logger.info(f"\n✅ Archivo CSV '{csv_file_path}' leído y parseado exitosamente.")
+            self.logger.info("\n✅ Archivo CSV '%s' leído y parseado exitosamente.", csv_file_path)
             return data_content
 
         except FileNotFoundError:
@@ -836,11 +859,13 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_csv_diccionario): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (leer_csv_diccionario): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("leer_csv_diccionario", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de lectura de archivo CSV finalizada.")
             
+    @medir_accion
     def leer_excel_diccionario(self, excel_file_path: str, sheet_name: str, has_header: bool = True, headers: Optional[List[str]] = None, nombre_paso: str = "") -> Union[List[Dict[str, Any]], None]:
         """
         Lee y parsea un archivo Excel o CSV, devolviendo su contenido como una lista de diccionarios.
@@ -864,14 +889,14 @@ class FileActions:
                                             o **None** si el archivo no se encuentra, el formato es inválido,
                                             si la hoja no existe o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo: '{excel_file_path}'. ---")
-        start_time_total_operation = time.time()
+        self.logger.info("\n--- %s: Intentando leer el archivo: '%s'. ---", nombre_paso, excel_file_path)
+        start_time_total_operation = time.perf_counter()
         data_content: List[Dict[str, Any]] = []
 
         try:
             # Manejo para archivos CSV
             if excel_file_path.endswith('.csv'):
-                self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{excel_file_path}'...")
+                self.logger.info("\n⏳ Abriendo y leyendo el archivo CSV: '%s'...", excel_file_path)
                 with open(excel_file_path, mode='r', newline='', encoding='utf-8') as file:
                     reader = csv.reader(file)
                     start_row = 1
@@ -887,7 +912,7 @@ class FileActions:
 
             # Manejo para archivos Excel (.xlsx)
             else:
-                self.logger.info(f"\n⏳ Abriendo y leyendo el archivo Excel: '{excel_file_path}'...")
+                self.logger.info("\n⏳ Abriendo y leyendo el archivo Excel: '%s'...", excel_file_path)
                 workbook = openpyxl.load_workbook(excel_file_path)
                 
                 # Se utiliza el nombre de la hoja proporcionado por el usuario
@@ -907,7 +932,7 @@ class FileActions:
                             row_dict[header] = cell.value
                     data_content.append(row_dict)
 
-            self.logger.info(f"\n✅ Archivo '{excel_file_path}' leído y parseado exitosamente.")
+            self.logger.info("\n✅ Archivo '%s' leído y parseado exitosamente.", excel_file_path)
             return data_content
 
         except FileNotFoundError:
@@ -931,11 +956,13 @@ class FileActions:
             self.logger.critical(error_msg, exc_info=True)
             return None
         finally:
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_excel_diccionario): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (leer_excel_diccionario): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("leer_excel_diccionario", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de lectura de archivo finalizada.")
         
+    @medir_accion
     def leer_texto_plano(self, file_path: str, delimiter: Optional[str] = None, nombre_paso: str = "") -> Union[str, List[str], None]:
         """
         Lee el contenido completo de un archivo de texto plano.
@@ -959,33 +986,34 @@ class FileActions:
                                          o si ocurre un error inesperado.
         """
         delimiter_log_info = f"'{delimiter}'" if delimiter is not None else "Ninguno"
-        self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo de texto: '{file_path}' (Delimitador: {delimiter_log_info}). ---")
+        self.logger.info("\n--- %s: Intentando leer el archivo de texto: '%s' (Delimitador: %s). ---", nombre_paso, file_path, delimiter_log_info)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         content: Optional[str] = None # Inicializamos content
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo de texto: '{file_path}'...")
+            self.logger.info("\n⏳ Abriendo y leyendo el archivo de texto: '%s'...", file_path)
             with open(file_path, 'r', encoding='utf-8') as file:
                 # 'encoding='utf-8'' es crucial para manejar correctamente una amplia gama de caracteres.
                 content = file.read() # Lee todo el contenido del archivo
             
-            self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído exitosamente.")
+            self.logger.info("\n✅ Archivo de texto '%s' leído exitosamente.", file_path)
 
             if delimiter is not None:
                 # --- Medición de rendimiento: División del contenido (si aplica) ---
-                start_time_split = time.time()
-                self.logger.info(f"\n🔎 Dividiendo el contenido por el delimitador: '{delimiter}'...")
+                start_time_split = time.perf_counter()
+                self.logger.info("\n🔎 Dividiendo el contenido por el delimitador: '%s'...", delimiter)
                 result = content.split(delimiter) # Divide el contenido por el delimitador y lo retorna como lista
-                end_time_split = time.time()
+                end_time_split = time.perf_counter()
                 duration_split = end_time_split - start_time_split
-                self.logger.info(f"PERFORMANCE: Tiempo de división del contenido: {duration_split:.4f} segundos.")
-                self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído y dividido exitosamente. Se encontraron {len(result)} segmentos.")
+                self.logger.info("PERFORMANCE: Tiempo de división del contenido: %.4f segundos.", duration_split)
+                self.base.registrar_metrica("leer_texto_plano", duration_split, medicion="split")
+                self.logger.info("\n✅ Archivo de texto '%s' leído y dividido exitosamente. Se encontraron %s segmentos.", file_path, len(result))
                 return result
             else:
-                self.logger.info(f"\n✅ Archivo de texto '{file_path}' leído completamente como una sola cadena.")
+                self.logger.info("\n✅ Archivo de texto '%s' leído completamente como una sola cadena.", file_path)
                 return content
             
         except FileNotFoundError:
@@ -1006,11 +1034,13 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_texto): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (leer_texto): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("leer_texto_plano", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de lectura de archivo de texto finalizada.")
 
+    @medir_accion
     def leer_xml(self, xml_file_path: str, nombre_paso: str = "") -> Union[ET.Element, None]:
         """
         Lee y parsea un archivo XML, devolviendo su elemento raíz como un objeto Element.
@@ -1027,15 +1057,15 @@ class FileActions:
                                      o **None** si el archivo no se encuentra, el formato XML es inválido,
                                      o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando leer el archivo XML: '{xml_file_path}'. ---")
+        self.logger.info("\n--- %s: Intentando leer el archivo XML: '%s'. ---", nombre_paso, xml_file_path)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         root_element: Optional[ET.Element] = None # Inicializamos el elemento raíz
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y parseando el archivo XML: '{xml_file_path}'...")
+            self.logger.info("\n⏳ Abriendo y parseando el archivo XML: '%s'...", xml_file_path)
             # ET.parse() se encarga de abrir y parsear el archivo.
             # No es necesario especificar la codificación en la mayoría de los casos ya que
             # ET lo detecta automáticamente si el XML tiene una declaración de codificación (e.g., <?xml version="1.0" encoding="UTF-8"?>).
@@ -1044,7 +1074,7 @@ class FileActions:
             # Obtiene el elemento raíz del XML
             root_element = tree.getroot()
             
-            self.logger.info(f"\n✅ Archivo XML '{xml_file_path}' leído y parseado exitosamente. Elemento raíz: '{root_element.tag}'.")
+            self.logger.info("\n✅ Archivo XML '%s' leído y parseado exitosamente. Elemento raíz: '%s'.", xml_file_path, root_element.tag)
             return root_element
 
         except FileNotFoundError:
@@ -1065,11 +1095,13 @@ class FileActions:
             return None
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (leer_xml): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (leer_xml): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("leer_xml", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de lectura de archivo XML finalizada.")
     
+    @medir_accion
     def escribir_texto_plano(self, file_path: str, content: Union[str, List[str]], append: bool = False, delimiter: Optional[str] = None, nombre_paso: str = "") -> bool:
         """
         Escribe contenido en un archivo de texto plano. Si el contenido es una lista de cadenas
@@ -1096,10 +1128,10 @@ class FileActions:
         action = "añadir a" if append else "escribir en" # Descripción de la acción para el log
         
         delimiter_log_info = f"'{delimiter}'" if delimiter is not None else "Ninguno"
-        self.logger.info(f"\n--- {nombre_paso}: Intentando {action} el archivo de texto: '{file_path}' (Delimitador de escritura: {delimiter_log_info}). ---")
+        self.logger.info("\n--- %s: Intentando %s el archivo de texto: '%s' (Delimitador de escritura: %s). ---", nombre_paso, action, file_path, delimiter_log_info)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         text_to_write: str = "" # Variable para almacenar el contenido final a escribir
 
@@ -1107,18 +1139,19 @@ class FileActions:
             # Lógica para procesar el contenido antes de la escritura
             if isinstance(content, list):
                 # --- Medición de rendimiento: Unión de la lista con el delimitador ---
-                start_time_join = time.time()
+                start_time_join = time.perf_counter()
                 
                 if delimiter is not None:
                     text_to_write = delimiter.join(content)
-                    self.logger.info(f"\n🔎 El contenido de la lista será unido con el delimitador '{delimiter}' antes de escribir.")
+                    self.logger.info("\n🔎 El contenido de la lista será unido con el delimitador '%s' antes de escribir.", delimiter)
                 else:
                     text_to_write = "".join(content)
                     self.logger.warning("\n⚠️ Se proporcionó una lista para escribir_texto sin delimitador. Las cadenas se concatenarán sin separación explícita, lo que puede no ser el comportamiento deseado.")
                 
-                end_time_join = time.time()
+                end_time_join = time.perf_counter()
                 duration_join = end_time_join - start_time_join
-                self.logger.info(f"PERFORMANCE: Tiempo de preparación del contenido (join): {duration_join:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de preparación del contenido (join): %.4f segundos.", duration_join)
+                self.base.registrar_metrica("escribir_texto_plano", duration_join, medicion="join")
 
             elif isinstance(content, str):
                 text_to_write = content # Si el contenido ya es una cadena, lo asigna tal cual
@@ -1129,12 +1162,12 @@ class FileActions:
                 return False
 
             # --- Medición de rendimiento: Escritura en el archivo ---
-            self.logger.info(f"\n✍️ Escribiendo contenido en el archivo: '{file_path}'...")
+            self.logger.info("\n✍️ Escribiendo contenido en el archivo: '%s'...", file_path)
             with open(file_path, mode, encoding='utf-8') as file:
                 # `encoding='utf-8'` es crucial para manejar correctamente una amplia gama de caracteres
                 file.write(text_to_write)
             
-            self.logger.info(f"\n✅ Contenido {action} exitosamente en '{file_path}'.")
+            self.logger.info("\n✅ Contenido %s exitosamente en '%s'.", action, file_path)
             return True
         
         except IOError as e:
@@ -1151,11 +1184,13 @@ class FileActions:
             return False
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (escribir_texto): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (escribir_texto): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("escribir_texto_plano", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de escritura de archivo de texto finalizada.")
     
+    @medir_accion
     def escribir_json(self, file_path: str, data: Union[Dict, List], indent: int = 4, append: bool = False, nombre_paso: str = "") -> bool:
         """
         Escribe un objeto Python (diccionario o lista) en un archivo JSON.
@@ -1176,10 +1211,10 @@ class FileActions:
             bool: `True` si la escritura fue exitosa, `False` en caso de error.
         """
         mode_action = "añadir a" if append else "escribir en"
-        self.logger.info(f"\n--- {nombre_paso}: Intentando {mode_action} el archivo JSON: '{file_path}'. ---")
+        self.logger.info("\n--- %s: Intentando %s el archivo JSON: '%s'. ---", nombre_paso, mode_action, file_path)
         
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         try:
             final_data = data
@@ -1194,29 +1229,30 @@ class FileActions:
                             final_data = existing_data + data
                         else:
                             final_data = existing_data + [data]
-                        self.logger.info(f"\n🔎 Modo 'append': Se añadieron nuevos datos a la lista existente del archivo.")
+                        self.logger.info("\n🔎 Modo 'append': Se añadieron nuevos datos a la lista existente del archivo.")
                     else:
                         raise TypeError(f"El modo 'append' requiere que el archivo JSON contenga una lista, pero se encontró un tipo '{type(existing_data).__name__}'.")
                 else:
                     # Si el archivo no existe o está vacío, crea una nueva lista
                     if not isinstance(data, list):
                         final_data = [data]
-                    self.logger.info(f"\n🔎 El archivo no existe o está vacío. Se creó un nuevo archivo con los datos iniciales.")
+                    self.logger.info("\n🔎 El archivo no existe o está vacío. Se creó un nuevo archivo con los datos iniciales.")
             
             # --- Medición de rendimiento: Serialización a JSON ---
-            start_time_serialization = time.time()
+            start_time_serialization = time.perf_counter()
             json_string = json.dumps(final_data, indent=indent, ensure_ascii=False)
             
-            end_time_serialization = time.time()
+            end_time_serialization = time.perf_counter()
             duration_serialization = end_time_serialization - start_time_serialization
-            self.logger.info(f"PERFORMANCE: Tiempo de serialización del objeto a JSON: {duration_serialization:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de serialización del objeto a JSON: %.4f segundos.", duration_serialization)
+            self.base.registrar_metrica("escribir_json", duration_serialization, medicion="serialization")
 
             # --- Medición de rendimiento: Escritura en el archivo ---
-            self.logger.info(f"\n✍️ Escribiendo contenido JSON en el archivo: '{file_path}'...")
+            self.logger.info("\n✍️ Escribiendo contenido JSON en el archivo: '%s'...", file_path)
             with open(file_path, 'w', encoding='utf-8') as file:
                 file.write(json_string)
             
-            self.logger.info(f"\n✅ Contenido JSON {mode_action} exitosamente en '{file_path}'.")
+            self.logger.info("\n✅ Contenido JSON %s exitosamente en '%s'.", mode_action, file_path)
             return True
         
         except (TypeError, json.JSONDecodeError) as e:
@@ -1236,11 +1272,13 @@ class FileActions:
             
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (escribir_json): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (escribir_json): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("escribir_json", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de escritura de archivo JSON finalizada.")
     
+    @medir_accion
     def escribir_excel(self, file_path: str, data: List[Dict], append: bool = False, header: bool = True, nombre_paso: str = "") -> bool:
         """
         Escribe una lista de diccionarios en un archivo Excel.
@@ -1262,8 +1300,8 @@ class FileActions:
             bool: `True` si la escritura fue exitosa, `False` en caso de error.
         """
         mode_action = "añadir a" if append else "escribir en"
-        self.logger.info(f"\n--- {nombre_paso}: Intentando {mode_action} el archivo Excel: '{file_path}'. ---")
-        start_time_total_operation = time.time()
+        self.logger.info("\n--- %s: Intentando %s el archivo Excel: '%s'. ---", nombre_paso, mode_action, file_path)
+        start_time_total_operation = time.perf_counter()
 
         try:
             if not isinstance(data, list) or not all(isinstance(d, dict) for d in data):
@@ -1272,7 +1310,7 @@ class FileActions:
             df_new = pd.DataFrame(data)
 
             if append and os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                self.logger.info(f"\n🔎 Modo 'append': Verificando archivo existente para añadir datos.")
+                self.logger.info("\n🔎 Modo 'append': Verificando archivo existente para añadir datos.")
                 
                 df_existing = pd.read_excel(file_path)
                 
@@ -1290,10 +1328,10 @@ class FileActions:
                 with pd.ExcelWriter(file_path, engine='openpyxl', mode='a', if_sheet_exists='overlay') as writer:
                     df_new.to_excel(writer, index=False, header=False, sheet_name='Sheet1', startrow=start_row)
             else:
-                self.logger.info(f"\n🔎 El archivo no existe o se sobrescribirá. Escribiendo nuevos datos.")
+                self.logger.info("\n🔎 El archivo no existe o se sobrescribirá. Escribiendo nuevos datos.")
                 df_new.to_excel(file_path, index=False, header=header, sheet_name='Sheet1')
             
-            self.logger.info(f"\n✅ Contenido Excel {mode_action} exitosamente en '{file_path}'.")
+            self.logger.info("\n✅ Contenido Excel %s exitosamente en '%s'.", mode_action, file_path)
             return True
 
         except pd.errors.EmptyDataError:
@@ -1309,11 +1347,13 @@ class FileActions:
             self.logger.critical(error_msg, exc_info=True)
             return False
         finally:
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (escribir_excel): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (escribir_excel): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("escribir_excel", duration_total_operation, medicion="total_operation")
             self.logger.debug("\nOperación de escritura de archivo Excel finalizada.")
             
+    @medir_accion
     def escribir_csv(self, file_path: str, data: List[Dict], append: bool = False, header: bool = True, nombre_paso: str = "escribir_csv") -> bool:
         """
         Escribe datos en un archivo CSV.
@@ -1350,7 +1390,7 @@ class FileActions:
 
                 writer.writerows(data)
 
-            self.logger.info(f"✅ {nombre_paso}: Datos escritos correctamente en el archivo CSV: '{file_path}'.")
+            self.logger.info("✅ %s: Datos escritos correctamente en el archivo CSV: '%s'.", nombre_paso, file_path)
             return True
 
         except IOError as e:
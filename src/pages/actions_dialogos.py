@@ -2,6 +2,8 @@ import time
 from typing import Union, Optional
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError, Dialog
 
+from src.utils.cronometro import medir_accion
+
 class DialogActions:
     def __init__(self, base_page):
         self.base = base_page
@@ -10,6 +12,7 @@ class DialogActions:
         
     # 40- Función para verificar una alerta simple utilizando page.expect_event().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta.
+    @medir_accion
     def verificar_alerta_simple_con_expect_event(self, selector: Locator, mensaje_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_alerta: Union[int, float] = 0.5) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
@@ -41,31 +44,32 @@ class DialogActions:
                             si el tipo de diálogo es incorrecto, o si ocurre un error inesperado
                             de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de alerta con expect_event: {nombre_base} ---")
-        self.logger.info(f"\nVerificando alerta al hacer clic en '{selector}'")
-        self.logger.info(f"\n  --> Mensaje de alerta esperado: '{mensaje_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de alerta con expect_event: %s ---", nombre_base)
+        self.logger.info("\nVerificando alerta al hacer clic en '%s'", selector)
+        self.logger.info("\n  --> Mensaje de alerta esperado: '%s'", mensaje_esperado)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Validar visibilidad y habilitación del selector que disparará la alerta
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
             # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
+            start_time_element_ready = time.perf_counter()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
+            end_time_element_ready = time.perf_counter()
             duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo para que el elemento disparador esté listo: %.4f segundos.", duration_element_ready)
+            self.base.registrar_metrica("verificar_alerta_simple_con_expect_event", duration_element_ready, medicion="element_ready", locator=selector)
             
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_alerta", directorio)
 
 
-            self.logger.debug(f"\n  --> Preparando expect_event para la alerta y haciendo clic (timeout de alerta: {tiempo_espera_alerta}s)...")
+            self.logger.debug("\n  --> Preparando expect_event para la alerta y haciendo clic (timeout de alerta: %ss)...", tiempo_espera_alerta)
             
             # 2. Esperar el evento de diálogo (alerta) y hacer clic en el selector
             # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición de la alerta.
@@ -75,17 +79,18 @@ class DialogActions:
             # Playwright automáticamente acepta diálogos si no hay un handler. Aquí, lo manejamos explícitamente.
             with self.page.expect_event("dialog") as info_dialogo:
                 # --- Medición de rendimiento: Inicio de click y espera de alerta ---
-                start_time_alert_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar la alerta...")
+                start_time_alert_detection = time.perf_counter()
+                self.logger.debug("\n  --> Haciendo clic en el botón '%s' para disparar la alerta...", selector)
                 selector.click()
             
             dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la alerta
             # --- Medición de rendimiento: Fin de click y espera de alerta ---
-            end_time_alert_detection = time.time()
+            end_time_alert_detection = time.perf_counter()
             duration_alert_detection = end_time_alert_detection - start_time_alert_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta: {duration_alert_detection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta: %.4f segundos.", duration_alert_detection)
+            self.base.registrar_metrica("verificar_alerta_simple_con_expect_event", duration_alert_detection, medicion="alert_detection", locator=selector)
 
-            self.logger.info(f"\n  --> Alerta detectada. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}'")
+            self.logger.info("\n  --> Alerta detectada. Tipo: '%s', Mensaje: '%s'", dialogo.type, dialogo.message)
             self.base.tomar_captura(f"{nombre_base}_alerta_detectada", directorio)
 
             # 3. Validar el tipo de diálogo
@@ -97,9 +102,9 @@ class DialogActions:
 
             # 4. Validar el mensaje de la alerta
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
+            start_time_message_verification = time.perf_counter()
             if mensaje_esperado not in dialogo.message:
-                self.base.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
+                self.base.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -110,9 +115,10 @@ class DialogActions:
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
+            end_time_message_verification = time.perf_counter()
             duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje de la alerta: {duration_message_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación del mensaje de la alerta: %.4f segundos.", duration_message_verification)
+            self.base.registrar_metrica("verificar_alerta_simple_con_expect_event", duration_message_verification, medicion="message_verification", locator=selector)
 
 
             # 5. Aceptar la alerta
@@ -123,21 +129,22 @@ class DialogActions:
             # Si tu aplicación cambia el estado del DOM (ej. un mensaje de éxito/error)
             # después de que la alerta es aceptada, puedes verificarlo aquí.
             # Por ejemplo: expect(self.page.locator("#status_message")).to_have_text("Operación completada");
-            self.base.esperar_fijo(0.5) # Pequeña pausa para que el DOM se actualice si es necesario
+            self.base.esperar_estabilidad(0.5) # Espera a que el DOM se asiente (0.5s como máximo)
 
             self.base.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de alerta): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificación de alerta): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_alerta_simple_con_expect_event", duration_total_operation, medicion="total_operation", locator=selector)
 
             return True
 
         except TimeoutError as e:
             # Captura si el selector no está listo o si la alerta no aparece a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo "
@@ -146,7 +153,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_alerta_NO_aparece_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_alerta_NO_aparece_timeout", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar alerta para selector '{selector}'") from e
 
@@ -157,7 +164,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
 
@@ -174,12 +181,13 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
     
     # 41- Función para verificar una alerta simple utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta a través de un listener.
+    @medir_accion
     def verificar_alerta_simple_con_on(self, selector: Locator, mensaje_alerta_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_alerta: Union[int, float] = 0.7) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
@@ -212,9 +220,9 @@ class DialogActions:
                             si el tipo de diálogo es incorrecto, o si ocurre un error inesperado
                             de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de alerta con page.once('dialog'): {nombre_base} ---")
-        self.logger.info(f"\nVerificando alerta simple al hacer clic en el botón '{selector}'")
-        self.logger.info(f"\n  --> Mensaje de alerta esperado: '{mensaje_alerta_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de alerta con page.once('dialog'): %s ---", nombre_base)
+        self.logger.info("\nVerificando alerta simple al hacer clic en el botón '%s'", selector)
+        self.logger.info("\n  --> Mensaje de alerta esperado: '%s'", mensaje_alerta_esperado)
 
         # Resetear el estado de las banderas para cada ejecución del test
         # Esto es crucial para evitar que valores de una ejecución anterior afecten la actual.
@@ -223,21 +231,22 @@ class DialogActions:
         self._alerta_tipo_capturado = ""
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Validar visibilidad y habilitación del selector que disparará la alerta
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
             # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
+            start_time_element_ready = time.perf_counter()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
+            end_time_element_ready = time.perf_counter()
             duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo para que el elemento disparador esté listo: %.4f segundos.", duration_element_ready)
+            self.base.registrar_metrica("verificar_alerta_simple_con_on", duration_element_ready, medicion="element_ready", locator=selector)
             
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_alerta", directorio)
 
@@ -248,44 +257,45 @@ class DialogActions:
             self.page.once("dialog", self._get_simple_alert_handler_for_on())
 
             # 3. Hacer clic en el botón que dispara la alerta
-            self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}'...")
+            self.logger.debug("\n  --> Haciendo clic en el botón '%s'...", selector)
             # --- Medición de rendimiento: Inicio de click y espera de detección de alerta ---
-            start_time_click_and_alert_detection = time.time()
+            start_time_click_and_alert_detection = time.perf_counter()
             selector.click() # Reutilizar tiempo_espera_elemento para el click
 
             # 4. Esperar a que el listener haya detectado y manejado la alerta
-            self.logger.debug(f"\n  --> Esperando a que la alerta sea detectada y manejada por el listener (timeout: {tiempo_max_deteccion_alerta}s)...")
+            self.logger.debug("\n  --> Esperando a que la alerta sea detectada y manejada por el listener (timeout: %ss)...", tiempo_max_deteccion_alerta)
             # Bucle de espera activa hasta que la bandera _alerta_detectada sea True
             # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_alerta
-            wait_end_time = time.time() + tiempo_max_deteccion_alerta
-            while not self._alerta_detectada and time.time() < wait_end_time:
+            wait_end_time = time.perf_counter() + tiempo_max_deteccion_alerta
+            while not self._alerta_detectada and time.perf_counter() < wait_end_time:
                 time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
 
             # --- Medición de rendimiento: Fin de click y espera de detección de alerta ---
-            end_time_click_and_alert_detection = time.time()
+            end_time_click_and_alert_detection = time.perf_counter()
             duration_click_and_alert_detection = end_time_click_and_alert_detection - start_time_click_and_alert_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta por el listener: {duration_click_and_alert_detection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo desde el clic hasta la detección de la alerta por el listener: %.4f segundos.", duration_click_and_alert_detection)
+            self.base.registrar_metrica("verificar_alerta_simple_con_on", duration_click_and_alert_detection, medicion="click_and_alert_detection", locator=selector)
 
             if not self._alerta_detectada:
                 error_msg = f"\n❌ FALLO: La alerta no fue detectada por el listener después de {tiempo_max_deteccion_alerta} segundos."
                 self.logger.error(error_msg)
-                self.base.tomar_captura(f"{nombre_base}_alerta_NO_detectada_timeout", directorio)
+                self.base.tomar_captura(f"{nombre_base}_alerta_NO_detectada_timeout", directorio, es_fallo=True)
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             
             self.base.tomar_captura(f"{nombre_base}_alerta_detectada_por_listener", directorio)
-            self.logger.info(f"\n  ✅  Alerta detectada con éxito por el listener.")
+            self.logger.info("\n  ✅  Alerta detectada con éxito por el listener.")
 
             # 5. Validaciones después de que el listener ha actuado
             # --- Medición de rendimiento: Inicio de verificación de contenido de alerta ---
-            start_time_alert_content_verification = time.time()
+            start_time_alert_content_verification = time.perf_counter()
             if self._alerta_tipo_capturado != "alert":
                 self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
 
             if mensaje_alerta_esperado not in self._alerta_mensaje_capturado:
-                self.base.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
+                self.base.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_alerta_esperado}'\n"
@@ -296,9 +306,10 @@ class DialogActions:
                 raise AssertionError(error_msg)
             
             # --- Medición de rendimiento: Fin de verificación de contenido de alerta ---
-            end_time_alert_content_verification = time.time()
+            end_time_alert_content_verification = time.perf_counter()
             duration_alert_content_verification = end_time_alert_content_verification - start_time_alert_content_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de tipo y mensaje de la alerta: {duration_alert_content_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de tipo y mensaje de la alerta: %.4f segundos.", duration_alert_content_verification)
+            self.base.registrar_metrica("verificar_alerta_simple_con_on", duration_alert_content_verification, medicion="alert_content_verification", locator=selector)
 
 
             # La alerta ya fue aceptada por el handler `_get_simple_alert_handler_for_on()`.
@@ -308,21 +319,22 @@ class DialogActions:
             # Si tu aplicación cambia el estado del DOM (ej. un mensaje de éxito/error)
             # después de que la alerta es aceptada, puedes verificarlo aquí.
             # Por ejemplo: expect(self.page.locator("#status_message")).to_have_text("Operación completada");
-            self.base.esperar_fijo(0.5) # Pequeña pausa para que el DOM se actualice si es necesario
+            self.base.esperar_estabilidad(0.5) # Espera a que el DOM se asiente (0.5s como máximo)
 
             self.base.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de alerta por listener): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificación de alerta por listener): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_alerta_simple_con_on", duration_total_operation, medicion="total_operation", locator=selector)
 
             return True
 
         except TimeoutError as e:
             # Captura si el selector no está listo. La detección de alerta por timeout se maneja en el bucle.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo "
@@ -331,7 +343,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_elemento_NO_listo_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_elemento_NO_listo_timeout", directorio, es_fallo=True)
             raise AssertionError(f"\nTimeout al preparar el elemento disparador para '{selector}'") from e
 
         except Error as e:
@@ -341,7 +353,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
 
         except AssertionError as e:
@@ -357,11 +369,12 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
         
     # 42- Función para verificar una alerta de confirmación utilizando page.expect_event().
     # Este método maneja el diálogo exclusivamente con expect_event e integra pruebas de rendimiento.
+    @medir_accion
     def verificar_confirmacion_expect_event(self, selector: Locator, mensaje_esperado: str, accion_confirmacion: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_confirmacion: Union[int, float] = 0.7) -> bool:
         """
         Verifica una alerta de tipo 'confirm' que aparece después de hacer clic en un selector dado.
@@ -396,55 +409,57 @@ class DialogActions:
                             si el tipo de diálogo es incorrecto, si el mensaje no coincide, si la acción
                             de confirmación no es válida, o si ocurre un error inesperado de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de confirmación con expect_event: {nombre_base} ---")
-        self.logger.info(f"\nVerificando confirmación al hacer clic en '{selector}' para '{accion_confirmacion}'")
-        self.logger.info(f"\n  --> Mensaje de confirmación esperado: '{mensaje_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de confirmación con expect_event: %s ---", nombre_base)
+        self.logger.info("\nVerificando confirmación al hacer clic en '%s' para '%s'", selector, accion_confirmacion)
+        self.logger.info("\n  --> Mensaje de confirmación esperado: '%s'", mensaje_esperado)
 
         # Validar la acción de confirmación antes de iniciar la operación
         if accion_confirmacion not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio, es_fallo=True)
             raise AssertionError(error_msg)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Validar visibilidad y habilitación del selector que disparará la confirmación
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
             # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
+            start_time_element_ready = time.perf_counter()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
+            end_time_element_ready = time.perf_counter()
             duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo para que el elemento disparador esté listo: %.4f segundos.", duration_element_ready)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_element_ready, medicion="element_ready", locator=selector)
             
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_confirmacion", directorio)
 
             # 2. Esperar el evento de diálogo (confirmación) y hacer clic en el selector
-            self.logger.debug(f"\n  --> Preparando expect_event para la confirmación y haciendo clic (timeout de confirmación: {tiempo_espera_confirmacion}s)...")
+            self.logger.debug("\n  --> Preparando expect_event para la confirmación y haciendo clic (timeout de confirmación: %ss)...", tiempo_espera_confirmacion)
             
             # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición de la confirmación.
             # Se usa `timeout` en `click` para el tiempo máximo de clic en el elemento.
             # Es importante que el timeout de `expect_event` sea suficiente para que la confirmación aparezca.
             with self.page.expect_event("dialog", timeout=int(tiempo_espera_confirmacion * 1000)) as info_dialogo:
                 # --- Medición de rendimiento: Inicio de click y espera de confirmación ---
-                start_time_confirm_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar la confirmación...")
+                start_time_confirm_detection = time.perf_counter()
+                self.logger.debug("\n  --> Haciendo clic en el botón '%s' para disparar la confirmación...", selector)
                 selector.click(timeout=int(tiempo_espera_elemento * 1000)) # Reutilizar tiempo_espera_elemento para el click
             
             dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog de la confirmación
             # --- Medición de rendimiento: Fin de click y espera de confirmación ---
-            end_time_confirm_detection = time.time()
+            end_time_confirm_detection = time.perf_counter()
             duration_confirm_detection = end_time_confirm_detection - start_time_confirm_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección de la confirmación: {duration_confirm_detection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo desde el clic hasta la detección de la confirmación: %.4f segundos.", duration_confirm_detection)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_confirm_detection, medicion="confirm_detection", locator=selector)
 
-            self.logger.info(f"\n  --> Confirmación detectada. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}'")
+            self.logger.info("\n  --> Confirmación detectada. Tipo: '%s', Mensaje: '%s'", dialogo.type, dialogo.message)
             self.base.tomar_captura(f"{nombre_base}_confirmacion_detectada", directorio)
 
             # 3. Validar el tipo de diálogo
@@ -460,9 +475,9 @@ class DialogActions:
 
             # 4. Validar el mensaje de la confirmación
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
+            start_time_message_verification = time.perf_counter()
             if mensaje_esperado not in dialogo.message:
-                self.base.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
+                self.base.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -477,13 +492,14 @@ class DialogActions:
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
+            end_time_message_verification = time.perf_counter()
             duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje de la confirmación: {duration_message_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación del mensaje de la confirmación: %.4f segundos.", duration_message_verification)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_message_verification, medicion="message_verification", locator=selector)
 
             # 5. Realizar la acción solicitada (Aceptar o Cancelar)
             # --- Medición de rendimiento: Inicio de la acción sobre la confirmación ---
-            start_time_confirm_action = time.time()
+            start_time_confirm_action = time.perf_counter()
             if accion_confirmacion == 'accept':
                 dialogo.accept()
                 self.logger.info("\n  ✅  --> Confirmación ACEPTADA.")
@@ -491,16 +507,17 @@ class DialogActions:
                 dialogo.dismiss()
                 self.logger.info("\n  ✅  --> Confirmación CANCELADA.")
             # --- Medición de rendimiento: Fin de la acción sobre la confirmación ---
-            end_time_confirm_action = time.time()
+            end_time_confirm_action = time.perf_counter()
             duration_confirm_action = end_time_confirm_action - start_time_confirm_action
-            self.logger.info(f"PERFORMANCE: Tiempo de acción ('{accion_confirmacion}') sobre la confirmación: {duration_confirm_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de acción ('%s') sobre la confirmación: %.4f segundos.", accion_confirmacion, duration_confirm_action)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_confirm_action, medicion="confirm_action", locator=selector)
 
 
             # 6. Opcional: Verificar el resultado en la página después de la interacción
             # Es crucial para confirmar que la acción en el diálogo tuvo el efecto esperado en la UI.
             # Asumo un selector '#demo' y textos específicos, ajusta esto a tu aplicación real.
             # --- Medición de rendimiento: Inicio de verificación del resultado en la página ---
-            start_time_post_action_verification = time.time()
+            start_time_post_action_verification = time.perf_counter()
             if accion_confirmacion == 'accept':
                 # Esto es un ejemplo, ajusta el selector y el texto esperado
                 expect(self.page.locator("#demo")).to_have_text("You pressed OK!", timeout=5000)
@@ -511,24 +528,26 @@ class DialogActions:
                 self.logger.info("\n  ✅  --> Resultado en página: 'You pressed Cancel!' verificado.")
             
             # --- Medición de rendimiento: Fin de verificación del resultado en la página ---
-            end_time_post_action_verification = time.time()
+            end_time_post_action_verification = time.perf_counter()
             duration_post_action_verification = end_time_post_action_verification - start_time_post_action_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del resultado en la página: {duration_post_action_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación del resultado en la página: %.4f segundos.", duration_post_action_verification)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_post_action_verification, medicion="post_action_verification", locator=selector)
 
 
             self.base.tomar_captura(f"{nombre_base}_confirmacion_exitosa_{accion_confirmacion}", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: La confirmación se mostró, mensaje verificado y '{accion_confirmacion}' correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: La confirmación se mostró, mensaje verificado y '%s' correctamente.", accion_confirmacion)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de confirmación): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificación de confirmación): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_confirmacion_expect_event", duration_total_operation, medicion="total_operation", locator=selector)
 
             return True
 
         except TimeoutError as e:
             # Captura si el selector no está listo o si la confirmación no aparece a tiempo, o la verificación post-acción falla.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
@@ -538,7 +557,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_confirmacion_NO_aparece_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_confirmacion_NO_aparece_timeout", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar confirmación para selector '{selector}'") from e
 
@@ -549,7 +568,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar confirmación para selector '{selector}'") from e
 
@@ -566,10 +585,11 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar confirmación para selector '{selector}'") from e
         
     # 43- Función para verificar una alerta de confirmación
+    @medir_accion
     def verificar_confirmacion_on_dialog(self, selector: Locator, mensaje_esperado: str, accion_confirmacion: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 5.0, tiempo_max_deteccion_confirmacion: Union[int, float] = 7.0) -> bool:
         """
         Verifica una confirmación de tipo 'confirm' que aparece después de un clic,
@@ -590,30 +610,30 @@ class DialogActions:
         Raises:
             AssertionError: Si el elemento no está disponible, el tipo de diálogo es incorrecto o el mensaje no coincide.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de confirmación (Manejo de Eventos Instantáneo): {nombre_base} ---")
-        self.logger.info(f"\nVerificando confirmación al hacer clic en '{selector}' para '{accion_confirmacion}'")
-        self.logger.info(f"\n  --> Mensaje de confirmación esperado: '{mensaje_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de confirmación (Manejo de Eventos Instantáneo): %s ---", nombre_base)
+        self.logger.info("\nVerificando confirmación al hacer clic en '%s' para '%s'", selector, accion_confirmacion)
+        self.logger.info("\n  --> Mensaje de confirmación esperado: '%s'", mensaje_esperado)
 
         if accion_confirmacion not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio, es_fallo=True)
             raise AssertionError(error_msg)
 
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         dialog_handler = None  # Definir antes para el ámbito del bloque finally
 
         def on_dialog(dialog):
             """Manejador de eventos que se ejecuta al instante de aparecer el diálogo."""
             nonlocal dialog_handler  # Para acceder a la variable de ámbito superior
             try:
-                self.logger.debug(f"\n  --> Diálogo detectado instantáneamente. Tipo: '{dialog.type}', Mensaje: '{dialog.message}'")
+                self.logger.debug("\n  --> Diálogo detectado instantáneamente. Tipo: '%s', Mensaje: '%s'", dialog.type, dialog.message)
                 if dialog.type != "confirm":
                     self.logger.error(f"\n⚠️ Tipo de diálogo inesperado: '{dialog.type}'. Se esperaba 'confirm'.")
                     raise AssertionError(f"Tipo de diálogo inesperado: '{dialog.type}'. Se esperaba 'confirm'.")
 
                 if mensaje_esperado not in dialog.message:
-                    self.base.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
+                    self.base.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio, es_fallo=True)
                     error_msg = (
                         f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
                         f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -622,13 +642,13 @@ class DialogActions:
                     self.logger.error(error_msg)
                     raise AssertionError(error_msg)
 
-                self.logger.debug(f"\n  --> Realizando la acción '{accion_confirmacion}' en el diálogo.")
+                self.logger.debug("\n  --> Realizando la acción '%s' en el diálogo.", accion_confirmacion)
                 if accion_confirmacion == 'accept':
                     dialog.accept()
                 elif accion_confirmacion == 'dismiss':
                     dialog.dismiss()
                 
-                self.logger.info(f"\n  ✅  --> Confirmación manejada (acción '{accion_confirmacion}').")
+                self.logger.info("\n  ✅  --> Confirmación manejada (acción '%s').", accion_confirmacion)
 
             except Exception as e:
                 # Captura y registra errores dentro del manejador.
@@ -641,10 +661,10 @@ class DialogActions:
 
         try:
             self.logger.debug("\n--- INICIO del bloque TRY ---")
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2)
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_confirmacion", directorio)
 
@@ -657,7 +677,7 @@ class DialogActions:
             # Usamos page.wait_for_timeout para esperar un tiempo prudencial a que el evento sea manejado.
             # No se recomienda, pero es una alternativa a wait_for_event cuando la acción
             # ya se realiza en el manejador.
-            self.logger.debug(f"\n  --> Esperando {tiempo_max_deteccion_confirmacion}s para que el diálogo sea procesado.")
+            self.logger.debug("\n  --> Esperando %ss para que el diálogo sea procesado.", tiempo_max_deteccion_confirmacion)
             self.page.wait_for_timeout(tiempo_max_deteccion_confirmacion * 1000)
 
             # 5. Verificar el resultado en la página después de la interacción
@@ -670,11 +690,12 @@ class DialogActions:
                 self.logger.info("\n  ✅  --> Resultado en página: 'You pressed Cancel!' verificado.")
             
             self.base.tomar_captura(f"{nombre_base}_confirmacion_exitosa_{accion_confirmacion}", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: La confirmación se mostró y se manejó correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: La confirmación se mostró y se manejó correctamente.")
             
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación: {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_confirmacion_on_dialog", duration_total_operation, medicion="total_operation", locator=selector)
             
             return True
 
@@ -682,7 +703,7 @@ class DialogActions:
             self.logger.debug("\n--- INICIO del bloque EXCEPT ---")
             if dialog_handler:
                 self.page.off("dialog", dialog_handler)
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO: Ocurrió un error al verificar la confirmación.\n"
@@ -690,11 +711,12 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"Error inesperado al verificar confirmación para selector '{selector}'") from e
     
     # 44- Función para verificar_prompt_expect_event (Implementación para Prompt Alert con expect_event).
     # Integra pruebas de rendimiento para medir la aparición, interacción y manejo de un diálogo prompt.
+    @medir_accion
     def verificar_prompt_expect_event(self, selector: Locator, mensaje_prompt_esperado: str, input_text: Optional[str], accion_prompt: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_prompt: Union[int, float] = 0.7) -> bool:
         """
         Verifica un cuadro de diálogo 'prompt' que aparece después de hacer clic en un selector dado.
@@ -733,63 +755,65 @@ class DialogActions:
                             si la acción del prompt no es válida, si `input_text` es incorrecto
                             para la acción, o si ocurre un error inesperado de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de prompt con expect_event: {nombre_base} ---")
-        self.logger.info(f"\nVerificando prompt al hacer clic en '{selector}' para '{accion_prompt}'")
-        self.logger.info(f"\n  --> Mensaje del prompt esperado: '{mensaje_prompt_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de prompt con expect_event: %s ---", nombre_base)
+        self.logger.info("\nVerificando prompt al hacer clic en '%s' para '%s'", selector, accion_prompt)
+        self.logger.info("\n  --> Mensaje del prompt esperado: '%s'", mensaje_prompt_esperado)
         if accion_prompt == 'accept':
-            self.logger.info(f"\n  --> Texto a introducir: '{input_text}'")
+            self.logger.info("\n  --> Texto a introducir: '%s'", input_text)
 
         # Validar la acción y el input_text antes de iniciar la operación
         if accion_prompt not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio, es_fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'accept' and input_text is None:
             error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
+            self.base.tomar_captura(f"{nombre_base}_input_text_missing", directorio, es_fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Validar visibilidad y habilitación del selector que disparará el prompt
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
             # --- Medición de rendimiento: Inicio de visibilidad y habilitación del elemento ---
-            start_time_element_ready = time.time()
+            start_time_element_ready = time.perf_counter()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
-            end_time_element_ready = time.time()
+            end_time_element_ready = time.perf_counter()
             duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo para que el elemento disparador esté listo: %.4f segundos.", duration_element_ready)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_element_ready, medicion="element_ready", locator=selector)
             
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_prompt", directorio)
 
             # 2. Esperar el evento de diálogo (prompt) y hacer clic en el selector
-            self.logger.debug(f"\n  --> Preparando expect_event para el prompt y haciendo clic (timeout de prompt: {tiempo_espera_prompt}s)...")
+            self.logger.debug("\n  --> Preparando expect_event para el prompt y haciendo clic (timeout de prompt: %ss)...", tiempo_espera_prompt)
             
             # Se usa `timeout` en `expect_event` para el tiempo máximo de aparición del prompt.
             # Se usa `timeout` en `click` para el tiempo máximo de clic en el elemento.
             with self.page.expect_event("dialog") as info_dialogo:
                 # --- Medición de rendimiento: Inicio de click y espera de prompt ---
-                start_time_prompt_detection = time.time()
-                self.logger.debug(f"\n  --> Haciendo clic en el botón '{selector}' para disparar el prompt...")
+                start_time_prompt_detection = time.perf_counter()
+                self.logger.debug("\n  --> Haciendo clic en el botón '%s' para disparar el prompt...", selector)
                 selector.click()
             
             dialogo: Dialog = info_dialogo.value # Obtener el objeto Dialog del prompt
             # --- Medición de rendimiento: Fin de click y espera de prompt ---
-            end_time_prompt_detection = time.time()
+            end_time_prompt_detection = time.perf_counter()
             duration_prompt_detection = end_time_prompt_detection - start_time_prompt_detection
-            self.logger.info(f"PERFORMANCE: Tiempo desde el clic hasta la detección del prompt: {duration_prompt_detection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo desde el clic hasta la detección del prompt: %.4f segundos.", duration_prompt_detection)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_prompt_detection, medicion="prompt_detection", locator=selector)
 
-            self.logger.info(f"\n  --> Prompt detectado. Tipo: '{dialogo.type}', Mensaje: '{dialogo.message}', Valor por defecto: '{dialogo.default_value}'")
+            self.logger.info("\n  --> Prompt detectado. Tipo: '%s', Mensaje: '%s', Valor por defecto: '%s'", dialogo.type, dialogo.message, dialogo.default_value)
             self.base.tomar_captura(f"{nombre_base}_prompt_detectado", directorio)
 
             # 3. Validar el tipo de diálogo
@@ -805,9 +829,9 @@ class DialogActions:
 
             # 4. Validar el mensaje del prompt
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
-            start_time_message_verification = time.time()
+            start_time_message_verification = time.perf_counter()
             if mensaje_prompt_esperado not in dialogo.message:
-                self.base.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
+                self.base.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
@@ -822,59 +846,63 @@ class DialogActions:
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             # --- Medición de rendimiento: Fin de verificación del mensaje ---
-            end_time_message_verification = time.time()
+            end_time_message_verification = time.perf_counter()
             duration_message_verification = end_time_message_verification - start_time_message_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del mensaje del prompt: {duration_message_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación del mensaje del prompt: %.4f segundos.", duration_message_verification)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_message_verification, medicion="message_verification", locator=selector)
 
             # 5. Realizar la acción solicitada (Introducir texto y Aceptar, o Cancelar)
             # --- Medición de rendimiento: Inicio de la acción sobre el prompt ---
-            start_time_prompt_action = time.time()
+            start_time_prompt_action = time.perf_counter()
             if accion_prompt == 'accept':
                 # El método `accept()` para prompts puede tomar un argumento `promptText`
                 dialogo.accept(input_text)
-                self.logger.info(f"\n  ✅  --> Texto '{input_text}' introducido en el prompt y ACEPTADO.")
+                self.logger.info("\n  ✅  --> Texto '%s' introducido en el prompt y ACEPTADO.", input_text)
             elif accion_prompt == 'dismiss':
                 dialogo.dismiss()
                 self.logger.info("\n  ✅  --> Prompt CANCELADO.")
             # No se necesita 'else' aquí, ya se validó 'accion_prompt' al principio
             # --- Medición de rendimiento: Fin de la acción sobre el prompt ---
-            end_time_prompt_action = time.time()
+            end_time_prompt_action = time.perf_counter()
             duration_prompt_action = end_time_prompt_action - start_time_prompt_action
-            self.logger.info(f"PERFORMANCE: Tiempo de acción ('{accion_prompt}') sobre el prompt: {duration_prompt_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de acción ('%s') sobre el prompt: %.4f segundos.", accion_prompt, duration_prompt_action)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_prompt_action, medicion="prompt_action", locator=selector)
 
 
             # 6. Opcional: Verificar el resultado en la página después de la interacción
             # Es crucial para confirmar que la acción en el diálogo tuvo el efecto esperado en la UI.
             # Asumo un selector '#demo' y textos específicos, ajusta esto a tu aplicación real.
             # --- Medición de rendimiento: Inicio de verificación del resultado en la página ---
-            start_time_post_action_verification = time.time()
+            start_time_post_action_verification = time.perf_counter()
             if accion_prompt == 'accept':
                 # Ejemplo: Si el texto introducido se muestra en un elemento de la página
                 expect(self.page.locator("#demo")).to_have_text(f"You entered: {input_text}")
-                self.logger.info(f"\n  ✅  --> Resultado en página: 'You entered: {input_text}' verificado.")
+                self.logger.info("\n  ✅  --> Resultado en página: 'You entered: %s' verificado.", input_text)
             elif accion_prompt == 'dismiss':
                 # Ejemplo: Si se muestra un mensaje de cancelación
                 expect(self.page.locator("#demo")).to_have_text("You cancelled the prompt.")
                 self.logger.info("\n  ✅  --> Resultado en página: 'You cancelled the prompt.' verificado.")
             
             # --- Medición de rendimiento: Fin de verificación del resultado en la página ---
-            end_time_post_action_verification = time.time()
+            end_time_post_action_verification = time.perf_counter()
             duration_post_action_verification = end_time_post_action_verification - start_time_post_action_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación del resultado en la página: {duration_post_action_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación del resultado en la página: %.4f segundos.", duration_post_action_verification)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_post_action_verification, medicion="post_action_verification", locator=selector)
 
             self.base.tomar_captura(f"{nombre_base}_prompt_exitosa_{accion_prompt}", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: El prompt se mostró, mensaje verificado, texto introducido y '{accion_prompt}' correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: El prompt se mostró, mensaje verificado, texto introducido y '%s' correctamente.", accion_prompt)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de prompt): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificación de prompt): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_prompt_expect_event", duration_total_operation, medicion="total_operation", locator=selector)
 
             return True
 
         except TimeoutError as e:
             # Captura si el selector no está listo o si el prompt no aparece a tiempo, o la verificación post-acción falla.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo listo, "
@@ -884,7 +912,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_prompt_NO_aparece_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_prompt_NO_aparece_timeout", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar prompt para selector '{selector}'") from e
 
@@ -895,7 +923,7 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar prompt para selector '{selector}'") from e
 
@@ -912,11 +940,12 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar prompt para selector '{selector}'") from e
 
     # 45- Función para verificar una alerta de tipo 'prompt' utilizando page.on("dialog") con page.once().
     # Este método registra un oyente de eventos para manejar el diálogo antes de hacer clic.
+    @medir_accion
     def verificar_prompt_on_dialog(self, selector: Locator, mensaje_prompt_esperado: str, input_text: Optional[str], accion_prompt: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 5.0, tiempo_max_deteccion_prompt: Union[int, float] = 7.0) -> bool:
         """
         Verifica un cuadro de diálogo 'prompt' que aparece después de hacer clic en un selector.
@@ -940,11 +969,11 @@ class DialogActions:
             AssertionError: Si el elemento no está disponible, el prompt no aparece, el tipo de diálogo es
                             incorrecto, el mensaje no coincide, o el texto de entrada es incorrecto.
         """
-        self.logger.info(f"\n--- Ejecutando verificación de prompt con page.once('dialog'): {nombre_base} ---")
-        self.logger.info(f"\nVerificando prompt al hacer clic en '{selector}' para '{accion_prompt}'")
-        self.logger.info(f"\n  --> Mensaje del prompt esperado: '{mensaje_prompt_esperado}'")
+        self.logger.info("\n--- Ejecutando verificación de prompt con page.once('dialog'): %s ---", nombre_base)
+        self.logger.info("\nVerificando prompt al hacer clic en '%s' para '%s'", selector, accion_prompt)
+        self.logger.info("\n  --> Mensaje del prompt esperado: '%s'", mensaje_prompt_esperado)
         if accion_prompt == 'accept':
-            self.logger.info(f"\n  --> Texto a introducir: '{input_text}'")
+            self.logger.info("\n  --> Texto a introducir: '%s'", input_text)
 
         # Resetear el estado para cada ejecución del test
         self._alerta_detectada = False
@@ -956,44 +985,45 @@ class DialogActions:
         if accion_prompt not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.base.tomar_captura(f"{nombre_base}_accion_invalida", directorio, es_fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'accept' and input_text is None:
             error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
+            self.base.tomar_captura(f"{nombre_base}_input_text_missing", directorio, es_fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
 
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             self.logger.debug("\n--- INICIO del bloque TRY ---")
             
             # 1. Validar visibilidad y habilitación del selector
-            self.logger.debug(f"\n  --> Validando visibilidad y habilitación del botón '{selector}' (timeout: {tiempo_espera_elemento}s)...")
-            start_time_element_ready = time.time()
+            self.logger.debug("\n  --> Validando visibilidad y habilitación del botón '%s' (timeout: %ss)...", selector, tiempo_espera_elemento)
+            start_time_element_ready = time.perf_counter()
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.logger.debug("\n  --> Elemento resaltado.")
             self.base.esperar_fijo(0.2)
-            end_time_element_ready = time.time()
+            end_time_element_ready = time.perf_counter()
             duration_element_ready = end_time_element_ready - start_time_element_ready
-            self.logger.info(f"PERFORMANCE: Tiempo para que el elemento disparador esté listo: {duration_element_ready:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo para que el elemento disparador esté listo: %.4f segundos.", duration_element_ready)
+            self.base.registrar_metrica("verificar_prompt_on_dialog", duration_element_ready, medicion="element_ready", locator=selector)
             self.base.tomar_captura(f"{nombre_base}_elemento_listo_para_prompt", directorio)
 
             # 2. Establecer el oyente del evento y disparar la acción
-            self.logger.debug(f"\n  --> Preparando la espera del evento 'dialog' y haciendo clic en '{selector}'...")
-            start_time_click_and_prompt_detection = time.time()
+            self.logger.debug("\n  --> Preparando la espera del evento 'dialog' y haciendo clic en '%s'...", selector)
+            start_time_click_and_prompt_detection = time.perf_counter()
 
             # El orden es crucial: registrar el oyente antes de hacer clic
             # CORRECCIÓN AQUÍ: Se llama al método _get_prompt_dialog_handler_for_on
             self.page.once("dialog", self._get_prompt_dialog_handler_for_on(input_text, accion_prompt))
 
             # Hacer clic en el botón que dispara el prompt. Usamos `no_wait_after=True` para prevenir el deadlock.
-            self.logger.debug(f"\n  --> Oyente 'dialog' registrado. Haciendo clic en el botón ahora...")
+            self.logger.debug("\n  --> Oyente 'dialog' registrado. Haciendo clic en el botón ahora...")
             selector.click(timeout=15000, no_wait_after=True)
 
             # Esperar a que el listener haya detectado y manejado el prompt. 
@@ -1009,7 +1039,7 @@ class DialogActions:
                 raise AssertionError(error_msg)
 
             if mensaje_prompt_esperado not in self._alerta_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
@@ -1020,7 +1050,7 @@ class DialogActions:
             
             # 4. Verificar que el texto introducido (si es el caso) se ha guardado correctamente
             if accion_prompt == 'accept' and self._alerta_input_capturado != input_text:
-                self.base.tomar_captura(f"{nombre_base}_prompt_input_incorrecto", directorio)
+                self.base.tomar_captura(f"{nombre_base}_prompt_input_incorrecto", directorio, es_fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Texto introducido en el prompt incorrecto.\n"
                     f"  --> Esperado: '{input_text}'\n"
@@ -1030,17 +1060,18 @@ class DialogActions:
                 raise AssertionError(error_msg)
 
             self.base.tomar_captura(f"{nombre_base}_prompt_exitosa_{accion_prompt}", directorio)
-            self.logger.info(f"\n✅  --> ÉXITO: El prompt se mostró, mensaje verificado, y acción '{accion_prompt}' completada correctamente.")
+            self.logger.info("\n✅  --> ÉXITO: El prompt se mostró, mensaje verificado, y acción '%s' completada correctamente.", accion_prompt)
             
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación: {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_prompt_on_dialog", duration_total_operation, medicion="total_operation", locator=selector)
             
             return True
 
         except Exception as e:
             self.logger.debug("\n--- INICIO del bloque EXCEPT ---")
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO: Ocurrió un error inesperado al verificar el prompt.\n"
@@ -1048,5 +1079,5 @@ class DialogActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"Error inesperado al verificar prompt para selector '{selector}'") from e
\ No newline at end of file
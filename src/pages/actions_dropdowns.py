@@ -2,6 +2,8 @@ import time
 from typing import Union, Optional, Dict, Any, List
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+
 class DropdownActions:
     def __init__(self, base_page):
         self.base = base_page
@@ -10,6 +12,7 @@ class DropdownActions:
         
         # 53- Función para seleccionar una opción en un ComboBox (elemento <select>) por su atributo 'value'.
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
+    @medir_accion
     def seleccionar_opcion_por_valor(self, combobox_locator: Locator, valor_a_seleccionar: str, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona una opción dentro de un elemento ComboBox (`<select>`) utilizando su atributo 'value'.
@@ -30,60 +33,64 @@ class DropdownActions:
             AssertionError: Si el ComboBox no es visible/habilitado, la opción no se puede seleccionar,
                             la selección no se verifica correctamente o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de '{valor_a_seleccionar}' en ComboBox por valor: '{combobox_locator}' ---")
+        self.logger.info("\n--- %s: Iniciando selección de '%s' en ComboBox por valor: '%s' ---", nombre_paso, valor_a_seleccionar, combobox_locator)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
-            self.logger.info(f"\n🔍 Esperando que el ComboBox '{combobox_locator}' sea visible y habilitado...")
+            self.logger.info("\n🔍 Esperando que el ComboBox '%s' sea visible y habilitado...", combobox_locator)
             # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
+            start_time_validation = time.perf_counter()
             expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_locator) # Para visualización durante la ejecución
             expect(combobox_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de validación de visibilidad y habilitación: %.4f segundos.", duration_validation)
+            self.base.registrar_metrica("seleccionar_opcion_por_valor", duration_validation, medicion="validation")
             
-            self.logger.info(f"\n✅ ComboBox '{combobox_locator}' es visible y habilitado.")
+            self.logger.info("\n✅ ComboBox '%s' es visible y habilitado.", combobox_locator)
             
             # 2. Tomar captura antes de la selección
             self.base.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo", directorio)
 
             # 3. Seleccionar la opción por su valor
-            self.logger.info(f"\n🔄 Seleccionando opción '{valor_a_seleccionar}' en '{combobox_locator}'...")
+            self.logger.info("\n🔄 Seleccionando opción '%s' en '%s'...", valor_a_seleccionar, combobox_locator)
             # --- Medición de rendimiento: Inicio selección ---
-            start_time_selection = time.time()
+            start_time_selection = time.perf_counter()
             combobox_locator.select_option(value=valor_a_seleccionar, timeout=timeout_ms) # Asegúrate de pasar el 'value=' explícitamente si es necesario
             # --- Medición de rendimiento: Fin selección ---
-            end_time_selection = time.time()
+            end_time_selection = time.perf_counter()
             duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de la opción: {duration_selection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de selección de la opción: %.4f segundos.", duration_selection)
+            self.base.registrar_metrica("seleccionar_opcion_por_valor", duration_selection, medicion="selection")
             
-            self.logger.info(f"\n✅ Opción '{valor_a_seleccionar}' seleccionada exitosamente en '{combobox_locator}'.")
+            self.logger.info("\n✅ Opción '%s' seleccionada exitosamente en '%s'.", valor_a_seleccionar, combobox_locator)
 
             # 4. Verificar que la opción fue seleccionada correctamente
-            self.logger.info(f"\n🔍 Verificando que ComboBox '{combobox_locator}' tenga el valor '{valor_a_seleccionar}'...")
+            self.logger.info("\n🔍 Verificando que ComboBox '%s' tenga el valor '%s'...", combobox_locator, valor_a_seleccionar)
             # --- Medición de rendimiento: Inicio verificación ---
-            start_time_verification = time.time()
+            start_time_verification = time.perf_counter()
             expect(combobox_locator).to_have_value(valor_a_seleccionar, timeout=timeout_ms)
             # --- Medición de rendimiento: Fin verificación ---
-            end_time_verification = time.time()
+            end_time_verification = time.perf_counter()
             duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la selección: {duration_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de la selección: %.4f segundos.", duration_verification)
+            self.base.registrar_metrica("seleccionar_opcion_por_valor", duration_verification, medicion="verification")
             
-            self.logger.info(f"\n✅ ComboBox '{combobox_locator}' verificado con valor '{valor_a_seleccionar}'.")
+            self.logger.info("\n✅ ComboBox '%s' verificado con valor '%s'.", combobox_locator, valor_a_seleccionar)
 
             # 5. Tomar captura después de la selección exitosa
             self.base.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_exito", directorio)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_opcion_por_valor", duration_total_operation, medicion="total_operation")
 
         except TimeoutError as e:
             # Captura TimeoutError específicamente para mensajes más claros
@@ -93,7 +100,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -104,7 +111,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -114,11 +121,12 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
         
     # 54- Función para seleccionar una opción en un ComboBox (elemento <select>) por su texto visible (label).
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
+    @medir_accion
     def seleccionar_opcion_por_label(self, combobox_locator: Locator, label_a_seleccionar: str, nombre_base: str, directorio: str, value_esperado: Optional[str] = None, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona una opción dentro de un elemento ComboBox (`<select>`) utilizando su texto visible (label).
@@ -143,42 +151,44 @@ class DropdownActions:
             AssertionError: Si el ComboBox no es visible/habilitado, la opción no se puede seleccionar,
                             la selección no se verifica correctamente o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de '{label_a_seleccionar}' en ComboBox por label: '{combobox_locator}' ---")
+        self.logger.info("\n--- %s: Iniciando selección de '%s' en ComboBox por label: '%s' ---", nombre_paso, label_a_seleccionar, combobox_locator)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
-            self.logger.info(f"\n🔍 Esperando que el ComboBox '{combobox_locator}' sea visible y habilitado...")
+            self.logger.info("\n🔍 Esperando que el ComboBox '%s' sea visible y habilitado...", combobox_locator)
             # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
+            start_time_validation = time.perf_counter()
             expect(combobox_locator).to_be_visible()
-            combobox_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_locator) # Para visualización durante la ejecución
             expect(combobox_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de validación de visibilidad y habilitación: %.4f segundos.", duration_validation)
+            self.base.registrar_metrica("seleccionar_opcion_por_label", duration_validation, medicion="validation")
             
-            self.logger.info(f"\n✅ ComboBox '{combobox_locator}' es visible y habilitado.")
+            self.logger.info("\n✅ ComboBox '%s' es visible y habilitado.", combobox_locator)
             
             # 2. Tomar captura antes de la selección
             self.base.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo_label", directorio)
 
             # 3. Seleccionar la opción por su texto visible (label)
-            self.logger.info(f"\n🔄 Seleccionando opción con texto '{label_a_seleccionar}' en '{combobox_locator}'...")
+            self.logger.info("\n🔄 Seleccionando opción con texto '%s' en '%s'...", label_a_seleccionar, combobox_locator)
             # --- Medición de rendimiento: Inicio selección ---
-            start_time_selection = time.time()
+            start_time_selection = time.perf_counter()
             # El método select_option() espera automáticamente a que el elemento
             # sea visible, habilitado y con la opción disponible.
             combobox_locator.select_option(label=label_a_seleccionar) # Usa 'label=' para claridad
             # --- Medición de rendimiento: Fin selección ---
-            end_time_selection = time.time()
+            end_time_selection = time.perf_counter()
             duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de la opción por label: {duration_selection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de selección de la opción por label: %.4f segundos.", duration_selection)
+            self.base.registrar_metrica("seleccionar_opcion_por_label", duration_selection, medicion="selection")
             
-            self.logger.info(f"\n✅ Opción '{label_a_seleccionar}' seleccionada exitosamente en '{combobox_locator}' por label.")
+            self.logger.info("\n✅ Opción '%s' seleccionada exitosamente en '%s' por label.", label_a_seleccionar, combobox_locator)
 
             # 4. Verificar que la opción fue seleccionada correctamente
             # Usamos to_have_value() para asegurar que el valor del select cambió al esperado.
@@ -186,25 +196,27 @@ class DropdownActions:
             # o incluir espacios, mientras que el 'value' es el dato real subyacente.
             valor_para_comparar_verificacion = value_esperado if value_esperado is not None else label_a_seleccionar
             
-            self.logger.info(f"\n🔍 Verificando que ComboBox '{combobox_locator}' tenga el valor esperado '{valor_para_comparar_verificacion}'...")
+            self.logger.info("\n🔍 Verificando que ComboBox '%s' tenga el valor esperado '%s'...", combobox_locator, valor_para_comparar_verificacion)
             # --- Medición de rendimiento: Inicio verificación ---
-            start_time_verification = time.time()
+            start_time_verification = time.perf_counter()
             expect(combobox_locator).to_have_value(valor_para_comparar_verificacion)
             # --- Medición de rendimiento: Fin verificación ---
-            end_time_verification = time.time()
+            end_time_verification = time.perf_counter()
             duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la selección: {duration_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de la selección: %.4f segundos.", duration_verification)
+            self.base.registrar_metrica("seleccionar_opcion_por_label", duration_verification, medicion="verification")
             
-            self.logger.info(f"\n✅ ComboBox '{combobox_locator}' verificado con valor seleccionado '{valor_para_comparar_verificacion}'.")
+            self.logger.info("\n✅ ComboBox '%s' verificado con valor seleccionado '%s'.", combobox_locator, valor_para_comparar_verificacion)
 
             # 5. Tomar captura después de la selección exitosa
             # Asegura que la captura refleje el estado final y el valor seleccionado
             self.base.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_label_exito", directorio)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox por label): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox por label): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_opcion_por_label", duration_total_operation, medicion="total_operation")
 
         except TimeoutError as e:
             mensaje_error = (
@@ -213,7 +225,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_combo_label", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_combo_label", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -223,7 +235,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo_label", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo_label", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -232,11 +244,12 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_combo_label", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_combo_label", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
             
     # 56- Función optimizada para seleccionar múltiples opciones en un ComboBox múltiple.
     # Integra pruebas de rendimiento utilizando mediciones de tiempo para cada fase clave.
+    @medir_accion
     def seleccionar_multiples_opciones_combo(self, combobox_multiple_locator: Locator, valores_a_seleccionar: List[str], nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
         """
         Selecciona múltiples opciones en un ComboBox (`<select multiple>`) por sus valores o labels.
@@ -258,29 +271,30 @@ class DropdownActions:
             AssertionError: Si el ComboBox no es visible/habilitado, las opciones no se pueden seleccionar,
                             la verificación de las selecciones falla o si ocurre un error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Iniciando selección de múltiples opciones {valores_a_seleccionar} en ComboBox: '{combobox_multiple_locator}' ---")
+        self.logger.info("\n--- %s: Iniciando selección de múltiples opciones %s en ComboBox: '%s' ---", nombre_paso, valores_a_seleccionar, combobox_multiple_locator)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que el ComboBox esté visible y habilitado
-            self.logger.info(f"\n🔍 Esperando que el ComboBox múltiple '{combobox_multiple_locator}' sea visible y habilitado...")
+            self.logger.info("\n🔍 Esperando que el ComboBox múltiple '%s' sea visible y habilitado...", combobox_multiple_locator)
             # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
+            start_time_validation = time.perf_counter()
             expect(combobox_multiple_locator).to_be_visible()
-            combobox_multiple_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(combobox_multiple_locator) # Para visualización durante la ejecución
             expect(combobox_multiple_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación: {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de validación de visibilidad y habilitación: %.4f segundos.", duration_validation)
+            self.base.registrar_metrica("seleccionar_multiples_opciones_combo", duration_validation, medicion="validation")
             
-            self.logger.info(f"\n✅ ComboBox múltiple '{combobox_multiple_locator}' es visible y habilitado.")
+            self.logger.info("\n✅ ComboBox múltiple '%s' es visible y habilitado.", combobox_multiple_locator)
             
             # Opcional: Verificar que sea un select múltiple.
             # Esta aserción es útil para fallar temprano si el locator no apunta al tipo de elemento correcto.
-            self.logger.debug(f"\nVerificando que '{combobox_multiple_locator}' sea un <select multiple>...")
+            self.logger.debug("\nVerificando que '%s' sea un <select multiple>...", combobox_multiple_locator)
             expect(combobox_multiple_locator).to_have_attribute("multiple") # El atributo 'multiple' existe
             self.logger.debug("\n  > ComboBox verificado como select múltiple.")
 
@@ -288,39 +302,42 @@ class DropdownActions:
             self.base.tomar_captura(f"{nombre_base}_antes_de_seleccionar_multi_combo", directorio)
 
             # 3. Seleccionar las opciones
-            self.logger.info(f"\n🔄 Seleccionando opciones '{valores_a_seleccionar}' en '{combobox_multiple_locator}'...")
+            self.logger.info("\n🔄 Seleccionando opciones '%s' en '%s'...", valores_a_seleccionar, combobox_multiple_locator)
             # --- Medición de rendimiento: Inicio selección de múltiples opciones ---
-            start_time_selection = time.time()
+            start_time_selection = time.perf_counter()
             # Playwright's select_option() para listas maneja tanto valores como labels.
             # Pasando una lista de strings seleccionará las opciones correspondientes.
             combobox_multiple_locator.select_option(valores_a_seleccionar)
             # --- Medición de rendimiento: Fin selección de múltiples opciones ---
-            end_time_selection = time.time()
+            end_time_selection = time.perf_counter()
             duration_selection = end_time_selection - start_time_selection
-            self.logger.info(f"PERFORMANCE: Tiempo de selección de las múltiples opciones: {duration_selection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de selección de las múltiples opciones: %.4f segundos.", duration_selection)
+            self.base.registrar_metrica("seleccionar_multiples_opciones_combo", duration_selection, medicion="selection")
             
-            self.logger.info(f"\n✅ Opciones '{valores_a_seleccionar}' seleccionadas exitosamente en '{combobox_multiple_locator}'.")
+            self.logger.info("\n✅ Opciones '%s' seleccionadas exitosamente en '%s'.", valores_a_seleccionar, combobox_multiple_locator)
 
             # 4. Verificar que las opciones fueron seleccionadas correctamente
-            self.logger.info(f"\n🔍 Verificando que ComboBox múltiple '{combobox_multiple_locator}' tenga los valores seleccionados: {valores_a_seleccionar}...")
+            self.logger.info("\n🔍 Verificando que ComboBox múltiple '%s' tenga los valores seleccionados: %s...", combobox_multiple_locator, valores_a_seleccionar)
             # --- Medición de rendimiento: Inicio verificación de selecciones ---
-            start_time_verification = time.time()
+            start_time_verification = time.perf_counter()
             # to_have_values() es la aserción correcta para verificar múltiples selecciones por su 'value'.
             expect(combobox_multiple_locator).to_have_values(valores_a_seleccionar)
             # --- Medición de rendimiento: Fin verificación de selecciones ---
-            end_time_verification = time.time()
+            end_time_verification = time.perf_counter()
             duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de las selecciones: {duration_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de las selecciones: %.4f segundos.", duration_verification)
+            self.base.registrar_metrica("seleccionar_multiples_opciones_combo", duration_verification, medicion="verification")
             
-            self.logger.info(f"\n✅ ComboBox múltiple '{combobox_multiple_locator}' verificado con valores seleccionados: {valores_a_seleccionar}.")
+            self.logger.info("\n✅ ComboBox múltiple '%s' verificado con valores seleccionados: %s.", combobox_multiple_locator, valores_a_seleccionar)
 
             # 5. Tomar captura después de la selección exitosa
             self.base.tomar_captura(f"{nombre_base}_despues_de_seleccionar_multi_combo_exito", directorio)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox múltiple): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (seleccionar ComboBox múltiple): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_multiples_opciones_combo", duration_total_operation, medicion="total_operation")
 
         except TimeoutError as e:
             mensaje_error = (
@@ -329,7 +346,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_multi_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_multi_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -339,7 +356,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_multi_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_multi_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -348,11 +365,12 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_multi_combo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_multi_combo", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
         
     # 57- Función que obtiene y imprime los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción de datos del dropdown.
+    @medir_accion
     def obtener_valores_dropdown(self, selector_dropdown: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> Optional[List[Dict[str, str]]]:
         """
         Obtiene los atributos 'value' y el texto visible de todas las opciones (`<option>`)
@@ -377,49 +395,51 @@ class DropdownActions:
             AssertionError: Si el dropdown no es visible/habilitado, o si ocurre un error inesperado
                             durante la extracción de los datos.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Extrayendo valores del dropdown '{selector_dropdown}' ---")
+        self.logger.info("\n--- %s: Extrayendo valores del dropdown '%s' ---", nombre_paso, selector_dropdown)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         valores_opciones: List[Dict[str, str]] = []
 
         try:
             # 1. Asegurar que el dropdown es visible y habilitado
-            self.logger.info(f"\n🔍 Esperando que el dropdown '{selector_dropdown}' sea visible y habilitado...")
+            self.logger.info("\n🔍 Esperando que el dropdown '%s' sea visible y habilitado...", selector_dropdown)
             # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
+            start_time_validation = time.perf_counter()
             expect(selector_dropdown).to_be_visible()
-            selector_dropdown.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(selector_dropdown) # Para visualización durante la ejecución
             expect(selector_dropdown).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: %.4f segundos.", duration_validation)
+            self.base.registrar_metrica("obtener_valores_dropdown", duration_validation, medicion="validation", locator=selector_dropdown)
             
-            self.logger.info(f"\n✅ Dropdown '{selector_dropdown}' es visible y habilitado.")
+            self.logger.info("\n✅ Dropdown '%s' es visible y habilitado.", selector_dropdown)
             self.base.tomar_captura(f"{nombre_base}_dropdown_antes_extraccion", directorio)
 
             # 2. Obtener todos los locators de las opciones dentro del dropdown
-            self.logger.info(f"\n🔄 Obteniendo locators de todas las opciones dentro de '{selector_dropdown}'...")
+            self.logger.info("\n🔄 Obteniendo locators de todas las opciones dentro de '%s'...", selector_dropdown)
             # --- Medición de rendimiento: Inicio obtención de option locators ---
-            start_time_get_options = time.time()
+            start_time_get_options = time.perf_counter()
             option_locators = selector_dropdown.locator("option").all()
             # --- Medición de rendimiento: Fin obtención de option locators ---
-            end_time_get_options = time.time()
+            end_time_get_options = time.perf_counter()
             duration_get_options = end_time_get_options - start_time_get_options
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de todos los option locators: {duration_get_options:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de obtención de todos los option locators: %.4f segundos.", duration_get_options)
+            self.base.registrar_metrica("obtener_valores_dropdown", duration_get_options, medicion="get_options", locator=selector_dropdown)
 
             if not option_locators:
                 self.logger.warning(f"\n⚠️ No se encontraron opciones dentro del dropdown '{selector_dropdown}'.")
                 self.base.tomar_captura(f"{nombre_base}_dropdown_sin_opciones", directorio)
                 return None
 
-            self.logger.info(f"\n Encontradas {len(option_locators)} opciones para '{selector_dropdown}':")
+            self.logger.info("\n Encontradas %s opciones para '%s':", len(option_locators), selector_dropdown)
 
             # 3. Iterar sobre cada opción y extraer su 'value' y 'text_content'
             self.logger.info("\n📊 Extrayendo valores y textos de cada opción...")
             # --- Medición de rendimiento: Inicio iteración y extracción ---
-            start_time_extract_loop = time.time()
+            start_time_extract_loop = time.perf_counter()
             for i, option_locator in enumerate(option_locators):
                 value = option_locator.get_attribute("value")
                 text = option_locator.text_content()
@@ -429,14 +449,15 @@ class DropdownActions:
                 clean_text = text.strip() if text is not None else "" # Manejo de None para text_content
 
                 valores_opciones.append({'value': clean_value, 'text': clean_text})
-                self.logger.info(f"  Opción {i+1}: Value='{clean_value}', Text='{clean_text}'")
+                self.logger.info("  Opción %s: Value='%s', Text='%s'", i+1, clean_value, clean_text)
             # --- Medición de rendimiento: Fin iteración y extracción ---
-            end_time_extract_loop = time.time()
+            end_time_extract_loop = time.perf_counter()
             duration_extract_loop = end_time_extract_loop - start_time_extract_loop
-            self.logger.info(f"PERFORMANCE: Tiempo de iteración y extracción de {len(option_locators)} opciones: {duration_extract_loop:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de iteración y extracción de %s opciones: %.4f segundos.", len(option_locators), duration_extract_loop)
+            self.base.registrar_metrica("obtener_valores_dropdown", duration_extract_loop, medicion="extract_loop", locator=selector_dropdown)
 
 
-            self.logger.info(f"\n✅ Valores obtenidos exitosamente del dropdown '{selector_dropdown}'.")
+            self.logger.info("\n✅ Valores obtenidos exitosamente del dropdown '%s'.", selector_dropdown)
             self.base.tomar_captura(f"{nombre_base}_dropdown_valores_extraidos", directorio)
             return valores_opciones
 
@@ -447,7 +468,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -456,7 +477,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -465,16 +486,18 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener valores dropdown): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (obtener valores dropdown): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("obtener_valores_dropdown", duration_total_operation, medicion="total_operation", locator=selector_dropdown)
         
     # 58- Función que obtiene y compara los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción y comparación de datos.
+    @medir_accion
     def obtener_y_comparar_valores_dropdown(self, dropdown_locator: Locator, nombre_base: str, directorio: str, expected_options: Optional[List[Union[str, Dict[str, str]]]] = None, compare_by_text: bool = True, compare_by_value: bool = False, nombre_paso: str = "", timeout_ms: int = 15000) -> Optional[List[Dict[str, str]]]:
         """
         Obtiene los atributos 'value' y el texto visible de todas las opciones (`<option>`)
@@ -511,37 +534,39 @@ class DropdownActions:
                             si no se encuentran opciones cuando se esperaban,
                             o si la comparación de opciones falla.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Extrayendo y comparando valores del dropdown '{dropdown_locator}' ---")
+        self.logger.info("\n--- %s: Extrayendo y comparando valores del dropdown '%s' ---", nombre_paso, dropdown_locator)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         valores_opciones_reales: List[Dict[str, str]] = []
 
         try:
             # 1. Asegurar que el dropdown es visible y habilitado
-            self.logger.info(f"\n🔍 Esperando que el dropdown '{dropdown_locator}' sea visible y habilitado...")
+            self.logger.info("\n🔍 Esperando que el dropdown '%s' sea visible y habilitado...", dropdown_locator)
             # --- Medición de rendimiento: Inicio validación/espera ---
-            start_time_validation = time.time()
+            start_time_validation = time.perf_counter()
             expect(dropdown_locator).to_be_visible()
-            dropdown_locator.highlight() # Para visualización durante la ejecución
+            self.base.resaltar_elemento(dropdown_locator) # Para visualización durante la ejecución
             expect(dropdown_locator).to_be_enabled()
             # --- Medición de rendimiento: Fin validación/espera ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de validación de visibilidad y habilitación del dropdown: %.4f segundos.", duration_validation)
+            self.base.registrar_metrica("obtener_y_comparar_valores_dropdown", duration_validation, medicion="validation")
             
-            self.logger.info(f"\n✅ Dropdown '{dropdown_locator}' es visible y habilitado.")
+            self.logger.info("\n✅ Dropdown '%s' es visible y habilitado.", dropdown_locator)
             self.base.tomar_captura(f"{nombre_base}_dropdown_antes_extraccion_y_comparacion", directorio)
 
             # 2. Obtener todos los locators de las opciones dentro del dropdown
-            self.logger.info(f"\n🔄 Obteniendo locators de todas las opciones dentro de '{dropdown_locator}'...")
+            self.logger.info("\n🔄 Obteniendo locators de todas las opciones dentro de '%s'...", dropdown_locator)
             # --- Medición de rendimiento: Inicio obtención de option locators ---
-            start_time_get_options = time.time()
+            start_time_get_options = time.perf_counter()
             option_locators = dropdown_locator.locator("option").all()
             # --- Medición de rendimiento: Fin obtención de option locators ---
-            end_time_get_options = time.time()
+            end_time_get_options = time.perf_counter()
             duration_get_options = end_time_get_options - start_time_get_options
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de todos los option locators: {duration_get_options:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de obtención de todos los option locators: %.4f segundos.", duration_get_options)
+            self.base.registrar_metrica("obtener_y_comparar_valores_dropdown", duration_get_options, medicion="get_options")
 
             if not option_locators:
                 self.logger.warning(f"\n⚠️ No se encontraron opciones dentro del dropdown '{dropdown_locator}'.")
@@ -551,12 +576,12 @@ class DropdownActions:
                     raise AssertionError(f"\n❌ FALLO: No se encontraron opciones en el dropdown '{dropdown_locator}', pero se esperaban {len(expected_options)}.")
                 return None
 
-            self.logger.info(f"\n Encontradas {len(option_locators)} opciones reales para '{dropdown_locator}':")
+            self.logger.info("\n Encontradas %s opciones reales para '%s':", len(option_locators), dropdown_locator)
 
             # 3. Iterar sobre cada opción y extraer su 'value' y 'text_content'
             self.logger.info("\n📊 Extrayendo valores y textos de cada opción...")
             # --- Medición de rendimiento: Inicio iteración y extracción ---
-            start_time_extract_loop = time.time()
+            start_time_extract_loop = time.perf_counter()
             for i, option_locator in enumerate(option_locators):
                 value = option_locator.get_attribute("value")
                 text = option_locator.text_content()
@@ -567,20 +592,21 @@ class DropdownActions:
                 clean_text = text.strip() if text is not None else ""
 
                 valores_opciones_reales.append({'value': clean_value, 'text': clean_text})
-                self.logger.info(f"\n  Opción Real {i+1}: Value='{clean_value}', Text='{clean_text}'")
+                self.logger.info("\n  Opción Real %s: Value='%s', Text='%s'", i+1, clean_value, clean_text)
             # --- Medición de rendimiento: Fin iteración y extracción ---
-            end_time_extract_loop = time.time()
+            end_time_extract_loop = time.perf_counter()
             duration_extract_loop = end_time_extract_loop - start_time_extract_loop
-            self.logger.info(f"PERFORMANCE: Tiempo de iteración y extracción de {len(option_locators)} opciones: {duration_extract_loop:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de iteración y extracción de %s opciones: %.4f segundos.", len(option_locators), duration_extract_loop)
+            self.base.registrar_metrica("obtener_y_comparar_valores_dropdown", duration_extract_loop, medicion="extract_loop")
 
-            self.logger.info(f"\n✅ Valores obtenidos exitosamente del dropdown '{dropdown_locator}'.")
+            self.logger.info("\n✅ Valores obtenidos exitosamente del dropdown '%s'.", dropdown_locator)
             self.base.tomar_captura(f"{nombre_base}_dropdown_valores_extraidos", directorio)
 
             # 4. Comparar con las opciones esperadas (si se proporcionan)
             if expected_options is not None:
                 self.logger.info("\n--- Realizando comparación de opciones ---")
                 # --- Medición de rendimiento: Inicio de la fase de comparación ---
-                start_time_comparison = time.time()
+                start_time_comparison = time.perf_counter()
                 try:
                     expected_set = set()
                     real_set = set()
@@ -622,17 +648,18 @@ class DropdownActions:
                         if missing_in_expected:
                             error_msg += f"  - Opciones encontradas en el dropdown que no estaban esperadas: {missing_in_expected}\n"
                         self.logger.error(error_msg)
-                        self.base.tomar_captura(f"{nombre_base}_dropdown_comparacion_fallida", directorio)
+                        self.base.tomar_captura(f"{nombre_base}_dropdown_comparacion_fallida", directorio, es_fallo=True)
                         raise AssertionError(f"\nComparación de opciones del dropdown fallida para '{dropdown_locator}'. {error_msg.strip()}")
 
                 except Exception as e:
                     self.logger.critical(f"\n❌ FALLO: Ocurrió un error durante la comparación de opciones: {e}", exc_info=True)
-                    self.base.tomar_captura(f"{nombre_base}_dropdown_error_comparacion", directorio)
+                    self.base.tomar_captura(f"{nombre_base}_dropdown_error_comparacion", directorio, es_fallo=True)
                     raise AssertionError(f"\nError al comparar opciones del dropdown '{dropdown_locator}': {e}") from e
                 # --- Medición de rendimiento: Fin de la fase de comparación ---
-                end_time_comparison = time.time()
+                end_time_comparison = time.perf_counter()
                 duration_comparison = end_time_comparison - start_time_comparison
-                self.logger.info(f"PERFORMANCE: Tiempo de la fase de comparación: {duration_comparison:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de la fase de comparación: %.4f segundos.", duration_comparison)
+                self.base.registrar_metrica("obtener_y_comparar_valores_dropdown", duration_comparison, medicion="comparison")
 
             return valores_opciones_reales
 
@@ -643,7 +670,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -652,7 +679,7 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -661,10 +688,11 @@ class DropdownActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener y comparar valores dropdown): {duration_total_operation:.4f} segundos.")
\ No newline at end of file
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (obtener y comparar valores dropdown): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("obtener_y_comparar_valores_dropdown", duration_total_operation, medicion="total_operation")
\ No newline at end of file
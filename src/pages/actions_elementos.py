@@ -6,12 +6,37 @@ import os
 from typing import Union, Optional, Dict, Any, List, Tuple
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+from src.utils.metricas import describir_locator
+
 class ElementActions:
+    # Valor actual de cada campo de un formulario: estado para checkbox/radio, texto para
+    # elementos editables y `value` para el resto (input, textarea, select).
+    _SCRIPT_VALORES_CAMPOS = """
+    (campos) => campos.map((campo) => {
+        if (campo.type === "checkbox" || campo.type === "radio") return campo.checked;
+        if (campo.isContentEditable) return campo.innerText;
+        return campo.value;
+    })
+    """
+
+    # Aserción de `expect` para cada estado admitido por `validar_elementos_visibles`.
+    _ASERCIONES_ESTADO = {
+        "visible": "to_be_visible",
+        "oculto": "to_be_hidden",
+        "vacio": "to_be_empty",
+        "habilitado": "to_be_enabled",
+        "deshabilitado": "to_be_disabled",
+    }
+
     def __init__(self, base_page):
         self.base = base_page
         self.page: Page = base_page.page
         self.logger = base_page.logger
+        # Selectores de obstáculos con un manejador de cierre automático ya registrado en la página.
+        self._obstaculos_con_manejador = set()
     
+    @medir_accion
     def validar_elemento_visible(self, selector, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, resaltar: bool = True) -> bool:
         """
         Valida que un elemento sea visible en la página dentro de un tiempo límite especificado.
@@ -40,7 +65,7 @@ class ElementActions:
                    elemento desprendido del DOM).
             Exception: Para cualquier otro error inesperado durante la ejecución.
         """
-        self.logger.info(f"\nValidando visibilidad del elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando visibilidad del elemento con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright.
         # Si 'selector' es una cadena, lo convierte a Locator; de lo contrario, usa el objeto directamente.
@@ -51,7 +76,7 @@ class ElementActions:
         
         # --- Medición de rendimiento: Inicio de la espera por visibilidad ---
         # Registra el tiempo justo antes de iniciar la espera activa de Playwright.
-        start_time_visible_check = time.time()
+        start_time_visible_check = time.perf_counter()
 
         try:
             # Espera explícita a que el elemento cumpla la condición de ser visible.
@@ -61,34 +86,33 @@ class ElementActions:
 
             # --- Medición de rendimiento: Fin de la espera por visibilidad ---
             # Registra el tiempo inmediatamente después de que el elemento se vuelve visible.
-            end_time_visible_check = time.time()
+            end_time_visible_check = time.perf_counter()
             # Calcula la duración total que tardó el elemento en ser visible.
             duration_visible_check = end_time_visible_check - start_time_visible_check
             # Registra la métrica de rendimiento. Un tiempo elevado aquí puede indicar
             # problemas de carga o renderizado en la aplicación.
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ser visible: {duration_visible_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en ser visible: %.4f segundos.", selector, duration_visible_check)
+            self.base.registrar_metrica("validar_elemento_visible", duration_visible_check, medicion="visible_check", locator=selector)
 
             if resaltar:
                 # Resalta visualmente el elemento en la página para ayudar en el debugging o demostraciones.
-                locator.highlight()
-                self.logger.debug(f"Elemento '{selector}' resaltado.")
+                self.base.resaltar_elemento(locator)
+                self.logger.debug("Elemento '%s' resaltado.", selector)
 
             # Toma una captura de pantalla para documentar que el elemento es visible.
-            self.base.tomar_captura(f"{nombre_base}_visible", directorio)
-            self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' es visible en la página.")
+            self.base.tomar_captura(f"{nombre_base}_visible", directorio, locator=locator)
+            self.logger.info("\n✔ ÉXITO: El elemento '%s' es visible en la página.", selector)
             
-            # Realiza una espera fija adicional. Esto es útil para pausas visuales
-            # o si el siguiente paso en la prueba requiere un breve momento después
-            # de la aparición del elemento. Considera si esta espera es estrictamente
-            # necesaria para la lógica de la prueba o si es solo para observación.
-            self.base.esperar_fijo(tiempo) 
+            # Espera a que el DOM se asiente tras la aparición del elemento. 'tiempo' es solo
+            # el límite superior: si la página ya está estable, se continúa de inmediato.
+            self.base.esperar_estabilidad(tiempo)
 
             return True
 
         except TimeoutError as e:
             # Manejo específico para cuando el elemento no se vuelve visible dentro del 'timeout'.
             # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_visible_check = time.time()
+            end_time_visible_check = time.perf_counter()
             duration_visible_check = end_time_visible_check - start_time_visible_check
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO fue visible "
@@ -96,7 +120,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg)
             # Toma una captura de pantalla en caso de timeout para depuración.
-            self.base.tomar_captura(f"{nombre_base}_NO_visible_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_NO_visible_timeout", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -108,7 +132,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # exc_info=True para incluir la traza completa.
             # Toma una captura de pantalla para el error de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise # Re-lanza la excepción para asegurar que la prueba falle.
 
         except Exception as e:
@@ -119,7 +143,7 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa critical para errores graves y exc_info.
             # Toma una captura para errores inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
@@ -128,6 +152,98 @@ class ElementActions:
             # manejadas en los bloques try/except.
             pass
         
+    @medir_accion
+    def validar_elementos_visibles(self, selectores: List[Union[str, Locator, Tuple[Union[str, Locator], str]]], nombre_base: str, directorio: str,
+                                   tiempo: Union[int, float] = 5.0, estado: str = "visible", resaltar: bool = False,
+                                   lanzar_error: bool = True) -> List[Dict[str, Any]]:
+        """
+        Valida un grupo de elementos bajo **un único plazo compartido**, en lugar de llamar a
+        `validar_elemento_visible` (o `validar_elemento_vacio`, etc.) por elemento con su espera,
+        resaltado, captura y pausa propios. Cada elemento espera solo el tiempo que queda del
+        plazo común: los que ya cumplen la condición se confirman al instante y los que tardan
+        aprovechan el tiempo ya transcurrido, por lo que N esperas se reducen a aproximadamente
+        una. Se toma una sola captura de la página para todo el grupo.
+
+        Args:
+            selectores (List[Union[str, Locator, Tuple[Union[str, Locator], str]]]): Elementos a validar.
+                Cada entrada es un selector/Locator (se valida con `estado`) o una tupla
+                (selector/Locator, estado) para validar un estado distinto en ese elemento.
+            nombre_base (str): Nombre base utilizado para la **captura de pantalla** del grupo.
+            directorio (str): **Ruta del directorio** donde se guardará la captura.
+            tiempo (Union[int, float]): **Plazo total** (en segundos) compartido por todo el grupo.
+                                        Por defecto, `5.0` segundos.
+            estado (str): Estado esperado por defecto: 'visible', 'oculto', 'vacio', 'habilitado'
+                          o 'deshabilitado'. Por defecto, 'visible'.
+            resaltar (bool): Si es `True`, resalta cada elemento que cumple la condición antes de la
+                             captura. Por defecto, `False`.
+            lanzar_error (bool): Si es `True` (por defecto), lanza `AssertionError` tras la captura
+                                 del grupo cuando algún elemento no cumple su estado, como
+                                 `validar_elemento_visible`. Con `False`, solo devuelve el reporte.
+
+        Returns:
+            List[Dict[str, Any]]: Un reporte por elemento, en el orden recibido, con 'selector',
+                                  'estado', 'ok' (bool), 'tiempo' (segundos desde el inicio hasta
+                                  confirmarse, o `None`) y 'error' (detalle del fallo, o `None`).
+
+        Raises:
+            ValueError: Si algún estado solicitado no está soportado.
+            AssertionError: Si algún elemento no cumple su estado y `lanzar_error` es `True`.
+        """
+        entradas = []
+        for entrada in selectores:
+            selector, estado_entrada = entrada if isinstance(entrada, tuple) else (entrada, estado)
+            if estado_entrada not in self._ASERCIONES_ESTADO:
+                raise ValueError(f"Estado '{estado_entrada}' no soportado. Estados válidos: {list(self._ASERCIONES_ESTADO)}")
+            locator = self.page.locator(selector) if isinstance(selector, str) else selector
+            entradas.append((selector, estado_entrada, locator))
+
+        self.logger.info("\nValidando %s elemento(s) con un plazo compartido de %ss.", len(entradas), tiempo)
+
+        # --- Medición de rendimiento: Inicio de la espera del grupo ---
+        start_time_group = time.perf_counter()
+        limite = start_time_group + tiempo
+        reporte = []
+
+        for selector, estado_entrada, locator in entradas:
+            # Tiempo restante del plazo común (al menos 1 ms: un timeout de 0 desactivaría el límite).
+            restante_ms = max((limite - time.perf_counter()) * 1000, 1)
+            resultado = {"selector": describir_locator(selector), "estado": estado_entrada, "ok": False, "tiempo": None, "error": None}
+            try:
+                getattr(expect(locator), self._ASERCIONES_ESTADO[estado_entrada])(timeout=restante_ms)
+                resultado["ok"] = True
+                resultado["tiempo"] = time.perf_counter() - start_time_group
+                if resaltar:
+                    self.base.resaltar_elemento(locator)
+            except AssertionError as e:
+                # `expect` informa con AssertionError cuando la condición no se cumple en el plazo.
+                resultado["error"] = str(e).strip().splitlines()[0] if str(e).strip() else "condición no cumplida a tiempo"
+            except Error as e:
+                resultado["error"] = f"Error de Playwright: {e}"
+                self.logger.error("\n❌ FALLO (Playwright): Error al validar '%s' (%s). Detalles: %s", selector, estado_entrada, e)
+            reporte.append(resultado)
+
+        # --- Medición de rendimiento: Fin de la espera del grupo ---
+        end_time_group = time.perf_counter()
+        duration_group = end_time_group - start_time_group
+        self.logger.info("PERFORMANCE: Tiempo que tardó en validarse el grupo de %s elemento(s): %.4f segundos.", len(entradas), duration_group)
+        self.base.registrar_metrica("validar_elementos_visibles", duration_group, medicion="group_check")
+
+        fallidos = [resultado for resultado in reporte if not resultado["ok"]]
+        for resultado in fallidos:
+            self.logger.warning("\n❌ FALLO: El elemento '%s' no cumplió el estado '%s' dentro del plazo de %ss. %s",
+                                resultado["selector"], resultado["estado"], tiempo, resultado["error"] or "")
+        if fallidos:
+            self.base.tomar_captura(f"{nombre_base}_grupo_con_fallos", directorio, es_fallo=True)
+            if lanzar_error:
+                detalle = "; ".join(f"'{resultado['selector']}' ({resultado['estado']}): {resultado['error'] or 'no cumplido'}"
+                                    for resultado in fallidos)
+                raise AssertionError(f"\n❌ FALLO: {len(fallidos)} de {len(reporte)} elemento(s) no cumplieron su estado dentro del plazo de {tiempo}s: {detalle}")
+        else:
+            self.logger.info("\n✔ ÉXITO: Los %s elemento(s) cumplen el estado esperado.", len(reporte))
+            self.base.tomar_captura(f"{nombre_base}_grupo_ok", directorio)
+        return reporte
+
+    @medir_accion
     def validar_elemento_no_visible(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Valida que un elemento NO es visible en la página dentro de un tiempo límite especificado.
@@ -148,7 +264,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nValidando que el elemento con selector '{selector}' NO es visible. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando que el elemento con selector '%s' NO es visible. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para su uso consistente.
         if isinstance(selector, str):
@@ -159,7 +275,7 @@ class ElementActions:
         # --- Medición de rendimiento: Inicio de la espera por no visibilidad ---
         # Registra el tiempo justo antes de iniciar la espera activa de Playwright
         # para que el elemento se oculte.
-        start_time_hidden_check = time.time()
+        start_time_hidden_check = time.perf_counter()
 
         try:
             # Espera explícita a que el elemento cumpla la condición de estar oculto (no visible)
@@ -169,20 +285,21 @@ class ElementActions:
 
             # --- Medición de rendimiento: Fin de la espera por no visibilidad ---
             # Registra el tiempo inmediatamente después de que el elemento se oculta.
-            end_time_hidden_check = time.time()
+            end_time_hidden_check = time.perf_counter()
             # Calcula la duración total que tardó el elemento en ocultarse.
             duration_hidden_check = end_time_hidden_check - start_time_hidden_check
             # Registra la métrica de rendimiento. Un tiempo elevado aquí podría indicar
             # que la aplicación tarda en ocultar elementos o en limpiar el DOM.
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ocultarse/desaparecer: {duration_hidden_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en ocultarse/desaparecer: %.4f segundos.", selector, duration_hidden_check)
+            self.base.registrar_metrica("validar_elemento_no_visible", duration_hidden_check, medicion="hidden_check", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: El elemento con selector '{selector}' NO es visible.")
+            self.logger.info("\n✔ ÉXITO: El elemento con selector '%s' NO es visible.", selector)
             # La captura de éxito se maneja en el bloque `finally` para asegurar que se tome.
 
         except TimeoutError as e:
             # Captura específica para el error de tiempo de espera de Playwright.
             # Esto ocurre si el elemento sigue visible después del 'timeout' especificado.
-            end_time_hidden_check = time.time() # Registra el tiempo al fallar el timeout.
+            end_time_hidden_check = time.perf_counter() # Registra el tiempo al fallar el timeout.
             duration_hidden_check = end_time_hidden_check - start_time_hidden_check
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' AÚN ES VISIBLE "
@@ -190,7 +307,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en caso de fallo por timeout para depuración.
-            self.base.tomar_captura(f"{nombre_base}_fallo_no_visible_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_no_visible_timeout", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except AssertionError as e:
@@ -201,7 +318,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_no_visible_assertion", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_no_visible_assertion", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
             
         except Error as e:
@@ -212,7 +329,7 @@ class ElementActions:
                 f"Posibles causas: Selector inválido, problema de contexto de la página. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_no_visible", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_no_visible", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except Exception as e:
@@ -222,14 +339,15 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_no_visible", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_no_visible", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, independientemente de si la validación fue exitosa o falló.
             # Es un buen lugar para tomar una captura de pantalla final que muestre el estado de la página.
-            self.base.tomar_captura(f"{nombre_base}_estado_final_no_visible", directorio=directorio)
+            self.base.tomar_captura(f"{nombre_base}_estado_final_no_visible", directorio=directorio, locator=locator)
             
+    @medir_accion
     def verificar_texto_contenido(self, selector: Union[str, Locator], texto_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Verifica que un elemento localizado en una página web **contiene un texto parcial**.
@@ -257,7 +375,7 @@ class ElementActions:
                    selector malformado, problema de comunicación con el navegador).
             Exception: Para cualquier otro error inesperado que no esté cubierto por las excepciones anteriores.
         """
-        self.logger.info(f"Verificando que el elemento con selector '{selector}' contiene el texto: '{texto_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("Verificando que el elemento con selector '%s' contiene el texto: '%s'. Tiempo máximo de espera: %ss.", selector, texto_esperado, tiempo)
 
         # Asegura que 'selector' sea un objeto Playwright Locator.
         # Esto permite una interacción consistente, ya sea que se pase una cadena de selector
@@ -269,55 +387,56 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la espera por visibilidad ---
         # Registra el tiempo en que comienza la operación de esperar a que el elemento sea visible.
-        start_time_visible_check = time.time()
+        start_time_visible_check = time.perf_counter()
         try:
             # Playwright espera implícitamente a que el elemento cumpla la condición de visibilidad.
             # El `timeout` se convierte de segundos a milisegundos, como lo requiere Playwright.
             expect(locator).to_be_visible()
             
             # Registra el tiempo una vez que el elemento se ha vuelto visible.
-            end_time_visible_check = time.time()
+            end_time_visible_check = time.perf_counter()
             # Calcula la duración de esta fase. Esta métrica es vital para entender
             # la latencia de renderizado de la UI.
             duration_visible_check = end_time_visible_check - start_time_visible_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ser visible: {duration_visible_check:.4f} segundos.")
-            self.logger.debug(f"Elemento con selector '{selector}' es visible.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en ser visible: %.4f segundos.", selector, duration_visible_check)
+            self.base.registrar_metrica("verificar_texto_contenido", duration_visible_check, medicion="visible_check", locator=selector)
+            self.logger.debug("Elemento con selector '%s' es visible.", selector)
 
             # Opcional: **Resalta visualmente el elemento** en la página del navegador.
             # Esto es extremadamente útil para el debugging o para demos visuales de la prueba.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado actual de la página, antes de verificar el texto,
             # para documentar la visibilidad del elemento.
-            self.base.tomar_captura(f"{nombre_base}_antes_verificacion_texto", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificacion_texto", directorio, locator=locator)
 
             # --- Medición de rendimiento: Inicio de la espera por el texto ---
             # Registra el tiempo en que comienza la operación de esperar a que el elemento contenga el texto.
-            start_time_text_check = time.time()
+            start_time_text_check = time.perf_counter()
             # Verifica que el elemento contiene el `texto_esperado`. Playwright también reintenta
             # esta aserción hasta que el texto coincide o el `timeout` se agota.
             expect(locator).to_contain_text(texto_esperado)
             
             # Registra el tiempo una vez que el texto esperado se ha encontrado.
-            end_time_text_check = time.time()
+            end_time_text_check = time.perf_counter()
             # Calcula la duración de esta fase. Esta métrica es importante si el texto se carga
             # dinámicamente o tarda en aparecer después de que el elemento base es visible.
             duration_text_check = end_time_text_check - start_time_text_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}': {duration_text_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en contener el texto '%s': %.4f segundos.", selector, texto_esperado, duration_text_check)
+            self.base.registrar_metrica("verificar_texto_contenido", duration_text_check, medicion="text_check", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
+            self.logger.info("\n✔ ÉXITO: Elemento con selector '%s' contiene el texto esperado: '%s'.", selector, texto_esperado)
 
             # Toma una captura de pantalla final para documentar la verificación exitosa del texto.
-            self.base.tomar_captura(nombre_base=f"{nombre_base}_despues_verificacion_texto", directorio=directorio)
+            self.base.tomar_captura(nombre_base=f"{nombre_base}_despues_verificacion_texto", directorio=directorio, locator=locator)
             
-            # Realiza una **espera fija** después de la verificación. Esto puede ser útil para
-            # propósitos de sincronización con el siguiente paso de la prueba o para permitir
-            # una observación visual si la prueba se ejecuta en modo interactivo.
-            self.base.esperar_fijo(tiempo)
+            # Espera a que el DOM se asiente después de la verificación, usando 'tiempo'
+            # como límite superior en lugar de una pausa fija.
+            self.base.esperar_estabilidad(tiempo)
 
         except TimeoutError as e:
             # Este bloque se ejecuta si el elemento no se hizo visible O no contenía el texto esperado
             # dentro del `tiempo` total especificado.
-            end_time_fail = time.time() # Registra el tiempo final de la operación.
+            end_time_fail = time.perf_counter() # Registra el tiempo final de la operación.
             # Calcula la duración total que tardó la operación completa hasta el fallo.
             duration_fail = end_time_fail - start_time_visible_check
             error_msg = (
@@ -326,7 +445,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout para depuración.
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_timeout", directorio, es_fallo=True)
             raise # Re-lanza la excepción para asegurar que la prueba falle.
 
         except AssertionError as e:
@@ -338,7 +457,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_contenido", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_contenido", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Error as e:
@@ -350,7 +469,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -362,9 +481,10 @@ class ElementActions:
             # Usa `critical` para errores graves e `exc_info=True` para incluir la traza completa.
             self.logger.critical(error_msg, exc_info=True)
             # Toma una captura para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
         
+    @medir_accion
     def validar_mensaje_validacion_html5(self, selector: Union[str, Locator], texto_esperado: Union[str, List[str], Tuple[str]], nombre_base: str, directorio: str, tiempo: Union[int, float] = 5.0):
         """
         Verifica el texto de un mensaje de validación nativo de HTML5 para un elemento de formulario.
@@ -397,7 +517,7 @@ class ElementActions:
         else:
             textos_esperados = list(texto_esperado)
 
-        self.logger.info(f"Validando mensaje de validación de HTML5 para el selector '{selector}'. Textos esperados: '{textos_esperados}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("Validando mensaje de validación de HTML5 para el selector '%s'. Textos esperados: '%s'. Tiempo máximo de espera: %ss.", selector, textos_esperados, tiempo)
 
         # Asegura que 'selector' sea un objeto Playwright Locator.
         if isinstance(selector, str):
@@ -406,25 +526,25 @@ class ElementActions:
             locator = selector
 
         # --- Medición de rendimiento: Inicio de la operación ---
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Espera a que el elemento de formulario esté visible.
             expect(locator).to_be_visible(timeout=tiempo * 1000)
-            self.logger.debug(f"Elemento con selector '{selector}' es visible.")
+            self.logger.debug("Elemento con selector '%s' es visible.", selector)
 
             # Resalta el elemento para el debugging visual.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
 
             # Toma una captura de pantalla antes de la validación.
-            self.base.tomar_captura(f"{nombre_base}_antes_validacion_mensaje_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_validacion_mensaje_html5", directorio, locator=locator)
 
             # Bucle con espera para verificar el mensaje de validación.
-            end_time_check = time.time() + tiempo
+            end_time_check = time.perf_counter() + tiempo
             current_message = None
             found_match = False
 
-            while time.time() < end_time_check:
+            while time.perf_counter() < end_time_check:
                 # Usa evaluate para obtener el `validationMessage` que no es un elemento del DOM.
                 try:
                     current_message = locator.evaluate("el => el.validationMessage")
@@ -435,7 +555,7 @@ class ElementActions:
 
                 # Verifica si el mensaje actual contiene alguno de los textos esperados.
                 if current_message and any(esperado in current_message for esperado in textos_esperados):
-                    self.logger.info(f"✔ ÉXITO: Mensaje de validación nativo encontrado. Contenido: '{current_message}'.")
+                    self.logger.info("✔ ÉXITO: Mensaje de validación nativo encontrado. Contenido: '%s'.", current_message)
                     found_match = True
                     break
 
@@ -446,12 +566,13 @@ class ElementActions:
                 raise AssertionError(f"El mensaje de validación '{current_message}' no contiene ninguno de los textos esperados: {textos_esperados}.")
 
             # --- Medición de rendimiento: Fin de la operación ---
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
-            self.logger.info(f"PERFORMANCE: Tiempo total para la validación del mensaje de HTML5: {duration:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total para la validación del mensaje de HTML5: %.4f segundos.", duration)
+            self.base.registrar_metrica("validar_mensaje_validacion_html5", duration, locator=selector)
 
             # Toma una captura de pantalla final para documentar el éxito.
-            self.base.tomar_captura(f"{nombre_base}_despues_validacion_mensaje_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_validacion_mensaje_html5", directorio, locator=locator)
 
         except TimeoutError as e:
             error_msg = (
@@ -459,7 +580,7 @@ class ElementActions:
                 f"mensaje de validación no apareció después de {tiempo} segundos. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_validacion_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_validacion_html5", directorio, es_fallo=True)
             raise
 
         except AssertionError as e:
@@ -468,7 +589,7 @@ class ElementActions:
                 f"Mensaje actual: '{current_message}'. Mensajes esperados: '{textos_esperados}'. Detalle: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_asercion_validacion_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_asercion_validacion_html5", directorio, es_fallo=True)
             raise
 
         except Error as e:
@@ -477,7 +598,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_validacion_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_validacion_html5", directorio, es_fallo=True)
             raise
 
         except Exception as e:
@@ -486,9 +607,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_validacion_html5", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_validacion_html5", directorio, es_fallo=True)
             raise
         
+    @medir_accion
     def verificar_texto_exacto(self, selector: Union[str, Locator], texto_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 5.0):
         """
         Verifica que un elemento localizado en una página web **contiene un texto exactamente igual** al texto esperado.
@@ -509,32 +631,33 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"Verificando que el elemento con selector '{selector}' tiene exactamente el texto: '{texto_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("Verificando que el elemento con selector '%s' tiene exactamente el texto: '%s'. Tiempo máximo de espera: %ss.", selector, texto_esperado, tiempo)
 
         if isinstance(selector, str):
             locator = self.page.locator(selector)
         else:
             locator = selector
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             # **Resalta visualmente el elemento** en la página del navegador.
             # Esto es extremadamente útil para el debugging o para demos visuales de la prueba.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             
             # Playwright espera implícitamente a que el elemento sea visible y tenga el texto exacto.
             expect(locator).to_have_text(texto_esperado, timeout=tiempo * 1000)
 
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó la verificación exacta de texto: {duration:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó la verificación exacta de texto: %.4f segundos.", duration)
+            self.base.registrar_metrica("verificar_texto_exacto", duration, locator=selector)
             
-            self.logger.info(f"\n✔ ÉXITO: El elemento con selector '{selector}' tiene exactamente el texto esperado.")
+            self.logger.info("\n✔ ÉXITO: El elemento con selector '%s' tiene exactamente el texto esperado.", selector)
             
-            self.base.tomar_captura(nombre_base=f"{nombre_base}_verificacion_texto_exacta_exitosa", directorio=directorio)
+            self.base.tomar_captura(nombre_base=f"{nombre_base}_verificacion_texto_exacta_exitosa", directorio=directorio, locator=locator)
 
         except (TimeoutError, AssertionError) as e:
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time
             error_msg = (
                 f"\n❌ FALLO: El elemento con selector '{selector}' NO tiene el texto exacto esperado. "
@@ -542,23 +665,24 @@ class ElementActions:
                 f"Texto actual: '{locator.text_content()}' | Texto esperado: '{texto_esperado}'. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_exacta", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_exacta", directorio, es_fallo=True)
             raise
         except Error as e:
             error_msg = (
                 f"\n❌ FALLO (Playwright): Error al verificar el texto exacto para '{selector}'. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto_exacta", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto_exacta", directorio, es_fallo=True)
             raise
         except Exception as e:
             error_msg = (
                 f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al verificar el texto exacto. Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto_exacta", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto_exacta", directorio, es_fallo=True)
             raise
     
+    @medir_accion
     def rellenar_campo_de_texto(self, selector: Union[str, Locator], texto, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Rellena un campo de texto con el valor especificado y toma capturas de pantalla
@@ -586,7 +710,7 @@ class ElementActions:
                    (ej., el selector es inválido, el elemento se desprende del DOM).
             Exception: Para cualquier otro error inesperado que ocurra durante la ejecución de la función.
         """
-        self.logger.info(f"\nRellenando campo con selector '{selector}' con el texto: '{texto}'.")
+        self.logger.info("\nRellenando campo con selector '%s' con el texto: '%s'.", selector, texto)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright. Esto garantiza que
         # las interacciones (como 'highlight' y 'fill') se realicen de manera consistente.
@@ -598,13 +722,13 @@ class ElementActions:
         try:
             # Resalta visualmente el campo de texto en el navegador. Esto es una ayuda visual
             # excelente durante la ejecución de la prueba o el debugging.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de introducir el texto.
-            self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio, locator=locator)
 
             # --- Medición de rendimiento: Inicio de la operación de rellenado ---
             # Registra el momento exacto en que comenzamos la operación de 'fill'.
-            start_time_fill = time.time()
+            start_time_fill = time.perf_counter()
             
             # Rellena el campo de texto con el valor proporcionado. El método `fill()` de Playwright
             # es robusto: espera automáticamente a que el elemento sea visible, habilitado y editable
@@ -613,17 +737,18 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la operación de rellenado ---
             # Registra el momento en que la operación de 'fill' ha finalizado.
-            end_time_fill = time.time()
+            end_time_fill = time.perf_counter()
             # Calcula la duración total que tomó la operación de rellenado.
             # Esta métrica es fundamental para evaluar la **reactividad de los campos de entrada**
             # y el rendimiento percibido por el usuario.
             duration_fill = end_time_fill - start_time_fill
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en rellenar el campo '{selector}': {duration_fill:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en rellenar el campo '%s': %.4f segundos.", selector, duration_fill)
+            self.base.registrar_metrica("rellenar_campo_de_texto", duration_fill, medicion="fill", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Campo '{selector}' rellenado con éxito con el texto: '{texto}'.")
+            self.logger.info("\n✔ ÉXITO: Campo '%s' rellenado con éxito con el texto: '%s'.", selector, texto)
 
             # Toma una captura de pantalla del estado del campo *después* de introducir el texto.
-            self.base.tomar_captura(f"{nombre_base}_despues_de_rellenar_texto", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_de_rellenar_texto", directorio, locator=locator)
 
         except TimeoutError as e:
             # Este bloque se ejecuta si la operación `locator.fill()` no pudo completarse
@@ -636,7 +761,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa para depuración.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_rellenar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_rellenar", directorio, es_fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia en el manejo de errores.
             raise Error(error_msg) from e
 
@@ -650,7 +775,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_rellenar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_rellenar", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que la prueba se marque como fallida.
 
         except Exception as e:
@@ -662,9 +787,135 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel 'critical' para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_rellenar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_rellenar", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
+    def llenar_formulario(self, campos: Dict[Union[str, Locator], Any], nombre_base: str, directorio: str, evidencia: bool = True, tiempo_max_campo: Union[int, float] = 5.0) -> bool:
+        """
+        Rellena varios campos de un formulario en una sola pasada y verifica todos sus valores con
+        **una única llamada `evaluate`**, en lugar de llamar a `rellenar_campo_de_texto` por campo
+        (con su resaltado, capturas y verificación propios). La evidencia es opcional y, si se
+        pide, es una sola captura de la página al final.
+
+        Los valores `bool` marcan o desmarcan el checkbox/radio correspondiente; cualquier otro
+        valor se convierte a texto y se introduce con `fill()`.
+
+        Args:
+            campos (Dict[Union[str, Locator], Any]): Diccionario {selector o Locator del campo: valor},
+                                                     en el orden en que deben rellenarse.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            evidencia (bool): Si es `True`, toma una captura de la página con el formulario
+                              completo. Por defecto, `True`.
+            tiempo_max_campo (Union[int, float]): **Tiempo máximo de espera** (en segundos) para que
+                                                  cada campo esté disponible. Por defecto, `5.0` segundos.
+
+        Returns:
+            bool: `True` si todos los campos quedaron con el valor esperado.
+
+        Raises:
+            AssertionError: Si algún campo no quedó con el valor esperado.
+            Error: Si algún campo no está disponible a tiempo o si ocurre un problema de Playwright
+                   al rellenarlo.
+            Exception: Para cualquier otro error inesperado.
+        """
+        self.logger.info("\nRellenando formulario con %s campo(s).", len(campos))
+
+        # --- Medición de rendimiento: Inicio del rellenado del formulario ---
+        start_time_fill = time.perf_counter()
+        selector_actual = None
+        manejadores = []
+
+        try:
+            # 1. Rellenar todos los campos seguidos, sin resaltado, capturas ni esperas intermedias.
+            #    Se conserva el ElementHandle de cada campo para verificarlos todos juntos después.
+            for selector, valor in campos.items():
+                selector_actual = selector
+                locator = self.page.locator(selector) if isinstance(selector, str) else selector
+                manejador = locator.element_handle(timeout=tiempo_max_campo * 1000)
+                manejadores.append(manejador)
+                if isinstance(valor, bool):
+                    manejador.set_checked(valor)
+                else:
+                    manejador.fill(str(valor))
+            selector_actual = None
+
+            end_time_fill = time.perf_counter()
+            duration_fill = end_time_fill - start_time_fill
+            self.logger.info("PERFORMANCE: Tiempo que tardó en rellenar los %s campo(s) del formulario: %.4f segundos.", len(campos), duration_fill)
+            self.base.registrar_metrica("llenar_formulario", duration_fill, medicion="fill")
+
+            # 2. Verificar todos los valores con una sola llamada al navegador.
+            start_time_verification = time.perf_counter()
+            valores_actuales = self.page.evaluate(self._SCRIPT_VALORES_CAMPOS, manejadores)
+            end_time_verification = time.perf_counter()
+            duration_verification = end_time_verification - start_time_verification
+            self.logger.info("PERFORMANCE: Tiempo que tardó en verificar los %s campo(s) del formulario: %.4f segundos.", len(campos), duration_verification)
+            self.base.registrar_metrica("llenar_formulario", duration_verification, medicion="verification")
+
+            discrepancias = []
+            for (selector, valor), actual in zip(campos.items(), valores_actuales):
+                esperado = valor if isinstance(valor, bool) else str(valor)
+                if actual != esperado:
+                    discrepancias.append((selector, esperado, actual))
+
+            if evidencia:
+                self.base.tomar_captura(f"{nombre_base}_formulario_rellenado", directorio)
+
+            if discrepancias:
+                for selector, esperado, actual in discrepancias:
+                    self.logger.error("\n❌ FALLO: El campo '%s' tiene el valor '%s', se esperaba '%s'.", selector, actual, esperado)
+                if not evidencia:
+                    self.base.tomar_captura(f"{nombre_base}_formulario_con_discrepancias", directorio, es_fallo=True)
+                detalle = "; ".join(f"'{selector}': '{actual}' (se esperaba '{esperado}')" for selector, esperado, actual in discrepancias)
+                raise AssertionError(f"\n❌ FALLO: {len(discrepancias)} campo(s) del formulario no tienen el valor esperado: {detalle}")
+
+            self.logger.info("\n✔ ÉXITO: Los %s campo(s) del formulario se rellenaron y verificaron correctamente.", len(campos))
+            return True
+
+        except TimeoutError as e:
+            error_msg = (
+                f"\n❌ ERROR (Timeout): El tiempo de espera se agotó al rellenar el campo '{selector_actual}' del formulario.\n"
+                f"Posibles causas: El elemento no apareció, no fue visible, habilitado o editable a tiempo.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_formulario", directorio, es_fallo=True)
+            raise Error(error_msg) from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ ERROR (Playwright): Ocurrió un problema de Playwright al rellenar el formulario (campo '{selector_actual}').\n"
+                f"Verifica la validez de los selectores y el estado de los elementos en el DOM.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_formulario", directorio, es_fallo=True)
+            raise
+
+        except AssertionError:
+            # Las discrepancias de valores ya se registraron y documentaron arriba.
+            raise
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ ERROR (Inesperado): Se produjo un error desconocido al rellenar el formulario (campo '{selector_actual}').\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_formulario", directorio, es_fallo=True)
+            raise
+
+        finally:
+            # Los ElementHandle mantienen vivos sus nodos en el navegador hasta que se liberan.
+            for manejador in manejadores:
+                try:
+                    manejador.dispose()
+                except Error:
+                    pass
+
+    @medir_accion
     def rellenar_campo_numerico_positivo(self, selector: Union[str, Locator], valor_numerico: Union[int, float], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Rellena un campo de texto con un **valor numérico positivo** (entero o flotante)
@@ -692,21 +943,21 @@ class ElementActions:
             TypeError: Si el `selector` proporcionado no es un tipo válido (`str` o `Locator`).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nRellenando campo con selector '{selector}' con el valor numérico POSITIVO: '{valor_numerico}'.")
+        self.logger.info("\nRellenando campo con selector '%s' con el valor numérico POSITIVO: '%s'.", selector, valor_numerico)
 
         # --- Validaciones de entrada ---
         # 1. Valida que el 'valor_numerico' sea de tipo numérico (int o float).
         if not isinstance(valor_numerico, (int, float)):
             error_msg = f"\n❌ ERROR: El valor proporcionado '{valor_numerico}' no es un tipo numérico (int o float) válido."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_valor_no_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_valor_no_numerico", directorio, es_fallo=True)
             raise ValueError(error_msg)
 
         # 2. Valida que el 'valor_numerico' sea positivo (mayor o igual a cero).
         if valor_numerico < 0:
             error_msg = f"\n❌ ERROR: El valor numérico '{valor_numerico}' no es positivo. Se esperaba un número mayor o igual a cero."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_valor_negativo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_valor_negativo", directorio, es_fallo=True)
             raise ValueError(error_msg)
 
         # Convierte el valor numérico a una cadena para poder rellenar el campo de texto.
@@ -721,18 +972,18 @@ class ElementActions:
         else:
             error_msg = f"\n❌ ERROR: El selector proporcionado '{type(selector)}' no es una cadena ni un objeto Locator válido."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_tipo_selector_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_tipo_selector_numerico", directorio, es_fallo=True)
             raise TypeError(error_msg)
 
         try:
             # Resalta visualmente el campo de texto en el navegador.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de rellenarlo.
-            self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_de_rellenar_numerico", directorio, locator=locator)
 
             # --- Medición de rendimiento: Inicio de la operación de rellenado ---
             # Registra el tiempo justo antes de ejecutar la acción de 'fill'.
-            start_time_fill = time.time()
+            start_time_fill = time.perf_counter()
             
             # Rellena el campo de texto con el valor numérico convertido a cadena.
             # El método `fill()` de Playwright esperará automáticamente a que el elemento
@@ -741,17 +992,18 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la operación de rellenado ---
             # Registra el tiempo inmediatamente después de que la operación de 'fill' se ha completado.
-            end_time_fill = time.time()
+            end_time_fill = time.perf_counter()
             # Calcula la duración total de la operación de rellenado.
             # Esta métrica es crucial para evaluar la **reactividad de los campos de entrada**,
             # especialmente en formularios donde el rendimiento es crítico.
             duration_fill = end_time_fill - start_time_fill
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en rellenar el campo '{selector}' con '{valor_a_rellenar_str}': {duration_fill:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en rellenar el campo '%s' con '%s': %.4f segundos.", selector, valor_a_rellenar_str, duration_fill)
+            self.base.registrar_metrica("rellenar_campo_numerico_positivo", duration_fill, medicion="fill", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Campo '{selector}' rellenado con éxito con el valor: '{valor_a_rellenar_str}'.")
+            self.logger.info("\n✔ ÉXITO: Campo '%s' rellenado con éxito con el valor: '%s'.", selector, valor_a_rellenar_str)
 
             # Toma una captura de pantalla del estado del campo *después* de rellenarlo.
-            self.base.tomar_captura(f"{nombre_base}_despues_de_rellenar_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_de_rellenar_numerico", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -764,7 +1016,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_numerico", directorio, es_fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -778,7 +1030,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_numerico", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -789,9 +1041,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_numerico", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_numerico", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def hacer_clic_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
         """
         Realiza un click en un elemento de la página web. La función incluye
@@ -822,7 +1075,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando hacer click en el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando hacer click en el elemento con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -832,25 +1085,26 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el clic.
-            self.base.tomar_captura(f"{nombre_base}_antes_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_click", directorio, locator=locator)
 
             # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
             # Esta aserción también espera a que el texto esté presente.
             if texto_esperado:
                 # Registra el tiempo antes de la aserción de texto.
-                start_time_text_check = time.time()
+                start_time_text_check = time.perf_counter()
                 expect(locator).to_have_text(texto_esperado)
                 # Registra el tiempo después de la aserción de texto y calcula la duración.
-                end_time_text_check = time.time()
+                end_time_text_check = time.perf_counter()
                 duration_text_check = end_time_text_check - start_time_text_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}': {duration_text_check:.4f} segundos.")
-                self.logger.info(f"\n✅ El elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
+                self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en contener el texto '%s': %.4f segundos.", selector, texto_esperado, duration_text_check)
+                self.base.registrar_metrica("hacer_clic_en_elemento", duration_text_check, medicion="text_check", locator=selector)
+                self.logger.info("\n✅ El elemento con selector '%s' contiene el texto esperado: '%s'.", selector, texto_esperado)
 
             # --- Medición de rendimiento: Inicio de la operación de clic ---
             # Registra el tiempo justo antes de ejecutar la acción de 'click'.
-            start_time_click = time.time()
+            start_time_click = time.perf_counter()
 
             # Realiza el clic en el elemento. El método `click()` de Playwright
             # esperará automáticamente a que el elemento sea visible, habilitado y clicable.
@@ -859,16 +1113,17 @@ class ElementActions:
 
             # --- Medición de rendimiento: Fin de la operación de clic ---
             # Registra el tiempo inmediatamente después de que la operación de clic se ha completado.
-            end_time_click = time.time()
+            end_time_click = time.perf_counter()
             # Calcula la duración total de la operación de clic.
             # Esta métrica es crucial para evaluar la **reactividad de los botones/enlaces**
             # y el rendimiento percibido por el usuario al interactuar.
             duration_click = end_time_click - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el clic en el elemento '{selector}': {duration_click:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el clic en el elemento '%s': %.4f segundos.", selector, duration_click)
+            self.base.registrar_metrica("hacer_clic_en_elemento", duration_click, medicion="click", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Click realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Click realizado exitosamente en el elemento con selector '%s'.", selector)
             # Toma una captura de pantalla del estado de la página *después* de realizar el clic.
-            self.base.tomar_captura(f"{nombre_base}_despues_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_click", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -882,7 +1137,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_click", directorio, es_fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -896,7 +1151,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_click", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -907,9 +1162,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_click", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def hacer_doble_click_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
         """
         Realiza un **doble click** en un elemento de la página web. La función incluye
@@ -940,7 +1196,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando hacer doble click en el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando hacer doble click en el elemento con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -950,25 +1206,26 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el doble clic.
-            self.base.tomar_captura(f"{nombre_base}_antes_doble_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_doble_click", directorio, locator=locator)
 
             # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
             # Esta aserción también espera a que el texto esté presente.
             if texto_esperado:
                 # Registra el tiempo antes de la aserción de texto.
-                start_time_text_check = time.time()
+                start_time_text_check = time.perf_counter()
                 expect(locator).to_have_text(texto_esperado)
                 # Registra el tiempo después de la aserción de texto y calcula la duración.
-                end_time_text_check = time.time()
+                end_time_text_check = time.perf_counter()
                 duration_text_check = end_time_text_check - start_time_text_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en contener el texto '{texto_esperado}' antes del doble clic: {duration_text_check:.4f} segundos.")
-                self.logger.info(f"\n✅ El elemento con selector '{selector}' contiene el texto esperado: '{texto_esperado}'.")
+                self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en contener el texto '%s' antes del doble clic: %.4f segundos.", selector, texto_esperado, duration_text_check)
+                self.base.registrar_metrica("hacer_doble_click_en_elemento", duration_text_check, medicion="text_check", locator=selector)
+                self.logger.info("\n✅ El elemento con selector '%s' contiene el texto esperado: '%s'.", selector, texto_esperado)
 
             # --- Medición de rendimiento: Inicio de la operación de doble clic ---
             # Registra el tiempo justo antes de ejecutar la acción de 'dblclick'.
-            start_time_dblclick = time.time()
+            start_time_dblclick = time.perf_counter()
 
             # Realiza el doble clic en el elemento. El método `dblclick()` de Playwright
             # esperará automáticamente a que el elemento sea visible, habilitado y doble-clicable.
@@ -977,16 +1234,17 @@ class ElementActions:
 
             # --- Medición de rendimiento: Fin de la operación de doble clic ---
             # Registra el tiempo inmediatamente después de que la operación de doble clic se ha completado.
-            end_time_dblclick = time.time()
+            end_time_dblclick = time.perf_counter()
             # Calcula la duración total de la operación de doble clic.
             # Esta métrica es crucial para evaluar la **reactividad de la UI**
             # ante interacciones más complejas como el doble clic.
             duration_dblclick = end_time_dblclick - start_time_dblclick
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el doble clic en el elemento '{selector}': {duration_dblclick:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el doble clic en el elemento '%s': %.4f segundos.", selector, duration_dblclick)
+            self.base.registrar_metrica("hacer_doble_click_en_elemento", duration_dblclick, medicion="dblclick", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Doble click realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Doble click realizado exitosamente en el elemento con selector '%s'.", selector)
             # Toma una captura de pantalla del estado de la página *después* de realizar el doble clic.
-            self.base.tomar_captura(f"{nombre_base}_despues_doble_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_doble_click", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -1000,7 +1258,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_doble_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_doble_click", directorio, es_fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -1014,7 +1272,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_doble_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_doble_click", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1025,9 +1283,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_doble_click", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_doble_click", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def hacer_hover_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Realiza una acción de **hover (pasar el ratón por encima)** sobre un elemento
@@ -1053,7 +1312,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando hacer hover sobre el elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando hacer hover sobre el elemento con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1063,13 +1322,13 @@ class ElementActions:
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de realizar el hover.
-            self.base.tomar_captura(f"{nombre_base}_antes_hover", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_hover", directorio, locator=locator)
 
             # --- Medición de rendimiento: Inicio de la operación de hover ---
             # Registra el tiempo justo antes de ejecutar la acción de 'hover'.
-            start_time_hover = time.time()
+            start_time_hover = time.perf_counter()
 
             # Realiza el hover sobre el elemento. El método `hover()` de Playwright
             # esperará automáticamente a que el elemento sea visible y esté listo para la interacción.
@@ -1078,17 +1337,18 @@ class ElementActions:
 
             # --- Medición de rendimiento: Fin de la operación de hover ---
             # Registra el tiempo inmediatamente después de que la operación de hover se ha completado.
-            end_time_hover = time.time()
+            end_time_hover = time.perf_counter()
             # Calcula la duración total de la operación de hover.
             # Esta métrica es importante para evaluar la **reactividad de la UI**
             # ante interacciones que revelan tooltips, menús desplegables, etc.
             duration_hover = end_time_hover - start_time_hover
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el hover en el elemento '{selector}': {duration_hover:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el hover en el elemento '%s': %.4f segundos.", selector, duration_hover)
+            self.base.registrar_metrica("hacer_hover_en_elemento", duration_hover, medicion="hover", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Hover realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Hover realizado exitosamente en el elemento con selector '%s'.", selector)
             # Toma una captura de pantalla del estado de la página *después* de realizar el hover.
             # Esta captura es especialmente útil si el hover revela nuevos elementos (ej., un menú).
-            self.base.tomar_captura(f"{nombre_base}_despues_hover", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_hover", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -1100,7 +1360,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_hover", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_hover", directorio, es_fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -1114,7 +1374,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_hover", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_hover", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1125,9 +1385,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_hover", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_hover", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def verificar_elemento_habilitado(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica si un elemento está **habilitado (enabled)** en la página web.
@@ -1156,7 +1417,7 @@ class ElementActions:
                    (ej., selector inválido, problema con el navegador).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nVerificando si el elemento con selector '{selector}' está habilitado. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nVerificando si el elemento con selector '%s' está habilitado. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1166,11 +1427,11 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la verificación de habilitación ---
         # Registra el tiempo justo antes de iniciar la aserción de habilitación.
-        start_time_enabled_check = time.time()
+        start_time_enabled_check = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
 
             # Playwright espera a que el elemento esté habilitado.
             # El `timeout` se especifica en milisegundos.
@@ -1178,23 +1439,24 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la verificación ---
             # Registra el tiempo una vez que la aserción de habilitación ha sido exitosa.
-            end_time_enabled_check = time.time()
+            end_time_enabled_check = time.perf_counter()
             # Calcula la duración total de la verificación de habilitación.
             # Esta métrica es importante para evaluar la **velocidad con la que los elementos
             # interactivos de la UI se vuelven funcionales**. Un tiempo de habilitación
             # prolongado podría indicar problemas de carga de JavaScript o de renderizado.
             duration_enabled_check = end_time_enabled_check - start_time_enabled_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el elemento '{selector}' está habilitado: {duration_enabled_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en verificar que el elemento '%s' está habilitado: %.4f segundos.", selector, duration_enabled_check)
+            self.base.registrar_metrica("verificar_elemento_habilitado", duration_enabled_check, medicion="enabled_check", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' está habilitado.")
+            self.logger.info("\n✔ ÉXITO: El elemento '%s' está habilitado.", selector)
             # Toma una captura de pantalla al verificar que el elemento está habilitado con éxito.
-            self.base.tomar_captura(f"{nombre_base}_habilitado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_habilitado", directorio, locator=locator)
             return True
 
         except TimeoutError as e:
             # Captura específica para cuando el elemento no está habilitado dentro del tiempo especificado.
             # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_enabled_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO está habilitado "
@@ -1203,7 +1465,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False en lugar de fallar la prueba.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_NO_habilitado_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_NO_habilitado_timeout", directorio, es_fallo=True)
             return False
 
         except AssertionError as e:
@@ -1217,7 +1479,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg) # Usa 'warning' aquí también.
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.base.tomar_captura(f"{nombre_base}_NO_habilitado_fallo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_NO_habilitado_fallo", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -1229,7 +1491,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_habilitado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_habilitado", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1240,9 +1502,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_habilitado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_habilitado", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def mouse_mueve_y_hace_clic_xy(self, x: int, y: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 1.0):
         """
         Mueve el cursor del mouse a las coordenadas de pantalla (X, Y) especificadas y luego
@@ -1268,14 +1531,14 @@ class ElementActions:
             ValueError: Si las coordenadas X o Y no son números enteros.
             Exception: Para cualquier error inesperado que ocurra durante la operación del mouse.
         """
-        self.logger.info(f"\nIntentando mover el mouse a X:{x}, Y:{y} y haciendo click.")
+        self.logger.info("\nIntentando mover el mouse a X:%s, Y:%s y haciendo click.", x, y)
 
         # --- Validaciones de entrada ---
         # Asegura que las coordenadas sean de tipo entero para evitar errores inesperados con mouse.move/click.
         if not isinstance(x, int) or not isinstance(y, int):
             error_msg = f"\n❌ ERROR: Las coordenadas X ({x}) e Y ({y}) deben ser números enteros."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_coordenadas_invalidas", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_coordenadas_invalidas", directorio, es_fallo=True)
             raise ValueError(error_msg)
 
         try:
@@ -1284,26 +1547,27 @@ class ElementActions:
             
             # --- Medición de rendimiento: Inicio de la operación del mouse ---
             # Registra el tiempo justo antes de iniciar el movimiento y clic del mouse.
-            start_time_mouse_action = time.time()
+            start_time_mouse_action = time.perf_counter()
 
             # Mueve el cursor del mouse a las coordenadas especificadas.
             # `steps=5` hace que el movimiento sea más suave, simulando un usuario real.
             self.page.mouse.move(x, y, steps=5) 
-            self.logger.debug(f"\nMouse movido a X:{x}, Y:{y}.")
+            self.logger.debug("\nMouse movido a X:%s, Y:%s.", x, y)
             
             # Realiza un clic en las mismas coordenadas.
             self.page.mouse.click(x, y)
 
             # --- Medición de rendimiento: Fin de la operación del mouse ---
             # Registra el tiempo inmediatamente después de que el clic se ha completado.
-            end_time_mouse_action = time.time()
+            end_time_mouse_action = time.perf_counter()
             # Calcula la duración total de la secuencia de movimiento y clic.
             # Esta métrica es relevante para acciones de UI que dependen de interacciones
             # de ratón muy precisas y para evaluar la latencia percibida en estas acciones.
             duration_mouse_action = end_time_mouse_action - start_time_mouse_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en mover y hacer clic en X:{x}, Y:{y}: {duration_mouse_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en mover y hacer clic en X:%s, Y:%s: %.4f segundos.", x, y, duration_mouse_action)
+            self.base.registrar_metrica("mouse_mueve_y_hace_clic_xy", duration_mouse_action, medicion="mouse_action")
 
-            self.logger.info(f"\n✔ ÉXITO: Click realizado en X:{x}, Y:{y}.")
+            self.logger.info("\n✔ ÉXITO: Click realizado en X:%s, Y:%s.", x, y)
             # Toma una captura de pantalla del estado de la página *después* de la acción del mouse.
             self.base.tomar_captura(f"{nombre_base}_despues_mouse_click_xy", directorio)
 
@@ -1316,7 +1580,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_click_xy", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_click_xy", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1327,9 +1591,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_click_xy", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_click_xy", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def marcar_checkbox(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Marca un checkbox especificado por su selector y verifica que se haya marcado
@@ -1354,7 +1619,7 @@ class ElementActions:
                             dentro del tiempo límite, o si ocurre un error de Playwright.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando marcar el checkbox con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando marcar el checkbox con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1364,13 +1629,13 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la operación de marcado y verificación ---
         # Registra el tiempo justo antes de iniciar la operación.
-        start_time_checkbox_action = time.time()
+        start_time_checkbox_action = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de marcar el checkbox.
-            self.base.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio, locator=locator)
             
             # Marca el checkbox. Playwright esperará automáticamente a que sea interactuable.
             locator.check()
@@ -1379,21 +1644,22 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la operación ---
             # Registra el tiempo una vez que el checkbox ha sido marcado y verificado con éxito.
-            end_time_checkbox_action = time.time()
+            end_time_checkbox_action = time.perf_counter()
             # Calcula la duración total de la operación.
             # Esta métrica es importante para evaluar la **capacidad de respuesta de los elementos
             # de formulario** y la velocidad de actualización de su estado en la UI.
             duration_checkbox_action = end_time_checkbox_action - start_time_checkbox_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en marcar y verificar el checkbox '{selector}': {duration_checkbox_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en marcar y verificar el checkbox '%s': %.4f segundos.", selector, duration_checkbox_action)
+            self.base.registrar_metrica("marcar_checkbox", duration_checkbox_action, medicion="checkbox_action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' marcado y verificado exitosamente.")
+            self.logger.info("\n✔ ÉXITO: Checkbox con selector '%s' marcado y verificado exitosamente.", selector)
             # Toma una captura de pantalla del estado de la página *después* de marcar el checkbox.
-            self.base.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para cuando la operación de marcar o la verificación fallan por tiempo.
             # Registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_checkbox_action # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El checkbox con selector '{selector}' no pudo ser marcado "
@@ -1402,7 +1668,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_marcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_marcar", directorio, es_fallo=True)
             # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
             raise AssertionError(f"\nCheckbox no marcado/verificado (Timeout): {selector}") from e
 
@@ -1414,7 +1680,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_marcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_marcar", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -1424,9 +1690,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_marcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_marcar", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def desmarcar_checkbox(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Desmarca un checkbox especificado por su selector y verifica que se haya desmarcado
@@ -1451,7 +1718,7 @@ class ElementActions:
                             dentro del tiempo límite, o si ocurre un error de Playwright.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIntentando desmarcar el checkbox con selector: '{selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIntentando desmarcar el checkbox con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1461,13 +1728,13 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la operación de desmarcado y verificación ---
         # Registra el tiempo justo antes de iniciar la operación.
-        start_time_checkbox_action = time.time()
+        start_time_checkbox_action = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la página *antes* de desmarcar el checkbox.
-            self.base.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio, locator=locator)
             
             # Desmarca el checkbox. Playwright esperará automáticamente a que sea interactuable.
             locator.uncheck()
@@ -1476,21 +1743,22 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la operación ---
             # Registra el tiempo una vez que el checkbox ha sido desmarcado y verificado con éxito.
-            end_time_checkbox_action = time.time()
+            end_time_checkbox_action = time.perf_counter()
             # Calcula la duración total de la operación.
             # Esta métrica es importante para evaluar la **capacidad de respuesta de los elementos
             # de formulario** y la velocidad de actualización de su estado en la UI.
             duration_checkbox_action = end_time_checkbox_action - start_time_checkbox_action
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en desmarcar y verificar el checkbox '{selector}': {duration_checkbox_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en desmarcar y verificar el checkbox '%s': %.4f segundos.", selector, duration_checkbox_action)
+            self.base.registrar_metrica("desmarcar_checkbox", duration_checkbox_action, medicion="checkbox_action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' desmarcado y verificado exitosamente.")
+            self.logger.info("\n✔ ÉXITO: Checkbox con selector '%s' desmarcado y verificado exitosamente.", selector)
             # Toma una captura de pantalla del estado de la página *después* de desmarcar el checkbox.
-            self.base.tomar_captura(f"{nombre_base}_despues_desmarcar_checkbox", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_desmarcar_checkbox", directorio, locator=locator)
 
         except TimeoutError as e:
             # Captura específica para cuando la operación de desmarcar o la verificación fallan por tiempo.
             # Registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_checkbox_action # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El checkbox con selector '{selector}' no pudo ser desmarcado "
@@ -1499,7 +1767,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_desmarcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_desmarcar", directorio, es_fallo=True)
             # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
             raise AssertionError(f"\nCheckbox no desmarcado/verificado (Timeout): {selector}") from e
 
@@ -1511,7 +1779,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_desmarcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_desmarcar", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -1521,9 +1789,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_desmarcar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_desmarcar", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def verificar_valor_campo(self, selector: Union[str, Locator], valor_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **valor de un campo de texto** coincida con el `valor_esperado`.
@@ -1554,7 +1823,7 @@ class ElementActions:
             Error: Si ocurre un problema específico de Playwright (ej., selector inválido, elemento no es un campo de texto).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nVerificando que el campo '{selector}' contiene el valor esperado: '{valor_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nVerificando que el campo '%s' contiene el valor esperado: '%s'. Tiempo máximo de espera: %ss.", selector, valor_esperado, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1563,23 +1832,24 @@ class ElementActions:
             locator = selector
 
         # --- Medición de rendimiento: Inicio de la verificación del valor del campo ---
-        start_time_value_check = time.time()
+        start_time_value_check = time.perf_counter()
 
         try:
-            locator.highlight()
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_campo", directorio)
+            self.base.resaltar_elemento(locator)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_campo", directorio, locator=locator)
             
             # Playwright espera a que el campo contenga el valor especificado.
             # El `timeout` se especifica en milisegundos.
             expect(locator).to_have_value(valor_esperado)
             
             # --- Medición de rendimiento: Fin de la verificación ---
-            end_time_value_check = time.time()
+            end_time_value_check = time.perf_counter()
             duration_value_check = end_time_value_check - start_time_value_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor '{valor_esperado}': {duration_value_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en verificar que el campo '%s' contiene el valor '%s': %.4f segundos.", selector, valor_esperado, duration_value_check)
+            self.base.registrar_metrica("verificar_valor_campo", duration_value_check, medicion="value_check", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor esperado: '{valor_esperado}'.")
-            self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_campo", directorio)
+            self.logger.info("\n✔ ÉXITO: El campo '%s' contiene el valor esperado: '%s'.", selector, valor_esperado)
+            self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_campo", directorio, locator=locator)
             return True
 
         except (TimeoutError, AssertionError) as e:
@@ -1590,14 +1860,14 @@ class ElementActions:
             except Exception:
                 pass
             
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_value_check
             error_msg = (
                 f"\n❌ FALLO (Aserción): El campo '{selector}' NO contiene el valor esperado '{valor_esperado}'. "
                 f"Valor actual: '{actual_value}'. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_valor_campo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_valor_campo", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que Pytest la detecte.
 
         except Error as e:
@@ -1607,7 +1877,7 @@ class ElementActions:
                 f"Esto indica un problema con el selector. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_campo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_campo", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1617,9 +1887,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_campo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_campo", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def verificar_valor_campo_numerico_int(self, selector: Union[str, Locator], valor_numerico_esperado: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **valor de un campo de texto**, interpretado como un **número entero**,
@@ -1653,7 +1924,7 @@ class ElementActions:
                    (ej., selector inválido, elemento no es un campo de texto).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nVerificando que el campo '{selector}' contiene el valor numérico entero esperado: '{valor_numerico_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nVerificando que el campo '%s' contiene el valor numérico entero esperado: '%s'. Tiempo máximo de espera: %ss.", selector, valor_numerico_esperado, tiempo)
 
         # --- Validación de entrada: Asegura que el valor esperado es un entero ---
         # Es crucial que el valor esperado sea un entero para la lógica de la función.
@@ -1663,7 +1934,7 @@ class ElementActions:
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_tipo_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_tipo_valor_int", directorio, es_fallo=True)
             raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -1674,14 +1945,14 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la verificación del valor numérico ---
         # Registra el tiempo justo antes de iniciar la aserción del valor.
-        start_time_numeric_check = time.time()
+        start_time_numeric_check = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
             # Esto puede ser útil para ver el valor inicial si es diferente al esperado.
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_int", directorio, locator=locator)
 
             # Playwright espera a que el campo contenga el valor especificado (convertido a cadena).
             # El `timeout` se especifica en milisegundos.
@@ -1691,17 +1962,18 @@ class ElementActions:
             
             # --- Medición de rendimiento: Fin de la verificación ---
             # Registra el tiempo una vez que la aserción del valor ha sido exitosa.
-            end_time_numeric_check = time.time()
+            end_time_numeric_check = time.perf_counter()
             # Calcula la duración total de la verificación del valor.
             # Esta métrica es importante para evaluar la **velocidad con la que los campos
             # numéricos se pueblan o actualizan** en la UI, lo cual puede depender de la carga
             # de datos, cálculos en el frontend o lógica de la aplicación que establece los valores.
             duration_numeric_check = end_time_numeric_check - start_time_numeric_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor numérico '{valor_numerico_esperado}': {duration_numeric_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en verificar que el campo '%s' contiene el valor numérico '%s': %.4f segundos.", selector, valor_numerico_esperado, duration_numeric_check)
+            self.base.registrar_metrica("verificar_valor_campo_numerico_int", duration_numeric_check, medicion="numeric_check", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor numérico entero esperado: '{valor_numerico_esperado}'.")
+            self.logger.info("\n✔ ÉXITO: El campo '%s' contiene el valor numérico entero esperado: '%s'.", selector, valor_numerico_esperado)
             # Toma una captura de pantalla al verificar que el campo tiene el valor esperado.
-            self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_int", directorio, locator=locator)
             return True
 
         except TimeoutError as e:
@@ -1714,7 +1986,7 @@ class ElementActions:
             except Exception:
                 pass # Ignora si no se puede obtener el valor (ej., elemento no existe o no es input)
 
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_numeric_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El campo '{selector}' no contiene el valor entero esperado '{valor_numerico_esperado}' "
@@ -1723,7 +1995,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_int", directorio, es_fallo=True)
             return False
 
         except AssertionError as e:
@@ -1745,7 +2017,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg) # Usa 'warning' aquí también.
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_valor_int", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -1757,7 +2029,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_int", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1768,9 +2040,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_int", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_int", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def verificar_valor_campo_numerico_float(self, selector: Union[str, Locator], valor_numerico_esperado: float, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, tolerancia: float = 1e-6) -> bool:
         """
         Verifica que el **valor de un campo de texto**, interpretado como un **número flotante**,
@@ -1807,7 +2080,7 @@ class ElementActions:
                    (ej., selector inválido, elemento no es un campo de texto).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nVerificando que el campo '{selector}' contiene el valor numérico flotante esperado: '{valor_numerico_esperado}' con tolerancia {tolerancia}. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nVerificando que el campo '%s' contiene el valor numérico flotante esperado: '%s' con tolerancia %s. Tiempo máximo de espera: %ss.", selector, valor_numerico_esperado, tolerancia, tiempo)
 
         # --- Validación de entrada: Asegura que el valor esperado es un flotante y la tolerancia es un flotante ---
         if not isinstance(valor_numerico_esperado, float):
@@ -1816,7 +2089,7 @@ class ElementActions:
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_tipo_valor_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_tipo_valor_float", directorio, es_fallo=True)
             raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
         
         if not isinstance(tolerancia, float) or tolerancia < 0:
@@ -1825,7 +2098,7 @@ class ElementActions:
                 f"pero se recibió un tipo: {type(tolerancia).__name__} con valor '{tolerancia}'."
             )
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_tipo_tolerancia_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_tipo_tolerancia_float", directorio, es_fallo=True)
             raise TypeError(error_msg)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -1836,13 +2109,13 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la verificación del valor flotante ---
         # Registra el tiempo justo antes de iniciar la operación de verificación.
-        start_time_float_check = time.time()
+        start_time_float_check = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado del campo *antes* de la verificación.
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_valor_float", directorio, locator=locator)
 
             # Primero, asegurar que el campo es visible y está presente en el DOM
             # Esto es necesario porque `input_value()` no tiene un mecanismo de espera.
@@ -1858,13 +2131,14 @@ class ElementActions:
             # `math.isclose` es la forma recomendada para comparar flotantes.
             if math.isclose(actual_value_float, valor_numerico_esperado, rel_tol=tolerancia, abs_tol=tolerancia):
                 # --- Medición de rendimiento: Fin de la verificación (éxito) ---
-                end_time_float_check = time.time()
+                end_time_float_check = time.perf_counter()
                 duration_float_check = end_time_float_check - start_time_float_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar que el campo '{selector}' contiene el valor flotante '{valor_numerico_esperado}': {duration_float_check:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo que tardó en verificar que el campo '%s' contiene el valor flotante '%s': %.4f segundos.", selector, valor_numerico_esperado, duration_float_check)
+                self.base.registrar_metrica("verificar_valor_campo_numerico_float", duration_float_check, medicion="float_check", locator=selector)
 
-                self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' contiene el valor numérico flotante esperado: '{valor_numerico_esperado}' (Actual: {actual_value_float}).")
+                self.logger.info("\n✔ ÉXITO: El campo '%s' contiene el valor numérico flotante esperado: '%s' (Actual: %s).", selector, valor_numerico_esperado, actual_value_float)
                 # Toma una captura de pantalla al verificar que el campo tiene el valor esperado.
-                self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_float", directorio)
+                self.base.tomar_captura(f"{nombre_base}_despues_verificar_valor_float", directorio, locator=locator)
                 return True
             else:
                 # Si la comparación con tolerancia falla
@@ -1874,7 +2148,7 @@ class ElementActions:
                     f"Diferencia: {abs(actual_value_float - valor_numerico_esperado):.10f} (Tolerancia: {tolerancia})."
                 )
                 self.logger.warning(error_msg)
-                self.base.tomar_captura(f"{nombre_base}_fallo_inexactitud_float", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_inexactitud_float", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -1887,7 +2161,7 @@ class ElementActions:
             except Exception:
                 pass # Ignora si no se puede obtener.
 
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_float_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El campo '{selector}' no se hizo visible o no se pudo obtener su valor "
@@ -1895,7 +2169,7 @@ class ElementActions:
                 f"Valor actual (si disponible): '{actual_value_str_on_timeout}'. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_float", directorio, es_fallo=True)
             return False
 
         except ValueError:
@@ -1905,7 +2179,7 @@ class ElementActions:
                 f"no pudo ser convertido a flotante para comparación. Se esperaba '{valor_numerico_esperado}'."
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -1917,7 +2191,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_float", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1928,9 +2202,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_float", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_float", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
+    @medir_accion
     def verificar_alt_imagen(self, selector: Union[str, Locator], texto_alt_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que el **texto del atributo 'alt' de una imagen** coincida con el
@@ -1962,7 +2237,7 @@ class ElementActions:
                    (ej., selector inválido, el elemento no es una imagen).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nVerificando el texto 'alt' para la imagen con selector: '{selector}'. Valor esperado: '{texto_alt_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nVerificando el texto 'alt' para la imagen con selector: '%s'. Valor esperado: '%s'. Tiempo máximo de espera: %ss.", selector, texto_alt_esperado, tiempo)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
         if isinstance(selector, str):
@@ -1972,18 +2247,18 @@ class ElementActions:
 
         # --- Medición de rendimiento: Inicio de la verificación del texto 'alt' ---
         # Registra el tiempo justo antes de iniciar la operación de verificación.
-        start_time_alt_check = time.time()
+        start_time_alt_check = time.perf_counter()
 
         try:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
-            locator.highlight()
+            self.base.resaltar_elemento(locator)
             # Toma una captura de pantalla del estado de la imagen *antes* de la verificación.
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_alt_imagen", directorio)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_alt_imagen", directorio, locator=locator)
 
             # Esperar a que la imagen sea visible y esté adjunta al DOM.
             # Esto es crucial antes de intentar obtener atributos, ya que asegura que el elemento está cargado.
             expect(locator).to_be_visible()
-            self.logger.debug(f"\nLa imagen con selector '{selector}' es visible.")
+            self.logger.debug("\nLa imagen con selector '%s' es visible.", selector)
 
             # Obtener el atributo 'alt' de la imagen.
             # `get_attribute` también tiene un `timeout` que esperará hasta que el atributo esté presente.
@@ -1993,13 +2268,14 @@ class ElementActions:
             # La comparación debe ser estricta para asegurar que el atributo existe y es correcto.
             if alt_text_actual == texto_alt_esperado:
                 # --- Medición de rendimiento: Fin de la verificación (éxito) ---
-                end_time_alt_check = time.time()
+                end_time_alt_check = time.perf_counter()
                 duration_alt_check = end_time_alt_check - start_time_alt_check
-                self.logger.info(f"PERFORMANCE: Tiempo que tardó en verificar el texto 'alt' de la imagen '{selector}': {duration_alt_check:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo que tardó en verificar el texto 'alt' de la imagen '%s': %.4f segundos.", selector, duration_alt_check)
+                self.base.registrar_metrica("verificar_alt_imagen", duration_alt_check, medicion="alt_check", locator=selector)
 
-                self.logger.info(f"\n✔ ÉXITO: El texto 'alt' de la imagen es '{alt_text_actual}' y coincide con el esperado ('{texto_alt_esperado}').")
+                self.logger.info("\n✔ ÉXITO: El texto 'alt' de la imagen es '%s' y coincide con el esperado ('%s').", alt_text_actual, texto_alt_esperado)
                 # Toma una captura de pantalla al verificar que el 'alt' de la imagen es el esperado.
-                self.base.tomar_captura(f"{nombre_base}_alt_ok", directorio)
+                self.base.tomar_captura(f"{nombre_base}_alt_ok", directorio, locator=locator)
                 return True
             else:
                 # Si el texto 'alt' no coincide con el esperado
@@ -2009,7 +2285,7 @@ class ElementActions:
                 )
                 self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
                 # Toma una captura de pantalla si el texto 'alt' no coincide.
-                self.base.tomar_captura(f"{nombre_base}_alt_error", directorio)
+                self.base.tomar_captura(f"{nombre_base}_alt_error", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -2021,7 +2297,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_alt_imagen", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_alt_imagen", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -2033,7 +2309,7 @@ class ElementActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_alt_imagen", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_alt_imagen", directorio, es_fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -2044,9 +2320,10 @@ class ElementActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_alt_imagen", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_alt_imagen", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def verificar_carga_exitosa_imagen(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_red: Union[int, float] = 10.0, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Verifica que una **imagen especificada por su selector** se cargue exitosamente,
@@ -2073,14 +2350,14 @@ class ElementActions:
             Error: Si ocurre un problema específico de Playwright (ej., selector inválido).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIniciando verificación de carga exitosa para la imagen con selector: '{selector}'. Tiempo de espera de red: {tiempo_espera_red}s.")
+        self.logger.info("\nIniciando verificación de carga exitosa para la imagen con selector: '%s'. Tiempo de espera de red: %ss.", selector, tiempo_espera_red)
 
         if isinstance(selector, str):
             locator = self.page.locator(selector)
         else:
             locator = selector
 
-        start_time_image_load_check = time.time()
+        start_time_image_load_check = time.perf_counter()
         
         # Intenta obtener la URL de la imagen. La aserción de visibilidad es la forma más
         # robusta de garantizar que el elemento existe y tiene un src.
@@ -2090,18 +2367,18 @@ class ElementActions:
         except Exception as e:
             error_msg = f"\n❌ FALLO: La imagen con selector '{selector}' no es visible o no tiene un atributo 'src'. Detalles: {e}"
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_no_visible_o_src_missing", directorio)
+            self.tomar_captura(f"{nombre_base}_no_visible_o_src_missing", directorio, es_fallo=True)
             raise ValueError(error_msg)
 
-        self.logger.info(f"\nLa imagen con selector '{selector}' es visible en el DOM y tiene la URL: {image_url}")
+        self.logger.info("\nLa imagen con selector '%s' es visible en el DOM y tiene la URL: %s", selector, image_url)
 
         try:
-            locator.highlight()
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_carga_imagen", directorio)
+            self.base.resaltar_elemento(locator)
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_carga_imagen", directorio, locator=locator)
 
             # Usamos page.wait_for_event para esperar la respuesta de red.
             # Esto es compatible con la API síncrona de Playwright.
-            self.logger.debug(f"\nEsperando respuesta de red para la imagen con URL: {image_url} (timeout: {tiempo_espera_red}s).")
+            self.logger.debug("\nEsperando respuesta de red para la imagen con URL: %s (timeout: %ss).", image_url, tiempo_espera_red)
             
             # El evento 'response' se dispara cuando una respuesta de red se completa.
             response = self.page.wait_for_event(
@@ -2113,21 +2390,22 @@ class ElementActions:
             # 4. Verificar el código de estado de la respuesta HTTP.
             if 200 <= response.status <= 299:
                 # Medición de rendimiento y logging de éxito.
-                end_time_image_load_check = time.time()
+                end_time_image_load_check = time.perf_counter()
                 duration_image_load_check = end_time_image_load_check - start_time_image_load_check
-                self.logger.info(f"PERFORMANCE: Tiempo total para verificar la carga exitosa de la imagen '{selector}' (URL: {image_url}): {duration_image_load_check:.4f} segundos.")
-                self.logger.info(f"\n✔ ÉXITO: La imagen con URL '{image_url}' cargó exitosamente con estado HTTP {response.status}.")
-                self.base.tomar_captura(f"{nombre_base}_carga_ok", directorio)
+                self.logger.info("PERFORMANCE: Tiempo total para verificar la carga exitosa de la imagen '%s' (URL: %s): %.4f segundos.", selector, image_url, duration_image_load_check)
+                self.base.registrar_metrica("verificar_carga_exitosa_imagen", duration_image_load_check, medicion="image_load_check", locator=selector)
+                self.logger.info("\n✔ ÉXITO: La imagen con URL '%s' cargó exitosamente con estado HTTP %s.", image_url, response.status)
+                self.base.tomar_captura(f"{nombre_base}_carga_ok", directorio, locator=locator)
                 return True
             else:
                 error_msg = f"\n❌ FALLO: La imagen con URL '{image_url}' cargó con un estado de error: {response.status}."
                 self.logger.error(error_msg)
-                self.base.tomar_captura(f"{nombre_base}_carga_fallida_status_{response.status}", directorio)
+                self.base.tomar_captura(f"{nombre_base}_carga_fallida_status_{response.status}", directorio, es_fallo=True)
                 raise ValueError(error_msg)
 
         except TimeoutError as e:
             # Captura si el elemento no aparece o la respuesta de red no llega a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_image_load_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo verificar la carga de la imagen con selector '{selector}' "
@@ -2136,7 +2414,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que la función devuelve False.
-            self.base.tomar_captura(f"{nombre_base}_timeout_verificacion", directorio)
+            self.base.tomar_captura(f"{nombre_base}_timeout_verificacion", directorio, es_fallo=True)
             raise TimeoutError(error_msg) # Eleva un error de timeout específico.
 
         except Error as e: # Captura errores específicos de Playwright (ej., selector inválido, no es un elemento de imagen)
@@ -2146,7 +2424,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -2156,9 +2434,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
                 
+    @medir_accion
     def obtener_valor_elemento(self, selector: Locator, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5) -> Optional[str]:
         """
         Extrae y retorna el valor de un elemento dado su Playwright Locator.
@@ -2188,34 +2467,34 @@ class ElementActions:
                             o si ocurre un error inesperado de Playwright o genérico
                             que impida la extracción del valor.
         """
-        self.logger.info(f"\n⚙️ Extrayendo valor del elemento con selector: '{selector}'. Tiempo máximo de espera: {tiempo_espera_elemento}s.")
+        self.logger.info("\n⚙️ Extrayendo valor del elemento con selector: '%s'. Tiempo máximo de espera: %ss.", selector, tiempo_espera_elemento)
         valor_extraido = None
         
         # --- Medición de rendimiento: Inicio de la extracción del valor ---
         # Registra el tiempo justo antes de iniciar la interacción con el elemento.
-        start_time_extraction = time.time()
+        start_time_extraction = time.perf_counter()
 
         try:
             # 1. Asegurar que el elemento esté visible y habilitado
             # Estas aserciones son cruciales para garantizar que el elemento está listo para interactuar.
-            self.logger.debug(f"\nEsperando que el elemento '{selector}' sea visible (timeout: {tiempo_espera_elemento}s).")
+            self.logger.debug("\nEsperando que el elemento '%s' sea visible (timeout: %ss).", selector, tiempo_espera_elemento)
             expect(selector).to_be_visible()
             
-            self.logger.debug(f"\nEsperando que el elemento '{selector}' esté habilitado (timeout: {tiempo_espera_elemento}s).")
+            self.logger.debug("\nEsperando que el elemento '%s' esté habilitado (timeout: %ss).", selector, tiempo_espera_elemento)
             expect(selector).to_be_enabled()
 
             # Resaltar el elemento para depuración visual y tomar una captura.
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
-            self.logger.debug(f"\nElemento '{selector}' es visible y habilitado.")
+            self.logger.debug("\nElemento '%s' es visible y habilitado.", selector)
 
             # 2. Intentar extraer el valor usando diferentes métodos de Playwright
             # Priorizamos `input_value` para campos de formulario (<input>, <textarea>, <select>).
             try:
                 valor_extraido = selector.input_value() # Un timeout corto para input_value
-                self.logger.debug(f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
+                self.logger.debug("\nValor extraído (input_value) de '%s': '%s'", selector, valor_extraido)
             except Error as e_input: # Capturamos el error si input_value no es aplicable (ej. no es un elemento de entrada)
-                self.logger.debug(f"\ninput_value no aplicable o falló para '{selector}'. Intentando text_content/inner_text. Error: {e_input}")
+                self.logger.debug("\ninput_value no aplicable o falló para '%s'. Intentando text_content/inner_text. Error: %s", selector, e_input)
                 
                 # Si input_value falla, intentamos con text_content o inner_text para otros elementos (p. ej. <div>, <span>, <p>)
                 try:
@@ -2224,9 +2503,9 @@ class ElementActions:
                     # intentamos inner_text, que a veces es más preciso para texto renderizado visiblemente.
                     if valor_extraido is not None and valor_extraido.strip() == "":
                         valor_extraido = selector.inner_text() # Un timeout corto para inner_text
-                        self.logger.debug(f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}' (después de text_content vacío).")
+                        self.logger.debug("\nValor extraído (inner_text) de '%s': '%s' (después de text_content vacío).", selector, valor_extraido)
                     else:
-                        self.logger.debug(f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
+                        self.logger.debug("\nValor extraído (text_content) de '%s': '%s'", selector, valor_extraido)
                 except Error as e_text_inner:
                     self.logger.warning(f"\nNo se pudo extraer input_value, text_content ni inner_text de '{selector}'. Detalles: {e_text_inner}")
                     valor_extraido = None # Asegurarse de que sea None si todos los intentos fallan
@@ -2236,22 +2515,23 @@ class ElementActions:
             if valor_extraido is not None:
                 # Eliminar espacios en blanco al inicio y al final si el valor es una cadena.
                 valor_final = valor_extraido.strip() if isinstance(valor_extraido, str) else valor_extraido
-                self.logger.info(f"\n✅ Valor final obtenido del elemento '{selector}': '{valor_final}'")
+                self.logger.info("\n✅ Valor final obtenido del elemento '%s': '%s'", selector, valor_final)
                 self.base.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
             else:
                 self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
-                self.base.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio, es_fallo=True)
             
             # --- Medición de rendimiento: Fin de la extracción del valor ---
-            end_time_extraction = time.time()
+            end_time_extraction = time.perf_counter()
             duration_extraction = end_time_extraction - start_time_extraction
-            self.logger.info(f"PERFORMANCE: Tiempo total de extracción del valor del elemento '{selector}': {duration_extraction:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de extracción del valor del elemento '%s': %.4f segundos.", selector, duration_extraction)
+            self.base.registrar_metrica("obtener_valor_elemento", duration_extraction, medicion="extraction", locator=selector)
 
             return valor_final
 
         except TimeoutError as e:
             # Captura si el elemento no se vuelve visible o habilitado a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_extraction
             mensaje_error = (
                 f"\n❌ FALLO (Timeout): El elemento '{selector}' no se volvió visible/habilitado a tiempo "
@@ -2259,7 +2539,7 @@ class ElementActions:
                 f"para extraer su valor. Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio, es_fallo=True)
             # Elevar AssertionError para indicar un fallo de prueba claro.
             raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}") from e
 
@@ -2269,7 +2549,7 @@ class ElementActions:
                 f"\n❌ FALLO (Error de Playwright): Ocurrió un error de Playwright al intentar extraer el valor de '{selector}'. Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al extraer valor: {selector}") from e
 
         except Exception as e:
@@ -2278,9 +2558,10 @@ class ElementActions:
                 f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar extraer el valor de '{selector}'. Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al extraer valor: {selector}") from e
         
+    @medir_accion
     def obtener_valor_elemento_disabled(self, selector: Union[str, Locator], nombre_base: str, directorio: str, 
                                  tiempo_max_espera_visibilidad: Union[int, float] = 5.0, nombre_paso: str = "") -> Optional[str]:
         """
@@ -2315,17 +2596,17 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Extrayendo valor del elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Extrayendo valor del elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
         valor_extraido: Optional[str] = None # Para almacenar el valor extraído
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento y espera de visibilidad ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
@@ -2333,54 +2614,56 @@ class ElementActions:
             
             # Esperar a que el elemento sea visible antes de intentar extraer su valor
             expect(locator).to_be_visible()
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y espera de visibilidad para '{selector}': {duration_locator:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización y espera de visibilidad para '%s': %.4f segundos.", selector, duration_locator)
+            self.base.registrar_metrica("obtener_valor_elemento_disabled", duration_locator, medicion="locator", locator=selector)
             
             # Resaltar el elemento (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes de la extracción
-            self.base.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes de la extracción de valor: '{nombre_base}_antes_extraccion_valor.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_extraccion_valor", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes de la extracción de valor: '%s_antes_extraccion_valor.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de extracción del valor ---
-            start_time_extraction = time.time()
+            start_time_extraction = time.perf_counter()
             # Priorizamos input_value() para campos de formulario (incluyendo <select>, <input>, <textarea>)
             # input_value() extrae el valor del atributo 'value' o el contenido de <textarea>.
             try:
                 valor_extraido = locator.input_value()
-                self.logger.debug(f"\nValor extraído (input_value) de '{selector}': '{valor_extraido}'")
+                self.logger.debug("\nValor extraído (input_value) de '%s': '%s'", selector, valor_extraido)
             except Error as e: # Captura si no es un elemento de entrada o si falla la operación
-                self.logger.debug(f"\ninput_value no aplicable o falló para '{selector}' (Detalles: {e.message if hasattr(e, 'message') else str(e)}). Intentando text_content/inner_text.")
+                self.logger.debug("\ninput_value no aplicable o falló para '%s' (Detalles: %s). Intentando text_content/inner_text.", selector, (e.message if hasattr(e, 'message') else str(e)))
                 
                 # Si falla input_value, intentamos con inner_text o text_content para otros elementos
                 # inner_text() es a menudo preferible ya que devuelve el texto visible y renderizado.
                 try:
                     valor_extraido = locator.inner_text()
-                    self.logger.debug(f"\nValor extraído (inner_text) de '{selector}': '{valor_extraido}'")
+                    self.logger.debug("\nValor extraído (inner_text) de '%s': '%s'", selector, valor_extraido)
                 except Error as e_inner:
-                    self.logger.debug(f"\ninner_text falló para '{selector}' (Detalles: {e_inner.message if hasattr(e_inner, 'message') else str(e_inner)}). Intentando text_content.")
+                    self.logger.debug("\ninner_text falló para '%s' (Detalles: %s). Intentando text_content.", selector, (e_inner.message if hasattr(e_inner, 'message') else str(e_inner)))
                     try:
                         valor_extraido = locator.text_content()
-                        self.logger.debug(f"\nValor extraído (text_content) de '{selector}': '{valor_extraido}'")
+                        self.logger.debug("\nValor extraído (text_content) de '%s': '%s'", selector, valor_extraido)
                     except Error as e_text:
                         self.logger.warning(f"\nNo se pudo extraer input_value, inner_text ni text_content de '{selector}' (Detalles: {e_text.message if hasattr(e_text, 'message') else str(e_text)}).")
                         valor_extraido = None # Asegurarse de que sea None si todo falla
 
-            end_time_extraction = time.time()
+            end_time_extraction = time.perf_counter()
             duration_extraction = end_time_extraction - start_time_extraction
-            self.logger.info(f"PERFORMANCE: Tiempo de extracción del valor para '{selector}': {duration_extraction:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de extracción del valor para '%s': %.4f segundos.", selector, duration_extraction)
+            self.base.registrar_metrica("obtener_valor_elemento_disabled", duration_extraction, medicion="extraction", locator=selector)
 
             if valor_extraido is not None:
                 # Stripping whitespace for cleaner results if it's a string
                 valor_final = valor_extraido.strip() if isinstance(valor_extraido, str) else valor_extraido
-                self.logger.info(f"\n✅ Valor final obtenido del elemento '{selector}': '{valor_final}'")
-                self.base.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
+                self.logger.info("\n✅ Valor final obtenido del elemento '%s': '%s'", selector, valor_final)
+                self.base.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio, locator=locator)
                 return valor_final
             else:
                 self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
-                self.base.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio, es_fallo=True)
                 return None
 
         except TimeoutError as e:
@@ -2389,7 +2672,7 @@ class ElementActions:
                 f"no se volvió visible a tiempo ({tiempo_max_espera_visibilidad}s) para extraer su valor. Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio, es_fallo=True)
             # Elevar una excepción clara para que el flujo de la prueba se detenga si el elemento no está disponible
             raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
 
@@ -2399,7 +2682,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al extraer valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -2408,14 +2691,15 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al extraer valor: {selector}. Error: {e}") from e
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener_valor_de_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (obtener_valor_de_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("obtener_valor_elemento_disabled", duration_total_operation, medicion="total_operation", locator=selector)
             
             # El parámetro 'tiempo' original en tu función no tenía un uso claro aquí,
             # ya que las operaciones de extracción tienen sus propios timeouts o son sincrónicas.
@@ -2424,6 +2708,7 @@ class ElementActions:
             # adicional después de la extracción, se debería añadir un nuevo parámetro.
             pass
                 
+    @medir_accion
     def realizar_drag_and_drop(self, elemento_origen: Locator, elemento_destino: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", tiempo_espera_manual: float = 0.5, timeout_ms: int = 15000) -> None:
         """
         Realiza una operación de "Drag and Drop" de un elemento de origen a un elemento de destino.
@@ -2448,61 +2733,65 @@ class ElementActions:
             AssertionError: Si la operación de Drag and Drop (estándar o manual) falla,
                             o si los elementos no están listos para la interacción.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando realizar 'Drag and Drop' de '{elemento_origen}' a '{elemento_destino}' ---")
+        self.logger.info("\n--- %s: Intentando realizar 'Drag and Drop' de '%s' a '%s' ---", nombre_paso, elemento_origen, elemento_destino)
         
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Pre-validación: Verificar que ambos elementos estén visibles y habilitados antes de interactuar.
-            self.logger.info(f"\n🔍 Validando que el elemento de origen '{elemento_origen}' esté habilitado y listo para interactuar...")
+            self.logger.info("\n🔍 Validando que el elemento de origen '%s' esté habilitado y listo para interactuar...", elemento_origen)
             # --- Medición de rendimiento: Inicio pre-validación ---
-            start_time_pre_validation = time.time()
+            start_time_pre_validation = time.perf_counter()
             expect(elemento_origen).to_be_enabled()
             expect(elemento_destino).to_be_enabled()
             # --- Medición de rendimiento: Fin pre-validación ---
-            end_time_pre_validation = time.time()
+            end_time_pre_validation = time.perf_counter()
             duration_pre_validation = end_time_pre_validation - start_time_pre_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de pre-validación de elementos: {duration_pre_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de pre-validación de elementos: %.4f segundos.", duration_pre_validation)
+            self.base.registrar_metrica("realizar_drag_and_drop", duration_pre_validation, medicion="pre_validation")
             
-            self.logger.info(f"\n✅ Ambos elementos están habilitados y listos para 'Drag and Drop'.")
+            self.logger.info("\n✅ Ambos elementos están habilitados y listos para 'Drag and Drop'.")
             self.base.tomar_captura(f"{nombre_base}_antes_drag_and_drop", directorio)
 
             # 2. Intento 1: Usar el método .drag_to() del Locator (recomendado por Playwright)
-            self.logger.info(f"\n🔄 Intentando 'Drag and Drop' con el método estándar de Playwright (locator.drag_to())...")
+            self.logger.info("\n🔄 Intentando 'Drag and Drop' con el método estándar de Playwright (locator.drag_to())...")
             # --- Medición de rendimiento: Inicio drag_to ---
-            start_time_drag_to = time.time()
+            start_time_drag_to = time.perf_counter()
             try:
                 elemento_origen.drag_to(elemento_destino)
                 # --- Medición de rendimiento: Fin drag_to ---
-                end_time_drag_to = time.time()
+                end_time_drag_to = time.perf_counter()
                 duration_drag_to = end_time_drag_to - start_time_drag_to
-                self.logger.info(f"PERFORMANCE: Tiempo del método estándar 'drag_to': {duration_drag_to:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo del método estándar 'drag_to': %.4f segundos.", duration_drag_to)
+                self.base.registrar_metrica("realizar_drag_and_drop", duration_drag_to, medicion="drag_to")
 
-                self.logger.info(f"\n✅ 'Drag and Drop' realizado exitosamente con el método estándar.")
+                self.logger.info("\n✅ 'Drag and Drop' realizado exitosamente con el método estándar.")
                 self.base.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_estandar", directorio)
                 
                 # --- Medición de rendimiento: Fin total de la función ---
-                end_time_total_operation = time.time()
+                end_time_total_operation = time.perf_counter()
                 duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (estándar D&D): {duration_total_operation:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo total de la operación (estándar D&D): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("realizar_drag_and_drop", duration_total_operation, medicion="total_operation")
                 return # Si funciona, salimos de la función
 
             except (Error, TimeoutError) as e:
                 # Captura errores específicos de Playwright (incluyendo TimeoutError de drag_to)
                 self.logger.warning(f"\n⚠️ Advertencia: El método directo 'locator.drag_to()' falló con error de Playwright: {type(e).__name__}: {e}")
                 self.logger.info("\n🔄 Recurriendo a 'Drag and Drop' con método manual de Playwright (mouse.hover, mouse.down, mouse.up)...")
-                self.base.tomar_captura(f"{nombre_base}_fallo_directo_intentando_manual", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_directo_intentando_manual", directorio, es_fallo=True)
                 
                 # Registrar el rendimiento del intento fallido de drag_to
-                end_time_drag_to = time.time() # Registrar el tiempo que tomó fallar
+                end_time_drag_to = time.perf_counter() # Registrar el tiempo que tomó fallar
                 duration_drag_to = end_time_drag_to - start_time_drag_to
-                self.logger.info(f"PERFORMANCE: Tiempo del método estándar 'drag_to' (fallido): {duration_drag_to:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo del método estándar 'drag_to' (fallido): %.4f segundos.", duration_drag_to)
+                self.base.registrar_metrica("realizar_drag_and_drop", duration_drag_to, medicion="drag_to")
 
                 # 3. Intento 2 (Fallback): Usar el método manual
                 self._realizar_drag_and_drop_manual(elemento_origen, elemento_destino, nombre_base, directorio, nombre_paso, tiempo_pausa_mouse=tiempo_espera_manual, timeout_ms=timeout_ms)
-                self.logger.info(f"\n✅ 'Drag and Drop' realizado exitosamente con el método manual.")
-                self.base.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_manual", directorio)
+                self.logger.info("\n✅ 'Drag and Drop' realizado exitosamente con el método manual.")
+                self.base.tomar_captura(f"{nombre_base}_drag_and_drop_exitoso_manual", directorio, es_fallo=True)
 
         except (Error, TimeoutError) as e: # Captura errores de Playwright que puedan ocurrir fuera del drag_to o en la pre-validación
             error_msg = (
@@ -2510,7 +2799,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_drag_and_drop", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_drag_and_drop", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
         except Exception as e: # Captura cualquier otro error inesperado
             error_msg = (
@@ -2518,15 +2807,17 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_drag_and_drop", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_drag_and_drop", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función (si no se salió antes) ---
             if 'start_time_total_operation' in locals() and 'end_time_total_operation' not in locals():
-                end_time_total_operation = time.time()
+                end_time_total_operation = time.perf_counter()
                 duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (fallback manual D&D): {duration_total_operation:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo total de la operación (fallback manual D&D): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("realizar_drag_and_drop", duration_total_operation, medicion="total_operation")
         
+    @medir_accion
     def mover_slider_rango_doble(self, pulgar_izquierdo_locator: Locator, pulgar_derecho_locator: Locator, barra_slider_locator: Locator,
                             porcentaje_destino_izquierdo: float, porcentaje_destino_derecho: float,
                             nombre_base: str, directorio: str, nombre_paso: str = "",
@@ -2555,23 +2846,23 @@ class ElementActions:
             RuntimeError: Si no se puede obtener el bounding box de los elementos.
             AssertionError: Si ocurre un error de Playwright o un error inesperado durante la interacción.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando mover el slider de rango. Pulgar Izquierdo a {porcentaje_destino_izquierdo*100:.0f}%, Pulgar Derecho a {porcentaje_destino_derecho*100:.0f}% ---")
+        self.logger.info("\n--- %s: Intentando mover el slider de rango. Pulgar Izquierdo a %.0f%%, Pulgar Derecho a %.0f%% ---", nombre_paso, porcentaje_destino_izquierdo*100, porcentaje_destino_derecho*100)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         # 1. Validaciones iniciales de porcentajes
         if not (0.0 <= porcentaje_destino_izquierdo <= 1.0) or not (0.0 <= porcentaje_destino_derecho <= 1.0):
             error_msg = "\n❌ Los porcentajes de destino para ambos pulgares deben ser valores flotantes entre 0.0 (0%) y 1.0 (100%)."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_validacion_porcentajes", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_validacion_porcentajes", directorio, es_fallo=True)
             raise ValueError(error_msg)
         
         # Validación de negocio: el porcentaje izquierdo no puede ser mayor que el derecho
         if porcentaje_destino_izquierdo > porcentaje_destino_derecho:
             error_msg = "\n❌ El porcentaje del pulgar izquierdo no puede ser mayor que el del pulgar derecho."
             self.logger.error(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_error_validacion_orden_porcentajes", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_validacion_orden_porcentajes", directorio, es_fallo=True)
             raise ValueError(error_msg)
         
         elementos_a_validar: Dict[str, Locator] = {
@@ -2584,40 +2875,42 @@ class ElementActions:
             # 2. Pre-validación: Verificar visibilidad y habilitación de todos los elementos
             self.logger.info("\n🔍 Validando visibilidad y habilitación de los elementos del slider...")
             # --- Medición de rendimiento: Inicio pre-validación ---
-            start_time_pre_validation = time.time()
+            start_time_pre_validation = time.perf_counter()
             for nombre_elemento, localizador_elemento in elementos_a_validar.items():
                 expect(localizador_elemento).to_be_visible()
                 expect(localizador_elemento).to_be_enabled()
-                localizador_elemento.highlight() # Para visualización durante la ejecución
+                self.base.resaltar_elemento(localizador_elemento) # Para visualización durante la ejecución
                 self.base.esperar_fijo(0.1) # Pequeña pausa para que se vea el highlight
             
             # --- Medición de rendimiento: Fin pre-validación ---
-            end_time_pre_validation = time.time()
+            end_time_pre_validation = time.perf_counter()
             duration_pre_validation = end_time_pre_validation - start_time_pre_validation
-            self.logger.info(f"PERFORMANCE: Tiempo de pre-validación de elementos del slider: {duration_pre_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de pre-validación de elementos del slider: %.4f segundos.", duration_pre_validation)
+            self.base.registrar_metrica("mover_slider_rango_doble", duration_pre_validation, medicion="pre_validation")
             self.logger.info("\n✅ Todos los elementos del slider están visibles y habilitados.")
             self.base.tomar_captura(f"{nombre_base}_slider_elementos_listos", directorio)
 
             # 3. Obtener el bounding box de la barra del slider (esencial para el cálculo de posiciones)
             self.logger.debug("\n  --> Obteniendo bounding box de la barra del slider...")
             # --- Medición de rendimiento: Inicio obtener bounding box ---
-            start_time_get_bounding_box = time.time()
+            start_time_get_bounding_box = time.perf_counter()
             caja_barra = barra_slider_locator.bounding_box()
             if not caja_barra:
                 raise RuntimeError(f"\n❌ No se pudo obtener el bounding box de la barra del slider '{barra_slider_locator}'.")
             # --- Medición de rendimiento: Fin obtener bounding box ---
-            end_time_get_bounding_box = time.time()
+            end_time_get_bounding_box = time.perf_counter()
             duration_get_bounding_box = end_time_get_bounding_box - start_time_get_bounding_box
-            self.logger.info(f"PERFORMANCE: Tiempo de obtención de bounding box de la barra: {duration_get_bounding_box:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de obtención de bounding box de la barra: %.4f segundos.", duration_get_bounding_box)
+            self.base.registrar_metrica("mover_slider_rango_doble", duration_get_bounding_box, medicion="get_bounding_box")
 
             inicio_x_barra = caja_barra['x']
             ancho_barra = caja_barra['width']
             posicion_y_barra = caja_barra['y'] + (caja_barra['height'] / 2) # Y central de la barra para movimientos
 
             # --- 4. Mover Pulgar Izquierdo (Mínimo) ---
-            self.logger.info(f"\n🔄 Moviendo pulgar izquierdo a {porcentaje_destino_izquierdo*100:.0f}%...")
+            self.logger.info("\n🔄 Moviendo pulgar izquierdo a %.0f%%...", porcentaje_destino_izquierdo*100)
             # --- Medición de rendimiento: Inicio movimiento pulgar izquierdo ---
-            start_time_move_left_thumb = time.time()
+            start_time_move_left_thumb = time.perf_counter()
 
             caja_pulgar_izquierdo = pulgar_izquierdo_locator.bounding_box()
             if not caja_pulgar_izquierdo:
@@ -2632,9 +2925,9 @@ class ElementActions:
 
             # Verificar si el pulgar izquierdo ya está en la posición deseada dentro de la tolerancia
             if abs(posicion_x_actual_izquierdo_centro - posicion_x_destino_izquierdo) < tolerancia_pixeles:
-                self.logger.info(f"\n  > Pulgar izquierdo ya se encuentra en la posición deseada ({porcentaje_destino_izquierdo*100:.0f}%). No se requiere movimiento.")
+                self.logger.info("\n  > Pulgar izquierdo ya se encuentra en la posición deseada (%.0f%%). No se requiere movimiento.", porcentaje_destino_izquierdo*100)
             else:
-                self.logger.info(f"\n  > Iniciando arrastre de pulgar izquierdo de X={posicion_x_actual_izquierdo_centro:.0f} a X={posicion_x_destino_izquierdo:.0f}...")
+                self.logger.info("\n  > Iniciando arrastre de pulgar izquierdo de X=%.0f a X=%.0f...", posicion_x_actual_izquierdo_centro, posicion_x_destino_izquierdo)
                 
                 # Acciones del ratón para el arrastre
                 self.logger.debug("\n    -> mouse.move al origen")
@@ -2651,19 +2944,20 @@ class ElementActions:
                 
                 self.logger.debug("\n    -> mouse.up")
                 self.page.mouse.up() # Soltar el botón del ratón
-                self.logger.info(f"\n  > Pulgar izquierdo movido a X={posicion_x_destino_izquierdo:.0f}.")
+                self.logger.info("\n  > Pulgar izquierdo movido a X=%.0f.", posicion_x_destino_izquierdo)
             
             # --- Medición de rendimiento: Fin movimiento pulgar izquierdo ---
-            end_time_move_left_thumb = time.time()
+            end_time_move_left_thumb = time.perf_counter()
             duration_move_left_thumb = end_time_move_left_thumb - start_time_move_left_thumb
-            self.logger.info(f"PERFORMANCE: Tiempo de movimiento de pulgar izquierdo: {duration_move_left_thumb:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de movimiento de pulgar izquierdo: %.4f segundos.", duration_move_left_thumb)
+            self.base.registrar_metrica("mover_slider_rango_doble", duration_move_left_thumb, medicion="move_left_thumb")
             self.base.tomar_captura(f"{nombre_base}_slider_izquierdo_movido", directorio)
-            self.base.esperar_fijo(0.5) # Pausa adicional después de procesar el primer pulgar para estabilización
+            self.base.esperar_estabilidad(0.5, condicion="animaciones") # Espera a que el slider termine su transición antes del segundo pulgar
 
             # --- 5. Mover Pulgar Derecho (Máximo) ---
-            self.logger.info(f"\n🔄 Moviendo pulgar derecho a {porcentaje_destino_derecho*100:.0f}%...")
+            self.logger.info("\n🔄 Moviendo pulgar derecho a %.0f%%...", porcentaje_destino_derecho*100)
             # --- Medición de rendimiento: Inicio movimiento pulgar derecho ---
-            start_time_move_right_thumb = time.time()
+            start_time_move_right_thumb = time.perf_counter()
 
             caja_pulgar_derecho = pulgar_derecho_locator.bounding_box()
             if not caja_pulgar_derecho:
@@ -2678,9 +2972,9 @@ class ElementActions:
 
             # Verificar si el pulgar derecho ya está en la posición deseada dentro de la tolerancia
             if abs(posicion_x_actual_derecho_centro - posicion_x_destino_derecho) < tolerancia_pixeles:
-                self.logger.info(f"\n  > Pulgar derecho ya se encuentra en la posición deseada ({porcentaje_destino_derecho*100:.0f}%). No se requiere movimiento.")
+                self.logger.info("\n  > Pulgar derecho ya se encuentra en la posición deseada (%.0f%%). No se requiere movimiento.", porcentaje_destino_derecho*100)
             else:
-                self.logger.info(f"\n  > Iniciando arrastre de pulgar derecho de X={posicion_x_actual_derecho_centro:.0f} a X={posicion_x_destino_derecho:.0f}...")
+                self.logger.info("\n  > Iniciando arrastre de pulgar derecho de X=%.0f a X=%.0f...", posicion_x_actual_derecho_centro, posicion_x_destino_derecho)
                 
                 # Acciones del ratón para el arrastre
                 self.logger.debug("\n    -> mouse.move al origen")
@@ -2697,20 +2991,22 @@ class ElementActions:
                 
                 self.logger.debug("    -> mouse.up")
                 self.page.mouse.up() # Soltar el botón del ratón
-                self.logger.info(f"\n  > Pulgar derecho movido a X={posicion_x_destino_derecho:.0f}.")
+                self.logger.info("\n  > Pulgar derecho movido a X=%.0f.", posicion_x_destino_derecho)
             
             # --- Medición de rendimiento: Fin movimiento pulgar derecho ---
-            end_time_move_right_thumb = time.time()
+            end_time_move_right_thumb = time.perf_counter()
             duration_move_right_thumb = end_time_move_right_thumb - start_time_move_right_thumb
-            self.logger.info(f"PERFORMANCE: Tiempo de movimiento de pulgar derecho: {duration_move_right_thumb:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de movimiento de pulgar derecho: %.4f segundos.", duration_move_right_thumb)
+            self.base.registrar_metrica("mover_slider_rango_doble", duration_move_right_thumb, medicion="move_right_thumb")
 
-            self.logger.info(f"\n✅ Slider de rango procesado exitosamente. Izquierdo a {porcentaje_destino_izquierdo*100:.0f}%, Derecho a {porcentaje_destino_derecho*100:.0f}%.")
+            self.logger.info("\n✅ Slider de rango procesado exitosamente. Izquierdo a %.0f%%, Derecho a %.0f%%.", porcentaje_destino_izquierdo*100, porcentaje_destino_derecho*100)
             self.base.tomar_captura(f"{nombre_base}_slider_rango_procesado_{int(porcentaje_destino_izquierdo*100)}_{int(porcentaje_destino_derecho*100)}pc_final", directorio)
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (mover slider de rango): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (mover slider de rango): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("mover_slider_rango_doble", duration_total_operation, medicion="total_operation")
 
         except (ValueError, RuntimeError) as e:
             # Captura errores de validación de entrada o de obtención de bounding box
@@ -2725,7 +3021,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_slider_rango", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_slider_rango", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -2735,9 +3031,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_slider_rango", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_slider_rango", directorio, es_fallo=True)
             raise AssertionError(mensaje_error) from e
             
+    @medir_accion
     def hacer_click_derecho_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_click: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de click derecho (context click) sobre un elemento en la página.
@@ -2763,45 +3060,47 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando hacer click derecho sobre el elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Intentando hacer click derecho sobre el elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
                 locator = selector
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del elemento '%s': %.4f segundos.", selector, duration_locator)
+            self.base.registrar_metrica("hacer_click_derecho_en_elemento", duration_locator, medicion="locator", locator=selector)
 
             # Resaltar el elemento antes de la interacción (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes del click derecho
-            self.base.tomar_captura(f"{nombre_base}_antes_click_derecho", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del click derecho: '{nombre_base}_antes_click_derecho.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_click_derecho", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes del click derecho: '%s_antes_click_derecho.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de ejecución del click derecho ---
-            start_time_click = time.time()
+            start_time_click = time.perf_counter()
             # El atributo 'button="right"' es clave para el click derecho (context click)
             # Playwright espera implícitamente que el elemento esté visible y habilitado.
             locator.click(button="right") 
-            end_time_click = time.time()
+            end_time_click = time.perf_counter()
             duration_click = end_time_click - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución del click derecho en '{selector}': {duration_click:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución del click derecho en '%s': %.4f segundos.", selector, duration_click)
+            self.base.registrar_metrica("hacer_click_derecho_en_elemento", duration_click, medicion="click", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Click derecho realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Click derecho realizado exitosamente en el elemento con selector '%s'.", selector)
             
             # Tomar captura de pantalla después del click derecho
-            self.base.tomar_captura(f"{nombre_base}_despues_click_derecho", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del click derecho: '{nombre_base}_despues_click_derecho.png'")
+            self.base.tomar_captura(f"{nombre_base}_despues_click_derecho", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada después del click derecho: '%s_despues_click_derecho.png'", nombre_base)
 
         except TimeoutError as e:
             error_msg = (
@@ -2810,7 +3109,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_click_derecho", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_click_derecho", directorio, es_fallo=True)
             # Re-lanzamos la excepción TimeoutError que ya es específica de Playwright
             raise 
 
@@ -2821,7 +3120,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_click_derecho", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_click_derecho", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -2830,21 +3129,23 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_click_derecho", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_click_derecho", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_click_derecho_en_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (hacer_click_derecho_en_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_click_derecho_en_elemento", duration_total_operation, medicion="total_operation", locator=selector)
             
-            # Espera fija después de la interacción, si se especificó
+            # Espera de estabilidad después de la interacción, si se especificó ('tiempo_espera_post_click' es el límite superior).
             # Nota: el parámetro de entrada 'tiempo' se ha renombrado a 'tiempo_espera_post_click' para mayor claridad.
             if tiempo_espera_post_click > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_click} segundos después del click derecho.")
-                self.base.esperar_fijo(tiempo_espera_post_click) # Asegúrate de que esta función exista
+                self.logger.info("\n⏳ Esperando estabilidad (máx. %s segundos) después del click derecho.", tiempo_espera_post_click)
+                self.base.esperar_estabilidad(tiempo_espera_post_click)
     
+    @medir_accion
     def hacer_mouse_down_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'mouse down' (presionar el botón izquierdo del ratón) sobre el centro de un elemento.
@@ -2871,17 +3172,17 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'mouse down' sobre el elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Intentando hacer 'mouse down' sobre el elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
         element_bounding_box: Optional[Dict[str, Any]] = None # Para almacenar las coordenadas del elemento
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
@@ -2899,30 +3200,32 @@ class ElementActions:
             center_x = element_bounding_box['x'] + element_bounding_box['width'] / 2
             center_y = element_bounding_box['y'] + element_bounding_box['height'] / 2
 
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y obtención de coordenadas para '{selector}': {duration_locator:.4f} segundos. Coordenadas: ({center_x:.2f}, {center_y:.2f})")
+            self.logger.info("PERFORMANCE: Tiempo de localización y obtención de coordenadas para '%s': %.4f segundos. Coordenadas: (%.2f, %.2f)", selector, duration_locator, center_x, center_y)
+            self.base.registrar_metrica("hacer_mouse_down_en_elemento", duration_locator, medicion="locator", locator=selector)
 
             # Resaltar el elemento antes de la interacción (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes de la acción
-            self.base.tomar_captura(f"{nombre_base}_antes_mouse_down", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'mouse down': '{nombre_base}_antes_mouse_down.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_mouse_down", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes del 'mouse down': '%s_antes_mouse_down.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'mouse down' ---
-            start_time_action = time.time()
+            start_time_action = time.perf_counter()
             # Realiza la acción de 'mouse down' puro en las coordenadas del centro del elemento.
             self.page.mouse.down(button="left", x=center_x, y=center_y) 
-            end_time_action = time.time()
+            end_time_action = time.perf_counter()
             duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'mouse down' en '{selector}': {duration_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución de la acción 'mouse down' en '%s': %.4f segundos.", selector, duration_action)
+            self.base.registrar_metrica("hacer_mouse_down_en_elemento", duration_action, medicion="action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Acción de 'mouse down' realizada exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Acción de 'mouse down' realizada exitosamente en el elemento con selector '%s'.", selector)
             
             # Tomar captura de pantalla después de la acción
             self.tomar_captura(f"{nombre_base}_despues_mouse_down", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del 'mouse down': '{nombre_base}_despues_mouse_down.png'")
+            self.logger.info("\n📸 Captura de pantalla tomada después del 'mouse down': '%s_despues_mouse_down.png'", nombre_base)
 
         except TimeoutError as e:
             error_msg = (
@@ -2931,7 +3234,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_mouse_down", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_mouse_down", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -2941,7 +3244,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_down", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_down", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -2950,20 +3253,22 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_down", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_down", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_down_en_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (hacer_mouse_down_en_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_mouse_down_en_elemento", duration_total_operation, medicion="total_operation", locator=selector)
             
-            # Espera fija después de la interacción, si se especificó
+            # Espera de estabilidad después de la interacción, si se especificó (el tiempo es el límite superior)
             if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse down'.")
-                self.base.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.logger.info("\n⏳ Esperando estabilidad (máx. %s segundos) después de la acción de 'mouse down'.", tiempo_espera_post_accion)
+                self.base.esperar_estabilidad(tiempo_espera_post_accion)
     
+    @medir_accion
     def hacer_mouse_up_de_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'mouse up' (soltar el botón izquierdo del ratón) sobre el centro de un elemento.
@@ -2991,17 +3296,17 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'mouse up' sobre el elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Intentando hacer 'mouse up' sobre el elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
         element_bounding_box: Optional[Dict[str, Any]] = None # Para almacenar las coordenadas del elemento
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
@@ -3018,30 +3323,32 @@ class ElementActions:
             center_x = element_bounding_box['x'] + element_bounding_box['width'] / 2
             center_y = element_bounding_box['y'] + element_bounding_box['height'] / 2
 
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización y obtención de coordenadas para '{selector}': {duration_locator:.4f} segundos. Coordenadas: ({center_x:.2f}, {center_y:.2f})")
+            self.logger.info("PERFORMANCE: Tiempo de localización y obtención de coordenadas para '%s': %.4f segundos. Coordenadas: (%.2f, %.2f)", selector, duration_locator, center_x, center_y)
+            self.base.registrar_metrica("hacer_mouse_up_de_elemento", duration_locator, medicion="locator", locator=selector)
 
             # Resaltar el elemento antes de la interacción (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes de la acción
-            self.base.tomar_captura(f"{nombre_base}_antes_mouse_up", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'mouse up': '{nombre_base}_antes_mouse_up.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_mouse_up", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes del 'mouse up': '%s_antes_mouse_up.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'mouse up' ---
-            start_time_action = time.time()
+            start_time_action = time.perf_counter()
             # Realiza la acción de 'mouse up' puro en las coordenadas del centro del elemento.
             self.page.mouse.up(button="left", x=center_x, y=center_y) 
-            end_time_action = time.time()
+            end_time_action = time.perf_counter()
             duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'mouse up' en '{selector}': {duration_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución de la acción 'mouse up' en '%s': %.4f segundos.", selector, duration_action)
+            self.base.registrar_metrica("hacer_mouse_up_de_elemento", duration_action, medicion="action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: Acción de 'mouse up' realizada exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: Acción de 'mouse up' realizada exitosamente en el elemento con selector '%s'.", selector)
             
             # Tomar captura de pantalla después de la acción
-            self.base.tomar_captura(f"{nombre_base}_despues_mouse_up", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del 'mouse up': '{nombre_base}_despues_mouse_up.png'")
+            self.base.tomar_captura(f"{nombre_base}_despues_mouse_up", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada después del 'mouse up': '%s_despues_mouse_up.png'", nombre_base)
 
         except TimeoutError as e:
             error_msg = (
@@ -3050,7 +3357,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_mouse_up", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_mouse_up", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -3060,7 +3367,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_up", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_mouse_up", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -3069,20 +3376,22 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_up", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_mouse_up", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_up_de_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (hacer_mouse_up_de_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_mouse_up_de_elemento", duration_total_operation, medicion="total_operation", locator=selector)
             
-            # Espera fija después de la interacción, si se especificó
+            # Espera de estabilidad después de la interacción, si se especificó (el tiempo es el límite superior)
             if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse up'.")
-                self.base.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.logger.info("\n⏳ Esperando estabilidad (máx. %s segundos) después de la acción de 'mouse up'.", tiempo_espera_post_accion)
+                self.base.esperar_estabilidad(tiempo_espera_post_accion)
     
+    @medir_accion
     def hacer_focus_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'focus' (establecer el foco) sobre un elemento especificado.
@@ -3111,47 +3420,49 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'focus' sobre el elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Intentando hacer 'focus' sobre el elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
                 locator = selector
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del elemento '%s': %.4f segundos.", selector, duration_locator)
+            self.base.registrar_metrica("hacer_focus_en_elemento", duration_locator, medicion="locator", locator=selector)
 
             # Resaltar el elemento antes de la interacción (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes de la acción
-            self.base.tomar_captura(f"{nombre_base}_antes_focus", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'focus': '{nombre_base}_antes_focus.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_focus", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes del 'focus': '%s_antes_focus.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'focus' ---
-            start_time_action = time.time()
-            locator.highlight()
+            start_time_action = time.perf_counter()
+            self.base.resaltar_elemento(locator)
             # El método focus() de Playwright establece el foco en el elemento.
             # Playwright espera implícitamente que el elemento esté visible y habilitado antes de enfocarlo.
             locator.focus() # Eliminado 'timeout' del focus() para usar el de Playwright por defecto o global.
                             # Si se necesita un timeout específico para el focus, se puede volver a añadir: timeout=tiempo_espera_max_para_focus * 1000
-            end_time_action = time.time()
+            end_time_action = time.perf_counter()
             duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'focus' en '{selector}': {duration_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución de la acción 'focus' en '%s': %.4f segundos.", selector, duration_action)
+            self.base.registrar_metrica("hacer_focus_en_elemento", duration_action, medicion="action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: 'Focus' realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: 'Focus' realizado exitosamente en el elemento con selector '%s'.", selector)
             
             # Tomar captura de pantalla después de la acción
-            self.base.tomar_captura(f"{nombre_base}_despues_focus", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del 'focus': '{nombre_base}_despues_focus.png'")
+            self.base.tomar_captura(f"{nombre_base}_despues_focus", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada después del 'focus': '%s_despues_focus.png'", nombre_base)
 
         except TimeoutError as e:
             error_msg = (
@@ -3160,7 +3471,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_focus", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_focus", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -3170,7 +3481,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_focus", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_focus", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -3179,21 +3490,23 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_focus", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_focus", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_focus_en_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (hacer_focus_en_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_focus_en_elemento", duration_total_operation, medicion="total_operation", locator=selector)
             
-            # Espera fija después de la interacción, si se especificó
+            # Espera de estabilidad después de la interacción, si se especificó (el tiempo es el límite superior)
             # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
             if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'focus'.")
-                self.base.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.logger.info("\n⏳ Esperando estabilidad (máx. %s segundos) después de la acción de 'focus'.", tiempo_espera_post_accion)
+                self.base.esperar_estabilidad(tiempo_espera_post_accion)
     
+    @medir_accion
     def hacer_blur_en_elemento(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo_espera_post_accion: Union[int, float] = 0.5, nombre_paso: str = ""):
         """
         Realiza una acción de 'blur' (quitar el foco) sobre un elemento que actualmente lo tiene.
@@ -3223,16 +3536,16 @@ class ElementActions:
             Error: Para otros errores específicos de Playwright durante la interacción.
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando hacer 'blur' sobre el elemento con selector: '{selector}'. ---")
+        self.logger.info("\n--- %s: Intentando hacer 'blur' sobre el elemento con selector: '%s'. ---", nombre_paso, selector)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 locator = self.page.locator(selector)
             else: # Asume que si no es str, ya es un Locator
@@ -3242,29 +3555,31 @@ class ElementActions:
             # Es útil para ver cuál elemento se va a desenfocar.
             # locator.highlight() 
 
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del elemento '%s': %.4f segundos.", selector, duration_locator)
+            self.base.registrar_metrica("hacer_blur_en_elemento", duration_locator, medicion="locator", locator=selector)
 
             # Tomar captura de pantalla antes de la acción
-            self.base.tomar_captura(f"{nombre_base}_antes_blur", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del 'blur': '{nombre_base}_antes_blur.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_blur", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes del 'blur': '%s_antes_blur.png'", nombre_base)
 
             # --- Medición de rendimiento: Tiempo de ejecución de la acción de 'blur' ---
-            start_time_action = time.time()
+            start_time_action = time.perf_counter()
             # El método blur() de Playwright quita el foco del elemento.
             # Playwright espera implícitamente que el elemento esté en el DOM y enfocado para poder desenfocarlo.
             locator.blur() # Eliminado 'timeout' del blur() para usar el de Playwright por defecto o global.
                            # Si se necesita un timeout específico para el blur, se puede volver a añadir: timeout=tiempo_espera_max_para_blur * 1000
-            end_time_action = time.time()
+            end_time_action = time.perf_counter()
             duration_action = end_time_action - start_time_action
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la acción 'blur' en '{selector}': {duration_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución de la acción 'blur' en '%s': %.4f segundos.", selector, duration_action)
+            self.base.registrar_metrica("hacer_blur_en_elemento", duration_action, medicion="action", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: 'Blur' realizado exitosamente en el elemento con selector '{selector}'.")
+            self.logger.info("\n✔ ÉXITO: 'Blur' realizado exitosamente en el elemento con selector '%s'.", selector)
             
             # Tomar captura de pantalla después de la acción
-            self.base.tomar_captura(f"{nombre_base}_despues_blur", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del 'blur': '{nombre_base}_despues_blur.png'")
+            self.base.tomar_captura(f"{nombre_base}_despues_blur", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada después del 'blur': '%s_despues_blur.png'", nombre_base)
 
         except TimeoutError as e:
             error_msg = (
@@ -3273,7 +3588,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_timeout_blur", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_timeout_blur", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -3283,7 +3598,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_blur", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_blur", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -3292,21 +3607,23 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_blur", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_blur", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_blur_en_elemento): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (hacer_blur_en_elemento): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_blur_en_elemento", duration_total_operation, medicion="total_operation", locator=selector)
             
-            # Espera fija después de la interacción, si se especificó
+            # Espera de estabilidad después de la interacción, si se especificó (el tiempo es el límite superior)
             # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
             if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'blur'.")
-                self.base.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+                self.logger.info("\n⏳ Esperando estabilidad (máx. %s segundos) después de la acción de 'blur'.", tiempo_espera_post_accion)
+                self.base.esperar_estabilidad(tiempo_espera_post_accion)
     
+    @medir_accion
     def verificar_estado_checkbox_o_select(self, selector: Union[str, Locator], estado_esperado: Union[bool, str], nombre_base: str, directorio: str, tiempo_max_espera_verificacion: Union[int, float] = 0.5, nombre_paso: str = "") -> bool:
         """
         Verifica el estado de un checkbox (marcado/desmarcado) o el valor de una opción seleccionada en un select.
@@ -3337,10 +3654,10 @@ class ElementActions:
             PlaywrightError (a través de TimeoutError o Error): Si ocurre un problema grave de Playwright
                                                                 que impide la verificación.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Verificando estado para el selector: '{selector}'. Estado esperado: '{estado_esperado}'. ---")
+        self.logger.info("\n--- %s: Verificando estado para el selector: '%s'. Estado esperado: '%s'. ---", nombre_paso, selector, estado_esperado)
 
         # --- Medición de rendimiento: Inicio de la operación total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         
         locator: Locator = None # Inicializamos el locator
         tipo_elemento: str = "elemento" # Valor por defecto para los mensajes de error
@@ -3349,26 +3666,27 @@ class ElementActions:
 
         try:
             # --- Medición de rendimiento: Tiempo de localización del elemento ---
-            start_time_locator = time.time()
+            start_time_locator = time.perf_counter()
             if isinstance(selector, str):
                 # Usar locator().first para manejar casos donde el selector podría devolver múltiples elementos
                 # pero solo nos interesa el primero. Si el selector ya es preciso, no hay problema.
                 locator = self.page.locator(selector) 
             else: # Asume que si no es str, ya es un Locator
                 locator = selector
-            end_time_locator = time.time()
+            end_time_locator = time.perf_counter()
             duration_locator = end_time_locator - start_time_locator
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento '{selector}': {duration_locator:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del elemento '%s': %.4f segundos.", selector, duration_locator)
+            self.base.registrar_metrica("verificar_estado_checkbox_o_select", duration_locator, medicion="locator", locator=selector)
             
             # Resaltar el elemento antes de la interacción (útil para la depuración visual)
             # locator.highlight() 
 
             # Tomar captura de pantalla antes de la verificación
-            self.base.tomar_captura(f"{nombre_base}_antes_verificar_estado", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes de verificar estado: '{nombre_base}_antes_verificar_estado.png'")
+            self.base.tomar_captura(f"{nombre_base}_antes_verificar_estado", directorio, locator=locator)
+            self.logger.info("\n📸 Captura de pantalla tomada antes de verificar estado: '%s_antes_verificar_estado.png'", nombre_base)
 
             # --- Lógica de Verificación y Medición de Aserción ---
-            start_time_assertion = time.time()
+            start_time_assertion = time.perf_counter()
             if isinstance(estado_esperado, bool): # Verificación para Checkbox
                 tipo_elemento = "checkbox"
                 if estado_esperado:
@@ -3389,12 +3707,13 @@ class ElementActions:
             else:
                 raise ValueError(f"\nEl 'estado_esperado' debe ser un booleano para checkbox o un string para select. Tipo proporcionado: {type(estado_esperado).__name__}")
 
-            end_time_assertion = time.time()
+            end_time_assertion = time.perf_counter()
             duration_assertion = end_time_assertion - start_time_assertion
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución de la verificación (aserción) para '{selector}': {duration_assertion:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución de la verificación (aserción) para '%s': %.4f segundos.", selector, duration_assertion)
+            self.base.registrar_metrica("verificar_estado_checkbox_o_select", duration_assertion, medicion="assertion", locator=selector)
 
-            self.logger.info(f"\n✔ ÉXITO: El {tipo_elemento} '{selector}' tiene el estado esperado '{estado_esperado}'.")
-            self.base.tomar_captura(f"{nombre_base}_despues_verificar_estado", directorio)
+            self.logger.info("\n✔ ÉXITO: El %s '%s' tiene el estado esperado '%s'.", tipo_elemento, selector, estado_esperado)
+            self.base.tomar_captura(f"{nombre_base}_despues_verificar_estado", directorio, locator=locator)
             return True
 
         except TimeoutError as e:
@@ -3414,7 +3733,7 @@ class ElementActions:
                 f"Estado actual: '{valor_actual_str}'. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_estado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_estado", directorio, es_fallo=True)
             return False
 
         except AssertionError as e:
@@ -3425,7 +3744,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_estado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_verificar_estado", directorio, es_fallo=True)
             return False
 
         except ValueError as e:
@@ -3434,7 +3753,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Incluir exc_info para ValueError también
-            self.base.tomar_captura(f"{nombre_base}_error_valor_invalido_verificar_estado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_valor_invalido_verificar_estado", directorio, es_fallo=True)
             raise # Re-lanzamos el ValueError ya que es un error de uso de la función.
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -3443,7 +3762,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_estado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_verificar_estado", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -3452,14 +3771,15 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_estado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_verificar_estado", directorio, es_fallo=True)
             raise # Re-lanza la excepción
 
         finally:
             # --- Medición de rendimiento: Fin de la operación total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificar_estado_checkbox_o_select): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificar_estado_checkbox_o_select): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_estado_checkbox_o_select", duration_total_operation, medicion="total_operation", locator=selector)
             
             # Espera fija después de la verificación, si se especificó.
             # El parámetro original 'tiempo' se renombró a 'tiempo_max_espera_verificacion' para el timeout de expect.
@@ -3472,41 +3792,110 @@ class ElementActions:
                  # Si 'tiempo' original era para una pausa, el parámetro ha sido absorbido por el timeout de expect.
                  # Si se desea una pausa *adicional* al final, se debería añadir un nuevo parámetro.
         
-    def manejar_obstaculos_en_pagina(self, obstaculos_locators: list, timeout: float = 5.0):
+    @medir_accion
+    def manejar_obstaculos_en_pagina(self, obstaculos_locators: list, timeout: float = 5.0, espera_aparicion: Union[int, float] = 0.0, auto_cerrar: bool = False):
         """
         Intenta cerrar banners, popups o elementos que puedan tapar la pantalla.
+
+        Todos los obstáculos se comprueban a la vez con un único locator combinado (`or_`)
+        filtrado por visibilidad, de modo que, cuando no hay ninguno (el caso habitual), la
+        función vuelve tras una sola comprobación en lugar de esperar `timeout` por cada uno.
+        Solo si el locator combinado encuentra algo se averigua qué obstáculos están visibles
+        y se cierran todos ellos.
         
         Args:
-            obstaculos_locators (list): Lista de localizadores de los elementos a cerrar.
-            timeout (float): Tiempo máximo de espera para cada intento.
+            obstaculos_locators (list): Lista de diccionarios con el 'nombre' y el 'locator'
+                                        (selector del botón que cierra el obstáculo).
+            timeout (float): Tiempo máximo de espera para el clic que cierra cada obstáculo detectado.
+            espera_aparicion (Union[int, float]): Tiempo máximo (en segundos) que se espera, una sola
+                                                  vez para todos los obstáculos, a que aparezca alguno.
+                                                  Por defecto, `0`: comprobación instantánea.
+            auto_cerrar (bool): Si es `True`, registra además con `page.add_locator_handler` un
+                                manejador por obstáculo: Playwright lo ejecuta en segundo plano antes
+                                de cada acción en la que el obstáculo aparezca y lo cierra, durante
+                                el resto de la vida de la página. Por defecto, `False`.
+
+        Returns:
+            bool: `True` si se cerró al menos un obstáculo; `False` si no había ninguno visible.
         """
         self.logger.info("\n🔄 Intentando cerrar posibles obstáculos en la página...")
-        
-        for locator_info in obstaculos_locators:
-            # Extraemos el localizador y el nombre del obstáculo para el log
-            locator_str = locator_info.get("locator")
-            nombre = locator_info.get("nombre", "obstáculo genérico")
-            
-            # Intentamos localizar el elemento con un timeout corto
-            obstaculo_locator = self.page.locator(locator_str)
-            
+
+        # Extraemos el nombre y el localizador de cada obstáculo
+        obstaculos = [(locator_info.get("nombre", "obstáculo genérico"), locator_info.get("locator"))
+                      for locator_info in obstaculos_locators if locator_info.get("locator")]
+        if not obstaculos:
+            self.logger.info("✅ No hay obstáculos conocidos que comprobar.")
+            return False
+
+        if auto_cerrar:
+            self._registrar_cierre_automatico_obstaculos(obstaculos, timeout)
+
+        # --- Medición de rendimiento: Inicio de la detección combinada ---
+        start_time_detection = time.perf_counter()
+
+        # Un único locator que coincide con cualquiera de los obstáculos visibles
+        combinado = self.page.locator(obstaculos[0][1])
+        for _, locator_str in obstaculos[1:]:
+            combinado = combinado.or_(self.page.locator(locator_str))
+        visibles = combinado.filter(visible=True)
+
+        try:
+            if espera_aparicion > 0:
+                visibles.first.wait_for(state="visible", timeout=espera_aparicion * 1000)
+            hay_obstaculos = visibles.count() > 0
+        except TimeoutError:
+            hay_obstaculos = False
+        except Exception as e:
+            self.logger.warning(f"❗ Ocurrió un error al comprobar la presencia de obstáculos: {e}")
+            hay_obstaculos = False
+
+        # --- Medición de rendimiento: Fin de la detección combinada ---
+        end_time_detection = time.perf_counter()
+        duration_detection = end_time_detection - start_time_detection
+        self.logger.info("PERFORMANCE: Tiempo de detección combinada de %s obstáculo(s): %.4f segundos.", len(obstaculos), duration_detection)
+        self.base.registrar_metrica("manejar_obstaculos_en_pagina", duration_detection, medicion="detection")
+
+        if not hay_obstaculos:
+            self.logger.info("✅ No se encontraron obstáculos conocidos o todos fueron manejados.")
+            return False
+
+        cerrado = False
+        for nombre, locator_str in obstaculos:
+            obstaculo_locator = self.page.locator(locator_str).filter(visible=True).first
             try:
-                # Espera a que el elemento sea visible y luego intenta hacer clic
-                expect(obstaculo_locator).to_be_visible(timeout=timeout * 1000)
-                self.logger.info(f"✅ Se detectó '{nombre}'. Intentando hacer clic para cerrarlo.")
-                obstaculo_locator.click()
-                self.logger.info(f"✔ '{nombre}' ha sido cerrado exitosamente.")
-                # Salimos del bucle si encontramos y cerramos un obstáculo, ya que no puede haber más
-                return True
-                
+                if obstaculo_locator.count() == 0:
+                    self.logger.debug("❌ '%s' no se detectó. Continuando...", nombre)
+                    continue
+                self.logger.info("✅ Se detectó '%s'. Intentando hacer clic para cerrarlo.", nombre)
+                obstaculo_locator.click(timeout=timeout * 1000)
+                self.logger.info("✔ '%s' ha sido cerrado exitosamente.", nombre)
+                cerrado = True
+
             except TimeoutError:
-                self.logger.debug(f"❌ '{nombre}' no se detectó. Continuando...")
+                self.logger.debug("❌ '%s' no se pudo cerrar a tiempo. Continuando...", nombre)
             except Exception as e:
                 self.logger.warning(f"❗ Ocurrió un error al intentar cerrar '{nombre}': {e}")
-                
-        self.logger.info("✅ No se encontraron obstáculos conocidos o todos fueron manejados.")
-        return False
+
+        return cerrado
+
+    def _registrar_cierre_automatico_obstaculos(self, obstaculos: List[Tuple[str, str]], timeout: float) -> None:
+        """
+        Registra con `page.add_locator_handler` un manejador que cierra cada obstáculo en cuanto
+        Playwright lo detecta tapando una acción. Cada selector se registra una sola vez por página.
+        """
+        for nombre, locator_str in obstaculos:
+            if locator_str in self._obstaculos_con_manejador:
+                continue
+
+            def cerrar_obstaculo(obstaculo: Locator, nombre: str = nombre) -> None:
+                self.logger.info("🔄 '%s' apareció durante una acción; cerrándolo automáticamente.", nombre)
+                obstaculo.first.click(timeout=timeout * 1000)
+
+            self.page.add_locator_handler(self.page.locator(locator_str), cerrar_obstaculo)
+            self._obstaculos_con_manejador.add(locator_str)
+            self.logger.debug("Manejador de cierre automático registrado para '%s' (%s).", nombre, locator_str)
     
+    @medir_accion
     def validar_elemento_vacio(self, selector, nombre_base: str, directorio: str, tiempo: Union[int, float] = 5.0, resaltar: bool = True) -> bool:
         """
         Valida que un elemento específico en la página no contenga texto dentro de un tiempo límite.
@@ -3534,7 +3923,7 @@ class ElementActions:
                 elemento desprendido del DOM).
             Exception: Para cualquier otro error inesperado durante la ejecución.
         """
-        self.logger.info(f"\nValidando que el elemento con selector: '{selector}' esté vacío. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando que el elemento con selector: '%s' esté vacío. Tiempo máximo de espera: %ss.", selector, tiempo)
         
         # Asegura que 'selector' sea un objeto Locator de Playwright.
         if isinstance(selector, str):
@@ -3543,36 +3932,37 @@ class ElementActions:
             locator = selector
         
         # --- Medición de rendimiento: Inicio de la espera por elemento vacío ---
-        start_time_empty_check = time.time()
+        start_time_empty_check = time.perf_counter()
         
         try:
             # Resalta el elemento para confirmación visual
-            locator.highlight()
-            self.logger.debug(f"Elemento '{selector}' resaltado.")
+            self.base.resaltar_elemento(locator)
+            self.logger.debug("Elemento '%s' resaltado.", selector)
             # Espera explícita a que el elemento esté vacío.
             expect(locator).to_be_empty(timeout=tiempo * 1000)
 
             # --- Medición de rendimiento: Fin de la espera ---
-            end_time_empty_check = time.time()
+            end_time_empty_check = time.perf_counter()
             duration_empty_check = end_time_empty_check - start_time_empty_check
-            self.logger.info(f"\nPERFORMANCE: Tiempo que tardó el elemento '{selector}' en estar vacío: {duration_empty_check:.4f} segundos.")
+            self.logger.info("\nPERFORMANCE: Tiempo que tardó el elemento '%s' en estar vacío: %.4f segundos.", selector, duration_empty_check)
+            self.base.registrar_metrica("validar_elemento_vacio", duration_empty_check, medicion="empty_check", locator=selector)
 
-            self.base.tomar_captura(f"{nombre_base}_vacio", directorio)
-            self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' está vacío.")
+            self.base.tomar_captura(f"{nombre_base}_vacio", directorio, locator=locator)
+            self.logger.info("\n✔ ÉXITO: El elemento '%s' está vacío.", selector)
             
-            self.base.esperar_fijo(0.5)
+            self.base.esperar_estabilidad(0.5)
             
             return True
         
         except TimeoutError as e:
-            end_time_empty_check = time.time()
+            end_time_empty_check = time.perf_counter()
             duration_empty_check = end_time_empty_check - start_time_empty_check
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO está vacío "
                 f"después de {duration_empty_check:.4f} segundos (timeout configurado: {tiempo}s). Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_NO_vacio_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_NO_vacio_timeout", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -3581,7 +3971,7 @@ class ElementActions:
                 f"Posibles causas: Selector inválido, elemento desprendido del DOM. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise
 
         except Exception as e:
@@ -3590,9 +3980,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise
     
+    @medir_accion
     def validar_elemento_desactivado(self, selector, nombre_base: str, directorio: str, tiempo: Union[int, float] = 5.0, resaltar: bool = True) -> bool:
         """
         Valida que un elemento en la página esté deshabilitado (desactivado) dentro de un tiempo límite.
@@ -3620,7 +4011,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright (ej., selector inválido).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nValidando que el elemento con selector: '{selector}' esté deshabilitado. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando que el elemento con selector: '%s' esté deshabilitado. Tiempo máximo de espera: %ss.", selector, tiempo)
         
         # Asegura que 'selector' sea un objeto Locator de Playwright.
         if isinstance(selector, str):
@@ -3629,32 +4020,33 @@ class ElementActions:
             locator = selector
             
         # --- Medición de rendimiento: Inicio de la espera por elemento deshabilitado ---
-        start_time_disabled_check = time.time()
+        start_time_disabled_check = time.perf_counter()
         
         try:
             # Resalta el elemento para confirmación visual
-            locator.highlight()
-            self.logger.debug(f"Elemento '{selector}' resaltado.")
+            self.base.resaltar_elemento(locator)
+            self.logger.debug("Elemento '%s' resaltado.", selector)
             # Espera explícita a que el elemento cumpla la condición de estar deshabilitado.
             expect(locator).to_be_disabled(timeout=tiempo * 1000)
             
             # --- Medición de rendimiento: Fin de la espera ---
-            end_time_disabled_check = time.time()
+            end_time_disabled_check = time.perf_counter()
             duration_disabled_check = end_time_disabled_check - start_time_disabled_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó el elemento '{selector}' en ser deshabilitado: {duration_disabled_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó el elemento '%s' en ser deshabilitado: %.4f segundos.", selector, duration_disabled_check)
+            self.base.registrar_metrica("validar_elemento_desactivado", duration_disabled_check, medicion="disabled_check", locator=selector)
 
             # Toma una captura de pantalla para documentar el estado deshabilitado del elemento.
-            self.base.tomar_captura(f"{nombre_base}_deshabilitado", directorio)
-            self.logger.info(f"\n✔ ÉXITO: El elemento '{selector}' está deshabilitado en la página.")
+            self.base.tomar_captura(f"{nombre_base}_deshabilitado", directorio, locator=locator)
+            self.logger.info("\n✔ ÉXITO: El elemento '%s' está deshabilitado en la página.", selector)
             
-            # Realiza una espera fija adicional para observación.
-            self.base.esperar_fijo(0.5)
+            # Espera a que el DOM se asiente (0.5s como máximo).
+            self.base.esperar_estabilidad(0.5)
             
             return True
         
         except TimeoutError as e:
             # Manejo para cuando el elemento no se deshabilita dentro del tiempo esperado.
-            end_time_disabled_check = time.time()
+            end_time_disabled_check = time.perf_counter()
             duration_disabled_check = end_time_disabled_check - start_time_disabled_check
             error_msg = (
                 f"\n❌ FALLO (Timeout): El elemento con selector '{selector}' NO se deshabilitó "
@@ -3662,7 +4054,7 @@ class ElementActions:
             )
             self.logger.warning(error_msg)
             # Toma una captura en caso de fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_NO_deshabilitado_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_NO_deshabilitado_timeout", directorio, es_fallo=True)
             return False
             
         except Error as e:
@@ -3672,7 +4064,7 @@ class ElementActions:
                 f"Posibles causas: Selector inválido, elemento desprendido del DOM. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise
             
         except Exception as e:
@@ -3682,9 +4074,10 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             raise
     
+    @medir_accion
     def limpiar_campo(self, selector, nombre_base: str, directorio: str, tiempo: Union[int, float] = 5.0, resaltar: bool = True) -> bool:
         """
         Limpia el contenido de un campo de texto o entrada en la página.
@@ -3712,7 +4105,7 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright (ej., selector inválido).
             Exception: Para cualquier otro error inesperado durante la ejecución.
         """
-        self.logger.info(f"\nLimpiando el campo de texto con selector: '{selector}'.")
+        self.logger.info("\nLimpiando el campo de texto con selector: '%s'.", selector)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright.
         if isinstance(selector, str):
@@ -3721,30 +4114,31 @@ class ElementActions:
             locator = selector
         
         # --- Medición de rendimiento: Inicio de la acción de limpieza ---
-        start_time_clear_action = time.time()
+        start_time_clear_action = time.perf_counter()
         
         try:
             # Espera que el elemento sea visible usando 'expect'.
             # Esto previene errores si el campo aún no ha cargado completamente.
             expect(locator).to_be_visible(timeout=tiempo * 1000)
             # Resalta el campo antes de la acción para una mejor depuración visual.
-            locator.highlight()
-            self.logger.debug(f"Elemento '{selector}' resaltado.")
+            self.base.resaltar_elemento(locator)
+            self.logger.debug("Elemento '%s' resaltado.", selector)
             
             # Realiza la acción de limpieza.
             locator.clear()
             
             # --- Medición de rendimiento: Fin de la acción ---
-            end_time_clear_action = time.time()
+            end_time_clear_action = time.perf_counter()
             duration_clear_action = end_time_clear_action - start_time_clear_action
-            self.logger.info(f"PERFORMANCE: La limpieza del campo '{selector}' tardó {duration_clear_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: La limpieza del campo '%s' tardó %.4f segundos.", selector, duration_clear_action)
+            self.base.registrar_metrica("limpiar_campo", duration_clear_action, medicion="clear_action", locator=selector)
 
             # Toma una captura de pantalla para documentar la acción.
-            self.base.tomar_captura(f"{nombre_base}_limpiado", directorio)
-            self.logger.info(f"\n✔ ÉXITO: El campo '{selector}' se ha limpiado correctamente.")
+            self.base.tomar_captura(f"{nombre_base}_limpiado", directorio, locator=locator)
+            self.logger.info("\n✔ ÉXITO: El campo '%s' se ha limpiado correctamente.", selector)
             
-            # Espera fija para observación.
-            self.base.esperar_fijo(0.5)
+            # Espera a que el DOM se asiente (0.5s como máximo).
+            self.base.esperar_estabilidad(0.5)
             
             return True
         
@@ -3755,7 +4149,7 @@ class ElementActions:
                 f"después de {tiempo} segundos para ser limpiado. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.base.tomar_captura(f"{nombre_base}_limpiar_fallo_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_limpiar_fallo_timeout", directorio, es_fallo=True)
             return False
             
         except Error as e:
@@ -3765,7 +4159,7 @@ class ElementActions:
                 f"Posibles causas: Selector inválido, elemento no interactuable. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_limpiar_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_limpiar_error_playwright", directorio, es_fallo=True)
             raise
             
         except Exception as e:
@@ -3775,7 +4169,7 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_limpiar_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_limpiar_error_inesperado", directorio, es_fallo=True)
             raise
     
     # Función privada para realizar Drag and Drop manual.
@@ -3812,65 +4206,69 @@ class ElementActions:
             Error: Si ocurre un error específico de Playwright durante las operaciones del ratón.
             Exception: Para cualquier otro error inesperado durante la ejecución.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando 'Drag and Drop' manualmente de '{elemento_origen}' a '{elemento_destino}'. ---")
+        self.logger.info("\n--- %s: Intentando 'Drag and Drop' manualmente de '%s' a '%s'. ---", nombre_paso, elemento_origen, elemento_destino)
 
         # Asegurarse de que el directorio de capturas de pantalla exista
         if not os.path.exists(directorio):
             os.makedirs(directorio, exist_ok=True)
-            self.logger.info(f"\n☑️ Directorio de capturas de pantalla creado: {directorio}")
+            self.logger.info("\n☑️ Directorio de capturas de pantalla creado: %s", directorio)
 
         # --- Medición de rendimiento: Inicio de la operación total de Drag and Drop manual ---
-        start_time_total_drag_drop = time.time()
+        start_time_total_drag_drop = time.perf_counter()
         
         try:
             self.base.tomar_captura(f"{nombre_base}_antes_drag_drop_manual", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada antes del D&D manual: '{nombre_base}_antes_drag_drop_manual.png'")
+            self.logger.info("\n📸 Captura de pantalla tomada antes del D&D manual: '%s_antes_drag_drop_manual.png'", nombre_base)
 
             # 1. Mover el ratón sobre el elemento de origen
-            start_time_hover_origin = time.time()
-            self.logger.info(f"\n🖱️ Moviendo ratón sobre elemento de origen: '{elemento_origen}'...")
+            start_time_hover_origin = time.perf_counter()
+            self.logger.info("\n🖱️ Moviendo ratón sobre elemento de origen: '%s'...", elemento_origen)
             elemento_origen.hover()
-            end_time_hover_origin = time.time()
+            end_time_hover_origin = time.perf_counter()
             duration_hover_origin = end_time_hover_origin - start_time_hover_origin
-            self.logger.info(f"PERFORMANCE: Tiempo de 'hover' en origen: {duration_hover_origin:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de 'hover' en origen: %.4f segundos.", duration_hover_origin)
+            self.base.registrar_metrica("_realizar_drag_and_drop_manual", duration_hover_origin, medicion="hover_origin")
 
             # 2. Presionar el botón izquierdo del ratón (iniciar arrastre)
-            start_time_mouse_down = time.time()
+            start_time_mouse_down = time.perf_counter()
             self.logger.info("\n⬇️ Presionando botón izquierdo del ratón para iniciar arrastre...")
             self.page.mouse.down()
-            end_time_mouse_down = time.time()
+            end_time_mouse_down = time.perf_counter()
             duration_mouse_down = end_time_mouse_down - start_time_mouse_down
-            self.logger.info(f"PERFORMANCE: Tiempo de 'mouse.down': {duration_mouse_down:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de 'mouse.down': %.4f segundos.", duration_mouse_down)
+            self.base.registrar_metrica("_realizar_drag_and_drop_manual", duration_mouse_down, medicion="mouse_down")
 
             # Pausa para simular arrastre humano
             if tiempo_pausa_ms > 0:
-                self.logger.info(f"\n⏳ Pausa durante arrastre (simulación): {tiempo_pausa_ms} ms...")
+                self.logger.info("\n⏳ Pausa durante arrastre (simulación): %s ms...", tiempo_pausa_ms)
                 self.page.wait_for_timeout()
 
             # 3. Mover el ratón sobre el elemento de destino
-            start_time_hover_destination = time.time()
-            self.logger.info(f"\n➡️ Moviendo ratón sobre elemento de destino: '{elemento_destino}'...")
+            start_time_hover_destination = time.perf_counter()
+            self.logger.info("\n➡️ Moviendo ratón sobre elemento de destino: '%s'...", elemento_destino)
             elemento_destino.hover(timeout=timeout_locators_ms)
-            end_time_hover_destination = time.time()
+            end_time_hover_destination = time.perf_counter()
             duration_hover_destination = end_time_hover_destination - start_time_hover_destination
-            self.logger.info(f"PERFORMANCE: Tiempo de 'hover' en destino: {duration_hover_destination:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de 'hover' en destino: %.4f segundos.", duration_hover_destination)
+            self.base.registrar_metrica("_realizar_drag_and_drop_manual", duration_hover_destination, medicion="hover_destination")
 
             # Pausa adicional antes de soltar, si se desea un comportamiento más humano
             if tiempo_pausa_ms > 0:
-                self.logger.info(f"\n⏳ Pausa antes de soltar (simulación): {tiempo_pausa_ms} ms...")
+                self.logger.info("\n⏳ Pausa antes de soltar (simulación): %s ms...", tiempo_pausa_ms)
                 self.page.wait_for_timeout()
 
             # 4. Soltar el botón izquierdo del ratón (finalizar arrastre)
-            start_time_mouse_up = time.time()
+            start_time_mouse_up = time.perf_counter()
             self.logger.info("\n⬆️ Soltando botón izquierdo del ratón para finalizar arrastre...")
             self.page.mouse.up()
-            end_time_mouse_up = time.time()
+            end_time_mouse_up = time.perf_counter()
             duration_mouse_up = end_time_mouse_up - start_time_mouse_up
-            self.logger.info(f"PERFORMANCE: Tiempo de 'mouse.up': {duration_mouse_up:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de 'mouse.up': %.4f segundos.", duration_mouse_up)
+            self.base.registrar_metrica("_realizar_drag_and_drop_manual", duration_mouse_up, medicion="mouse_up")
 
-            self.logger.info(f"\n✔ ÉXITO: 'Drag and Drop' manual realizado exitosamente de '{elemento_origen}' a '{elemento_destino}'.")
+            self.logger.info("\n✔ ÉXITO: 'Drag and Drop' manual realizado exitosamente de '%s' a '%s'.", elemento_origen, elemento_destino)
             self.base.tomar_captura(f"{nombre_base}_despues_drag_drop_manual", directorio)
-            self.logger.info(f"\n📸 Captura de pantalla tomada después del D&D manual: '{nombre_base}_despues_drag_drop_manual.png'")
+            self.logger.info("\n📸 Captura de pantalla tomada después del D&D manual: '%s_despues_drag_drop_manual.png'", nombre_base)
 
         except Error as e:
             error_msg = (
@@ -3878,7 +4276,7 @@ class ElementActions:
                 f"Asegúrate de que los elementos sean visibles e interactuables. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_manual_drag_and_drop_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_manual_drag_and_drop_playwright", directorio, es_fallo=True)
             raise # Re-lanza la excepción original de Playwright.
         
         except Exception as e:
@@ -3887,11 +4285,12 @@ class ElementActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Uso critical para errores inesperados graves.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_manual_drag_and_drop", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_manual_drag_and_drop", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
         
         finally:
             # --- Medición de rendimiento: Fin de la operación total de Drag and Drop manual ---
-            end_time_total_drag_drop = time.time()
+            end_time_total_drag_drop = time.perf_counter()
             duration_total_drag_drop = end_time_total_drag_drop - start_time_total_drag_drop
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación 'Drag and Drop' manual: {duration_total_drag_drop:.4f} segundos.")
\ No newline at end of file
+            self.logger.info("PERFORMANCE: Tiempo total de la operación 'Drag and Drop' manual: %.4f segundos.", duration_total_drag_drop)
+            self.base.registrar_metrica("_realizar_drag_and_drop_manual", duration_total_drag_drop, medicion="total_drag_drop")
\ No newline at end of file
@@ -3,12 +3,41 @@ import re
 from typing import Union, Optional, Dict, Any, List
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+
 class NavigationActions:
+    # Lee en una sola llamada el estado de un componente de paginación: el texto de la página
+    # activa (primer <a> visible con la clase de resaltado), el total de páginas (último <li>
+    # cuyo texto es un número) y el href de cada enlace numérico.
+    _SCRIPT_ESTADO_PAGINACION = """
+    (contenedor, claseResaltado) => {
+        const esNumero = (texto) => /^\\d+$/.test(texto);
+        const activo = Array.from(contenedor.querySelectorAll("a." + CSS.escape(claseResaltado)))[0];
+        const actual = activo && activo.getClientRects().length ? (activo.textContent || "").trim() : null;
+        const items = Array.from(contenedor.querySelectorAll("li"));
+        let total = 0;
+        for (let i = items.length - 1; i >= 0; i--) {
+            const texto = (items[i].textContent || "").trim();
+            if (esNumero(texto)) {
+                total = parseInt(texto, 10);
+                break;
+            }
+        }
+        const enlaces = {};
+        for (const enlace of contenedor.querySelectorAll("li a")) {
+            const texto = (enlace.textContent || "").trim();
+            if (esNumero(texto) && enlace.href) enlaces[texto] = enlace.href;
+        }
+        return {actual: actual, total: total, enlaces: enlaces};
+    }
+    """
+
     def __init__(self, base_page):
         self.base = base_page
         self.page: Page = base_page.page
         self.logger = base_page.logger
 
+    @medir_accion
     def ir_a_url(self, url: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Navega a una URL específica y mide el tiempo que tarda la operación.
@@ -21,10 +50,10 @@ class NavigationActions:
             tiempo (Union[int, float]): Tiempo de espera después de la navegación.
         """
         nombre_paso = f"Navegar a la URL: '{url}'"
-        self.logger.info(f"\n--- {nombre_paso} ---")
+        self.logger.info("\n--- %s ---", nombre_paso)
 
         # --- Medición de rendimiento: Inicio de la acción de navegación ---
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Navega a la URL. El `wait_until='domcontentloaded'` espera a que el DOM esté listo,
@@ -32,17 +61,18 @@ class NavigationActions:
             self.page.goto(url, wait_until="domcontentloaded")
             
             # --- Medición de rendimiento: Fin de la acción de navegación ---
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
             
             # Registra el éxito y las métricas de rendimiento.
-            self.logger.info(f"PERFORMANCE: La navegación a '{url}' tardó {duration:.4f} segundos.")
-            self.logger.info(f"\n✔ ÉXITO: Navegación completada a la URL: '{self.page.url}'.")
+            self.logger.info("PERFORMANCE: La navegación a '%s' tardó %.4f segundos.", url, duration)
+            self.base.registrar_metrica("ir_a_url", duration)
+            self.logger.info("\n✔ ÉXITO: Navegación completada a la URL: '%s'.", self.page.url)
             self.base.tomar_captura(f"{nombre_base}_navegacion_exitosa", directorio)
 
         except Error as e:
             # Captura errores específicos de Playwright, como timeouts o errores de red.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time
             error_msg = (
                 f"\n❌ FALLO (Playwright Error) - {nombre_paso}: Ocurrió un error de Playwright al navegar a la URL.\\n"
@@ -50,7 +80,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_navegacion_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_navegacion_playwright", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que el test falle.
 
         except Exception as e:
@@ -60,9 +90,10 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_navegacion", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_navegacion", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
     
+    @medir_accion
     def volver_a_pagina_anterior(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Simula la acción de volver a la página anterior en el historial del navegador.
@@ -82,14 +113,14 @@ class NavigationActions:
             Exception: Para cualquier otro error inesperado.
         """
         nombre_paso = "Volver a la página anterior"
-        self.logger.info(f"\n--- {nombre_paso} ---")
+        self.logger.info("\n--- %s ---", nombre_paso)
 
         # Almacena la URL actual para verificar el cambio posterior.
         url_actual = self.page.url
-        self.logger.info(f"URL actual antes de la acción: '{url_actual}'.")
+        self.logger.info("URL actual antes de la acción: '%s'.", url_actual)
 
         # --- Medición de rendimiento: Inicio de la acción de 'volver atrás' ---
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Intenta volver a la página anterior. Playwright espera implícitamente
@@ -97,22 +128,23 @@ class NavigationActions:
             self.page.go_back()
             
             # --- Medición de rendimiento: Fin de la acción ---
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
             
             # Registra el éxito y las métricas de rendimiento.
-            self.logger.info(f"PERFORMANCE: La acción de 'volver atrás' tardó {duration:.4f} segundos.")
+            self.logger.info("PERFORMANCE: La acción de 'volver atrás' tardó %.4f segundos.", duration)
+            self.base.registrar_metrica("volver_a_pagina_anterior", duration)
             
             # Verifica que la URL haya cambiado, asegurando que la navegación fue exitosa.
             if self.page.url != url_actual:
-                self.logger.info(f"\n✔ ÉXITO: Navegación de regreso completada. Nueva URL: '{self.page.url}'.")
+                self.logger.info("\n✔ ÉXITO: Navegación de regreso completada. Nueva URL: '%s'.", self.page.url)
                 self.base.tomar_captura(f"{nombre_base}_volver_atras_exitoso", directorio)
             else:
                 # Lanza una excepción si la URL no cambia, indicando un fallo en la navegación.
                 raise Exception("La URL no cambió, lo que indica que la navegación de regreso falló o no había página anterior.")
 
         except Error as e:
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time
             error_msg = (
                 f"\n❌ FALLO (Playwright Error) - {nombre_paso}: Ocurrió un error de Playwright al intentar volver a la página anterior.\\n"
@@ -120,7 +152,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_volver_atras_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_volver_atras_playwright", directorio, es_fallo=True)
             raise
 
         except Exception as e:
@@ -129,9 +161,10 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_volver_atras", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_volver_atras", directorio, es_fallo=True)
             raise
     
+    @medir_accion
     def avanzar_a_pagina_siguiente(self, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Simula la acción de avanzar a la página siguiente en el historial del navegador.
@@ -151,14 +184,14 @@ class NavigationActions:
             Exception: Para cualquier otro error inesperado.
         """
         nombre_paso = "Avanzar a la página siguiente"
-        self.logger.info(f"\n--- {nombre_paso} ---")
+        self.logger.info("\n--- %s ---", nombre_paso)
 
         # Almacena la URL actual para verificar el cambio posterior.
         url_actual = self.page.url
-        self.logger.info(f"\nURL actual antes de la acción: '{url_actual}'.")
+        self.logger.info("\nURL actual antes de la acción: '%s'.", url_actual)
 
         # --- Medición de rendimiento: Inicio de la acción de 'avanzar' ---
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Intenta avanzar a la página siguiente. Playwright espera implícitamente
@@ -166,22 +199,23 @@ class NavigationActions:
             self.page.go_forward()
             
             # --- Medición de rendimiento: Fin de la acción ---
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
             
             # Registra el éxito y las métricas de rendimiento.
-            self.logger.info(f"\nPERFORMANCE: La acción de 'avanzar' tardó {duration:.4f} segundos.")
+            self.logger.info("\nPERFORMANCE: La acción de 'avanzar' tardó %.4f segundos.", duration)
+            self.base.registrar_metrica("avanzar_a_pagina_siguiente", duration)
             
             # Verifica que la URL haya cambiado, asegurando que la navegación fue exitosa.
             if self.page.url != url_actual:
-                self.logger.info(f"\n✔ ÉXITO: Navegación avanzada completada. Nueva URL: '{self.page.url}'.")
+                self.logger.info("\n✔ ÉXITO: Navegación avanzada completada. Nueva URL: '%s'.", self.page.url)
                 self.base.tomar_captura(f"{nombre_base}_avanzar_exitoso", directorio)
             else:
                 # Lanza una excepción si la URL no cambia, indicando un fallo en la navegación.
                 raise Exception("La URL no cambió, lo que indica que la navegación de avance falló o no había página siguiente.")
 
         except Error as e:
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time
             error_msg = (
                 f"\n❌ FALLO (Playwright Error) - {nombre_paso}: Ocurrió un error de Playwright al intentar avanzar a la página siguiente.\\n"
@@ -189,7 +223,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_fallo_avanzar_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_avanzar_playwright", directorio, es_fallo=True)
             raise
 
         except Exception as e:
@@ -198,9 +232,10 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_avanzar", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_avanzar", directorio, es_fallo=True)
             raise
                     
+    @medir_accion
     def validar_titulo_de_web(self, titulo_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
         """
         Valida el título de la página web actual. Esta función espera hasta que el título
@@ -224,11 +259,11 @@ class NavigationActions:
                             para esta aserción cuando se usa un timeout).
             Exception: Para cualquier otro error inesperado que ocurra durante la validación.
         """
-        self.logger.info(f"\nValidando que el título de la página sea: '{titulo_esperado}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando que el título de la página sea: '%s'. Tiempo máximo de espera: %ss.", titulo_esperado, tiempo)
 
         # --- Medición de rendimiento: Inicio de la espera por el título ---
         # Registra el tiempo justo antes de iniciar la espera activa de Playwright.
-        start_time_title_check = time.time()
+        start_time_title_check = time.perf_counter()
 
         try:
             # Playwright espera a que el título de la página coincida con el `titulo_esperado`.
@@ -237,21 +272,22 @@ class NavigationActions:
             
             # --- Medición de rendimiento: Fin de la espera por el título ---
             # Registra el tiempo una vez que el título ha sido validado con éxito.
-            end_time_title_check = time.time()
+            end_time_title_check = time.perf_counter()
             # Calcula la duración total que tardó la validación del título.
             # Esta métrica es importante para evaluar la **velocidad de carga y actualización**
             # del título de la página, un indicador clave del rendimiento de navegación.
             duration_title_check = end_time_title_check - start_time_title_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en validar el título de la página a '{titulo_esperado}': {duration_title_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en validar el título de la página a '%s': %.4f segundos.", titulo_esperado, duration_title_check)
+            self.base.registrar_metrica("validar_titulo_de_web", duration_title_check, medicion="title_check")
 
-            self.logger.info(f"\n✔ ÉXITO: Título de la página '{self.page.title()}' validado exitosamente.")
+            self.logger.info("\n✔ ÉXITO: Título de la página '%s' validado exitosamente.", self.page.title())
             # Toma una captura de pantalla al validar el título con éxito.
             self.base.tomar_captura(f"{nombre_base}_exito_titulo", directorio)
 
         except TimeoutError as e:
             # Captura específica para cuando el título no coincide dentro del tiempo especificado.
             # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_title_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): El título de la página no coincidió con '{titulo_esperado}' "
@@ -259,7 +295,7 @@ class NavigationActions:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.base.tomar_captura(f"{nombre_base}_fallo_titulo_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_titulo_timeout", directorio, es_fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except AssertionError as e:
@@ -271,7 +307,7 @@ class NavigationActions:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.base.tomar_captura(f"{nombre_base}_fallo_titulo_no_coincide", directorio)
+            self.base.tomar_captura(f"{nombre_base}_fallo_titulo_no_coincide", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -282,9 +318,10 @@ class NavigationActions:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura para errores inesperados.
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_titulo", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_titulo", directorio, es_fallo=True)
             raise # Re-lanza la excepción.
         
+    @medir_accion
     def validar_url_actual(self, patron_url: str, tiempo: Union[int, float] = 0.5):
         """
         Valida la URL actual de la página usando un patrón de expresión regular.
@@ -309,11 +346,11 @@ class NavigationActions:
                             suele ser la excepción principal).
             Exception: Para cualquier otro error inesperado que ocurra durante la validación de la URL.
         """
-        self.logger.info(f"\nValidando que la URL actual coincida con el patrón: '{patron_url}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nValidando que la URL actual coincida con el patrón: '%s'. Tiempo máximo de espera: %ss.", patron_url, tiempo)
 
         # --- Medición de rendimiento: Inicio de la espera por la URL ---
         # Registra el tiempo justo antes de iniciar la espera activa de Playwright para la URL.
-        start_time_url_check = time.time()
+        start_time_url_check = time.perf_counter()
 
         try:
             # Playwright espera a que la URL de la página coincida con el patrón de expresión regular.
@@ -324,14 +361,15 @@ class NavigationActions:
             
             # --- Medición de rendimiento: Fin de la espera por la URL ---
             # Registra el tiempo una vez que la URL ha sido validada con éxito.
-            end_time_url_check = time.time()
+            end_time_url_check = time.perf_counter()
             # Calcula la duración total que tardó la validación de la URL.
             # Esta métrica es crucial para evaluar la **velocidad de navegación y carga de la página**,
             # ya que la URL a menudo cambia una vez que la página está completamente cargada o enrutada.
             duration_url_check = end_time_url_check - start_time_url_check
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en validar la URL a '{patron_url}': {duration_url_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en validar la URL a '%s': %.4f segundos.", patron_url, duration_url_check)
+            self.base.registrar_metrica("validar_url_actual", duration_url_check, medicion="url_check")
 
-            self.logger.info(f"\n✔ ÉXITO: URL '{self.page.url}' validada exitosamente con el patrón: '{patron_url}'.")
+            self.logger.info("\n✔ ÉXITO: URL '%s' validada exitosamente con el patrón: '%s'.", self.page.url, patron_url)
             # Nota sobre capturas de pantalla para URL:
             # Generalmente, una captura de pantalla no es visualmente útil para validar una URL,
             # ya que la URL se encuentra en la barra de direcciones del navegador.
@@ -343,7 +381,7 @@ class NavigationActions:
         except TimeoutError as e:
             # Captura específica para cuando la URL no coincide con el patrón dentro del tiempo especificado.
             # Se registra el tiempo transcurrido hasta el fallo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_url_check # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): La URL actual '{self.page.url}' no coincidió con el patrón "
@@ -377,6 +415,7 @@ class NavigationActions:
             # self.tomar_captura(f"{nombre_base}_error_inesperado_url", directorio)
             raise # Re-lanza la excepción.
         
+    @medir_accion
     def verificar_pagina_inicial_seleccionada(self, selector_paginado: Locator, texto_pagina_inicial: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0) -> bool:
         """
         Verifica que la página inicial esperada esté seleccionada y correctamente resaltada
@@ -408,24 +447,24 @@ class NavigationActions:
                             no están disponibles a tiempo, o si ocurre un error inesperado
                             de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Iniciando verificación del estado inicial de la paginación ---")
-        self.logger.info(f"\nContenedor de paginación locator: '{selector_paginado}'")
-        self.logger.info(f"P\nágina inicial esperada: '{texto_pagina_inicial}'")
+        self.logger.info("\n--- Iniciando verificación del estado inicial de la paginación ---")
+        self.logger.info("\nContenedor de paginación locator: '%s'", selector_paginado)
+        self.logger.info("P\nágina inicial esperada: '%s'", texto_pagina_inicial)
         self.base.tomar_captura(f"{nombre_base}_inicio_verificacion_paginacion", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que el contenedor de paginación esté visible
-            self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
+            self.logger.debug("\nEsperando que el contenedor de paginación '%s' esté visible (timeout: %ss).", selector_paginado, tiempo_espera_componente)
             # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self.base.resaltar_elemento(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo a verificar la página inicial.")
 
             # --- Medición de rendimiento: Inicio de localización de la página inicial ---
-            start_time_locator_page = time.time()
+            start_time_locator_page = time.perf_counter()
 
             # 2. Intentar encontrar el elemento de la página inicial por su texto dentro del contenedor
             # Se usa text= para una coincidencia exacta del texto visible del número de página.
@@ -435,21 +474,22 @@ class NavigationActions:
             pagina_inicial_locator = selector_paginado.locator(f"text='{texto_pagina_inicial}'").first
 
             # Esperar a que el elemento de la página inicial esté visible y sea interactuable
-            self.logger.debug(f"\nEsperando que el elemento de la página inicial '{texto_pagina_inicial}' esté visible (timeout: {tiempo_espera_componente}s).")
+            self.logger.debug("\nEsperando que el elemento de la página inicial '%s' esté visible (timeout: %ss).", texto_pagina_inicial, tiempo_espera_componente)
             expect(pagina_inicial_locator).to_be_visible()
-            self.logger.info(f"\n✅ Elemento para la página '{texto_pagina_inicial}' encontrado y visible.")
+            self.logger.info("\n✅ Elemento para la página '%s' encontrado y visible.", texto_pagina_inicial)
 
             # --- Medición de rendimiento: Fin de localización de la página inicial ---
-            end_time_locator_page = time.time()
+            end_time_locator_page = time.perf_counter()
             duration_locator_page = end_time_locator_page - start_time_locator_page
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del elemento de la página inicial: {duration_locator_page:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del elemento de la página inicial: %.4f segundos.", duration_locator_page)
+            self.base.registrar_metrica("verificar_pagina_inicial_seleccionada", duration_locator_page, medicion="locator_page")
 
             # --- Medición de rendimiento: Inicio de verificación de estado ---
-            start_time_verification = time.time()
+            start_time_verification = time.perf_counter()
 
             # 3. Verificar que la página inicial esperada esté seleccionada (marcada con la clase de resaltado)
-            self.logger.info(f"\nVerificando si la página '{texto_pagina_inicial}' tiene la clase de resaltado esperada '{clase_resaltado}'...")
-            pagina_inicial_locator.highlight() # Resaltar el elemento para la captura visual
+            self.logger.info("\nVerificando si la página '%s' tiene la clase de resaltado esperada '%s'...", texto_pagina_inicial, clase_resaltado)
+            self.base.resaltar_elemento(pagina_inicial_locator) # Resaltar el elemento para la captura visual
             self.base.tomar_captura(f"{nombre_base}_pagina_inicial_encontrada_resaltada", directorio)
 
             # Obtener todas las clases del elemento y verificar si la clase de resaltado está presente
@@ -462,30 +502,32 @@ class NavigationActions:
                 current_classes_list = [] # Si no hay atributo 'class', la lista está vacía
 
             if clase_resaltado in current_classes_list:
-                self.logger.info(f"\n  ✅ ÉXITO: La página '{texto_pagina_inicial}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
+                self.logger.info("\n  ✅ ÉXITO: La página '%s' está seleccionada y resaltada con la clase '%s'.", texto_pagina_inicial, clase_resaltado)
                 self.base.tomar_captura(f"{nombre_base}_pagina_inicial_seleccionada_ok", directorio)
                 success = True
             else:
                 self.logger.error(f"\n  ❌ FALLO: La página '{texto_pagina_inicial}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
-                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
-                self.base.tomar_captura(f"{nombre_base}_pagina_inicial_no_resaltada", directorio)
+                self.logger.info("\n  Clases actuales del elemento: '%s'", current_classes_attribute)
+                self.base.tomar_captura(f"{nombre_base}_pagina_inicial_no_resaltada", directorio, es_fallo=True)
                 success = False
             
             # --- Medición de rendimiento: Fin de verificación de estado ---
-            end_time_verification = time.time()
+            end_time_verification = time.perf_counter()
             duration_verification = end_time_verification - start_time_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la clase de resaltado: {duration_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de la clase de resaltado: %.4f segundos.", duration_verification)
+            self.base.registrar_metrica("verificar_pagina_inicial_seleccionada", duration_verification, medicion="verification")
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (verificación de paginación inicial): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (verificación de paginación inicial): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("verificar_pagina_inicial_seleccionada", duration_total_operation, medicion="total_operation")
 
             return success
 
         except TimeoutError as e:
             # Captura si el contenedor de paginación o el elemento de la página inicial no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): El contenedor de paginación '{selector_paginado}' "
@@ -495,7 +537,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_timeout_paginacion", directorio)
+            self.base.tomar_captura(f"{nombre_base}_timeout_paginacion", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nComponente de paginación o página inicial no disponibles a tiempo: {selector_paginado}") from e
 
@@ -507,7 +549,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar paginación: {selector_paginado}") from e
 
@@ -518,10 +560,11 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al verificar paginación: {selector_paginado}") from e
         
+    @medir_accion
     def navegar_y_verificar_pagina(self, selector_paginado: Locator, numero_pagina_a_navegar: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0, pausa_post_clic: Union[int, float] = 0.5) -> bool:
         """
         Navega a un número de página específico en un componente de paginación haciendo clic en el enlace
@@ -558,58 +601,39 @@ class NavigationActions:
                             no están disponibles a tiempo, o si ocurre un error inesperado
                             de Playwright o genérico.
         """
-        self.logger.info(f"\n--- Iniciando navegación a la página '{numero_pagina_a_navegar}' y verificación de resaltado ---")
-        self.logger.info(f"\nContenedor de paginación locator: '{selector_paginado}'")
+        self.logger.info("\n--- Iniciando navegación a la página '%s' y verificación de resaltado ---", numero_pagina_a_navegar)
+        self.logger.info("\nContenedor de paginación locator: '%s'", selector_paginado)
         self.base.tomar_captura(f"{nombre_base}_inicio_navegacion_pagina_{numero_pagina_a_navegar}", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que el contenedor de paginación está visible
-            self.logger.debug(f"\nEsperando que el contenedor de paginación '{selector_paginado}' esté visible (timeout: {tiempo_espera_componente}s).")
+            self.logger.debug("\nEsperando que el contenedor de paginación '%s' esté visible (timeout: %ss).", selector_paginado, tiempo_espera_componente)
             # Convertir tiempo_espera_componente de segundos a milisegundos para expect()
             expect(selector_paginado).to_be_visible()
-            selector_paginado.highlight()
+            self.base.resaltar_elemento(selector_paginado)
             self.logger.info("\n✅ Contenedor de paginación visible. Procediendo.")
 
             # --- Medición de rendimiento: Inicio detección de página actual y total ---
-            start_time_detection = time.time()
-
-            # Obtener la página actualmente seleccionada
-            # Este locator debería apuntar al elemento que realmente tiene la clase 'active'
-            # y cuyo texto es el número de página (ej. un <a> dentro de un <li>)
-            pagina_actual_locator = selector_paginado.locator(f"a.{clase_resaltado}").first
-            # O si el <li> es el que tiene la clase, y necesitas el texto del <a> dentro:
-            # pagina_actual_locator = selector_paginado.locator(f"li.{clase_resaltado} a").first
-
-            # Usar .is_visible() y .text_content() para obtener el texto de forma segura
-            pagina_actual_texto = "Desconocida"
-            if pagina_actual_locator.count() > 0 and pagina_actual_locator.is_visible():
-                pagina_actual_texto = pagina_actual_locator.text_content().strip()
-            self.logger.info(f"\n  Página actualmente seleccionada detectada: {pagina_actual_texto}")
-
-            # Calcular el número total de páginas disponibles
-            # Asumimos que los elementos de paginación son 'li' y que el último 'li' visible
-            # que contenga un número representa la última página.
-            todos_los_botones_pagina = selector_paginado.locator("li")
-            num_botones = todos_los_botones_pagina.count()
-            
-            total_paginas = 0
-            if num_botones > 0:
-                for i in range(num_botones - 1, -1, -1): # Iterar al revés para encontrar el último número
-                    btn = todos_los_botones_pagina.nth(i)
-                    btn_text = btn.text_content().strip()
-                    if btn_text.isdigit(): # Si el texto es un número válido
-                        total_paginas = int(btn_text)
-                        break
+            start_time_detection = time.perf_counter()
+
+            # Obtener la página actualmente seleccionada y el número total de páginas en una sola llamada
+            # (elemento `a.<clase_resaltado>` visible y último `li` cuyo texto es un número).
+            estado_paginacion = self.obtener_estado_paginacion(selector_paginado, clase_resaltado)
+            pagina_actual_texto = estado_paginacion["actual"] or "Desconocida"
+            self.logger.info("\n  Página actualmente seleccionada detectada: %s", pagina_actual_texto)
+
+            total_paginas = estado_paginacion["total"]
             
-            self.logger.info(f"\n  Número total de páginas detectadas: {total_paginas}")
+            self.logger.info("\n  Número total de páginas detectadas: %s", total_paginas)
             
             # --- Medición de rendimiento: Fin detección de página actual y total ---
-            end_time_detection = time.time()
+            end_time_detection = time.perf_counter()
             duration_detection = end_time_detection - start_time_detection
-            self.logger.info(f"PERFORMANCE: Tiempo de detección de página actual y total: {duration_detection:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de detección de página actual y total: %.4f segundos.", duration_detection)
+            self.base.registrar_metrica("navegar_y_verificar_pagina", duration_detection, medicion="detection")
 
             # 2. Validaciones previas a la navegación
             try:
@@ -618,13 +642,13 @@ class NavigationActions:
                 pagina_actual_int = int(pagina_actual_texto) if pagina_actual_texto.isdigit() else -1 # Usar -1 si es desconocido
             except ValueError:
                 self.logger.error(f"\n❌ FALLO: El número de página a navegar '{numero_pagina_a_navegar}' no es un número válido.")
-                self.base.tomar_captura(f"{nombre_base}_pagina_destino_invalida", directorio)
+                self.base.tomar_captura(f"{nombre_base}_pagina_destino_invalida", directorio, es_fallo=True)
                 return False
 
             # Condicional 1: Página de destino es mayor que el total de páginas
             if total_paginas > 0 and num_pagina_int > total_paginas:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: La página de destino '{numero_pagina_a_navegar}' es mayor que el número total de páginas disponibles '{total_paginas}'.")
-                self.base.tomar_captura(f"{nombre_base}_pagina_destino_fuera_rango", directorio)
+                self.base.tomar_captura(f"{nombre_base}_pagina_destino_fuera_rango", directorio, es_fallo=True)
                 return False # Considerar como fallo si la página está fuera de rango
 
             # Condicional 2: La página de destino es la misma que la página actual
@@ -642,42 +666,44 @@ class NavigationActions:
             ).first
             
             # --- Medición de rendimiento: Inicio de localización del botón de la página de destino ---
-            start_time_locator_button = time.time()
+            start_time_locator_button = time.perf_counter()
             expect(pagina_destino_locator).to_be_visible()
             expect(pagina_destino_locator).to_be_enabled()
-            self.logger.info(f"\n✅ Elemento de la página '{numero_pagina_a_navegar}' encontrado y habilitado para clic.")
+            self.logger.info("\n✅ Elemento de la página '%s' encontrado y habilitado para clic.", numero_pagina_a_navegar)
             
             # --- Medición de rendimiento: Fin de localización del botón de la página de destino ---
-            end_time_locator_button = time.time()
+            end_time_locator_button = time.perf_counter()
             duration_locator_button = end_time_locator_button - start_time_locator_button
-            self.logger.info(f"PERFORMANCE: Tiempo de localización del botón de la página de destino: {duration_locator_button:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de localización del botón de la página de destino: %.4f segundos.", duration_locator_button)
+            self.base.registrar_metrica("navegar_y_verificar_pagina", duration_locator_button, medicion="locator_button")
 
-            pagina_destino_locator.highlight()
+            self.base.resaltar_elemento(pagina_destino_locator)
             self.base.tomar_captura(f"{nombre_base}_pagina_a_navegar_encontrada", directorio)
             
-            self.logger.info(f"\n  Haciendo clic en la página '{numero_pagina_a_navegar}'...")
+            self.logger.info("\n  Haciendo clic en la página '%s'...", numero_pagina_a_navegar)
             
             # --- Medición de rendimiento: Inicio de click y espera de carga ---
-            start_time_click_and_wait = time.time()
+            start_time_click_and_wait = time.perf_counter()
             pagina_destino_locator.click()
-            self.base.esperar_fijo(pausa_post_clic) # Pausa para permitir la carga de la página y la aplicación de estilos
+            self.base.esperar_estabilidad(pausa_post_clic, condicion="red") # Espera a que la red quede inactiva tras el clic ('pausa_post_clic' como máximo)
             
             # --- Medición de rendimiento: Fin de click y espera de carga ---
-            end_time_click_and_wait = time.time()
+            end_time_click_and_wait = time.perf_counter()
             duration_click_and_wait = end_time_click_and_wait - start_time_click_and_wait
-            self.logger.info(f"PERFORMANCE: Tiempo de click y espera de carga para la página '{numero_pagina_a_navegar}': {duration_click_and_wait:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de click y espera de carga para la página '%s': %.4f segundos.", numero_pagina_a_navegar, duration_click_and_wait)
+            self.base.registrar_metrica("navegar_y_verificar_pagina", duration_click_and_wait, medicion="click_and_wait")
 
             self.base.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_clic", directorio)
 
             # 4. Verificar que la página de destino se resalte
-            self.logger.info(f"\nVerificando si la página '{numero_pagina_a_navegar}' tiene la clase de resaltado '{clase_resaltado}'...")
+            self.logger.info("\nVerificando si la página '%s' tiene la clase de resaltado '%s'...", numero_pagina_a_navegar, clase_resaltado)
             
             # Asegurarse de que el elemento de destino aún esté visible y, opcionalmente, que sus atributos se hayan actualizado.
             expect(pagina_destino_locator).to_be_visible()
-            pagina_destino_locator.highlight() # Resaltar el elemento para la captura final
+            self.base.resaltar_elemento(pagina_destino_locator) # Resaltar el elemento para la captura final
 
             # --- Medición de rendimiento: Inicio de verificación de estado final ---
-            start_time_final_verification = time.time()
+            start_time_final_verification = time.perf_counter()
 
             current_classes_attribute = pagina_destino_locator.get_attribute("class")
             
@@ -687,30 +713,32 @@ class NavigationActions:
                 current_classes_list = []
 
             if clase_resaltado in current_classes_list:
-                self.logger.info(f"\n  ✅ ÉXITO: La página '{numero_pagina_a_navegar}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
+                self.logger.info("\n  ✅ ÉXITO: La página '%s' está seleccionada y resaltada con la clase '%s'.", numero_pagina_a_navegar, clase_resaltado)
                 self.base.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_seleccionada_ok", directorio)
                 success = True
             else:
                 self.logger.error(f"\n  ❌ FALLO: La página '{numero_pagina_a_navegar}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
-                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
-                self.base.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_no_resaltada", directorio)
+                self.logger.info("\n  Clases actuales del elemento: '%s'", current_classes_attribute)
+                self.base.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_no_resaltada", directorio, es_fallo=True)
                 success = False
 
             # --- Medición de rendimiento: Fin de verificación de estado final ---
-            end_time_final_verification = time.time()
+            end_time_final_verification = time.perf_counter()
             duration_final_verification = end_time_final_verification - start_time_final_verification
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación de la clase de resaltado final: {duration_final_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación de la clase de resaltado final: %.4f segundos.", duration_final_verification)
+            self.base.registrar_metrica("navegar_y_verificar_pagina", duration_final_verification, medicion="final_verification")
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (navegación y verificación de paginación): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (navegación y verificación de paginación): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("navegar_y_verificar_pagina", duration_total_operation, medicion="total_operation")
 
             return success
 
         except TimeoutError as e:
             # Captura si el contenedor de paginación o el elemento de la página de destino no se vuelven visibles/interactuables a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): El contenedor de paginación '{selector_paginado}' "
@@ -720,7 +748,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_timeout_navegacion", directorio)
+            self.base.tomar_captura(f"{nombre_base}_timeout_navegacion", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nComponente de paginación o página de destino no disponibles a tiempo: {selector_paginado} o página {numero_pagina_a_navegar}") from e
 
@@ -732,7 +760,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al navegar/verificar paginación: {selector_paginado}") from e
 
@@ -743,10 +771,33 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al navegar/verificar paginación: {selector_paginado}") from e
             
+    @medir_accion
+    def obtener_estado_paginacion(self, selector_paginado: Locator, clase_resaltado: str = "active") -> Dict[str, Any]:
+        """
+        Obtiene con **una sola llamada al navegador** el estado de un componente de paginación,
+        en lugar de recorrer sus elementos `li` uno a uno con `text_content()`.
+
+        Args:
+            selector_paginado (Locator): El **Locator de Playwright** del contenedor de la paginación.
+            clase_resaltado (str): La **clase CSS** de la página activa. Por defecto, "active".
+
+        Returns:
+            Dict[str, Any]: 'actual' (texto de la página activa o `None`), 'total' (número total de
+                            páginas, 0 si no se detecta) y 'enlaces' ({número de página: href}).
+
+        Raises:
+            Error: Si ocurre un problema de Playwright al evaluar el contenedor (se relanza).
+        """
+        estado = selector_paginado.evaluate(self._SCRIPT_ESTADO_PAGINACION, clase_resaltado)
+        self.logger.debug("\nEstado de la paginación '%s': página actual %s de %s, %s enlaces numéricos.",
+                          selector_paginado, estado["actual"], estado["total"], len(estado["enlaces"]))
+        return estado
+
+    @medir_accion
     def abrir_y_cambiar_a_nueva_pestana(self, selector_boton_apertura: Locator, nombre_base: str, directorio: str, tiempo_espera_max_total: Union[int, float] = 15.0, texto_esperado_en_boton: Optional[str] = None) -> Optional[Page]:
         """
         Esperar por la apertura de una nueva pestaña/página (popup) después de hacer clic
@@ -765,19 +816,19 @@ class NavigationActions:
         Raises:
             AssertionError: Si el elemento disparador no está disponible, o si el proceso falla.
         """
-        self.logger.info(f"\n🔄 Preparando para hacer clic en '{selector_boton_apertura}' y esperar nueva pestaña/popup. Esperando hasta {tiempo_espera_max_total} segundos...")
+        self.logger.info("\n🔄 Preparando para hacer clic en '%s' y esperar nueva pestaña/popup. Esperando hasta %s segundos...", selector_boton_apertura, tiempo_espera_max_total)
 
         # Reiniciar las banderas y variables de estado para esta operación
         self._popup_detectado = False
         self._popup_page = None
 
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             self.logger.debug("\n--- INICIO del bloque TRY ---")
 
             # 1. Hacer clic en el botón que abre la nueva pestaña
-            self.logger.info(f"--> Haciendo clic en el botón '{selector_boton_apertura}' para disparar la apertura de la nueva página...")
+            self.logger.info("--> Haciendo clic en el botón '%s' para disparar la apertura de la nueva página...", selector_boton_apertura)
             self.base.element.hacer_click_en_elemento(
                 selector_boton_apertura, 
                 f"{nombre_base}_click_para_nueva_pestana", 
@@ -786,54 +837,56 @@ class NavigationActions:
             )
 
             # 2. Esperar que la nueva página sea detectada por el oyente del constructor
-            self.logger.info(f"--> Clic en el botón disparador completado. Esperando que el oyente permanente detecte la nueva página...")
+            self.logger.info("--> Clic en el botón disparador completado. Esperando que el oyente permanente detecte la nueva página...")
             
-            start_time_new_page_detection = time.time()
+            start_time_new_page_detection = time.perf_counter()
             
             # Bucle de espera para la detección del popup
-            while not self._popup_detectado and (time.time() - start_time_total_operation) < tiempo_espera_max_total:
+            while not self._popup_detectado and (time.perf_counter() - start_time_total_operation) < tiempo_espera_max_total:
                 time.sleep(0.1)  # Espera corta para no sobrecargar el CPU
             
-            end_time_new_page_detection = time.time()
+            end_time_new_page_detection = time.perf_counter()
             duration_new_page_detection = end_time_new_page_detection - start_time_new_page_detection
             
             # Validar si el popup fue detectado y el objeto page no está vacío
             if not self._popup_detectado or self._popup_page is None or self._popup_page.is_closed():
                 raise TimeoutError("No se detectó una nueva pestaña/página o se cerró inesperadamente dentro del tiempo de espera.")
                 
-            self.logger.info(f"PERFORMANCE: Tiempo de detección de la nueva página por el oyente: {duration_new_page_detection:.4f} segundos.")
-            self.logger.info(f"--> Nueva página detectada. URL: {self._popup_page.url}")
+            self.logger.info("PERFORMANCE: Tiempo de detección de la nueva página por el oyente: %.4f segundos.", duration_new_page_detection)
+            self.base.registrar_metrica("abrir_y_cambiar_a_nueva_pestana", duration_new_page_detection, medicion="new_page_detection")
+            self.logger.info("--> Nueva página detectada. URL: %s", self._popup_page.url)
             
             nueva_pagina = self._popup_page
             
             # 3. Esperar a que la nueva página cargue completamente el DOM y los recursos
-            self.logger.debug(f"--> Esperando que la nueva página cargue completamente (Load state)...")
+            self.logger.debug("--> Esperando que la nueva página cargue completamente (Load state)...")
             #nueva_pagina.wait_for_load_state("load")
             nueva_pagina.wait_for_load_state("domcontentloaded")
             self.logger.info("--> Carga de la nueva página completada (Load state).")
 
             # 4. Esperar a que un elemento clave de la nueva página sea visible
-            self.logger.debug(f"--> Esperando que el 'body' de la nueva página sea visible...")
+            self.logger.debug("--> Esperando que el 'body' de la nueva página sea visible...")
             expect(nueva_pagina.locator("body")).to_be_visible()
             self.logger.info("--> El 'body' de la nueva página es visible.")
 
-            self.logger.info(f"\n✅ Nueva pestaña abierta y detectada: URL = {nueva_pagina.url}, Título = {nueva_pagina.title()}")
+            self.logger.info("\n✅ Nueva pestaña abierta y detectada: URL = %s, Título = %s", nueva_pagina.url, nueva_pagina.title())
             
             # 5. Actualizar self.page para que las subsiguientes operaciones usen la nueva página
-            self.logger.info(f"--> Cambiando el foco de la instancia 'page' actual a la nueva pestaña...")
+            self.logger.info("--> Cambiando el foco de la instancia 'page' actual a la nueva pestaña...")
             self.page = nueva_pagina 
             
             self.base.tomar_captura(f"{nombre_base}_nueva_pestana_abierta_y_cargada", directorio)
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (apertura y cambio a nueva pestaña): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (apertura y cambio a nueva pestaña): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("abrir_y_cambiar_a_nueva_pestana", duration_total_operation, medicion="total_operation")
             
             return nueva_pagina
 
         except TimeoutError as e:
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Tiempo de espera excedido): No se detectó ninguna nueva pestaña/página después de {tiempo_espera_max_total} segundos.\n"
@@ -841,7 +894,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_no_se_detecto_popup_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_no_se_detecto_popup_timeout", directorio, es_fallo=True)
             raise AssertionError(f"\nTimeout al abrir o cargar nueva pestaña para selector '{selector_boton_apertura}'") from e
         except Error as e:
             error_msg = (
@@ -849,7 +902,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_abrir_pestana", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_abrir_pestana", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
         except Exception as e:
             error_msg = (
@@ -857,9 +910,10 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_abrir_pestana", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_abrir_pestana", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
 
+    @medir_accion
     def cerrar_pestana_actual(self, nombre_base: str, directorio: str, tiempo_post_cierre: Union[int, float] = 1.0) -> None:
         """
         Cierra la pestaña Playwright actualmente activa (`self.page`).
@@ -880,13 +934,13 @@ class NavigationActions:
                             Se lanza para asegurar que el test falle si la operación no es exitosa.
         """
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         # Guardar la URL actual antes de cerrarla (para logging)
         current_page_url = "N/A (Página ya cerrada o no accesible)"
         try:
             current_page_url = self.page.url
-            self.logger.info(f"\n🚪 Cerrando la pestaña actual: URL = {current_page_url}")
+            self.logger.info("\n🚪 Cerrando la pestaña actual: URL = %s", current_page_url)
         except Exception as e:
             self.logger.warning(f"\nNo se pudo obtener la URL de la página actual antes de intentar cerrarla: {e}")
 
@@ -895,35 +949,37 @@ class NavigationActions:
             # ¡IMPORTANTE! Tomar la captura *antes* de cerrar la página.
             self.base.tomar_captura(f"{nombre_base}_antes_de_cerrar", directorio) 
             
-            self.logger.debug(f"\n  --> Iniciando cierre de la página: {current_page_url}")
+            self.logger.debug("\n  --> Iniciando cierre de la página: %s", current_page_url)
             # --- Medición de rendimiento: Inicio del cierre de la pestaña ---
-            start_time_close_page = time.time()
+            start_time_close_page = time.perf_counter()
             self.page.close()
             # --- Medición de rendimiento: Fin del cierre de la pestaña ---
-            end_time_close_page = time.time()
+            end_time_close_page = time.perf_counter()
             duration_close_page = end_time_close_page - start_time_close_page
-            self.logger.info(f"PERFORMANCE: Tiempo de cierre de la pestaña: {duration_close_page:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de cierre de la pestaña: %.4f segundos.", duration_close_page)
+            self.base.registrar_metrica("cerrar_pestana_actual", duration_close_page, medicion="close_page")
             
-            self.logger.info(f"\n✅ Pestaña con URL '{current_page_url}' cerrada exitosamente.")
+            self.logger.info("\n✅ Pestaña con URL '%s' cerrada exitosamente.", current_page_url)
             
-            # Pequeña espera después de cerrar la pestaña para asegurar que el DOM se libere
-            self.base.esperar_fijo(tiempo_post_cierre) 
+            # Espera de estabilidad después de cerrar la pestaña ('tiempo_post_cierre' como máximo)
+            self.base.esperar_estabilidad(tiempo_post_cierre)
 
             # Verificar si hay otras páginas abiertas en el contexto y cambiar el foco
             self.logger.debug("\n  --> Verificando otras pestañas en el contexto para cambiar el foco...")
             # --- Medición de rendimiento: Inicio del cambio de foco ---
-            start_time_switch_focus = time.time()
+            start_time_switch_focus = time.perf_counter()
             if self.page.context.pages:
                 # Playwright mantiene automáticamente la lista de páginas abiertas.
                 # Al cerrar una página, si era la única, la lista se vacía.
                 # Si hay más, la primera página en la lista es generalmente la que queda activa o la primera en crearse.
                 self.page = self.page.context.pages[0] # Cambia el foco a la primera página disponible
                 # --- Medición de rendimiento: Fin del cambio de foco ---
-                end_time_switch_focus = time.time()
+                end_time_switch_focus = time.perf_counter()
                 duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                self.logger.info(f"PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: {duration_switch_focus:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: %.4f segundos.", duration_switch_focus)
+                self.base.registrar_metrica("cerrar_pestana_actual", duration_switch_focus, medicion="switch_focus")
 
-                self.logger.info(f"\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = {self.page.url}")
+                self.logger.info("\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = %s", self.page.url)
                 # Opcional: Podrías tomar otra captura aquí si quieres mostrar el estado de la nueva pestaña activa.
                 # self.tomar_captura(f"{nombre_base}_foco_cambiado", directorio)
             else:
@@ -931,9 +987,10 @@ class NavigationActions:
                 self.page = None # No hay página activa en este contexto
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cierre de pestaña y cambio de foco): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (cierre de pestaña y cambio de foco): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("cerrar_pestana_actual", duration_total_operation, medicion="total_operation")
 
         except Error as e:
             # Captura errores específicos de Playwright, como si la página ya está cerrada o el contexto se cerró.
@@ -955,50 +1012,52 @@ class NavigationActions:
             # No se toma captura aquí porque la página podría estar inactiva/cerrada.
             raise AssertionError(f"\nError inesperado al cerrar pestaña actual: {e}") from e
         
+    @medir_accion
     def hacer_clic_y_abrir_nueva_ventana(self, selector: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", tiempo_espera_max_total: Union[int, float] = 30.0) -> List[Page]:
         """
         Hace clic en un selector y espera que se abran una o más nuevas ventanas/pestañas (popups).
         Esta versión utiliza un bucle con un listener de Playwright para capturar múltiples ventanas.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Iniciando operación de clic y espera de nueva ventana para el selector '{selector}' ---")
+        self.logger.info("\n--- %s: Iniciando operación de clic y espera de nueva ventana para el selector '%s' ---", nombre_paso, selector)
         self.base.tomar_captura(f"{nombre_base}_antes_clic_nueva_ventana", directorio)
         
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
         all_pages = self.page.context.pages # Almacena las páginas existentes antes del clic
         loaded_pages = []
 
         try:
             # 1. Validar que el elemento es visible y habilitado antes de hacer clic
-            self.logger.debug(f"Paso 1: Validando que el selector '{selector}' sea visible y habilitado.")
+            self.logger.debug("Paso 1: Validando que el selector '%s' sea visible y habilitado.", selector)
             expect(selector).to_be_visible(timeout=tiempo_espera_max_total * 1000)
             expect(selector).to_be_enabled(timeout=tiempo_espera_max_total * 1000)
             self.logger.info("El selector ha sido validado exitosamente. Está visible y habilitado.")
-            selector.highlight()
+            self.base.resaltar_elemento(selector)
             self.base.esperar_fijo(0.2)
             
             # 2. Realizar el clic
-            self.logger.debug(f"--> Realizando clic en el selector '{selector}'...")
-            start_time_click = time.time()
+            self.logger.debug("--> Realizando clic en el selector '%s'...", selector)
+            start_time_click = time.perf_counter()
             selector.click()
-            duration_click = time.time() - start_time_click
-            self.logger.info(f"PERFORMANCE: Tiempo de la acción de clic: {duration_click:.4f} segundos.")
+            duration_click = time.perf_counter() - start_time_click
+            self.logger.info("PERFORMANCE: Tiempo de la acción de clic: %.4f segundos.", duration_click)
+            self.base.registrar_metrica("hacer_clic_y_abrir_nueva_ventana", duration_click, medicion="click", locator=selector)
             
             # 3. Esperar que se abran las nuevas páginas
-            end_time = time.time() + tiempo_espera_max_total
+            end_time = time.perf_counter() + tiempo_espera_max_total
             self.logger.info("Paso 2: Esperando la(s) nueva(s) ventana(s) hasta que no se abran más o se agote el tiempo.")
             
-            while time.time() < end_time:
+            while time.perf_counter() < end_time:
                 # Captura todas las nuevas páginas que aparecieron después del clic
                 nuevas_paginas = [p for p in self.page.context.pages if p not in all_pages and p not in loaded_pages]
                 
                 if nuevas_paginas:
-                    self.logger.info(f"✅ Se detectaron {len(nuevas_paginas)} nueva(s) ventana(s).")
+                    self.logger.info("✅ Se detectaron %s nueva(s) ventana(s).", len(nuevas_paginas))
                     for new_page in nuevas_paginas:
                         # Esperar a que cada nueva página cargue completamente
-                        self.logger.info(f"Paso 3: Esperando la carga completa de la nueva página (URL: {new_page.url}).")
+                        self.logger.info("Paso 3: Esperando la carga completa de la nueva página (URL: %s).", new_page.url)
                         try:
-                            new_page.wait_for_load_state("networkidle", timeout=(end_time - time.time()) * 1000)
-                            self.logger.info(f"🌐 Nueva página cargada exitosamente: URL = {new_page.url}, Título = {new_page.title()}")
+                            new_page.wait_for_load_state("networkidle", timeout=(end_time - time.perf_counter()) * 1000)
+                            self.logger.info("🌐 Nueva página cargada exitosamente: URL = %s, Título = %s", new_page.url, new_page.title())
                             self.base.tomar_captura(f"{nombre_base}_pagina_abierta_{len(loaded_pages)+1}", directorio)
                             loaded_pages.append(new_page)
                         except TimeoutError as te:
@@ -1015,25 +1074,27 @@ class NavigationActions:
                 raise AssertionError("No se detectaron nuevas ventanas/pestañas después del clic.")
 
             self.base.tomar_captura(f"{nombre_base}_despues_clic_nueva_ventana_final", directorio)
-            self.logger.info(f"\n✅ Operación completada: se ha detectado y cargado {len(loaded_pages)} nueva(s) ventana(s) con éxito.")
+            self.logger.info("\n✅ Operación completada: se ha detectado y cargado %s nueva(s) ventana(s) con éxito.", len(loaded_pages))
             
-            duration_total_operation = time.time() - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación: {duration_total_operation:.4f} segundos.")
+            duration_total_operation = time.perf_counter() - start_time_total_operation
+            self.logger.info("PERFORMANCE: Tiempo total de la operación: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("hacer_clic_y_abrir_nueva_ventana", duration_total_operation, medicion="total_operation", locator=selector)
 
             return loaded_pages
 
         except TimeoutError as e:
             error_msg = f"\n❌ FALLO (Tiempo de espera excedido): El elemento '{selector}' no estuvo visible/habilitado a tiempo o no se detectaron nuevas ventanas dentro de {tiempo_espera_max_total}s. Detalles: {e}"
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_no_nueva_ventana_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_no_nueva_ventana_timeout", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
         
         except Exception as e:
             error_msg = f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al intentar abrir nuevas ventanas. Detalles: {e}"
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_abrir_nueva_ventana", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_abrir_nueva_ventana", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
 
+    @medir_accion
     def cambiar_foco_entre_ventanas(self, opcion_ventana: Union[int, str], nombre_base: str, directorio: str, nombre_paso: str = "") -> Page:
         """
         Cambia el foco de la instancia 'self.page' a una ventana/pestaña específica
@@ -1059,44 +1120,45 @@ class NavigationActions:
             TypeError: Si el tipo de `opcion_ventana` no es `int` ni `str`.
             AssertionError: Si ocurre un error inesperado durante el proceso de cambio de foco.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Intentando cambiar el foco a la ventana/pestaña: '{opcion_ventana}' ---")
+        self.logger.info("\n--- %s: Intentando cambiar el foco a la ventana/pestaña: '%s' ---", nombre_paso, opcion_ventana)
         
         target_page_to_focus: Optional[Page] = None
         
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Obtener todas las páginas actuales en el contexto del navegador
             self.logger.debug("\n  --> Recuperando todas las páginas en el contexto del navegador...")
             # --- Medición de rendimiento: Inicio de recuperación de páginas ---
-            start_time_get_pages = time.time()
+            start_time_get_pages = time.perf_counter()
             all_pages_in_context = self.page.context.pages
             # --- Medición de rendimiento: Fin de recuperación de páginas ---
-            end_time_get_pages = time.time()
+            end_time_get_pages = time.perf_counter()
             duration_get_pages = end_time_get_pages - start_time_get_pages
-            self.logger.info(f"PERFORMANCE: Tiempo de recuperación de todas las páginas en el contexto: {duration_get_pages:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de recuperación de todas las páginas en el contexto: %.4f segundos.", duration_get_pages)
+            self.base.registrar_metrica("cambiar_foco_entre_ventanas", duration_get_pages, medicion="get_pages")
 
-            self.logger.info(f"\n  Ventanas/pestañas abiertas actualmente: {len(all_pages_in_context)}")
+            self.logger.info("\n  Ventanas/pestañas abiertas actualmente: %s", len(all_pages_in_context))
             for i, p in enumerate(all_pages_in_context):
                 try:
-                    self.logger.info(f"\n    [{i}] URL: {p.url} | Título: {p.title()}")
+                    self.logger.info("\n    [%s] URL: %s | Título: %s", i, p.url, p.title())
                 except Exception as e:
                     self.logger.warning(f"\n    [{i}] No se pudo obtener URL/Título: {e}")
 
             # 2. Buscar la página objetivo basada en la opción_ventana
-            self.logger.debug(f"\n  --> Buscando la página objetivo '{opcion_ventana}'...")
+            self.logger.debug("\n  --> Buscando la página objetivo '%s'...", opcion_ventana)
             # --- Medición de rendimiento: Inicio de búsqueda de página objetivo ---
-            start_time_find_target_page = time.time()
+            start_time_find_target_page = time.perf_counter()
 
             if isinstance(opcion_ventana, int):
                 if 0 <= opcion_ventana < len(all_pages_in_context):
                     target_page_to_focus = all_pages_in_context[opcion_ventana]
-                    self.logger.info(f"  --> Seleccionada por índice: {opcion_ventana}")
+                    self.logger.info("  --> Seleccionada por índice: %s", opcion_ventana)
                 else:
                     error_msg = f"\n❌ FALLO: El índice '{opcion_ventana}' está fuera del rango de pestañas abiertas (0-{len(all_pages_in_context)-1})."
                     self.logger.error(error_msg)
-                    self.base.tomar_captura(f"{nombre_base}_error_indice_invalido", directorio)
+                    self.base.tomar_captura(f"{nombre_base}_error_indice_invalido", directorio, es_fallo=True)
                     raise IndexError(error_msg)
             elif isinstance(opcion_ventana, str):
                 # Intentar encontrar por URL o título
@@ -1106,7 +1168,7 @@ class NavigationActions:
                         if opcion_ventana in p.url or opcion_ventana in p.title():
                             target_page_to_focus = p
                             found_match = True
-                            self.logger.info(f"\n  --> Seleccionada por coincidencia de URL/Título: '{opcion_ventana}' (URL: {p.url}, Título: {p.title()})")
+                            self.logger.info("\n  --> Seleccionada por coincidencia de URL/Título: '%s' (URL: %s, Título: %s)", opcion_ventana, p.url, p.title())
                             break
                     except Error as e:
                         # La página podría haberse cerrado justo en el momento de acceder a URL/title
@@ -1115,43 +1177,46 @@ class NavigationActions:
                 if not found_match:
                     error_msg = f"\n❌ FALLO: No se encontró ninguna pestaña con la URL o título que contenga '{opcion_ventana}'."
                     self.logger.error(error_msg)
-                    self.base.tomar_captura(f"{nombre_base}_error_no_coincidencia_foco", directorio)
+                    self.base.tomar_captura(f"{nombre_base}_error_no_coincidencia_foco", directorio, es_fallo=True)
                     raise ValueError(error_msg)
             else:
                 error_msg = f"\n❌ FALLO: El tipo de 'opcion_ventana' no es válido. Debe ser int o str (tipo recibido: {type(opcion_ventana).__name__})."
                 self.logger.error(error_msg)
-                self.base.tomar_captura(f"{nombre_base}_error_tipo_opcion_foco", directorio)
+                self.base.tomar_captura(f"{nombre_base}_error_tipo_opcion_foco", directorio, es_fallo=True)
                 raise TypeError(error_msg)
             
             # --- Medición de rendimiento: Fin de búsqueda de página objetivo ---
-            end_time_find_target_page = time.time()
+            end_time_find_target_page = time.perf_counter()
             duration_find_target_page = end_time_find_target_page - start_time_find_target_page
-            self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de la página objetivo: {duration_find_target_page:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de búsqueda de la página objetivo: %.4f segundos.", duration_find_target_page)
+            self.base.registrar_metrica("cambiar_foco_entre_ventanas", duration_find_target_page, medicion="find_target_page")
 
             # 3. Cambiar el foco si la página objetivo no es la actual
             if target_page_to_focus == self.page:
-                self.logger.info(f"\n✅ El foco ya está en la ventana seleccionada (URL: {self.page.url}). No es necesario cambiar.")
+                self.logger.info("\n✅ El foco ya está en la ventana seleccionada (URL: %s). No es necesario cambiar.", self.page.url)
             else:
-                self.logger.debug(f"\n  --> Cambiando el foco de '{self.page.url}' a '{target_page_to_focus.url}'...")
+                self.logger.debug("\n  --> Cambiando el foco de '%s' a '%s'...", self.page.url, target_page_to_focus.url)
                 # --- Medición de rendimiento: Inicio del cambio de foco ---
-                start_time_switch_focus = time.time()
+                start_time_switch_focus = time.perf_counter()
                 self.page = target_page_to_focus
                 # --- Medición de rendimiento: Fin del cambio de foco ---
-                end_time_switch_focus = time.time()
+                end_time_switch_focus = time.perf_counter()
                 duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                self.logger.info(f"PERFORMANCE: Tiempo de asignación del foco (self.page = ...): {duration_switch_focus:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de asignación del foco (self.page = ...): %.4f segundos.", duration_switch_focus)
+                self.base.registrar_metrica("cambiar_foco_entre_ventanas", duration_switch_focus, medicion="switch_focus")
                 
-                self.logger.info(f"\n✅ Foco cambiado exitosamente a la ventana/pestaña seleccionada.")
+                self.logger.info("\n✅ Foco cambiado exitosamente a la ventana/pestaña seleccionada.")
             
             # 4. Reportar el estado final y tomar captura
-            self.logger.info(f"\n  URL de la pestaña actual: {self.page.url}")
-            self.logger.info(f"\n  Título de la pestaña actual: {self.page.title()}")
+            self.logger.info("\n  URL de la pestaña actual: %s", self.page.url)
+            self.logger.info("\n  Título de la pestaña actual: %s", self.page.title())
             self.base.tomar_captura(f"{nombre_base}_foco_cambiado", directorio)
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cambio de foco entre ventanas): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (cambio de foco entre ventanas): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("cambiar_foco_entre_ventanas", duration_total_operation, medicion="total_operation")
             
             return self.page # Retorna la página a la que se cambió el foco
 
@@ -1168,7 +1233,7 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright_cambiar_foco", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright_cambiar_foco", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
 
         except Exception as e:
@@ -1178,9 +1243,10 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado_cambiar_foco", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado_cambiar_foco", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
 
+    @medir_accion
     def cerrar_pestana_especifica(self, page_to_close: Page, nombre_base: str, directorio: str, nombre_paso: str = "") -> None:
         """
         Cierra un objeto `Page` específico proporcionado.
@@ -1200,7 +1266,7 @@ class NavigationActions:
                             durante el cierre de la pestaña o el cambio de foco.
         """
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             closed_url = "N/A (Página no válida o ya cerrada)"
@@ -1208,57 +1274,61 @@ class NavigationActions:
                 # Intenta obtener la URL para el log, pero maneja el error si la página ya está cerrada
                 if page_to_close and not page_to_close.is_closed():
                     closed_url = page_to_close.url
-                self.logger.info(f"\n--- {nombre_paso}: Intentando cerrar la pestaña con URL: {closed_url} ---")
+                self.logger.info("\n--- %s: Intentando cerrar la pestaña con URL: %s ---", nombre_paso, closed_url)
             except Error as e:
                 self.logger.warning(f"\nNo se pudo obtener la URL de la página a cerrar. Podría estar inactiva: {e}")
 
             if not page_to_close or page_to_close.is_closed():
-                self.logger.info(f"\n ℹ️ La pestaña (URL: {closed_url}) ya estaba cerrada o no es un objeto Page válido. No se requiere acción.")
+                self.logger.info("\n ℹ️ La pestaña (URL: %s) ya estaba cerrada o no es un objeto Page válido. No se requiere acción.", closed_url)
                 # --- Medición de rendimiento: Fin total de la función (sin acción real) ---
-                end_time_total_operation = time.time()
+                end_time_total_operation = time.perf_counter()
                 duration_total_operation = end_time_total_operation - start_time_total_operation
-                self.logger.info(f"PERFORMANCE: Tiempo total de la operación (pestaña ya cerrada): {duration_total_operation:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo total de la operación (pestaña ya cerrada): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("cerrar_pestana_especifica", duration_total_operation, medicion="total_operation")
                 return # Salir si la página ya está cerrada o no es válida
 
             # 1. Determinar si la página a cerrar es la página actual (self.page)
             # --- Medición de rendimiento: Inicio de la detección de página actual ---
-            start_time_is_current_page_check = time.time()
+            start_time_is_current_page_check = time.perf_counter()
             is_current_page = (self.page == page_to_close)
             # --- Medición de rendimiento: Fin de la detección de página actual ---
-            end_time_is_current_page_check = time.time()
+            end_time_is_current_page_check = time.perf_counter()
             duration_is_current_page_check = end_time_is_current_page_check - start_time_is_current_page_check
-            self.logger.info(f"PERFORMANCE: Tiempo de verificación si es la página actual: {duration_is_current_page_check:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de verificación si es la página actual: %.4f segundos.", duration_is_current_page_check)
+            self.base.registrar_metrica("cerrar_pestana_especifica", duration_is_current_page_check, medicion="is_current_page_check")
 
-            self.logger.debug(f"\n  --> Tomando captura antes de cerrar la pestaña: {closed_url}")
+            self.logger.debug("\n  --> Tomando captura antes de cerrar la pestaña: %s", closed_url)
             self.base.tomar_captura(f"{nombre_base}_antes_de_cerrar_especifica", directorio)
             
             # 2. Cerrar la pestaña específica
-            self.logger.debug(f"\n  --> Procediendo a cerrar la pestaña: {closed_url}")
+            self.logger.debug("\n  --> Procediendo a cerrar la pestaña: %s", closed_url)
             # --- Medición de rendimiento: Inicio del cierre de la pestaña ---
-            start_time_close_page = time.time()
+            start_time_close_page = time.perf_counter()
             page_to_close.close()
             # --- Medición de rendimiento: Fin del cierre de la pestaña ---
-            end_time_close_page = time.time()
+            end_time_close_page = time.perf_counter()
             duration_close_page = end_time_close_page - start_time_close_page
-            self.logger.info(f"PERFORMANCE: Tiempo de cierre de la pestaña '{closed_url}': {duration_close_page:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de cierre de la pestaña '%s': %.4f segundos.", closed_url, duration_close_page)
+            self.base.registrar_metrica("cerrar_pestana_especifica", duration_close_page, medicion="close_page")
             
-            self.logger.info(f"\n✅ Pestaña '{closed_url}' cerrada exitosamente.")
+            self.logger.info("\n✅ Pestaña '%s' cerrada exitosamente.", closed_url)
             # No se toma una captura después de cerrar la página porque ya no es accesible.
 
             # 3. Si la página cerrada era la página actual (self.page), cambiar el foco
             if is_current_page:
                 self.logger.info("\n  --> Detectado: La pestaña cerrada era la pestaña activa.")
                 # --- Medición de rendimiento: Inicio del cambio de foco ---
-                start_time_switch_focus = time.time()
+                start_time_switch_focus = time.perf_counter()
                 # Buscar la primera página disponible en el contexto
                 if self.page.context.pages:
                     self.page = self.page.context.pages[0]
                     # --- Medición de rendimiento: Fin del cambio de foco ---
-                    end_time_switch_focus = time.time()
+                    end_time_switch_focus = time.perf_counter()
                     duration_switch_focus = end_time_switch_focus - start_time_switch_focus
-                    self.logger.info(f"PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: {duration_switch_focus:.4f} segundos.")
+                    self.logger.info("PERFORMANCE: Tiempo de cambio de foco a la nueva pestaña activa: %.4f segundos.", duration_switch_focus)
+                    self.base.registrar_metrica("cerrar_pestana_especifica", duration_switch_focus, medicion="switch_focus")
 
-                    self.logger.info(f"\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = {self.page.url}")
+                    self.logger.info("\n🔄 Foco cambiado automáticamente a la primera pestaña disponible: URL = %s", self.page.url)
                     self.base.tomar_captura(f"{nombre_base}_foco_cambiado_despues_cerrar", directorio)
                 else:
                     self.logger.warning("\n⚠️ No hay más pestañas abiertas en el contexto del navegador. La instancia 'self.page' ahora es None.")
@@ -1268,9 +1338,10 @@ class NavigationActions:
                 self.logger.info("\n  --> La pestaña cerrada no era la pestaña activa. El foco actual permanece sin cambios.")
             
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (cierre de pestaña específica y gestión de foco): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (cierre de pestaña específica y gestión de foco): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("cerrar_pestana_especifica", duration_total_operation, medicion="total_operation")
 
         except Error as e: # Captura errores específicos de Playwright
             # Esto puede ocurrir si la página ya se cerró por alguna razón externa, o si hubo un problema con el contexto.
@@ -1283,7 +1354,7 @@ class NavigationActions:
                     self.logger.warning("\n  --> La página activa se ha cerrado. Intentando reasignar el foco.")
                     if self.page.context.pages:
                         self.page = self.page.context.pages[0]
-                        self.logger.info(f"\n  --> Foco reasignado a: {self.page.url}")
+                        self.logger.info("\n  --> Foco reasignado a: %s", self.page.url)
                     else:
                         self.page = None
                         self.logger.warning("\n  --> No hay más páginas en el contexto. self.page es None.")
@@ -1293,7 +1364,7 @@ class NavigationActions:
                     f"Detalles: {e}"
                 )
                 self.logger.critical(error_msg, exc_info=True)
-                self.base.tomar_captura(f"{nombre_base}_error_cerrar_pestana_playwright", directorio)
+                self.base.tomar_captura(f"{nombre_base}_error_cerrar_pestana_playwright", directorio, es_fallo=True)
                 raise AssertionError(error_msg) from e
         except Exception as e:
             error_msg = (
@@ -1301,5 +1372,5 @@ class NavigationActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_cerrar_pestana", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_cerrar_pestana", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
\ No newline at end of file
@@ -1,15 +1,141 @@
 import time
 import random
-from typing import Union, Optional, Dict, Any, List, Tuple
+import re
+from typing import TYPE_CHECKING, Union, Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+from src.utils.indice_tabla import IndiceTabla
+from src.utils.instantanea_tabla import InstantaneaTabla
+from src.utils.metricas import describir_locator
+from src.utils.paginacion import plantilla_url_paginas
+
+# verificacion_tablas y diferencia_tablas dependen de pandas y numpy: se importan en las funciones
+# que los usan, para no cargar pandas en los tests que no verifican ni comparan tablas.
+if TYPE_CHECKING:
+    from src.utils.diferencia_tablas import DiferenciaTablas
+    from src.utils.verificacion_tablas import ReporteVerificacion
+
 class TableActions:
+    # Script que extrae en una sola llamada `evaluate` todo lo que las verificaciones de tablas
+    # necesitan: encabezados, texto de cada celda (por columnas), estado de los checkboxes de cada
+    # celda, atributos de cada fila (<tr>) y el texto completo de cada fila. Se evalúa sobre el
+    # elemento <table> (o un contenedor de la tabla).
+    _SCRIPT_SNAPSHOT_TABLA = """
+    (tabla) => {
+        let encabezados = Array.from(tabla.querySelectorAll("thead th"));
+        if (encabezados.length === 0) {
+            encabezados = Array.from(tabla.querySelectorAll("th"));
+        }
+        const filas = Array.from(tabla.querySelectorAll("tbody tr"));
+        const celdasPorFila = filas.map((fila) => Array.from(fila.querySelectorAll("td")));
+        let numColumnas = encabezados.length;
+        for (const celdas of celdasPorFila) {
+            if (celdas.length > numColumnas) numColumnas = celdas.length;
+        }
+
+        const columnas = [];
+        const casillas = [];
+        for (let j = 0; j < numColumnas; j++) {
+            columnas.push(new Array(filas.length).fill(null));
+            casillas.push(new Array(filas.length).fill(null));
+        }
+        const atributos = [];
+        const textosFilas = [];
+
+        celdasPorFila.forEach((celdas, i) => {
+            celdas.forEach((celda, j) => {
+                columnas[j][i] = (celda.textContent || "").trim();
+                const checkbox = celda.querySelector("input[type='checkbox']");
+                if (checkbox) casillas[j][i] = checkbox.checked;
+            });
+            const fila = filas[i];
+            const atributosFila = {};
+            for (const atributo of fila.attributes) atributosFila[atributo.name] = atributo.value;
+            atributos.push(atributosFila);
+            textosFilas.push(fila.textContent || "");
+        });
+
+        return {
+            encabezados: encabezados.map((th) => (th.textContent || "").trim()),
+            columnas: columnas,
+            casillas: casillas,
+            atributos: atributos,
+            textos_filas: textosFilas,
+        };
+    }
+    """
+
+    # Instala (una sola vez por <tbody>) un MutationObserver que incrementa una versión cada vez que
+    # cambian las filas o el texto de la tabla, y devuelve '<id>:<versión>'. Si el <tbody> se
+    # reemplaza, el nuevo no tiene observador y el id cambia, por lo que el índice se reconstruye.
+    _SCRIPT_VERSION_TABLA = """
+    (tabla) => {
+        const cuerpo = tabla.querySelector("tbody") || tabla;
+        if (!cuerpo.__versionTabla) {
+            const estado = {id: Math.random().toString(36).slice(2), version: 0};
+            new MutationObserver(() => { estado.version += 1; })
+                .observe(cuerpo, {childList: true, subtree: true, characterData: true});
+            cuerpo.__versionTabla = estado;
+        }
+        return cuerpo.__versionTabla.id + ":" + cuerpo.__versionTabla.version;
+    }
+    """
+
+    # Lee las filas renderizadas de una tabla/grid virtualizado y desplaza su contenedor una
+    # "pantalla" hacia abajo, todo en una sola llamada. Antes de leer espera dos frames para que
+    # el grid termine de renderizar las filas del desplazamiento anterior. Cada fila se identifica
+    # por el atributo clave (por ejemplo, 'aria-rowindex') o, si no lo tiene, por su texto más su
+    # posición vertical dentro del contenido desplazable: la misma fila leída en dos pasadas tiene
+    # la misma clave, pero dos filas con el mismo texto no se confunden.
+    _SCRIPT_FILAS_RENDERIZADAS = """
+    async (contenedor, opciones) => {
+        await new Promise((resolver) => requestAnimationFrame(() => requestAnimationFrame(resolver)));
+        const texto = (el) => (el.textContent || "").trim();
+        const origen = contenedor.getBoundingClientRect().top - contenedor.scrollTop;
+        let clavesPorTexto = 0;
+        const filas = Array.from(contenedor.querySelectorAll(opciones.selectorFila)).map((fila) => {
+            const celdas = Array.from(fila.querySelectorAll(opciones.selectorCelda)).map(texto);
+            const atributo = opciones.atributoClave ? fila.getAttribute(opciones.atributoClave) : null;
+            const posicion = Math.round(fila.getBoundingClientRect().top - origen);
+            const orden = atributo !== null ? Number(atributo) : NaN;
+            if (atributo === null) clavesPorTexto += 1;
+            return {
+                clave: atributo !== null ? atributo : celdas.join("\u241f") + "\u241e" + posicion,
+                orden: Number.isFinite(orden) ? orden : posicion,
+                celdas: celdas,
+            };
+        });
+        // Los grids virtualizados no siempre mantienen el orden del DOM igual al visual.
+        filas.sort((a, b) => a.orden - b.orden);
+        const encabezados = opciones.leerEncabezados
+            ? Array.from(contenedor.querySelectorAll(opciones.selectorEncabezado)).map(texto)
+            : null;
+        const alFinal = contenedor.scrollTop + contenedor.clientHeight >= contenedor.scrollHeight - 1;
+        contenedor.scrollTop += Math.max(1, Math.floor(contenedor.clientHeight * opciones.pasoScroll));
+        return {filas: filas, encabezados: encabezados, al_final: alFinal, claves_por_texto: clavesPorTexto};
+    }
+    """
+
+    # Estado del checkbox de cada celda del <tbody>, indexado por [fila][columna] como
+    # `InstantaneaTabla.casillas` (el primer checkbox de la celda, o null si no tiene ninguno).
+    _SCRIPT_ESTADOS_CHECKBOX = """
+    (tabla) => Array.from(tabla.querySelectorAll("tbody tr"), (fila) =>
+        Array.from(fila.querySelectorAll("td"), (celda) => {
+            const checkbox = celda.querySelector("input[type='checkbox']");
+            return checkbox ? checkbox.checked : null;
+        }))
+    """
+
     def __init__(self, base_page):
         self.base = base_page
         self.page: Page = base_page.page
         self.logger = base_page.logger
+        # Índices de búsqueda por tabla: {selector: (versión del <tbody>, IndiceTabla)}.
+        self._indices: Dict[str, Tuple[str, IndiceTabla]] = {}
         
     # 27- Función para contar filas y columnas de una tabla con pruebas de rendimiento
+    @medir_accion
     def obtener_dimensiones_tabla(self, selector: Locator, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> Tuple[int, int]:
         """
         Obtiene las dimensiones (número de filas y columnas) de una tabla HTML
@@ -51,21 +177,21 @@ class TableActions:
             except Exception:
                 selector_info = f"Tabla con selector genérico: {selector}" # Fallback si evaluate falla
 
-        self.logger.info(f"\nObteniendo dimensiones de la tabla con selector: '{selector_info}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nObteniendo dimensiones de la tabla con selector: '%s'. Tiempo máximo de espera: %ss.", selector_info, tiempo)
 
         # --- Medición de rendimiento: Inicio de la operación de obtener dimensiones ---
         # Registra el tiempo justo antes de iniciar la interacción para obtener las dimensiones.
-        start_time_get_dimensions = time.time()
+        start_time_get_dimensions = time.perf_counter()
 
         try:
             # 1. Asegurar que la tabla principal esté visible
             # Es crucial que la tabla esté cargada y visible para poder contar sus elementos.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{selector_info}' esté visible (timeout: {tiempo}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", selector_info, tiempo)
             expect(selector).to_be_visible()
             
             # Resaltar el elemento de la tabla para depuración visual.
-            selector.highlight()
-            self.logger.debug(f"\nTabla con selector '{selector_info}' resaltada.")
+            self.base.resaltar_elemento(selector)
+            self.logger.debug("\nTabla con selector '%s' resaltada.", selector_info)
             self.base.tomar_captura(f"{nombre_base}_antes_obtener_dimensiones", directorio) # Captura antes de contar.
 
             # 2. Contar el número de filas de datos
@@ -73,7 +199,7 @@ class TableActions:
             # excluyendo potencialmente encabezados o pies de tabla.
             filas_datos = selector.locator("tbody tr")
             num_filas = filas_datos.count()
-            self.logger.debug(f"\nFilas de datos encontradas (tbody tr): {num_filas}.")
+            self.logger.debug("\nFilas de datos encontradas (tbody tr): %s.", num_filas)
 
             # 3. Contar el número de columnas
             num_columnas = 0
@@ -81,14 +207,14 @@ class TableActions:
             headers = selector.locator("th")
             if headers.count() > 0:
                 num_columnas = headers.count()
-                self.logger.debug(f"\nColumnas contadas desde encabezados (th): {num_columnas}.")
+                self.logger.debug("\nColumnas contadas desde encabezados (th): %s.", num_columnas)
             else:
                 # Si no hay thead/th, intentar contar td's de la primera fila de datos.
                 # Esto es útil para tablas que no usan thead o que son simples.
                 first_row_tds = selector.locator("tr").first.locator("td")
                 if first_row_tds.count() > 0:
                     num_columnas = first_row_tds.count()
-                    self.logger.debug(f"\nColumnas contadas desde celdas de la primera fila (td): {num_columnas}.")
+                    self.logger.debug("\nColumnas contadas desde celdas de la primera fila (td): %s.", num_columnas)
                 else:
                     self.logger.warning(f"\nADVERTENCIA: No se pudieron encontrar encabezados (th) ni celdas (td) en la primera fila "
                                         f"para la tabla con selector '{selector_info}'. Asumiendo 0 columnas.")
@@ -96,19 +222,20 @@ class TableActions:
 
             # --- Medición de rendimiento: Fin de la operación de obtener dimensiones ---
             # Registra el tiempo una vez que se han contado las filas y columnas.
-            end_time_get_dimensions = time.time()
+            end_time_get_dimensions = time.perf_counter()
             duration_get_dimensions = end_time_get_dimensions - start_time_get_dimensions
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó en obtener las dimensiones de la tabla '{selector_info}': {duration_get_dimensions:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó en obtener las dimensiones de la tabla '%s': %.4f segundos.", selector_info, duration_get_dimensions)
+            self.base.registrar_metrica("obtener_dimensiones_tabla", duration_get_dimensions, medicion="get_dimensions", locator=selector)
 
             self.base.tomar_captura(f"{nombre_base}_dimensiones_obtenidas", directorio)
-            self.logger.info(f"\n✅ ÉXITO: Dimensiones de la tabla '{selector_info}' obtenidas.")
-            self.logger.info(f"--> Filas encontradas: {num_filas}")
-            self.logger.info(f"--> Columnas encontradas: {num_columnas}")
+            self.logger.info("\n✅ ÉXITO: Dimensiones de la tabla '%s' obtenidas.", selector_info)
+            self.logger.info("--> Filas encontradas: %s", num_filas)
+            self.logger.info("--> Columnas encontradas: %s", num_columnas)
             return (num_filas, num_columnas)
 
         except TimeoutError as e:
             # Captura si la tabla principal o sus elementos internos no se hacen visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_get_dimensions # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo obtener las dimensiones de la tabla con selector '{selector_info}' "
@@ -117,7 +244,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve un valor indicativo de fallo.
-            self.base.tomar_captura(f"{nombre_base}_dimensiones_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dimensiones_timeout", directorio, es_fallo=True)
             return (-1, -1) # Retorna valores indicativos de fallo.
 
         except Error as e:
@@ -128,7 +255,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_dimensiones_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dimensiones_error_playwright", directorio, es_fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright, no un fallo de aserción.
 
         except Exception as e:
@@ -138,10 +265,11 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.base.tomar_captura(f"{nombre_base}_dimensiones_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_dimensiones_error_inesperado", directorio, es_fallo=True)
             raise # Relanzar por ser un error inesperado.
         
     # 28- Función para buscar datos parcial e imprimir la fila con pruebas de rendimiento
+    @medir_accion
     def busqueda_coincidencia_e_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Busca una **coincidencia parcial de texto** dentro de las filas de una tabla
@@ -172,61 +300,58 @@ class TableActions:
                    de la tabla (ej., el selector no apunta a una tabla válida).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIniciando búsqueda de coincidencia parcial para '{texto_buscado}' en la tabla con selector: '{table_selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIniciando búsqueda de coincidencia parcial para '%s' en la tabla con selector: '%s'. Tiempo máximo de espera: %ss.", texto_buscado, table_selector, tiempo)
         encontrado = False
 
         # --- Medición de rendimiento: Inicio de la búsqueda en la tabla ---
         # Registra el tiempo justo antes de iniciar la interacción con la tabla para la búsqueda.
-        start_time_table_search = time.time()
+        start_time_table_search = time.perf_counter()
 
         try:
             # 1. Esperar a que la tabla esté visible
             # Esto es fundamental antes de intentar iterar sobre sus filas.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{table_selector}' esté visible (timeout: {tiempo}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", table_selector, tiempo)
             expect(table_selector).to_be_visible()
-            self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
+            self.logger.info("\nTabla con selector '%s' está visible.", table_selector)
             
             # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
+            self.base.resaltar_elemento(table_selector)
             self.base.tomar_captura(f"{nombre_base}_antes_busqueda_coincidencia", directorio) # Captura antes de buscar.
 
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `<tbody>` para enfocar la búsqueda en los datos.
+            # 2. Obtener el índice de la tabla: se construye con una sola instantánea y se reutiliza
+            # en búsquedas posteriores mientras el <tbody> no cambie.
             filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila para buscar la coincidencia
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                fila_texto = fila.text_content() # Obtiene todo el texto visible de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1}: '{fila_texto}'.")
-
-                # Realizar la búsqueda de coincidencia parcial sin distinguir mayúsculas/minúsculas.
-                if texto_buscado.lower() in fila_texto.lower():
-                    self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
-                    self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
-                    fila.highlight() # Resalta la fila donde se encontró la coincidencia.
-                    self.base.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
-                    encontrado = True
-                    # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'
-                    # break 
+            indice = self._obtener_indice(table_selector)
+            self.logger.debug("\nNúmero de filas de datos encontradas en la tabla: %s.", indice.instantanea.num_filas)
+
+            # 3. Buscar la coincidencia parcial (sin distinguir mayúsculas/minúsculas) en el índice de subcadenas
+            for i in indice.buscar_parcial(texto_buscado):
+                fila_texto = indice.instantanea.textos_filas[i]
+                self.logger.info("\n✅ ÉXITO: Texto '%s' encontrado (coincidencia parcial) en la fila %s.", texto_buscado, i+1)
+                self.logger.info("Contenido completo de la fila: '%s'", fila_texto)
+                fila = filas.nth(i) # Locator de la fila solo para resaltarla y capturarla.
+                self.base.resaltar_elemento(fila) # Resalta la fila donde se encontró la coincidencia.
+                self.base.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
+                encontrado = True
+                # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'
+                # break 
             
             if not encontrado:
-                self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia parcial) NO encontrado en ninguna fila de la tabla.")
+                self.logger.info("\nℹ️ Texto '%s' (coincidencia parcial) NO encontrado en ninguna fila de la tabla.", texto_buscado)
                 self.base.tomar_captura(f"{nombre_base}_coincidencia_parcial_no_encontrada", directorio)
 
             # --- Medición de rendimiento: Fin de la búsqueda en la tabla ---
             # Registra el tiempo una vez que se ha completado la iteración sobre todas las filas (o hasta la primera coincidencia si se usa break).
-            end_time_table_search = time.time()
+            end_time_table_search = time.perf_counter()
             duration_table_search = end_time_table_search - start_time_table_search
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó la búsqueda de '{texto_buscado}' en la tabla '{table_selector}': {duration_table_search:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó la búsqueda de '%s' en la tabla '%s': %.4f segundos.", texto_buscado, table_selector, duration_table_search)
+            self.base.registrar_metrica("busqueda_coincidencia_e_imprimir_fila", duration_table_search, medicion="table_search", locator=table_selector)
 
             return encontrado
 
         except TimeoutError as e:
             # Captura si la tabla principal o sus filas no se hacen visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_table_search # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla con selector '{table_selector}' "
@@ -235,7 +360,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_timeout", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -247,7 +372,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_playwright", directorio, es_fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright.
 
         except Exception as e:
@@ -258,10 +383,11 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_inesperado", directorio, es_fallo=True)
             raise # Relanzar por ser un error inesperado.
         
     # 29- Función para buscar datos exacto e imprimir la fila con pruebas de rendimiento
+    @medir_accion
     def busqueda_estricta_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
         """
         Busca una **coincidencia exacta de texto** dentro de las celdas de una tabla
@@ -294,73 +420,62 @@ class TableActions:
                    de la tabla (ej., el selector no apunta a una tabla válida).
             Exception: Para cualquier otro error inesperado.
         """
-        self.logger.info(f"\nIniciando búsqueda estricta para '{texto_buscado}' en la tabla con selector: '{table_selector}'. Tiempo máximo de espera: {tiempo}s.")
+        self.logger.info("\nIniciando búsqueda estricta para '%s' en la tabla con selector: '%s'. Tiempo máximo de espera: %ss.", texto_buscado, table_selector, tiempo)
         encontrado = False
 
         # --- Medición de rendimiento: Inicio de la búsqueda estricta en la tabla ---
         # Registra el tiempo justo antes de iniciar la interacción con la tabla para la búsqueda.
-        start_time_strict_search = time.time()
+        start_time_strict_search = time.perf_counter()
 
         try:
             # 1. Esperar a que la tabla esté visible
             # Esto es fundamental antes de intentar iterar sobre sus filas y celdas.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{table_selector}' esté visible (timeout: {tiempo}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", table_selector, tiempo)
             expect(table_selector).to_be_visible()
-            self.logger.info(f"\nTabla con selector '{table_selector}' está visible.")
+            self.logger.info("\nTabla con selector '%s' está visible.", table_selector)
             
             # Resaltar la tabla completa para depuración visual.
-            table_selector.highlight()
+            self.base.resaltar_elemento(table_selector)
             self.base.tomar_captura(f"{nombre_base}_antes_busqueda_estricta", directorio) # Captura antes de buscar.
 
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `tbody` para enfocar la búsqueda en los datos.
+            # 2. Obtener el índice de la tabla: se construye con una sola instantánea y se reutiliza
+            # en búsquedas posteriores mientras el <tbody> no cambie.
             filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila y cada celda para buscar la coincidencia exacta
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                celdas = fila.locator("td") # Asumiendo celdas de datos son 'td'.
-                num_celdas = celdas.count()
-                fila_texto_completo = "" # Para reconstruir y loggear el contenido completo de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1} para búsqueda estricta.")
-
-                for j in range(num_celdas):
-                    celda = celdas.nth(j) # Obtiene el Locator para la celda actual.
-                    celda_texto = celda.text_content().strip() # Obtiene el texto de la celda y elimina espacios en blanco alrededor.
-                    fila_texto_completo += celda_texto + " | " # Concatenar para imprimir la fila completa en el log.
-
-                    # Realizar la búsqueda de coincidencia estricta.
-                    if celda_texto == texto_buscado: # Coincidencia estricta
-                        self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
-                        self.logger.info(f"Contenido completo de la fila: '{fila_texto_completo.strip(' | ')}'")
-                        celda.highlight() # Resaltar la celda donde se encontró la coincidencia.
-                        fila.highlight() # También resaltar la fila para mejor visibilidad.
-                        self.base.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
-                        encontrado = True
-                        # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar ambos 'break'.
-                        # break # Rompe el bucle de celdas.
-                
-                if encontrado:
-                    # break # Rompe el bucle de filas si se encontró una coincidencia y se desea parar.
-                    pass # Si se desea seguir buscando en otras filas, manteniendo el 'encontrado' en True.
+            indice = self._obtener_indice(table_selector)
+            self.logger.debug("\nNúmero de filas de datos encontradas en la tabla: %s.", indice.instantanea.num_filas)
+
+            # 3. Buscar la coincidencia exacta en el índice de valores de celda (sin recorrer las filas)
+            for i, j in indice.buscar_exacto(texto_buscado):
+                # Celdas existentes de la fila (ya sin espacios alrededor), para loggear la fila completa.
+                fila_texto_completo = " | ".join(texto for texto in indice.instantanea.valores_fila(i) if texto is not None)
+                self.logger.info("\n✅ ÉXITO: Texto '%s' encontrado (coincidencia estricta) en la celda %s de la fila %s.", texto_buscado, j+1, i+1)
+                self.logger.info("Contenido completo de la fila: '%s'", fila_texto_completo)
+                # Locators de la fila y la celda solo para resaltarlas y capturarlas.
+                fila = filas.nth(i)
+                celda = fila.locator("td").nth(j)
+                self.base.resaltar_elemento(celda) # Resaltar la celda donde se encontró la coincidencia.
+                self.base.resaltar_elemento(fila) # También resaltar la fila para mejor visibilidad.
+                self.base.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
+                encontrado = True
+                # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'.
+                # break
 
             if not encontrado:
-                self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia estricta) NO encontrado en ninguna celda de la tabla.")
+                self.logger.info("\nℹ️ Texto '%s' (coincidencia estricta) NO encontrado en ninguna celda de la tabla.", texto_buscado)
                 self.base.tomar_captura(f"{nombre_base}_coincidencia_estricta_no_encontrada", directorio)
 
             # --- Medición de rendimiento: Fin de la búsqueda estricta en la tabla ---
             # Registra el tiempo una vez que se ha completado la iteración sobre todas las celdas/filas.
-            end_time_strict_search = time.time()
+            end_time_strict_search = time.perf_counter()
             duration_strict_search = end_time_strict_search - start_time_strict_search
-            self.logger.info(f"PERFORMANCE: Tiempo que tardó la búsqueda estricta de '{texto_buscado}' en la tabla '{table_selector}': {duration_strict_search:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo que tardó la búsqueda estricta de '%s' en la tabla '%s': %.4f segundos.", texto_buscado, table_selector, duration_strict_search)
+            self.base.registrar_metrica("busqueda_estricta_imprimir_fila", duration_strict_search, medicion="strict_search", locator=table_selector)
 
             return encontrado
 
         except TimeoutError as e:
             # Captura si la tabla principal o sus elementos internos (filas/celdas) no se hacen visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_strict_search # Mide desde el inicio de la operación.
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla con selector '{table_selector}' "
@@ -369,7 +484,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_timeout", directorio, es_fallo=True)
             return False
 
         except Error as e:
@@ -381,7 +496,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_error_playwright", directorio, es_fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright.
 
         except Exception as e:
@@ -392,10 +507,11 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_busqueda_estricta_error_inesperado", directorio, es_fallo=True)
             raise # Relanzar por ser un error inesperado.
         
     # 30- Función para validar que todos los valores en una columna específica de una tabla sean numéricos, con pruebas de rendimiento
+    @medir_accion
     def verificar_precios_son_numeros(self, tabla_selector: Locator, columna_nombre: str, nombre_base: str, directorio: str, tiempo_espera_celda: Union[int, float] = 0.5, tiempo_general_timeout: Union[int, float] = 15.0) -> bool:
         """
         Verifica que todos los valores en una **columna específica** de una tabla HTML
@@ -413,9 +529,9 @@ class TableActions:
             nombre_base (str): Nombre base utilizado para las **capturas de pantalla**
                                tomadas durante la ejecución de la función.
             directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
-            tiempo_espera_celda (Union[int, float]): **Tiempo máximo de espera** (en segundos)
-                                                     para que una celda de precio individual
-                                                     sea visible. Por defecto, `5.0` segundos.
+            tiempo_espera_celda (Union[int, float]): Se conserva por compatibilidad: las celdas ya no
+                                                     se esperan una a una, se leen de una sola
+                                                     instantánea de la tabla (`snapshot`).
             tiempo_general_timeout (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                         para que la tabla y su `<tbody>` estén
                                                         visibles y listos para la interacción.
@@ -429,29 +545,29 @@ class TableActions:
             AssertionError: Si la tabla o sus elementos clave no están disponibles a tiempo,
                             o si ocurre un error inesperado de Playwright o genérico.
         """
-        self.logger.info(f"\n⚙️ Verificando que todos los precios en la columna '{columna_nombre}' de la tabla '{tabla_selector}' son números.")
+        self.logger.info("\n⚙️ Verificando que todos los precios en la columna '%s' de la tabla '%s' son números.", columna_nombre, tabla_selector)
 
         # --- Medición de rendimiento: Inicio de la validación de la tabla ---
         # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_validation = time.time()
+        start_time_validation = time.perf_counter()
 
         try:
             # 1. Asegurar que la tabla principal esté visible
             # Es el primer paso para garantizar que la tabla se ha cargado en el DOM.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_general_timeout}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_general_timeout)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
-            self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
+            self.base.resaltar_elemento(tabla_selector)
+            self.logger.debug("\nTabla resaltada para verificación: %s", tabla_selector)
 
             # 2. Esperar a que el tbody exista y tenga contenido
             # Es crucial esperar por la sección de cuerpo de la tabla y al menos una fila,
             # ya que a menudo se cargan de forma asíncrona.
             tbody_locator = tabla_selector.locator("tbody")
-            self.logger.debug(f"\nEsperando que el tbody de la tabla sea visible (timeout: {tiempo_general_timeout}s).")
+            self.logger.debug("\nEsperando que el tbody de la tabla sea visible (timeout: %ss).", tiempo_general_timeout)
             expect(tbody_locator).to_be_visible()
             self.logger.info("\n✅ El tbody de la tabla es visible.")
             
-            self.logger.debug(f"\nEsperando que al menos la primera fila de datos sea visible (timeout: {tiempo_general_timeout}s).")
+            self.logger.debug("\nEsperando que al menos la primera fila de datos sea visible (timeout: %ss).", tiempo_general_timeout)
             expect(tbody_locator.locator("tr").first).to_be_visible()
             self.logger.info("\n✅ Al menos la primera fila de datos en la tabla es visible.")
             self.base.tomar_captura(f"{nombre_base}_tabla_visible_para_verificacion", directorio) # Captura el estado inicial.
@@ -459,69 +575,52 @@ class TableActions:
             # 3. Encontrar el índice de la columna por su nombre
             # Primero, asegurar que los encabezados existan y sean visibles.
             headers = tabla_selector.locator("th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_general_timeout}s).")
+            self.logger.debug("\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: %ss).", tiempo_general_timeout)
             expect(headers.first).to_be_visible()
 
-            col_index = -1
-            header_texts = []
-            for i in range(headers.count()):
-                header_text = headers.nth(i).text_content().strip()
-                header_texts.append(header_text)
-                if header_text == columna_nombre:
-                    col_index = i
-            
-            self.logger.info(f"\n🔍 Cabeceras encontradas: {header_texts}")
+            # Encabezados y celdas se leen con una sola instantánea de la tabla.
+            instantanea = self._extraer_instantanea(tabla_selector)
+            header_texts = instantanea.encabezados
+            col_index = instantanea.indice_columna(columna_nombre)
+
+            self.logger.info("\n🔍 Cabeceras encontradas: %s", header_texts)
 
             if col_index == -1:
                 self.logger.error(f"\n❌ Error: No se encontró la columna '{columna_nombre}' en la tabla. Cabeceras disponibles: {header_texts}")
-                self.base.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio)
+                self.base.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio, es_fallo=True)
                 # No lanzamos una excepción aquí, ya que el retorno False es suficiente para indicar el fallo lógico.
                 return False
 
-            self.logger.info(f"\n🔍 Columna '{columna_nombre}' encontrada en el índice: {col_index}")
+            self.logger.info("\n🔍 Columna '%s' encontrada en el índice: %s", columna_nombre, col_index)
 
             # 4. Obtener todas las filas de la tabla (solo las de datos dentro de tbody)
             rows = tbody_locator.locator("tr")
-            num_rows = rows.count()
+            num_rows = instantanea.num_filas
             if num_rows == 0:
                 self.logger.warning("\n⚠️ Advertencia: La tabla no contiene filas de datos para verificar.")
                 self.base.tomar_captura(f"{nombre_base}_tabla_vacia_no_precios", directorio)
                 return True # Considera esto un éxito si no hay datos que validar.
 
-            self.logger.info(f"\n🔍 Se encontraron {num_rows} filas de datos para verificar precios.")
-
-            all_prices_are_numbers = True
-            for i in range(num_rows):
-                row_locator = rows.nth(i)
-                # Se busca la celda correspondiente al índice de la columna dentro de la fila actual.
-                price_cell = row_locator.locator(f"td").nth(col_index)
-                
-                # Es crucial esperar a que la celda de precio sea visible si las filas se renderizan dinámicamente
-                # o el contenido de las celdas aparece con un retardo.
-                self.logger.debug(f"\n Esperando que la celda de precio en la fila {i+1} esté visible (timeout: {tiempo_espera_celda}s).")
-                expect(price_cell).to_be_visible() # Convertir a milisegundos
-                
-                price_text = price_cell.text_content().strip() # Obtener texto y limpiar espacios.
-                price_cell.highlight() # Resaltar la celda actual para depuración visual.
-
-                self.logger.debug(f"\n Procesando fila {i+1}, texto de precio: '{price_text}'")
+            self.logger.info("\n🔍 Se encontraron %s filas de datos para verificar precios.", num_rows)
 
-                try:
-                    float(price_text) # Intentar convertir el texto a un número flotante.
-                    self.logger.debug(f"\n ✅ '{price_text}' es un número válido.")
-                except ValueError:
-                    self.logger.error(f"\n ❌ Error: El valor '{price_text}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
-                    self.base.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio)
-                    all_prices_are_numbers = False
-                    # Continuamos el bucle para reportar todos los valores no numéricos, no solo el primero.
+            # Verificación vectorizada de toda la columna; solo se recorren las celdas inválidas.
+            from src.utils.verificacion_tablas import VerificadorTabla
+            reporte = VerificadorTabla(instantanea).numerica(col_index).reporte
+            for discrepancia in reporte.discrepancias:
+                i = discrepancia["fila"] - 1
+                self.logger.error(f"\n ❌ Error: El valor '{discrepancia['valor']}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
+                self.base.resaltar_elemento(rows.nth(i).locator("td").nth(col_index)) # Resaltar la celda inválida para depuración visual.
+                self.base.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio, es_fallo=True)
+            all_prices_are_numbers = reporte.ok
 
             # --- Medición de rendimiento: Fin de la validación ---
-            end_time_validation = time.time()
+            end_time_validation = time.perf_counter()
             duration_validation = end_time_validation - start_time_validation
-            self.logger.info(f"PERFORMANCE: Tiempo total de validación de precios en la columna '{columna_nombre}': {duration_validation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de validación de precios en la columna '%s': %.4f segundos.", columna_nombre, duration_validation)
+            self.base.registrar_metrica("verificar_precios_son_numeros", duration_validation, medicion="validation", locator=tabla_selector)
 
             if all_prices_are_numbers:
-                self.logger.info(f"\n✅ Todos los precios en la columna '{columna_nombre}' son números válidos.")
+                self.logger.info("\n✅ Todos los precios en la columna '%s' son números válidos.", columna_nombre)
                 self.base.tomar_captura(f"{nombre_base}_precios_ok", directorio)
                 return True
             else:
@@ -529,7 +628,7 @@ class TableActions:
                 return False
 
         except TimeoutError as e:
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_validation
             error_msg = (
                 f"\n❌ FALLO (Timeout): La tabla o sus elementos (tbody, filas, celdas) no se volvieron visibles a tiempo "
@@ -537,7 +636,7 @@ class TableActions:
                 f"Error: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_timeout_verificacion_precios", directorio)
+            self.base.tomar_captura(f"{nombre_base}_timeout_verificacion_precios", directorio, es_fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de la tabla no disponibles a tiempo para verificación de precios: {tabla_selector}") from e
         
@@ -548,7 +647,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico porque un error de Playwright es un problema fundamental.
-            self.base.tomar_captura(f"{nombre_base}_playwright_error_verificacion_precios", directorio)
+            self.base.tomar_captura(f"{nombre_base}_playwright_error_verificacion_precios", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar precios en la tabla: {tabla_selector}") from e
         
         except Exception as e:
@@ -558,10 +657,11 @@ class TableActions:
                 f"Error: {type(e).__name__}: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_excepcion_inesperada", directorio)
+            self.base.tomar_captura(f"{nombre_base}_excepcion_inesperada", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar precios en la tabla: {tabla_selector}") from e
                 
     # 32- Función para verificar que los encabezados de las columnas de una tabla sean correctos y estén presentes, con pruebas de rendimiento
+    @medir_accion
     def verificar_encabezados_tabla(self, tabla_selector: Locator, encabezados_esperados: List[str], nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0) -> bool:
         """
         Verifica que los encabezados (<th>) de las columnas de una tabla HTML
@@ -594,35 +694,35 @@ class TableActions:
                             a tiempo, o si ocurre un error inesperado de Playwright o genérico
                             que impida la verificación.
         """
-        self.logger.info(f"\n⚙️ Verificando encabezados de la tabla con selector '{tabla_selector}'...")
-        self.logger.info(f"\nEncabezados esperados: {encabezados_esperados}. Tiempo máximo de espera: {tiempo_espera_tabla}s.")
+        self.logger.info("\n⚙️ Verificando encabezados de la tabla con selector '%s'...", tabla_selector)
+        self.logger.info("\nEncabezados esperados: %s. Tiempo máximo de espera: %ss.", encabezados_esperados, tiempo_espera_tabla)
         
         # --- Medición de rendimiento: Inicio de la verificación de encabezados ---
         # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_header_verification = time.time()
+        start_time_header_verification = time.perf_counter()
 
         try:
             # 1. Verificar la presencia y visibilidad de la tabla misma
             # Esto es crucial para asegurar que la tabla se ha cargado en el DOM.
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
-            self.logger.debug(f"\nTabla resaltada para verificación: {tabla_selector}")
+            self.base.resaltar_elemento(tabla_selector)
+            self.logger.debug("\nTabla resaltada para verificación: %s", tabla_selector)
 
             # 2. Verificar la presencia y visibilidad del elemento thead (cabecera de la tabla)
             thead_locator = tabla_selector.locator("thead")
-            self.logger.debug(f"\nEsperando que el thead de la tabla con selector '{tabla_selector} thead' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que el thead de la tabla con selector '%s thead' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             expect(thead_locator).to_be_visible()
             self.logger.info("\n✅ El elemento '<thead>' de la tabla es visible.")
             
             # 3. Obtener los locators de los encabezados (<th>) dentro del thead
             encabezados_actuales_locators = thead_locator.locator("th")
-            self.logger.debug(f"\nEsperando que al menos un '<th>' dentro del '<thead>' sea visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que al menos un '<th>' dentro del '<thead>' sea visible (timeout: %ss).", tiempo_espera_tabla)
             expect(encabezados_actuales_locators.first).to_be_visible()
             
             # Resaltar todos los encabezados encontrados para depuración visual.
             for i in range(encabezados_actuales_locators.count()):
-                encabezados_actuales_locators.nth(i).highlight()
+                self.base.resaltar_elemento(encabezados_actuales_locators.nth(i))
             self.base.tomar_captura(f"{nombre_base}_encabezados_encontrados_y_resaltados", directorio)
 
             num_encabezados_actuales = encabezados_actuales_locators.count()
@@ -634,7 +734,7 @@ class TableActions:
                 self.logger.error(f"\n❌ --> FALLO: El número de encabezados '<th>' encontrados ({num_encabezados_actuales}) "
                                   f"no coincide con el número de encabezados esperados ({num_encabezados_esperados}).\n"
                                   f"Actuales: {actual_texts}\nEsperados: {encabezados_esperados}")
-                self.base.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio)
+                self.base.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio, es_fallo=True)
                 return False
 
             # 5. Iterar y comparar el texto de cada encabezado
@@ -646,19 +746,20 @@ class TableActions:
                 encabezado_esperado = encabezados_esperados[i]
 
                 if texto_encabezado_actual == encabezado_esperado:
-                    self.logger.info(f"\n ✅ Encabezado {i+1}: '{texto_encabezado_actual}' coincide con el esperado '{encabezado_esperado}'.")
+                    self.logger.info("\n ✅ Encabezado %s: '%s' coincide con el esperado '%s'.", i+1, texto_encabezado_actual, encabezado_esperado)
                     # encabezado_locator.highlight() # Opcional: resaltar el encabezado individual si es necesario para cada uno.
                 else:
                     self.logger.error(f"\n ❌ FALLO: Encabezado {i+1} esperado era '{encabezado_esperado}', pero se encontró '{texto_encabezado_actual}'.")
-                    encabezado_locator.highlight() # Resaltar el encabezado incorrecto.
-                    self.base.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio)
+                    self.base.resaltar_elemento(encabezado_locator) # Resaltar el encabezado incorrecto.
+                    self.base.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio, es_fallo=True)
                     todos_correctos = False
                     # No es necesario un time.sleep() aquí si solo queremos el log y la captura.
 
             # --- Medición de rendimiento: Fin de la verificación de encabezados ---
-            end_time_header_verification = time.time()
+            end_time_header_verification = time.perf_counter()
             duration_header_verification = end_time_header_verification - start_time_header_verification
-            self.logger.info(f"PERFORMANCE: Tiempo total de verificación de encabezados de tabla '{tabla_selector}': {duration_header_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de verificación de encabezados de tabla '%s': %.4f segundos.", tabla_selector, duration_header_verification)
+            self.base.registrar_metrica("verificar_encabezados_tabla", duration_header_verification, medicion="header_verification", locator=tabla_selector)
 
             if todos_correctos:
                 self.logger.info("\n✅ ÉXITO: Todos los encabezados de columna son correctos y están en el orden esperado.")
@@ -666,12 +767,12 @@ class TableActions:
                 return True
             else:
                 self.logger.error("\n❌ FALLO: Uno o más encabezados de columna son incorrectos o no están en el orden esperado.")
-                self.base.tomar_captura(f"{nombre_base}_encabezados_verificados_fallo", directorio)
+                self.base.tomar_captura(f"{nombre_base}_encabezados_verificados_fallo", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
             # Captura si la tabla, el thead o los th no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_header_verification
             error_msg = (
                 f"\n❌ FALLO (Timeout): La tabla o sus encabezados con el selector '{tabla_selector}' no se volvieron visibles a tiempo "
@@ -680,7 +781,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_timeout", directorio, es_fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de encabezado de tabla no disponibles a tiempo: {tabla_selector}") from e
 
@@ -692,7 +793,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
 
         except Exception as e:
@@ -702,10 +803,11 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_encabezados_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
         
     # 33- Función para verificar los datos de las filas de una tabla, con pruebas de rendimiento integradas.
+    @medir_accion
     def verificar_datos_filas_tabla(self, tabla_selector: Locator, datos_filas_esperados: List[Dict[str, Union[str, bool, int, float]]], nombre_base: str, directorio: str, tiempo_espera_general: Union[int, float] = 0.5) -> bool:
         """
         Verifica que los datos de las filas de una tabla HTML coincidan con los datos esperados.
@@ -739,45 +841,48 @@ class TableActions:
                             disponibles a tiempo, o si ocurre un error inesperado de Playwright
                             o genérico que impida la verificación.
         """
-        self.logger.info(f"\n--- Iniciando verificación de datos de las filas de la tabla con locator '{tabla_selector}' ---")
-        self.logger.info(f"\nNúmero de filas esperadas: {len(datos_filas_esperados)}")
+        self.logger.info("\n--- Iniciando verificación de datos de las filas de la tabla con locator '%s' ---", tabla_selector)
+        self.logger.info("\nNúmero de filas esperadas: %s", len(datos_filas_esperados))
         self.base.tomar_captura(f"{nombre_base}_inicio_verificacion_datos_filas", directorio)
 
         # --- Medición de rendimiento: Inicio de la verificación de datos de filas ---
         # Registra el tiempo justo antes de iniciar cualquier interacción con la tabla.
-        start_time_row_data_verification = time.time()
+        start_time_row_data_verification = time.perf_counter()
 
         try:
             # 1. Asegurarse de que la tabla esté visible y disponible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_general}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_general)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a verificar los datos.")
 
             # 2. Obtener los encabezados para mapear los índices de las columnas
             header_locators = tabla_selector.locator("thead th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_espera_general}s).")
+            self.logger.debug("\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: %ss).", tiempo_espera_general)
             expect(header_locators.first).to_be_visible()
-            headers = [h.text_content().strip() for h in header_locators.all()]
+
+            # Encabezados, texto de las celdas y estado de los checkboxes se leen con una sola instantánea.
+            instantanea = self._extraer_instantanea(tabla_selector)
+            headers = instantanea.encabezados
             
             if not headers:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron encabezados en la tabla con locator '{tabla_selector}'. No se pueden verificar los datos de las filas.")
-                self.base.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio, es_fallo=True)
                 return False
-            self.logger.info(f"\n🔍 Encabezados de la tabla encontrados: {headers}")
+            self.logger.info("\n🔍 Encabezados de la tabla encontrados: %s", headers)
 
             # 3. Obtener todas las filas del cuerpo de la tabla (excluyendo thead)
             tbody_locator = tabla_selector.locator("tbody")
-            self.logger.debug(f"\nEsperando que el tbody de la tabla sea visible (timeout: {tiempo_espera_general}s).")
+            self.logger.debug("\nEsperando que el tbody de la tabla sea visible (timeout: %ss).", tiempo_espera_general)
             expect(tbody_locator).to_be_visible()
 
             row_locators = tbody_locator.locator("tr")
             # Esperar a que al menos la primera fila de datos sea visible si se esperan filas.
             if len(datos_filas_esperados) > 0:
-                self.logger.debug(f"\nEsperando que al menos la primera fila de datos sea visible (timeout: {tiempo_espera_general}s).")
+                self.logger.debug("\nEsperando que al menos la primera fila de datos sea visible (timeout: %ss).", tiempo_espera_general)
                 expect(row_locators.first).to_be_visible()
 
-            num_filas_actuales = row_locators.count()
+            num_filas_actuales = instantanea.num_filas
             num_filas_esperadas = len(datos_filas_esperados)
 
             # 4. Comparar el número total de filas
@@ -790,100 +895,36 @@ class TableActions:
             if num_filas_actuales != num_filas_esperadas:
                 self.logger.error(f"\n❌ --> FALLO: El número de filas encontradas ({num_filas_actuales}) "
                                   f"no coincide con el número de filas esperadas ({num_filas_esperadas}).")
-                self.base.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio)
+                self.base.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio, es_fallo=True)
                 return False
-            self.logger.info(f"\n🔍 Número de filas actual y esperado coinciden: {num_filas_actuales} filas.")
-
-            # --- Variable principal para el retorno ---
-            todos_los_datos_correctos = True 
-
-            # 5. Iterar sobre cada fila esperada y verificar sus datos
-            for i in range(num_filas_esperadas):
-                fila_actual_locator = row_locators.nth(i)
-                datos_fila_esperada = datos_filas_esperados[i]
-                self.logger.info(f"\n  Verificando Fila {i+1} (Datos esperados: {datos_fila_esperada})...")
-                fila_actual_locator.highlight() # Resaltar la fila actual en la captura para debug.
-
-                # Bandera para saber si la fila actual tiene algún fallo
-                fila_actual_correcta = True 
-
-                # Iterar sobre las columnas esperadas para esta fila
-                for col_name, expected_value in datos_fila_esperada.items():
-                    try:
-                        # Encontrar el índice de la columna por su nombre
-                        if col_name not in headers:
-                            self.logger.error(f"\n  ❌ FALLO: Columna '{col_name}' esperada para la Fila {i+1} no encontrada en los encabezados de la tabla. Encabezados actuales: {headers}")
-                            self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_columna_{col_name}_no_encontrada", directorio)
-                            todos_los_datos_correctos = False # Falla general
-                            fila_actual_correcta = False # Falla en esta fila
-                            continue # Pasa a la siguiente columna esperada o fila
-
-                        col_index = headers.index(col_name)
-                        
-                        # Localizar la celda específica (td) dentro de la fila por su índice
-                        celda_locator = fila_actual_locator.locator("td").nth(col_index)
-                        
-                        # Asegurarse de que la celda esté visible antes de interactuar.
-                        expect(celda_locator).to_be_visible() # Timeout para celda individual
-
-                        if col_name == "Select": # Lógica específica para el checkbox en la columna "Select"
-                            checkbox_locator = celda_locator.locator("input[type='checkbox']")
-                            if checkbox_locator.count() == 0: # Si no se encuentra el checkbox dentro de la celda
-                                self.logger.error(f"\n  ❌ FALLO: Checkbox no encontrado en la columna '{col_name}' de la Fila {i+1}.")
-                                celda_locator.highlight() # Resaltar la celda donde se esperaba el checkbox
-                                self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_no_checkbox", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            elif isinstance(expected_value, bool): # Si se espera un estado específico (True/False)
-                                if checkbox_locator.is_checked() != expected_value:
-                                    self.logger.error(f"\n  ❌ FALLO: El checkbox de la Fila {i+1}, Columna '{col_name}' estaba "
-                                                      f"{'marcado' if checkbox_locator.is_checked() else 'desmarcado'}, se esperaba {'marcado' if expected_value else 'desmarcado'}.")
-                                    checkbox_locator.highlight() # Resaltar el checkbox incorrecto
-                                    self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_estado_incorrecto", directorio)
-                                    todos_los_datos_correctos = False
-                                    fila_actual_correcta = False
-                                else:
-                                    self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente y estado correcto ({'marcado' if expected_value else 'desmarcado'}).")
-                            else: # Si se espera que el checkbox exista, pero no se especificó un estado booleano
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente (estado no verificado explícitamente).")
-                        else: # Para otras columnas de texto (no checkbox)
-                            actual_value = celda_locator.text_content().strip()
-                            # Aseguramos que expected_value también sea una cadena para la comparación, eliminando espacios.
-                            if actual_value != str(expected_value).strip(): 
-                                self.logger.error(f"\n  ❌ FALLO: Fila {i+1}, Columna '{col_name}'. Se esperaba '{expected_value}', se encontró '{actual_value}'.")
-                                celda_locator.highlight() # Resaltar la celda con el dato incorrecto
-                                self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_incorrecta", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            else:
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': '{actual_value}' coincide con lo esperado.")
-                        
-                    except TimeoutError as cell_timeout_e:
-                        self.logger.error(f"\n  ❌ FALLO (Timeout): La celda de la Fila {i+1}, Columna '{col_name}' no se volvió visible a tiempo. Detalles: {cell_timeout_e}")
-                        self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_timeout", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Error as col_playwright_e:
-                        self.logger.error(f"\n  ❌ FALLO (Playwright): Error de Playwright al verificar la columna '{col_name}' de la Fila {i+1}. Detalles: {col_playwright_e}")
-                        self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_playwright_error", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Exception as col_e:
-                        self.logger.error(f"\n  ❌ ERROR INESPERADO al verificar la columna '{col_name}' de la Fila {i+1}: {col_e}", exc_info=True)
-                        self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_error_inesperado", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                        # Podrías decidir si quieres continuar con el resto de las columnas/filas
-                        # o si este error debe detener la verificación.
-
+            self.logger.info("\n🔍 Número de filas actual y esperado coinciden: %s filas.", num_filas_actuales)
+
+            # 5. Comparar todas las filas esperadas con la instantánea en una pasada vectorizada por columna.
+            # La columna "Select" se compara con el estado del checkbox de la celda.
+            from src.utils.verificacion_tablas import VerificadorTabla
+            reporte = VerificadorTabla(instantanea).filas_esperadas(datos_filas_esperados, columnas_casilla=("Select",)).reporte
+            todos_los_datos_correctos = reporte.ok
+
+            # Solo las filas con discrepancias se resaltan, se registran y se capturan.
+            for numero_fila in reporte.filas_con_fallo():
+                fila_actual_locator = row_locators.nth(numero_fila - 1)
+                self.logger.info("\n  Verificando Fila %s (Datos esperados: %s)...", numero_fila, datos_filas_esperados[numero_fila - 1])
+                self.base.resaltar_elemento(fila_actual_locator) # Resaltar la fila con fallos en la captura para debug.
+                for discrepancia in reporte.de_fila(numero_fila):
+                    self.logger.error(f"\n  ❌ FALLO ({discrepancia['verificacion']}): Fila {numero_fila}, Columna '{discrepancia['columna']}'. "
+                                      f"Se esperaba {discrepancia['esperado']}, se encontró {discrepancia['valor']!r}.")
+                    if headers and discrepancia["columna"] in headers:
+                        self.base.resaltar_elemento(fila_actual_locator.locator("td").nth(headers.index(discrepancia["columna"])))
+                self.base.tomar_captura(f"{nombre_base}_fila_{numero_fila}_datos_incorrectos", directorio, es_fallo=True)
                 # Pausa solo si la fila actual tuvo algún fallo para que la captura sea más útil
-                if not fila_actual_correcta:
-                    self.base.esperar_fijo(1) # Pausa de 1 segundo para visualización si hay un fallo en la fila.
+                self.base.esperar_fijo(1) # Pausa de 1 segundo para visualización si hay un fallo en la fila.
+            self.logger.info("\n  ✅ %s de %s filas coinciden con los datos esperados.", num_filas_esperadas - len(reporte.filas_con_fallo()), num_filas_esperadas)
 
             # --- Medición de rendimiento: Fin de la verificación de datos de filas ---
-            end_time_row_data_verification = time.time()
+            end_time_row_data_verification = time.perf_counter()
             duration_row_data_verification = end_time_row_data_verification - start_time_row_data_verification
-            self.logger.info(f"PERFORMANCE: Tiempo total de verificación de datos de filas en la tabla '{tabla_selector}': {duration_row_data_verification:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de verificación de datos de filas en la tabla '%s': %.4f segundos.", tabla_selector, duration_row_data_verification)
+            self.base.registrar_metrica("verificar_datos_filas_tabla", duration_row_data_verification, medicion="row_data_verification", locator=tabla_selector)
 
             # --- Retorno final basado en el estado acumulado ---
             if todos_los_datos_correctos:
@@ -892,12 +933,12 @@ class TableActions:
                 return True
             else:
                 self.logger.error("\n❌ FALLO: Uno o más datos de las filas o checkboxes son incorrectos o faltan.")
-                self.base.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio)
+                self.base.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
             # Captura si la tabla, el thead, el tbody o las filas no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_row_data_verification
             error_msg = (
                 f"\n❌ FALLO (Timeout): La tabla, sus encabezados o sus filas con el locator '{tabla_selector}' no se volvieron visibles a tiempo "
@@ -906,7 +947,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_timeout", directorio, es_fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de tabla no disponibles a tiempo para verificación de datos de filas: {tabla_selector}") from e
 
@@ -918,7 +959,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar datos de filas de tabla: {tabla_selector}") from e
 
         except Exception as e:
@@ -928,14 +969,17 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar datos de filas de tabla: {tabla_selector}") from e
     
     # 34- Función para seleccionar y verificar el estado de checkboxes de filas aleatorias, con pruebas de rendimiento.
-    def seleccionar_y_verificar_checkboxes_aleatorios(self, tabla_selector: Locator, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
+    @medir_accion
+    def seleccionar_y_verificar_checkboxes_aleatorios(self, tabla_selector: Locator, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5, en_lote: bool = False) -> bool:
         """
         Selecciona y verifica el estado de un número específico de checkboxes aleatorios
         dentro de una tabla. Mide el rendimiento de las operaciones de búsqueda e interacción.
+        El ID de producto y el estado inicial se leen de una instantánea previa de la tabla, y
+        los estados finales se verifican con una instantánea posterior y su diferencia (`diff`).
 
         Args:
             tabla_selector (Locator): El **Locator de Playwright** que representa el elemento
@@ -951,6 +995,9 @@ class TableActions:
             pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
                                                    cada interacción con un checkbox para permitir
                                                    que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            en_lote (bool): Si es `True`, hace todos los clics en un bucle ajustado, sin resaltado,
+                            captura ni pausa por checkbox, y verifica todos los estados finales
+                            con una sola llamada al navegador. Por defecto, `False`.
 
         Returns:
             bool: `True` si todos los checkboxes seleccionados aleatoriamente fueron
@@ -961,40 +1008,45 @@ class TableActions:
                             o si ocurre un error inesperado de Playwright o genérico
                             que impida la interacción.
         """
-        self.logger.info(f"\n--- Iniciando selección y verificación de {num_checkboxes_a_interactuar} checkbox(es) aleatorio(s) en la tabla con locator '{tabla_selector}' ---")
+        self.logger.info("\n--- Iniciando selección y verificación de %s checkbox(es) aleatorio(s) en la tabla con locator '%s' ---", num_checkboxes_a_interactuar, tabla_selector)
         self.base.tomar_captura(f"{nombre_base}_inicio_seleccion_checkbox", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
+            start_time_discovery = time.perf_counter()
 
             # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
             all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
             
             # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar.
             if num_checkboxes_a_interactuar > 0:
-                self.logger.debug(f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
+                self.logger.debug("\nEsperando que al menos un checkbox en la tabla sea visible (timeout: %ss).", tiempo_espera_tabla)
                 expect(all_checkbox_locators.first).to_be_visible()
 
-            num_checkboxes_disponibles = all_checkbox_locators.count()
+            # Instantánea previa: ID de producto (primera columna) y estado de todos los checkboxes
+            # en una sola llamada al navegador, en lugar de subir al 'tr' y leer cada celda y estado.
+            instantanea_antes = self._extraer_instantanea(tabla_selector)
+            posiciones_checkbox = instantanea_antes.posiciones_casillas()
+            num_checkboxes_disponibles = len(posiciones_checkbox)
 
             # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
+            end_time_discovery = time.perf_counter()
             duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: {duration_discovery:.4f} segundos. ({num_checkboxes_disponibles} encontrados)")
+            self.logger.info("PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: %.4f segundos. (%s encontrados)", duration_discovery, num_checkboxes_disponibles)
+            self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_aleatorios", duration_discovery, medicion="discovery", locator=tabla_selector)
 
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados", directorio, es_fallo=True)
                 return False
             
             if num_checkboxes_a_interactuar <= 0:
@@ -1003,107 +1055,116 @@ class TableActions:
 
             if num_checkboxes_a_interactuar > num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: Se solicitaron {num_checkboxes_a_interactuar} checkboxes para interactuar, pero solo hay {num_checkboxes_disponibles} disponibles.")
-                self.base.tomar_captura(f"{nombre_base}_no_suficientes_checkboxes", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_suficientes_checkboxes", directorio, es_fallo=True)
                 return False
 
-            self.logger.info(f"\nSe encontraron {num_checkboxes_disponibles} checkboxes. Seleccionando {num_checkboxes_a_interactuar} aleatoriamente...")
+            self.logger.info("\nSe encontraron %s checkboxes. Seleccionando %s aleatoriamente...", num_checkboxes_disponibles, num_checkboxes_a_interactuar)
 
             # 3. Seleccionar N índices de checkboxes aleatorios y únicos
             random_indices = random.sample(range(num_checkboxes_disponibles), num_checkboxes_a_interactuar)
+
+            if en_lote:
+                filas_lote = [posiciones_checkbox[idx][0] for idx in random_indices]
+                resultado = self._marcar_en_lote(tabla_selector, instantanea_antes, filas_lote, True, nombre_base, directorio,
+                                                 "seleccionar_y_verificar_checkboxes_aleatorios", False, pausa_interaccion)
+                duration_total_operation = time.perf_counter() - start_time_total_operation
+                self.logger.info("PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes (en lote): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_aleatorios", duration_total_operation, medicion="total_operation", locator=tabla_selector)
+                return resultado
             
             todos_correctos = True
             interaction_times = [] # Lista para almacenar tiempos de interacción individuales
 
             # 4. Iterar sobre los checkboxes seleccionados aleatoriamente e interactuar con ellos
             for i, idx in enumerate(random_indices):
-                checkbox_to_interact = all_checkbox_locators.nth(idx)
+                fila, columna = posiciones_checkbox[idx]
+                checkbox_to_interact = self._checkbox_en_celda(tabla_selector, fila, columna)
                 
                 # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
+                start_time_interaction = time.perf_counter()
 
                 # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_checkbox_{i+1}_aleatorio_idx_{idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Encontrar la fila que contiene este checkbox para obtener información de contexto.
-                    # Esto es un poco más complejo si el checkbox no está en la primera columna,
-                    # pero si asumimos que está dentro de un 'td' de un 'tr' que representa una fila:
-                    # Podemos buscar el ancestro 'tr' y luego el primer 'td' de ese 'tr'.
-                    # Podría ser más robusto si el product ID estuviera en un atributo de datos,
-                    # o si el checkbox tuviera un atributo id/name relacionado con el producto.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..") # Sube dos niveles para llegar al 'tr'
-                    # Asegurarse de que el 'td' existe en la primera posición.
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {idx}: {id_e}")
-                
-                initial_state = checkbox_to_interact.is_checked()
-                self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}): Estado inicial {'MARCADO' if initial_state else 'DESMARCADO'}.")
+                # ID del producto y estado inicial, leídos de la instantánea previa (ID en la primera columna).
+                product_id = instantanea_antes.columnas[0][fila] or "N/A"
+                initial_state = instantanea_antes.casillas[columna][fila]
+                self.logger.info("\n  Checkbox del Producto ID: %s (Fila índice: %s, Interacción %s/%s): Estado inicial %s.", product_id, idx, i+1, num_checkboxes_a_interactuar, ('MARCADO' if initial_state else 'DESMARCADO'))
 
                 # --- Lógica para asegurar que el click lo deje en estado 'seleccionado' (marcado) ---
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
-                    self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
+                    self.logger.info("\n  El checkbox del Producto ID: %s ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.", product_id)
                     checkbox_to_interact.uncheck()
-                    self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-
-                    if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
-                        self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
-                        self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_desmarco", directorio)
-                        todos_correctos = False
-                        # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
-                        # Continua al siguiente checkbox aleatorio.
-                        continue 
+                    self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
                 
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
+                self.logger.info("\n  Haciendo clic en el checkbox del Producto ID: %s para MARCARLO...", product_id)
                 checkbox_to_interact.check() # Marca el checkbox
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-
-                final_state = checkbox_to_interact.is_checked()
-                if not final_state: # Si no está marcado (seleccionado) después del clic
-                    self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio)
-                    todos_correctos = False
-                else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
-                    self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_marcado_ok", directorio)
+                self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
                 
                 # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
+                end_time_interaction = time.perf_counter()
                 duration_interaction = end_time_interaction - start_time_interaction
                 interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de interacción para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de interacción para checkbox %s (Producto ID: %s): %.4f segundos.", i+1, product_id, duration_interaction)
+                self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_aleatorios", duration_interaction, medicion="interaction", locator=tabla_selector)
+
+            # 5. Verificar todos los estados finales con una instantánea posterior y su diferencia con la previa
+            #    (una llamada al navegador en total, en lugar de un 'is_checked()' por checkbox).
+            start_time_verification = time.perf_counter()
+            instantanea_despues = self._extraer_instantanea(tabla_selector)
+            from src.utils.diferencia_tablas import diferenciar_instantaneas
+            diferencia = diferenciar_instantaneas(instantanea_antes, instantanea_despues)
+            end_time_verification = time.perf_counter()
+            duration_verification = end_time_verification - start_time_verification
+            self.logger.info("PERFORMANCE: Tiempo de verificación de los estados finales (instantánea + diferencia): %.4f segundos.", duration_verification)
+            self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_aleatorios", duration_verification, medicion="verification", locator=tabla_selector)
+            self.logger.debug("\nCambios en la tabla tras la interacción:\n%s", diferencia.texto())
+
+            celdas_interactuadas = {posiciones_checkbox[idx] for idx in random_indices}
+            for idx in random_indices:
+                fila, columna = posiciones_checkbox[idx]
+                product_id = instantanea_antes.columnas[0][fila] or "N/A"
+                final_state = instantanea_despues.casillas[columna][fila] if fila < instantanea_despues.num_filas and columna < instantanea_despues.num_columnas else None
+                if not final_state: # Si no está marcado (seleccionado) después del clic
+                    self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
+                    self.base.resaltar_elemento(self._checkbox_en_celda(tabla_selector, fila, columna))
+                    self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio, es_fallo=True)
+                    todos_correctos = False
+                else:
+                    self.logger.info("\n  ✅ ÉXITO: El checkbox del Producto ID: %s ahora está MARCADO (seleccionado).", product_id)
+                    self.base.tomar_captura(f"{nombre_base}_fila_{idx+1}_marcado_ok", directorio)
+
+            # Cambios fuera de los checkboxes interactuados: no invalidan la selección, pero se informan.
+            indice_por_nombre = {nombre: j for j, nombre in enumerate(instantanea_antes.nombres_columnas())}
+            cambios_ajenos = [cambio for cambio in diferencia.cambios if (cambio["clave"], indice_por_nombre[cambio["columna"]]) not in celdas_interactuadas]
+            if cambios_ajenos or diferencia.agregadas or diferencia.eliminadas:
+                self.logger.warning("\n⚠️ ADVERTENCIA: La tabla cambió fuera de los checkboxes interactuados: %s celda(s) modificada(s), %s fila(s) agregada(s), %s eliminada(s).", len(cambios_ajenos), len(diferencia.agregadas), len(diferencia.eliminadas))
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes: {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_aleatorios", duration_total_operation, medicion="total_operation", locator=tabla_selector)
 
             if interaction_times:
                 avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de interacción por checkbox: {avg_interaction_time:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo promedio de interacción por checkbox: %.4f segundos.", avg_interaction_time)
 
             if todos_correctos:
-                self.logger.info(f"\n✅ ÉXITO: Todos los {num_checkboxes_a_interactuar} checkbox(es) aleatorio(s) fueron seleccionados y verificados correctamente.")
+                self.logger.info("\n✅ ÉXITO: Todos los %s checkbox(es) aleatorio(s) fueron seleccionados y verificados correctamente.", num_checkboxes_a_interactuar)
                 self.base.tomar_captura(f"{nombre_base}_todos_seleccionados_ok", directorio)
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) aleatorio(s) no pudieron ser seleccionados o verificados.")
-                self.base.tomar_captura(f"{nombre_base}_fallo_general_seleccion", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_general_seleccion", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
             # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
@@ -1111,7 +1172,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_timeout", directorio, es_fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -1122,7 +1183,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -1132,11 +1193,12 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
     
     # 35- Función para seleccionar y verificar el estado de checkboxes de filas CONSECUTIVAS, con pruebas de rendimiento.
-    def seleccionar_y_verificar_checkboxes_consecutivos(self, tabla_selector: Locator, start_index: int, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
+    @medir_accion
+    def seleccionar_y_verificar_checkboxes_consecutivos(self, tabla_selector: Locator, start_index: int, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5, en_lote: bool = False) -> bool:
         """
         Selecciona y verifica el estado de un número específico de checkboxes en filas consecutivas
         dentro de una tabla, comenzando desde un índice dado. Mide el rendimiento de las
@@ -1158,6 +1220,9 @@ class TableActions:
             pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
                                                    cada interacción con un checkbox para permitir
                                                    que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            en_lote (bool): Si es `True`, hace todos los clics en un bucle ajustado, sin resaltado,
+                            captura ni pausa por checkbox, y verifica todos los estados finales
+                            con una sola llamada al navegador. Por defecto, `False`.
 
         Returns:
             bool: `True` si todos los checkboxes consecutivos fueron interactuados y
@@ -1168,29 +1233,28 @@ class TableActions:
                             o si ocurre un error inesperado de Playwright o genérico
                             que impida la interacción.
         """
-        self.logger.info(f"\n--- Iniciando selección y verificación de {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) "
-                         f"a partir del índice {start_index} en la tabla con locator '{tabla_selector}' ---")
+        self.logger.info("\n--- Iniciando selección y verificación de %s checkbox(es) consecutivo(s) a partir del índice %s en la tabla con locator '%s' ---", num_checkboxes_a_interactuar, start_index, tabla_selector)
         self.base.tomar_captura(f"{nombre_base}_inicio_seleccion_consecutiva_checkbox", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
+            start_time_discovery = time.perf_counter()
 
             # 2. Obtener todos los locators de los checkboxes en las celdas del cuerpo de la tabla
             all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
             
             # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar.
             if num_checkboxes_a_interactuar > 0:
-                self.logger.debug(f"\nEsperando que al menos el primer checkbox en el rango deseado sea visible (timeout: {tiempo_espera_tabla}s).")
+                self.logger.debug("\nEsperando que al menos el primer checkbox en el rango deseado sea visible (timeout: %ss).", tiempo_espera_tabla)
                 # Intentamos esperar al primer checkbox de la secuencia.
                 if num_checkboxes_a_interactuar > 0 and start_index < all_checkbox_locators.count():
                     expect(all_checkbox_locators.nth(start_index)).to_be_visible()
@@ -1198,17 +1262,21 @@ class TableActions:
                     # Esto será capturado por las validaciones de rango más adelante.
                     pass 
 
-            num_checkboxes_disponibles = all_checkbox_locators.count()
+            # Instantánea previa: ID de producto (primera columna) y estado de todos los checkboxes en una sola llamada.
+            instantanea_antes = self._extraer_instantanea(tabla_selector)
+            posiciones_checkbox = instantanea_antes.posiciones_casillas()
+            num_checkboxes_disponibles = len(posiciones_checkbox)
 
             # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
+            end_time_discovery = time.perf_counter()
             duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: {duration_discovery:.4f} segundos. ({num_checkboxes_disponibles} encontrados)")
+            self.logger.info("PERFORMANCE: Tiempo de descubrimiento de checkboxes disponibles: %.4f segundos. (%s encontrados)", duration_discovery, num_checkboxes_disponibles)
+            self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_consecutivos", duration_discovery, medicion="discovery", locator=tabla_selector)
 
             # 3. Validaciones de precondición
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_consec", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_consec", directorio, es_fallo=True)
                 return False
             
             if num_checkboxes_a_interactuar <= 0:
@@ -1217,17 +1285,25 @@ class TableActions:
 
             if start_index < 0 or start_index >= num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: El 'posición de inicio' ({start_index}) está fuera del rango válido de checkboxes disponibles (0 a {num_checkboxes_disponibles - 1}).")
-                self.base.tomar_captura(f"{nombre_base}_start_index_invalido_consec", directorio)
+                self.base.tomar_captura(f"{nombre_base}_start_index_invalido_consec", directorio, es_fallo=True)
                 return False
             
             if (start_index + num_checkboxes_a_interactuar) > num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: Se solicitaron {num_checkboxes_a_interactuar} checkboxes a partir del índice {start_index}, "
                                   f"pero solo hay {num_checkboxes_disponibles} disponibles. El rango excede los límites de la tabla.")
-                self.base.tomar_captura(f"{nombre_base}_rango_excedido_consec", directorio)
+                self.base.tomar_captura(f"{nombre_base}_rango_excedido_consec", directorio, es_fallo=True)
                 return False
 
-            self.logger.info(f"\nInteractuando con {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) "
-                             f"desde el índice {start_index} hasta el {start_index + num_checkboxes_a_interactuar - 1}...")
+            self.logger.info("\nInteractuando con %s checkbox(es) consecutivo(s) desde el índice %s hasta el %s...", num_checkboxes_a_interactuar, start_index, start_index + num_checkboxes_a_interactuar - 1)
+
+            if en_lote:
+                filas_lote = [posiciones_checkbox[idx][0] for idx in range(start_index, start_index + num_checkboxes_a_interactuar)]
+                resultado = self._marcar_en_lote(tabla_selector, instantanea_antes, filas_lote, True, nombre_base, directorio,
+                                                 "seleccionar_y_verificar_checkboxes_consecutivos", False, pausa_interaccion)
+                duration_total_operation = time.perf_counter() - start_time_total_operation
+                self.logger.info("PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes consecutivos (en lote): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_consecutivos", duration_total_operation, medicion="total_operation", locator=tabla_selector)
+                return resultado
             
             todos_correctos = True
             interaction_times = [] # Lista para almacenar tiempos de interacción individuales
@@ -1235,88 +1311,80 @@ class TableActions:
             # 4. Iterar sobre los checkboxes consecutivos e interactuar con ellos
             for i in range(num_checkboxes_a_interactuar):
                 current_idx = start_index + i
-                checkbox_to_interact = all_checkbox_locators.nth(current_idx)
+                fila, columna = posiciones_checkbox[current_idx]
+                checkbox_to_interact = self._checkbox_en_celda(tabla_selector, fila, columna)
                 
                 # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
+                start_time_interaction = time.perf_counter()
 
                 # Resaltar el checkbox actual para la captura/visualización
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_checkbox_consecutivo_{i+1}_idx_{current_idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
 
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Se asume que el checkbox está dentro de un 'td' y este 'td' está dentro de un 'tr'.
-                    # Se suben dos niveles para llegar al 'tr' y luego se busca el primer 'td'.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..") 
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {current_idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {current_idx}: {id_e}")
-                
-                initial_state = checkbox_to_interact.is_checked()
-                self.logger.info(f"\n  Checkbox del Producto ID: {product_id} (Fila índice: {current_idx}, Interacción {i+1}/{num_checkboxes_a_interactuar}): Estado inicial {'MARCADO' if initial_state else 'DESMARCADO'}.")
+                # ID del producto y estado inicial, leídos de la instantánea previa (ID en la primera columna).
+                product_id = instantanea_antes.columnas[0][fila] or "N/A"
+                initial_state = instantanea_antes.casillas[columna][fila]
+                self.logger.info("\n  Checkbox del Producto ID: %s (Fila índice: %s, Interacción %s/%s): Estado inicial %s.", product_id, current_idx, i+1, num_checkboxes_a_interactuar, ('MARCADO' if initial_state else 'DESMARCADO'))
 
                 # --- Lógica para asegurar que el click lo deje en estado 'seleccionado' (marcado) ---
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
-                    self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
+                    self.logger.info("\n  El checkbox del Producto ID: %s ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.", product_id)
                     checkbox_to_interact.uncheck()
-                    self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                    self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
 
                     if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
                         self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
-                        checkbox_to_interact.highlight()
-                        self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio)
+                        self.base.resaltar_elemento(checkbox_to_interact)
+                        self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio, es_fallo=True)
                         todos_correctos = False
                         # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
                         continue 
                 
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
+                self.logger.info("\n  Haciendo clic en el checkbox del Producto ID: %s para MARCARLO...", product_id)
                 checkbox_to_interact.check() # Marca el checkbox
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
 
                 final_state = checkbox_to_interact.is_checked()
                 if not final_state: # Si no está marcado (seleccionado) después del clic
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio)
+                    self.base.resaltar_elemento(checkbox_to_interact)
+                    self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio, es_fallo=True)
                     todos_correctos = False
                 else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
+                    self.logger.info("\n  ✅ ÉXITO: El checkbox del Producto ID: %s ahora está MARCADO (seleccionado).", product_id)
                     self.base.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_marcado_ok_consec", directorio)
                 
                 # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
+                end_time_interaction = time.perf_counter()
                 duration_interaction = end_time_interaction - start_time_interaction
                 interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de interacción para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de interacción para checkbox %s (Producto ID: %s): %.4f segundos.", i+1, product_id, duration_interaction)
+                self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_consecutivos", duration_interaction, medicion="interaction", locator=tabla_selector)
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes consecutivos: {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación de selección y verificación de checkboxes consecutivos: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_y_verificar_checkboxes_consecutivos", duration_total_operation, medicion="total_operation", locator=tabla_selector)
 
             if interaction_times:
                 avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de interacción por checkbox: {avg_interaction_time:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo promedio de interacción por checkbox: %.4f segundos.", avg_interaction_time)
 
             if todos_correctos:
-                self.logger.info(f"\n✅ ÉXITO: Todos los {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) fueron seleccionados y verificados correctamente.")
+                self.logger.info("\n✅ ÉXITO: Todos los %s checkbox(es) consecutivo(s) fueron seleccionados y verificados correctamente.", num_checkboxes_a_interactuar)
                 self.base.tomar_captura(f"{nombre_base}_todos_seleccionados_ok_consec", directorio)
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) consecutivo(s) no pudieron ser seleccionados o verificados.")
-                self.base.tomar_captura(f"{nombre_base}_fallo_general_seleccion_consec", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_general_seleccion_consec", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
             # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
@@ -1324,7 +1392,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_timeout", directorio, es_fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -1335,7 +1403,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -1345,11 +1413,12 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
         
     # 36- Función para deseleccionar todos los checkboxes actualmente marcados y verificar su estado.
-    def deseleccionar_y_verificar_checkbox_marcado(self, tabla_selector: Locator, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
+    @medir_accion
+    def deseleccionar_y_verificar_checkbox_marcado(self, tabla_selector: Locator, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5, en_lote: bool = False) -> bool:
         """
         Deselecciona y verifica el estado de **todos** los checkboxes que se encuentren
         actualmente marcados dentro de una tabla específica. Mide el rendimiento de
@@ -1367,6 +1436,9 @@ class TableActions:
             pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
                                                    cada deselección con un checkbox para permitir
                                                    que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            en_lote (bool): Si es `True`, hace todas las deselecciones en un bucle ajustado, sin resaltado,
+                            captura ni pausa por checkbox, y verifica todos los estados finales
+                            con una sola llamada al navegador. Por defecto, `False`.
 
         Returns:
             bool: `True` si todos los checkboxes que estaban marcados fueron deseleccionados
@@ -1377,56 +1449,66 @@ class TableActions:
                             o si ocurre un error inesperado de Playwright o genérico
                             que impida la interacción.
         """
-        self.logger.info(f"\n--- Iniciando deselección y verificación de TODOS los checkboxes marcados "
-                         f"en la tabla con locator '{tabla_selector}' ---")
+        self.logger.info("\n--- Iniciando deselección y verificación de TODOS los checkboxes marcados en la tabla con locator '%s' ---", tabla_selector)
         self.base.tomar_captura(f"{nombre_base}_inicio_deseleccion_todos_marcados", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que la tabla esté visible
-            self.logger.debug(f"\nEsperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             expect(tabla_selector).to_be_visible()
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Procediendo a buscar checkboxes.")
 
             # --- Medición de rendimiento: Inicio del descubrimiento de checkboxes ---
-            start_time_discovery = time.time()
+            start_time_discovery = time.perf_counter()
 
             # 2. Obtener todos los locators de los checkboxes en las celdas de la tabla
             all_checkbox_locators = tabla_selector.locator("tbody tr td input[type='checkbox']")
             
             # Asegurarse de que al menos un checkbox sea visible si esperamos interactuar (si no hay ninguno, lo gestionamos)
             if all_checkbox_locators.count() > 0:
-                self.logger.debug(f"\nEsperando que al menos un checkbox en la tabla sea visible (timeout: {tiempo_espera_tabla}s).")
+                self.logger.debug("\nEsperando que al menos un checkbox en la tabla sea visible (timeout: %ss).", tiempo_espera_tabla)
                 expect(all_checkbox_locators.first).to_be_visible()
 
             num_checkboxes_disponibles = all_checkbox_locators.count()
 
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_todos", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_todos", directorio, es_fallo=True)
                 return False
             
-            # 3. Recolectar todos los checkboxes que están actualmente marcados para deseleccionar
+            # 3. Recolectar todos los checkboxes que están actualmente marcados para deseleccionar,
+            #    a partir de una instantánea (una llamada al navegador en lugar de un 'is_checked()' por checkbox).
+            instantanea_antes = self._extraer_instantanea(tabla_selector)
             checkboxes_to_deselect = []
-            for i in range(num_checkboxes_disponibles):
-                checkbox = all_checkbox_locators.nth(i)
-                if checkbox.is_checked():
-                    checkboxes_to_deselect.append({"locator": checkbox, "original_index": i})
+            for i, (fila, columna) in enumerate(instantanea_antes.posiciones_casillas()):
+                if instantanea_antes.casillas[columna][fila]:
+                    checkboxes_to_deselect.append({"locator": self._checkbox_en_celda(tabla_selector, fila, columna), "original_index": i, "fila": fila})
             
             # --- Medición de rendimiento: Fin del descubrimiento de checkboxes ---
-            end_time_discovery = time.time()
+            end_time_discovery = time.perf_counter()
             duration_discovery = end_time_discovery - start_time_discovery
-            self.logger.info(f"PERFORMANCE: Tiempo de descubrimiento de checkboxes y filtrado de marcados: {duration_discovery:.4f} segundos. ({len(checkboxes_to_deselect)} marcados encontrados de {num_checkboxes_disponibles} disponibles)")
+            self.logger.info("PERFORMANCE: Tiempo de descubrimiento de checkboxes y filtrado de marcados: %.4f segundos. (%s marcados encontrados de %s disponibles)", duration_discovery, len(checkboxes_to_deselect), num_checkboxes_disponibles)
+            self.base.registrar_metrica("deseleccionar_y_verificar_checkbox_marcado", duration_discovery, medicion="discovery", locator=tabla_selector)
 
             if not checkboxes_to_deselect:
                 self.logger.warning("\n⚠️ ADVERTENCIA: No se encontró ningún checkbox actualmente MARCADO en la tabla para deseleccionar. La función finaliza sin acciones de deselección.")
                 self.base.tomar_captura(f"{nombre_base}_no_marcados_para_deseleccionar", directorio)
                 return True # Consideramos éxito si no hay nada que deseleccionar
 
-            self.logger.info(f"\nSe encontraron {len(checkboxes_to_deselect)} checkbox(es) marcado(s) para deseleccionar. Iniciando el proceso...")
+            self.logger.info("\nSe encontraron %s checkbox(es) marcado(s) para deseleccionar. Iniciando el proceso...", len(checkboxes_to_deselect))
+
+            if en_lote:
+                filas_lote = [checkbox_info["fila"] for checkbox_info in checkboxes_to_deselect]
+                resultado = self._marcar_en_lote(tabla_selector, instantanea_antes, filas_lote, False, nombre_base, directorio,
+                                                 "deseleccionar_y_verificar_checkbox_marcado", False, pausa_interaccion)
+                duration_total_operation = time.perf_counter() - start_time_total_operation
+                self.logger.info("PERFORMANCE: Tiempo total de la operación de deselección y verificación de checkboxes (en lote): %.4f segundos.", duration_total_operation)
+                self.base.registrar_metrica("deseleccionar_y_verificar_checkbox_marcado", duration_total_operation, medicion="total_operation", locator=tabla_selector)
+                return resultado
 
             todos_deseleccionados_correctamente = True
             interaction_times = [] # Lista para almacenar tiempos de interacción individuales
@@ -1437,72 +1519,64 @@ class TableActions:
                 original_idx = checkbox_info["original_index"]
                 
                 # --- Medición de rendimiento: Inicio de interacción individual ---
-                start_time_interaction = time.time()
+                start_time_interaction = time.perf_counter()
 
                 # Resaltar el checkbox actual
-                checkbox_to_interact.highlight()
+                self.base.resaltar_elemento(checkbox_to_interact)
                 self.base.tomar_captura(f"{nombre_base}_deseleccion_actual_{i+1}_idx_{original_idx}_resaltado", directorio)
                 self.base.esperar_fijo(pausa_interaccion)
 
-                # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
-                product_id = "N/A" # Default en caso de error
-                try:
-                    # Se asume que el checkbox está dentro de un 'td' y este 'td' dentro de un 'tr'.
-                    # Se suben dos niveles para llegar al 'tr' y luego se busca el primer 'td'.
-                    row_locator_for_id = checkbox_to_interact.locator("..").locator("..")
-                    if row_locator_for_id.locator("td").count() > 0:
-                        product_id = row_locator_for_id.locator("td").nth(0).text_content().strip()
-                    else:
-                        self.logger.warning(f"No se pudo extraer el ID del producto para la fila del checkbox en el índice {original_idx}. La primera celda (td[0]) no fue encontrada o no tiene texto.")
-                except Exception as id_e:
-                    self.logger.warning(f"Error al intentar obtener el ID del producto para el checkbox en el índice {original_idx}: {id_e}")
+                # ID del producto leído de la instantánea previa (ID en la primera columna).
+                product_id = instantanea_antes.columnas[0][checkbox_info["fila"]] or "N/A"
                 
-                self.logger.info(f"\n  Procesando checkbox del Producto ID: {product_id} (Fila índice: {original_idx}, Interacción {i+1}/{len(checkboxes_to_deselect)}). Estado inicial: MARCADO (esperado).")
+                self.logger.info("\n  Procesando checkbox del Producto ID: %s (Fila índice: %s, Interacción %s/%s). Estado inicial: MARCADO (esperado).", product_id, original_idx, i+1, len(checkboxes_to_deselect))
 
                 # --- Interacción: Clic para deseleccionar ---
-                self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para DESMARCARLO...")
+                self.logger.info("\n  Haciendo clic en el checkbox del Producto ID: %s para DESMARCARLO...", product_id)
                 # Usar .uncheck() es más directo para desmarcar que .click() si ya sabes el estado esperado.
                 checkbox_to_interact.uncheck()
-                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
 
                 final_state = checkbox_to_interact.is_checked()
                 if final_state: # Si sigue marcado después de .uncheck()
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a DESMARCADO después del clic. Sigue MARCADO.")
-                    checkbox_to_interact.highlight()
-                    self.base.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio)
+                    self.base.resaltar_elemento(checkbox_to_interact)
+                    self.base.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio, es_fallo=True)
                     todos_deseleccionados_correctamente = False
                 else:
-                    self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está DESMARCADO (deseleccionado).")
+                    self.logger.info("\n  ✅ ÉXITO: El checkbox del Producto ID: %s ahora está DESMARCADO (deseleccionado).", product_id)
                     self.base.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_desmarcado_ok", directorio)
                 
                 # --- Medición de rendimiento: Fin de interacción individual ---
-                end_time_interaction = time.time()
+                end_time_interaction = time.perf_counter()
                 duration_interaction = end_time_interaction - start_time_interaction
                 interaction_times.append(duration_interaction)
-                self.logger.info(f"PERFORMANCE: Tiempo de deselección para checkbox {i+1} (Producto ID: {product_id}): {duration_interaction:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de deselección para checkbox %s (Producto ID: %s): %.4f segundos.", i+1, product_id, duration_interaction)
+                self.base.registrar_metrica("deseleccionar_y_verificar_checkbox_marcado", duration_interaction, medicion="interaction", locator=tabla_selector)
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación de deselección y verificación de checkboxes: {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación de deselección y verificación de checkboxes: %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("deseleccionar_y_verificar_checkbox_marcado", duration_total_operation, medicion="total_operation", locator=tabla_selector)
 
             if interaction_times:
                 avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de deselección por checkbox: {avg_interaction_time:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo promedio de deselección por checkbox: %.4f segundos.", avg_interaction_time)
 
 
             if todos_deseleccionados_correctamente:
-                self.logger.info(f"\n✅ ÉXITO: Todos los {len(checkboxes_to_deselect)} checkbox(es) marcados fueron deseleccionados y verificados correctamente.")
+                self.logger.info("\n✅ ÉXITO: Todos los %s checkbox(es) marcados fueron deseleccionados y verificados correctamente.", len(checkboxes_to_deselect))
                 self.base.tomar_captura(f"{nombre_base}_todos_deseleccionados_ok", directorio)
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) marcados no pudieron ser deseleccionados o verificados.")
-                self.base.tomar_captura(f"{nombre_base}_fallo_general_deseleccion_todos", directorio)
+                self.base.tomar_captura(f"{nombre_base}_fallo_general_deseleccion_todos", directorio, es_fallo=True)
                 return False
 
         except TimeoutError as e:
             # Captura si la tabla o los checkboxes no se vuelven visibles a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
@@ -1510,7 +1584,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_timeout", directorio)
+            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_timeout", directorio, es_fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -1521,7 +1595,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -1531,11 +1605,12 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_error_inesperado", directorio)
+            self.base.tomar_captura(f"{nombre_base}_deseleccion_todos_error_inesperado", directorio, es_fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
     
     # 37- Función para buscar un 'texto_a_buscar' en las celdas de una tabla (tbody) y, si lo encuentra,
     # intenta marcar el checkbox asociado en la misma fila. Incluye pruebas de rendimiento.
+    @medir_accion
     def seleccionar_checkbox_por_contenido_celda(self, tabla_selector: Locator, texto_a_buscar: str, nombre_base: str, directorio: str, case_sensitive: bool = False, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
         """
         Busca un 'texto_a_buscar' en todas las celdas (<td>) del cuerpo de una tabla (<tbody>).
@@ -1566,22 +1641,22 @@ class TableActions:
             AssertionError: Si la tabla no está disponible a tiempo, o si ocurre un error
                             inesperado de Playwright o genérico durante la interacción.
         """
-        self.logger.info(f"\n--- Iniciando búsqueda de '{texto_a_buscar}' en la tabla '{tabla_selector}' para marcar checkboxes ---")
+        self.logger.info("\n--- Iniciando búsqueda de '%s' en la tabla '%s' para marcar checkboxes ---", texto_a_buscar, tabla_selector)
         self.base.tomar_captura(f"{nombre_base}_inicio_busqueda_celdas", directorio)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # 1. Asegurarse de que la tabla está visible y cargada
-            self.logger.debug(f"Esperando que la tabla con selector '{tabla_selector}' esté visible (timeout: {tiempo_espera_tabla}s).")
+            self.logger.debug("Esperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
             # Convertir timeout de segundos a milisegundos para expect()
             expect(tabla_selector).to_be_visible() 
-            tabla_selector.highlight()
+            self.base.resaltar_elemento(tabla_selector)
             self.logger.info("\n✅ Tabla visible. Comenzando a iterar por filas y celdas.")
 
             # --- Medición de rendimiento: Inicio del escaneo de la tabla ---
-            start_time_scan = time.time()
+            start_time_scan = time.perf_counter()
 
             # Obtener todas las filas del cuerpo de la tabla
             filas = tabla_selector.locator("tbody tr")
@@ -1589,10 +1664,10 @@ class TableActions:
 
             if num_filas == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron filas en el 'tbody' de la tabla con locator '{tabla_selector}'.")
-                self.base.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio)
+                self.base.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio, es_fallo=True)
                 return False
 
-            self.logger.info(f"\nSe encontraron {num_filas} filas en la tabla. Iniciando escaneo de celdas...")
+            self.logger.info("\nSe encontraron %s filas en la tabla. Iniciando escaneo de celdas...", num_filas)
             
             checkboxes_marcados_exitosamente = 0
             
@@ -1621,7 +1696,7 @@ class TableActions:
                     celda_texto_normalized = celda_texto if case_sensitive else celda_texto.lower()
 
                     if search_text_normalized in celda_texto_normalized:
-                        self.logger.info(f"\n  ✅ Coincidencia encontrada en Fila {i+1}, Celda {j+1}: '{celda_texto}' contiene '{texto_a_buscar}'.")
+                        self.logger.info("\n  ✅ Coincidencia encontrada en Fila %s, Celda %s: '%s' contiene '%s'.", i+1, j+1, celda_texto, texto_a_buscar)
                         celda_encontrada_en_fila = True
                         found_any_match = True
                         
@@ -1630,59 +1705,62 @@ class TableActions:
                         
                         if checkbox_locator.count() > 0:
                             checkbox = checkbox_locator.first
-                            checkbox.highlight()
+                            self.base.resaltar_elemento(checkbox)
                             self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_coincidencia_resaltada", directorio)
                             self.base.esperar_fijo(pausa_interaccion)
 
                             # --- Medición de rendimiento: Inicio de interacción de checkbox ---
-                            start_time_checkbox_interaction = time.time()
+                            start_time_checkbox_interaction = time.perf_counter()
 
                             if not checkbox.is_checked():
-                                self.logger.info(f"\n  --> Marcando checkbox en Fila {i+1} (texto '{celda_texto}')...")
+                                self.logger.info("\n  --> Marcando checkbox en Fila %s (texto '%s')...", i+1, celda_texto)
                                 checkbox.check()
-                                self.base.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
+                                self.base.esperar_estabilidad(pausa_interaccion) # Espera a que el DOM se actualice ('pausa_interaccion' como máximo)
                                 
                                 if checkbox.is_checked():
-                                    self.logger.info(f"\n  ✅ Checkbox en Fila {i+1} marcado correctamente.")
+                                    self.logger.info("\n  ✅ Checkbox en Fila %s marcado correctamente.", i+1)
                                     checkboxes_marcados_exitosamente += 1
                                     self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_marcado", directorio)
                                 else:
                                     self.logger.error(f"\n  ❌ FALLO: No se pudo marcar el checkbox en Fila {i+1} (texto '{celda_texto}').")
-                                    self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio)
+                                    self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio, es_fallo=True)
                             else:
                                 self.logger.warning(f"\n  ⚠️ Checkbox en Fila {i+1} (texto '{celda_texto}') ya estaba marcado. No se requiere acción.")
                                 self.base.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_ya_marcado", directorio)
                             
                             # --- Medición de rendimiento: Fin de interacción de checkbox ---
-                            end_time_checkbox_interaction = time.time()
+                            end_time_checkbox_interaction = time.perf_counter()
                             duration_checkbox_interaction = end_time_checkbox_interaction - start_time_checkbox_interaction
                             interaction_times.append(duration_checkbox_interaction)
-                            self.logger.info(f"PERFORMANCE: Tiempo de interacción con checkbox en Fila {i+1}: {duration_checkbox_interaction:.4f} segundos.")
+                            self.logger.info("PERFORMANCE: Tiempo de interacción con checkbox en Fila %s: %.4f segundos.", i+1, duration_checkbox_interaction)
+                            self.base.registrar_metrica("seleccionar_checkbox_por_contenido_celda", duration_checkbox_interaction, medicion="checkbox_interaction", locator=tabla_selector)
 
                         else:
                             self.logger.warning(f"\n  ⚠️ ADVERTENCIA: No se encontró un checkbox en la Fila {i+1} a pesar de la coincidencia del texto.")
                         break # Salir del bucle de celdas una vez encontrada la coincidencia en la fila
 
                 if not celda_encontrada_en_fila:
-                    self.logger.debug(f"\n  No se encontró '{texto_a_buscar}' en la Fila {i+1}. Continuando con la siguiente fila.")
+                    self.logger.debug("\n  No se encontró '%s' en la Fila %s. Continuando con la siguiente fila.", texto_a_buscar, i+1)
 
             # --- Medición de rendimiento: Fin del escaneo de la tabla ---
-            end_time_scan = time.time()
+            end_time_scan = time.perf_counter()
             duration_scan = end_time_scan - start_time_scan
-            self.logger.info(f"PERFORMANCE: Tiempo total de escaneo de {num_filas} filas en la tabla: {duration_scan:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de escaneo de %s filas en la tabla: %.4f segundos.", num_filas, duration_scan)
+            self.base.registrar_metrica("seleccionar_checkbox_por_contenido_celda", duration_scan, medicion="scan", locator=tabla_selector)
 
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (búsqueda y marcado): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (búsqueda y marcado): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("seleccionar_checkbox_por_contenido_celda", duration_total_operation, medicion="total_operation", locator=tabla_selector)
 
             if interaction_times:
                 avg_interaction_time = sum(interaction_times) / len(interaction_times)
-                self.logger.info(f"PERFORMANCE: Tiempo promedio de marcado por checkbox: {avg_interaction_time:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo promedio de marcado por checkbox: %.4f segundos.", avg_interaction_time)
 
 
             if checkboxes_marcados_exitosamente > 0:
-                self.logger.info(f"\n✅ ÉXITO: Se marcaron {checkboxes_marcados_exitosamente} checkbox(es) basados en la búsqueda de '{texto_a_buscar}'.")
+                self.logger.info("\n✅ ÉXITO: Se marcaron %s checkbox(es) basados en la búsqueda de '%s'.", checkboxes_marcados_exitosamente, texto_a_buscar)
                 self.base.tomar_captura(f"{nombre_base}_busqueda_finalizada_exito", directorio)
                 return True
             elif found_any_match and checkboxes_marcados_exitosamente == 0:
@@ -1691,12 +1769,12 @@ class TableActions:
                  return True # Consideramos éxito si se encontró la coincidencia, aunque no se marcaran nuevos.
             else:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: No se encontraron coincidencias para '{texto_a_buscar}' en ninguna celda de la tabla.")
-                self.base.tomar_captura(f"{nombre_base}_busqueda_finalizada_sin_coincidencias", directorio)
+                self.base.tomar_captura(f"{nombre_base}_busqueda_finalizada_sin_coincidencias", directorio, es_fallo=True)
                 return False # Falla si no se encuentra ninguna coincidencia.
 
         except TimeoutError as e:
             # Captura si la tabla no se vuelve visible a tiempo.
-            end_time_fail = time.time()
+            end_time_fail = time.perf_counter()
             duration_fail = end_time_fail - start_time_total_operation
             error_msg = (
                 f"\n❌ FALLO (Timeout): La tabla con el locator '{tabla_selector}' no estuvo visible a tiempo (timeout configurado: {tiempo_espera_tabla}s).\n"
@@ -1704,7 +1782,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_timeout_tabla", directorio)
+            self.base.tomar_captura(f"{nombre_base}_timeout_tabla", directorio, es_fallo=True)
             raise AssertionError(f"\nTabla no disponible a tiempo: {tabla_selector}") from e
 
         except Error as e:
@@ -1715,7 +1793,7 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.base.tomar_captura(f"{nombre_base}_error_playwright", directorio, es_fallo=True)
             raise AssertionError(f"\nError de Playwright durante la búsqueda/marcado: {tabla_selector}") from e
 
         except Exception as e:
@@ -1725,5 +1803,829 @@ class TableActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
-            raise AssertionError(f"\nError inesperado durante la búsqueda/marcado: {tabla_selector}") from e
\ No newline at end of file
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado durante la búsqueda/marcado: {tabla_selector}") from e
+    # 38- Función para obtener una instantánea (snapshot) completa de una tabla con una sola llamada al navegador, con pruebas de rendimiento.
+    @medir_accion
+    def snapshot(self, tabla_selector: Locator, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> InstantaneaTabla:
+        """
+        Extrae en **una sola llamada `evaluate`** los encabezados, el texto de todas las celdas,
+        el estado de los checkboxes de cada celda y los atributos de cada fila de una tabla HTML,
+        y los devuelve como una `InstantaneaTabla` orientada a columnas. Las verificaciones
+        posteriores se ejecutan sobre la instantánea en Python, sin más viajes al navegador,
+        en lugar de una llamada por fila o por celda (`nth(i).text_content()`).
+
+        Args:
+            tabla_selector (Locator): El **Locator de Playwright** que representa el elemento
+                                      `<table>` (o un elemento padre que contenga la tabla).
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**
+                               tomadas durante la ejecución de la función.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            tiempo (Union[int, float]): **Tiempo máximo de espera** (en segundos) para que la tabla
+                                        esté visible antes de extraer la instantánea.
+
+        Returns:
+            InstantaneaTabla: Encabezados, columnas (texto de las celdas), estado de los checkboxes
+                              y atributos de las filas de la tabla.
+
+        Raises:
+            AssertionError: Si la tabla no está visible a tiempo, o si ocurre un error de Playwright
+                            o inesperado durante la extracción.
+        """
+        self.logger.info("\nObteniendo instantánea de la tabla con selector: '%s'. Tiempo máximo de espera: %ss.", tabla_selector, tiempo)
+
+        # --- Medición de rendimiento: Inicio de la extracción de la instantánea ---
+        start_time_snapshot = time.perf_counter()
+
+        try:
+            # 1. Asegurar que la tabla esté visible antes de extraer su contenido.
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo)
+            expect(tabla_selector).to_be_visible()
+
+            # 2. Extraer todo el contenido de la tabla en una sola llamada al navegador.
+            instantanea = self._extraer_instantanea(tabla_selector)
+
+            # --- Medición de rendimiento: Fin de la extracción de la instantánea ---
+            end_time_snapshot = time.perf_counter()
+            duration_snapshot = end_time_snapshot - start_time_snapshot
+            self.logger.info("PERFORMANCE: Tiempo que tardó en obtener la instantánea de la tabla '%s': %.4f segundos.", tabla_selector, duration_snapshot)
+            self.base.registrar_metrica("snapshot", duration_snapshot, medicion="snapshot", locator=tabla_selector)
+
+            self.logger.info("\n✅ ÉXITO: Instantánea de la tabla obtenida: %s filas, %s columnas.", instantanea.num_filas, instantanea.num_columnas)
+            self.logger.debug("\nEncabezados de la instantánea: %s", instantanea.encabezados)
+            self.base.tomar_captura(f"{nombre_base}_snapshot_tabla", directorio, locator=tabla_selector)
+            return instantanea
+
+        except TimeoutError as e:
+            end_time_fail = time.perf_counter()
+            duration_fail = end_time_fail - start_time_snapshot
+            error_msg = (
+                f"\n❌ FALLO (Timeout): La tabla con el locator '{tabla_selector}' no estuvo visible a tiempo "
+                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_snapshot_timeout", directorio, es_fallo=True)
+            raise AssertionError(f"\nTabla no disponible a tiempo para obtener la instantánea: {tabla_selector}") from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al obtener la instantánea de la tabla '{tabla_selector}'.\n"
+                f"Posibles causas: Locator inválido, el elemento no es una tabla o fue eliminado del DOM.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_snapshot_error_playwright", directorio, es_fallo=True)
+            raise AssertionError(f"\nError de Playwright al obtener la instantánea de la tabla: {tabla_selector}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al obtener la instantánea de la tabla '{tabla_selector}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_snapshot_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado al obtener la instantánea de la tabla: {tabla_selector}") from e
+
+    # 39- Función para validar una tabla con reglas vectorizadas (numéricas, regex, unicidad, orden y filas esperadas) sobre una instantánea, con pruebas de rendimiento.
+    @medir_accion
+    def validar_tabla(self, tabla_selector: Locator, nombre_base: str, directorio: str,
+                      columnas_numericas: Optional[List[str]] = None, patrones: Optional[Dict[str, str]] = None,
+                      columnas_unicas: Optional[List[Union[str, List[str]]]] = None, orden: Optional[Dict[str, bool]] = None,
+                      filas_esperadas: Optional[List[Dict[str, Any]]] = None, tiempo: Union[int, float] = 0.5) -> "ReporteVerificacion":
+        """
+        Obtiene una instantánea de la tabla (una sola llamada al navegador), la carga en un
+        DataFrame de pandas y ejecuta sobre ella las reglas indicadas como operaciones
+        vectorizadas. Devuelve un reporte con las coordenadas (fila y columna) de cada discrepancia.
+
+        Args:
+            tabla_selector (Locator): El **Locator de Playwright** que representa el elemento `<table>`.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            columnas_numericas (Optional[List[str]]): Columnas cuyas celdas deben ser números válidos.
+            patrones (Optional[Dict[str, str]]): Expresión regular que debe cumplir cada celda, por columna.
+            columnas_unicas (Optional[List[Union[str, List[str]]]]): Columnas (o combinaciones de columnas)
+                                                                     cuyos valores no deben repetirse.
+            orden (Optional[Dict[str, bool]]): Columnas que deben estar ordenadas (`True` ascendente, `False` descendente).
+            filas_esperadas (Optional[List[Dict[str, Any]]]): Filas esperadas, como en `verificar_datos_filas_tabla`.
+            tiempo (Union[int, float]): **Tiempo máximo de espera** (en segundos) para que la tabla esté visible.
+
+        Returns:
+            ReporteVerificacion: Reporte de discrepancias (`reporte.ok` es `True` si la tabla cumple todas las reglas).
+
+        Raises:
+            AssertionError: Si la tabla no está disponible a tiempo, o si ocurre un error de Playwright
+                            o inesperado durante la validación.
+        """
+        self.logger.info("\n⚙️ Validando la tabla '%s' con reglas vectorizadas.", tabla_selector)
+
+        # --- Medición de rendimiento: Inicio de la validación de la tabla ---
+        start_time_table_rules = time.perf_counter()
+
+        try:
+            # 1. Asegurar que la tabla esté visible y obtener su instantánea.
+            expect(tabla_selector).to_be_visible()
+            instantanea = self._extraer_instantanea(tabla_selector)
+            self.logger.info("\n🔍 Instantánea obtenida: %s filas, encabezados: %s", instantanea.num_filas, instantanea.encabezados)
+
+            # 2. Ejecutar las reglas solicitadas sobre la instantánea.
+            from src.utils.verificacion_tablas import VerificadorTabla
+            verificador = VerificadorTabla(instantanea)
+            for columna in columnas_numericas or []:
+                verificador.numerica(columna)
+            for columna, patron in (patrones or {}).items():
+                verificador.regex(columna, patron)
+            for columnas in columnas_unicas or []:
+                verificador.unica(columnas)
+            for columna, ascendente in (orden or {}).items():
+                verificador.ordenada(columna, ascendente=ascendente)
+            if filas_esperadas is not None:
+                verificador.filas_esperadas(filas_esperadas)
+            reporte = verificador.reporte
+
+            # --- Medición de rendimiento: Fin de la validación de la tabla ---
+            end_time_table_rules = time.perf_counter()
+            duration_table_rules = end_time_table_rules - start_time_table_rules
+            self.logger.info("PERFORMANCE: Tiempo total de validación de la tabla '%s': %.4f segundos.", tabla_selector, duration_table_rules)
+            self.base.registrar_metrica("validar_tabla", duration_table_rules, medicion="table_rules", locator=tabla_selector)
+
+            if reporte.ok:
+                self.logger.info("\n✅ ÉXITO: La tabla cumple todas las reglas de validación.")
+                self.base.tomar_captura(f"{nombre_base}_validacion_tabla_ok", directorio, locator=tabla_selector)
+            else:
+                self.logger.error("\n❌ FALLO: La tabla no cumple las reglas de validación.\n%s", reporte.texto())
+                for numero_fila in reporte.filas_con_fallo():
+                    self.base.resaltar_elemento(tabla_selector.locator("tbody tr").nth(numero_fila - 1))
+                self.base.tomar_captura(f"{nombre_base}_validacion_tabla_fallo", directorio, es_fallo=True)
+            return reporte
+
+        except TimeoutError as e:
+            end_time_fail = time.perf_counter()
+            duration_fail = end_time_fail - start_time_table_rules
+            error_msg = (
+                f"\n❌ FALLO (Timeout): La tabla con el locator '{tabla_selector}' no estuvo visible a tiempo "
+                f"después de {duration_fail:.4f} segundos (timeout configurado: {tiempo}s).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_validacion_tabla_timeout", directorio, es_fallo=True)
+            raise AssertionError(f"\nTabla no disponible a tiempo para su validación: {tabla_selector}") from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al validar la tabla '{tabla_selector}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_validacion_tabla_error_playwright", directorio, es_fallo=True)
+            raise AssertionError(f"\nError de Playwright al validar la tabla: {tabla_selector}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al validar la tabla '{tabla_selector}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_validacion_tabla_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado al validar la tabla: {tabla_selector}") from e
+
+    # 40- Función para extraer por streaming las filas de una tabla/grid virtualizado (o con scroll infinito), desplazando su contenedor.
+    def extraer_filas_virtualizadas(self, contenedor_selector: Locator, nombre_base: str, directorio: str,
+                                    selector_fila: str = "tbody tr", selector_celda: str = "td", selector_encabezado: str = "thead th",
+                                    atributo_clave: Optional[str] = "aria-rowindex", paso_scroll: float = 0.9,
+                                    pausa_carga: Union[int, float] = 0.5, intentos_al_final: int = 2,
+                                    max_filas: Optional[int] = None) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Extrae las filas de una tabla o grid **virtualizado** (que solo renderiza las filas visibles)
+        desplazando su contenedor y leyendo en cada paso, con una sola llamada al navegador, las filas
+        recién renderizadas. Las filas se **descartan si ya se vieron** (por su clave) y se entregan
+        una a una como **generador**, de modo que la memoria no crece con el tamaño del grid
+        (solo se conservan las claves vistas).
+
+        La extracción termina cuando el contenedor llega al final y, tras `intentos_al_final`
+        lecturas separadas por `pausa_carga` (para grids con scroll infinito que cargan más datos
+        al llegar al final), no aparecen filas nuevas.
+
+        Args:
+            contenedor_selector (Locator): El **Locator del elemento con scroll** que contiene las filas.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla** de fallo.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            selector_fila (str): Selector CSS de las filas dentro del contenedor. Para grids ARIA,
+                                 por ejemplo, "[role='row']". Por defecto, "tbody tr".
+            selector_celda (str): Selector CSS de las celdas dentro de cada fila. Por defecto, "td".
+            selector_encabezado (str): Selector CSS de los encabezados dentro del contenedor. Por defecto, "thead th".
+            atributo_clave (Optional[str]): Atributo de la fila que la identifica (por ejemplo,
+                                            'aria-rowindex' o 'data-id'). Si es `None` o la fila no lo
+                                            tiene (lo habitual en un `<table>` sin roles ARIA), la clave
+                                            es el texto de sus celdas más su posición vertical dentro
+                                            del contenido, y se registra una advertencia: esa clave
+                                            distingue filas idénticas, pero depende de que la altura
+                                            de las filas no cambie durante el scroll, así que conviene
+                                            indicar un atributo propio (por ejemplo, 'data-id').
+            paso_scroll (float): Fracción de la altura visible del contenedor que se desplaza en cada paso. Por defecto, 0.9.
+            pausa_carga (Union[int, float]): Segundos de espera al llegar al final antes de volver a leer. Por defecto, 0.5.
+            intentos_al_final (int): Lecturas sin filas nuevas al final necesarias para terminar. Por defecto, 2.
+            max_filas (Optional[int]): Número máximo de filas a entregar. Por defecto, sin límite.
+
+        Yields:
+            Dict[str, Optional[str]]: Cada fila como diccionario {encabezado: texto de la celda}
+                                      (o 'columna_<n>' si no hay encabezado para esa posición).
+
+        Raises:
+            AssertionError: Si el contenedor no está disponible a tiempo, o si ocurre un error de
+                            Playwright o inesperado durante la extracción.
+        """
+        self.logger.info("\nIniciando extracción por streaming de filas virtualizadas del contenedor '%s' (selector de fila: '%s').", contenedor_selector, selector_fila)
+        claves_vistas = set()
+        entregadas = 0
+        lecturas = 0
+        nombres_columnas: List[str] = []
+        lecturas_sin_cambios_al_final = 0
+        advertencia_clave_texto = False
+
+        # --- Medición de rendimiento: Inicio de la extracción ---
+        start_time_virtual_extraction = time.perf_counter()
+
+        try:
+            expect(contenedor_selector).to_be_visible()
+            while max_filas is None or entregadas < max_filas:
+                opciones = {"selectorFila": selector_fila, "selectorCelda": selector_celda, "selectorEncabezado": selector_encabezado,
+                            "atributoClave": atributo_clave, "pasoScroll": paso_scroll, "leerEncabezados": lecturas == 0}
+                resultado = contenedor_selector.evaluate(self._SCRIPT_FILAS_RENDERIZADAS, opciones)
+                lecturas += 1
+                if resultado["encabezados"] is not None:
+                    nombres_columnas = resultado["encabezados"]
+                if resultado["claves_por_texto"] and not advertencia_clave_texto:
+                    advertencia_clave_texto = True
+                    self.logger.warning("\n⚠️ %s fila(s) del contenedor '%s' no tienen el atributo clave '%s'; se identifican por su texto y su "
+                                        "posición en el contenido. Indica un 'atributo_clave' propio (por ejemplo, 'data-id') para una clave estable.",
+                                        resultado["claves_por_texto"], contenedor_selector, atributo_clave)
+
+                nuevas = 0
+                for fila in resultado["filas"]:
+                    if fila["clave"] in claves_vistas:
+                        continue
+                    claves_vistas.add(fila["clave"])
+                    nuevas += 1
+                    celdas = fila["celdas"]
+                    nombres = [nombres_columnas[j] if j < len(nombres_columnas) and nombres_columnas[j] else f"columna_{j + 1}"
+                               for j in range(max(len(celdas), len(nombres_columnas)))]
+                    entregadas += 1
+                    yield dict(zip(nombres, celdas + [None] * (len(nombres) - len(celdas))))
+                    if max_filas is not None and entregadas >= max_filas:
+                        break
+                self.logger.debug("\nLectura %s: %s filas renderizadas, %s nuevas (total: %s).", lecturas, len(resultado["filas"]), nuevas, entregadas)
+
+                if resultado["al_final"]:
+                    lecturas_sin_cambios_al_final = 0 if nuevas else lecturas_sin_cambios_al_final + 1
+                    if lecturas_sin_cambios_al_final >= intentos_al_final:
+                        break
+                    # Espera real (no escalada por el perfil) para que un scroll infinito cargue más datos.
+                    self.page.wait_for_timeout(pausa_carga * 1000)
+
+            # --- Medición de rendimiento: Fin de la extracción ---
+            end_time_virtual_extraction = time.perf_counter()
+            duration_virtual_extraction = end_time_virtual_extraction - start_time_virtual_extraction
+            self.logger.info("PERFORMANCE: Tiempo de extracción de %s filas virtualizadas en %s lecturas: %.4f segundos.", entregadas, lecturas, duration_virtual_extraction)
+            self.base.registrar_metrica("extraer_filas_virtualizadas", duration_virtual_extraction, medicion="virtual_extraction", locator=contenedor_selector)
+            self.logger.info("\n✅ ÉXITO: Se extrajeron %s filas únicas del contenedor '%s'.", entregadas, contenedor_selector)
+
+        except TimeoutError as e:
+            end_time_fail = time.perf_counter()
+            duration_fail = end_time_fail - start_time_virtual_extraction
+            error_msg = (
+                f"\n❌ FALLO (Timeout): El contenedor '{contenedor_selector}' no estuvo disponible a tiempo "
+                f"después de {duration_fail:.4f} segundos ({entregadas} filas extraídas).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_extraccion_virtualizada_timeout", directorio, es_fallo=True)
+            raise AssertionError(f"\nContenedor no disponible a tiempo para la extracción: {contenedor_selector}") from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al extraer filas del contenedor '{contenedor_selector}' "
+                f"({entregadas} filas extraídas).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_extraccion_virtualizada_error_playwright", directorio, es_fallo=True)
+            raise AssertionError(f"\nError de Playwright al extraer filas virtualizadas: {contenedor_selector}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al extraer filas del contenedor '{contenedor_selector}' "
+                f"({entregadas} filas extraídas).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_extraccion_virtualizada_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado al extraer filas virtualizadas: {contenedor_selector}") from e
+
+    # 41- Función para contar filas y columnas de una tabla/grid virtualizado recorriéndolo por streaming, con pruebas de rendimiento.
+    @medir_accion
+    def obtener_dimensiones_tabla_virtualizada(self, contenedor_selector: Locator, nombre_base: str, directorio: str,
+                                               selector_fila: str = "tbody tr", selector_celda: str = "td",
+                                               atributo_clave: Optional[str] = "aria-rowindex") -> Tuple[int, int]:
+        """
+        Variante de `obtener_dimensiones_tabla` para grids virtualizados: en ellos contar `tbody tr`
+        solo cuenta las filas visibles. Recorre el grid con `extraer_filas_virtualizadas` y cuenta
+        las filas únicas sin conservarlas en memoria.
+
+        Args:
+            contenedor_selector (Locator): El **Locator del elemento con scroll** que contiene las filas.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            selector_fila (str): Selector CSS de las filas. Por defecto, "tbody tr".
+            selector_celda (str): Selector CSS de las celdas. Por defecto, "td".
+            atributo_clave (Optional[str]): Atributo que identifica cada fila. Por defecto, 'aria-rowindex'.
+
+        Returns:
+            tuple[int, int]: `(num_filas, num_columnas)`; las columnas son el máximo de celdas (o encabezados) por fila.
+        """
+        num_filas, num_columnas = 0, 0
+        for fila in self.extraer_filas_virtualizadas(contenedor_selector, nombre_base, directorio, selector_fila=selector_fila,
+                                                     selector_celda=selector_celda, atributo_clave=atributo_clave):
+            num_filas += 1
+            num_columnas = max(num_columnas, len(fila))
+        self.logger.info("\n✅ ÉXITO: Dimensiones de la tabla virtualizada '%s' obtenidas.", contenedor_selector)
+        self.logger.info("--> Filas encontradas: %s", num_filas)
+        self.logger.info("--> Columnas encontradas: %s", num_columnas)
+        self.base.tomar_captura(f"{nombre_base}_dimensiones_virtualizada_obtenidas", directorio, locator=contenedor_selector)
+        return (num_filas, num_columnas)
+
+    # 42- Función para recorrer todas las páginas de una tabla paginada y unir sus filas en una sola instantánea, con pruebas de rendimiento.
+    @medir_accion
+    def rastrear_tabla_paginada(self, tabla_selector: Union[str, Locator], selector_paginado: Locator, nombre_base: str, directorio: str,
+                                plantilla_url: Optional[str] = None, num_contextos: int = 4, clase_resaltado: str = "active",
+                                pausa_post_clic: Union[int, float] = 0.5, tiempo_cambio_pagina: Union[int, float] = 5.0) -> InstantaneaTabla:
+        """
+        Obtiene las filas de **todas las páginas** de una tabla paginada y las une en una sola
+        `InstantaneaTabla`, lista para verificarse con `VerificadorTabla` o `validar_tabla`.
+
+        1. Lee el estado de la paginación (página actual, total y enlaces) con una sola llamada.
+        2. Toma la instantánea de la página actual.
+        3. Si las páginas son **direccionables por URL** (se indica `plantilla_url` o se deduce de
+           los enlaces numéricos), reparte las páginas restantes entre `num_contextos` contextos de
+           navegador nuevos (con las cookies y el almacenamiento de la sesión actual). En cada lote,
+           cada `goto` espera solo hasta recibir la respuesta del servidor (`wait_until="commit"`),
+           una página tras otra; después se espera la carga de cada una y se extrae su tabla. Las
+           peticiones al servidor no son concurrentes: lo que se solapa entre los contextos es la
+           carga posterior (recursos y renderizado) de las páginas del lote.
+        4. Si no lo son, recorre las páginas en la página actual haciendo clic en cada número y,
+           antes de leer cada página, espera a que la paginación la marque como activa y a que
+           cambien las filas de la tabla, para no volver a leer las de la página anterior.
+
+        Args:
+            tabla_selector (Union[str, Locator]): Selector (o Locator de la página actual) de la tabla;
+                                                  se vuelve a resolver en cada contexto.
+            selector_paginado (Locator): El **Locator** del contenedor de la paginación.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            plantilla_url (Optional[str]): URL de las páginas con el marcador '{pagina}'
+                                           (por ejemplo, 'https://sitio/lista?page={pagina}').
+                                           Por defecto se deduce de los enlaces de la paginación.
+            num_contextos (int): Número máximo de contextos de navegador por lote. Por defecto, 4.
+            clase_resaltado (str): Clase CSS de la página activa en la paginación. Por defecto, "active".
+            pausa_post_clic (Union[int, float]): Espera máxima de estabilidad tras cada clic en el
+                                                 modo secuencial. Por defecto, `0.5` segundos.
+            tiempo_cambio_pagina (Union[int, float]): Tiempo máximo (en segundos) para que, tras cada
+                                                      clic, la página pedida quede activa y la tabla
+                                                      cambie. Por defecto, `5.0` segundos.
+
+        Returns:
+            InstantaneaTabla: Filas de todas las páginas, en orden de página.
+
+        Raises:
+            AssertionError: Si la tabla o una página no están disponibles a tiempo, o si ocurre un
+                            error de Playwright o inesperado durante el recorrido.
+        """
+        selector_tabla = tabla_selector if isinstance(tabla_selector, str) else describir_locator(tabla_selector)
+        self.logger.info("\n--- Iniciando recorrido de la tabla paginada '%s' ---", selector_tabla)
+
+        # --- Medición de rendimiento: Inicio del recorrido ---
+        start_time_crawl = time.perf_counter()
+        contextos = []
+
+        try:
+            # 1. Estado de la paginación en una sola llamada.
+            tabla_actual = self.page.locator(selector_tabla)
+            expect(tabla_actual).to_be_visible()
+            estado = self.base.navigation.obtener_estado_paginacion(selector_paginado, clase_resaltado)
+            pagina_actual = int(estado["actual"]) if estado["actual"] and estado["actual"].isdigit() else 1
+            total_paginas = max(estado["total"], pagina_actual)
+            self.logger.info("\n🔍 Paginación detectada: página actual %s de %s.", pagina_actual, total_paginas)
+
+            # 2. Instantánea de la página actual.
+            instantaneas: Dict[int, InstantaneaTabla] = {pagina_actual: self._extraer_instantanea(tabla_actual)}
+            pendientes = [numero for numero in range(1, total_paginas + 1) if numero != pagina_actual]
+
+            plantilla = plantilla_url or plantilla_url_paginas(estado["enlaces"])
+            navegador = self.page.context.browser
+            if pendientes and plantilla and navegador is not None:
+                # 3. Páginas direccionables por URL: reparto entre varios contextos.
+                self.logger.info("\n🔀 Páginas direccionables por URL ('%s'); repartiendo %s páginas entre %s contextos.",
+                                 plantilla, len(pendientes), min(num_contextos, len(pendientes)))
+                estado_sesion = self.page.context.storage_state()
+                for _ in range(max(1, min(num_contextos, len(pendientes)))):
+                    contexto = navegador.new_context(storage_state=estado_sesion, viewport=self.page.viewport_size)
+                    contextos.append((contexto, contexto.new_page()))
+
+                for inicio in range(0, len(pendientes), len(contextos)):
+                    lote = list(zip(contextos, pendientes[inicio:inicio + len(contextos)]))
+                    # Se lanzan todas las navegaciones del lote sin esperar la carga...
+                    for (_, pagina_contexto), numero in lote:
+                        pagina_contexto.goto(plantilla.format(pagina=numero), wait_until="commit")
+                    # ...y después se espera y se extrae cada una.
+                    for (_, pagina_contexto), numero in lote:
+                        pagina_contexto.wait_for_load_state("load")
+                        tabla_pagina = pagina_contexto.locator(selector_tabla)
+                        expect(tabla_pagina).to_be_visible()
+                        instantaneas[numero] = self._extraer_instantanea(tabla_pagina)
+                        self.logger.debug("\nPágina %s: %s filas.", numero, instantaneas[numero].num_filas)
+            elif pendientes:
+                # 4. Páginas no direccionables por URL: recorrido secuencial con clics.
+                self.logger.info("\n➡️ Páginas no direccionables por URL; recorriendo %s páginas con clics.", len(pendientes))
+                enlace_activo = selector_paginado.locator(f"a.{clase_resaltado}").first
+                for numero in pendientes:
+                    enlace = selector_paginado.locator("li a").filter(has_text=re.compile(rf"^\s*{numero}\s*$")).first
+                    version_previa = tabla_actual.evaluate(self._SCRIPT_VERSION_TABLA)
+                    enlace.click()
+                    # 'networkidle' vuelve al instante si el documento ya alcanzó ese estado (SPA), así que
+                    # primero se espera a que la paginación marque la página pedida como activa...
+                    expect(enlace_activo).to_have_text(re.compile(rf"^\s*{numero}\s*$"), timeout=tiempo_cambio_pagina * 1000)
+                    # ...y a que cambien las filas (versión del <tbody>, o tabla reemplazada en el DOM).
+                    self._esperar_cambio_tabla(tabla_actual, version_previa, tiempo_cambio_pagina)
+                    self.base.esperar_estabilidad(pausa_post_clic, condicion="red")
+                    instantaneas[numero] = self._extraer_instantanea(tabla_actual)
+                    self.logger.debug("\nPágina %s: %s filas.", numero, instantaneas[numero].num_filas)
+
+            resultado = InstantaneaTabla.concatenar([instantaneas[numero] for numero in sorted(instantaneas)])
+
+            # --- Medición de rendimiento: Fin del recorrido ---
+            end_time_crawl = time.perf_counter()
+            duration_crawl = end_time_crawl - start_time_crawl
+            self.logger.info("PERFORMANCE: Tiempo de recorrido de %s páginas de la tabla '%s': %.4f segundos.", len(instantaneas), selector_tabla, duration_crawl)
+            self.base.registrar_metrica("rastrear_tabla_paginada", duration_crawl, medicion="crawl", locator=selector_tabla)
+
+            self.logger.info("\n✅ ÉXITO: Se obtuvieron %s filas de %s páginas.", resultado.num_filas, len(instantaneas))
+            self.base.tomar_captura(f"{nombre_base}_tabla_paginada_recorrida", directorio)
+            return resultado
+
+        except TimeoutError as e:
+            end_time_fail = time.perf_counter()
+            duration_fail = end_time_fail - start_time_crawl
+            error_msg = (
+                f"\n❌ FALLO (Timeout): La tabla '{selector_tabla}' o alguna de sus páginas no estuvo disponible a tiempo "
+                f"después de {duration_fail:.4f} segundos.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_tabla_paginada_timeout", directorio, es_fallo=True)
+            raise AssertionError(f"\nTabla paginada no disponible a tiempo: {selector_tabla}") from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al recorrer la tabla paginada '{selector_tabla}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_tabla_paginada_error_playwright", directorio, es_fallo=True)
+            raise AssertionError(f"\nError de Playwright al recorrer la tabla paginada: {selector_tabla}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al recorrer la tabla paginada '{selector_tabla}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_tabla_paginada_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado al recorrer la tabla paginada: {selector_tabla}") from e
+
+        finally:
+            for contexto, _ in contextos:
+                contexto.close()
+
+    # 43- Función para comparar dos instantáneas de una tabla (antes y después de una acción) por una columna clave, con pruebas de rendimiento.
+    @medir_accion
+    def diff(self, antes: InstantaneaTabla, despues: InstantaneaTabla, columna_clave: Optional[Union[str, int]] = None) -> "DiferenciaTablas":
+        """
+        Compara dos instantáneas de la misma tabla (por ejemplo, las obtenidas con `snapshot` antes
+        y después de una acción) y devuelve las filas agregadas, las eliminadas y las celdas
+        modificadas, tanto de texto como de estado de checkbox. La comparación es una única pasada
+        vectorizada en memoria: no realiza ninguna llamada al navegador, en lugar de un
+        `is_checked()`/`text_content()` por celda para averiguar qué cambió.
+
+        Args:
+            antes (InstantaneaTabla): Instantánea de la tabla anterior a la acción.
+            despues (InstantaneaTabla): Instantánea de la tabla posterior a la acción.
+            columna_clave (Optional[Union[str, int]]): Nombre o índice de la columna que identifica
+                                                       cada fila (por ejemplo, 'ID'). Si es `None`,
+                                                       las filas se emparejan por posición.
+
+        Returns:
+            DiferenciaTablas: Filas agregadas, eliminadas y celdas modificadas.
+
+        Raises:
+            AssertionError: Si la columna clave no existe en alguna de las instantáneas o tiene
+                            valores repetidos, o si ocurre un error inesperado durante la comparación.
+        """
+        self.logger.info("\nComparando instantáneas de tabla (%s filas antes, %s después) por la columna clave: %s.",
+                         antes.num_filas, despues.num_filas, columna_clave if columna_clave is not None else "posición de la fila")
+
+        # --- Medición de rendimiento: Inicio de la comparación ---
+        start_time_diff = time.perf_counter()
+
+        try:
+            from src.utils.diferencia_tablas import diferenciar_instantaneas
+            diferencia = diferenciar_instantaneas(antes, despues, columna_clave)
+
+            # --- Medición de rendimiento: Fin de la comparación ---
+            end_time_diff = time.perf_counter()
+            duration_diff = end_time_diff - start_time_diff
+            self.logger.info("PERFORMANCE: Tiempo que tardó en comparar las instantáneas de la tabla: %.4f segundos.", duration_diff)
+            self.base.registrar_metrica("diff", duration_diff, medicion="diff")
+
+            if diferencia.sin_cambios:
+                self.logger.info("\n✅ La tabla no cambió entre ambas instantáneas.")
+            else:
+                self.logger.info("\nDiferencias encontradas en la tabla:\n%s", diferencia.texto())
+            return diferencia
+
+        except (KeyError, ValueError) as e:
+            error_msg = (
+                f"\n❌ FALLO: No se pudieron emparejar las filas de ambas instantáneas por la columna clave '{columna_clave}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg)
+            raise AssertionError(f"\nColumna clave inválida para comparar las instantáneas: {columna_clave}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al comparar las instantáneas de la tabla.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            raise AssertionError("\nError inesperado al comparar las instantáneas de la tabla.") from e
+
+    # 44- Función para marcar o desmarcar en lote los checkboxes de varias filas de una tabla y verificar sus estados con una sola llamada, con pruebas de rendimiento.
+    @medir_accion
+    def marcar_checkboxes_en_lote(self, tabla_selector: Locator, filas: Optional[Iterable[Union[int, str]]], nombre_base: str, directorio: str,
+                                  marcar: bool = True, columna_clave: Optional[Union[str, int]] = None, evidencia_por_checkbox: bool = False,
+                                  tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
+        """
+        Deja en el estado indicado (marcado o desmarcado) el checkbox de cada una de las filas
+        recibidas. Las filas se resuelven sobre una instantánea de la tabla (una llamada al
+        navegador), solo se hace clic en los checkboxes que no están ya en el estado deseado, en un
+        bucle ajustado sin resaltado, captura ni pausa por checkbox, y todos los estados finales se
+        verifican con una sola llamada `evaluate`. Seleccionar 100 filas cuesta así segundos en lugar
+        de minutos.
+
+        Args:
+            tabla_selector (Locator): El **Locator de Playwright** que representa el elemento
+                                      `<table>` que contiene los checkboxes.
+            filas (Optional[Iterable[Union[int, str]]]): Filas a interactuar: índices de fila (`int`,
+                                                         basados en 0) o valores de la `columna_clave`
+                                                         (`str`). Si es `None`, todas las filas con checkbox.
+            nombre_base (str): Nombre base utilizado para las **capturas de pantalla**
+                               tomadas durante la ejecución de la función.
+            directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
+            marcar (bool): Estado final deseado: `True` para marcar, `False` para desmarcar.
+            columna_clave (Optional[Union[str, int]]): Nombre o índice de la columna con la que se
+                                                       buscan las filas indicadas por texto. Por
+                                                       defecto, la primera columna (ID del producto).
+            evidencia_por_checkbox (bool): Si es `True`, resalta, captura y espera `pausa_interaccion`
+                                           antes de cada clic, como las funciones no agrupadas.
+                                           Por defecto, `False`.
+            tiempo_espera_tabla (Union[int, float]): **Tiempo máximo de espera** (en segundos)
+                                                     para que la tabla esté visible.
+            pausa_interaccion (Union[int, float]): Tiempo máximo (en segundos) de espera de
+                                                   estabilidad del DOM tras el último clic, y pausa
+                                                   por checkbox si `evidencia_por_checkbox` es `True`.
+
+        Returns:
+            bool: `True` si todos los checkboxes de las filas indicadas quedaron en el estado
+                  deseado; `False` si alguna fila no existe, no tiene checkbox o no cambió de estado.
+
+        Raises:
+            AssertionError: Si la tabla no está disponible a tiempo, o si ocurre un error
+                            de Playwright o inesperado durante la interacción.
+        """
+        estado_deseado = "MARCADO" if marcar else "DESMARCADO"
+        self.logger.info("\n--- Iniciando interacción en lote con checkboxes (estado deseado: %s) en la tabla con locator '%s' ---", estado_deseado, tabla_selector)
+
+        # --- Medición de rendimiento: Inicio total de la función ---
+        start_time_total_operation = time.perf_counter()
+
+        try:
+            # 1. Asegurarse de que la tabla esté visible
+            self.logger.debug("\nEsperando que la tabla con selector '%s' esté visible (timeout: %ss).", tabla_selector, tiempo_espera_tabla)
+            expect(tabla_selector).to_be_visible()
+
+            # --- Medición de rendimiento: Inicio de la resolución de filas ---
+            start_time_discovery = time.perf_counter()
+
+            # 2. Resolver las filas (índices o claves) sobre una instantánea de la tabla
+            instantanea = self._extraer_instantanea(tabla_selector)
+            if filas is None:
+                filas_objetivo = sorted({fila for fila, _ in instantanea.posiciones_casillas()})
+                no_encontradas = []
+            else:
+                filas_objetivo, no_encontradas, fila_por_clave = [], [], None
+                for fila in filas:
+                    if isinstance(fila, int):
+                        if 0 <= fila < instantanea.num_filas:
+                            filas_objetivo.append(fila)
+                        else:
+                            no_encontradas.append(fila)
+                        continue
+                    if fila_por_clave is None:
+                        fila_por_clave = {}
+                        for i, valor in enumerate(instantanea.columna(columna_clave if columna_clave is not None else 0)):
+                            fila_por_clave.setdefault(valor, i)
+                    if fila in fila_por_clave:
+                        filas_objetivo.append(fila_por_clave[fila])
+                    else:
+                        no_encontradas.append(fila)
+                filas_objetivo = list(dict.fromkeys(filas_objetivo))
+
+            # --- Medición de rendimiento: Fin de la resolución de filas ---
+            end_time_discovery = time.perf_counter()
+            duration_discovery = end_time_discovery - start_time_discovery
+            self.logger.info("PERFORMANCE: Tiempo de resolución de filas sobre la instantánea: %.4f segundos. (%s fila(s) a interactuar)", duration_discovery, len(filas_objetivo))
+            self.base.registrar_metrica("marcar_checkboxes_en_lote", duration_discovery, medicion="discovery", locator=tabla_selector)
+
+            if no_encontradas:
+                self.logger.error(f"\n❌ --> FALLO: Las siguientes filas no existen en la tabla (filas: {instantanea.num_filas}): {no_encontradas[:20]}")
+                self.base.tomar_captura(f"{nombre_base}_lote_filas_no_encontradas", directorio, es_fallo=True)
+                return False
+
+            if not filas_objetivo:
+                self.logger.warning("\n⚠️ ADVERTENCIA: No hay filas con checkbox sobre las que interactuar. La función finaliza sin acciones.")
+                return True
+
+            # 3. Clics en bucle ajustado y verificación en una sola llamada
+            resultado = self._marcar_en_lote(tabla_selector, instantanea, filas_objetivo, marcar, nombre_base, directorio,
+                                             "marcar_checkboxes_en_lote", evidencia_por_checkbox, pausa_interaccion)
+
+            # --- Medición de rendimiento: Fin total de la función ---
+            end_time_total_operation = time.perf_counter()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            self.logger.info("PERFORMANCE: Tiempo total de la interacción en lote con %s checkbox(es): %.4f segundos.", len(filas_objetivo), duration_total_operation)
+            self.base.registrar_metrica("marcar_checkboxes_en_lote", duration_total_operation, medicion="total_operation", locator=tabla_selector)
+            return resultado
+
+        except TimeoutError as e:
+            end_time_fail = time.perf_counter()
+            duration_fail = end_time_fail - start_time_total_operation
+            error_msg = (
+                f"\n❌ FALLO (Timeout): No se pudo encontrar la tabla o los checkboxes con el locator '{tabla_selector}'.\n"
+                f"Posiblemente los elementos no estuvieron disponibles a tiempo después de {duration_fail:.4f} segundos (timeout configurado: {tiempo_espera_tabla}s).\n"
+                f"Detalles: {e}"
+            )
+            self.logger.error(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_lote_checkbox_timeout", directorio, es_fallo=True)
+            raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
+
+        except Error as e:
+            error_msg = (
+                f"\n❌ FALLO (Playwright): Error de Playwright al interactuar en lote con checkboxes en la tabla '{tabla_selector}'.\n"
+                f"Posibles causas: Locator inválido, problemas de interacción con el DOM.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_lote_checkbox_error_playwright", directorio, es_fallo=True)
+            raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
+
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Inesperado): Ocurrió un error inesperado al interactuar en lote con checkboxes.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True)
+            self.base.tomar_captura(f"{nombre_base}_lote_checkbox_error_inesperado", directorio, es_fallo=True)
+            raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
+
+    def _obtener_indice(self, tabla_selector: Locator) -> IndiceTabla:
+        """
+        Devuelve el índice de búsqueda de la tabla. Comprobar si sigue vigente cuesta una sola
+        llamada al navegador (la versión del MutationObserver del <tbody>); solo si la tabla
+        cambió, o es la primera búsqueda, se extrae una nueva instantánea y se reconstruye.
+        """
+        clave = describir_locator(tabla_selector)
+        version = tabla_selector.evaluate(self._SCRIPT_VERSION_TABLA)
+        en_cache = self._indices.get(clave)
+        if en_cache is not None and en_cache[0] == version:
+            self.logger.debug("\nÍndice de la tabla '%s' vigente (versión %s); se reutiliza.", clave, version)
+            return en_cache[1]
+
+        # La versión se lee antes de la instantánea: un cambio entre ambas llamadas solo provoca
+        # una reconstrucción adicional en la siguiente búsqueda, nunca un índice desactualizado.
+        indice = IndiceTabla(self._extraer_instantanea(tabla_selector))
+        self._indices[clave] = (version, indice)
+        self.logger.debug("\nÍndice de la tabla '%s' construido (versión %s): %s", clave, version, indice)
+        return indice
+
+    def _esperar_cambio_tabla(self, tabla_selector: Locator, version_previa: str, tiempo: Union[int, float]) -> None:
+        """
+        Espera a que las filas de la tabla cambien respecto de `version_previa` (leída con
+        `_SCRIPT_VERSION_TABLA` antes de la acción): la versión de su <tbody> avanza, el <tbody>
+        se reemplaza o la propia tabla sale del DOM (en ese caso el Locator ya resuelve la nueva).
+
+        Raises:
+            TimeoutError: Si la tabla no cambia dentro de `tiempo` segundos.
+        """
+        manejador = tabla_selector.element_handle(timeout=tiempo * 1000)
+        try:
+            self.page.wait_for_function(
+                f"([tabla, previa]) => !tabla.isConnected || ({self._SCRIPT_VERSION_TABLA.strip()})(tabla) !== previa",
+                arg=[manejador, version_previa],
+                timeout=tiempo * 1000,
+            )
+        finally:
+            manejador.dispose()
+
+    def _checkbox_en_celda(self, tabla_selector: Locator, fila: int, columna: int) -> Locator:
+        """
+        Localiza el checkbox de la celda (fila, columna) del <tbody>: el primero de la celda, que es
+        el que leen `_SCRIPT_SNAPSHOT_TABLA` y `_SCRIPT_ESTADOS_CHECKBOX`. Se localiza por fila y celda,
+        y no por su posición entre todos los checkboxes de la tabla, porque una celda con varios
+        checkboxes desplazaría esa posición para todos los siguientes.
+        """
+        return tabla_selector.locator("tbody tr").nth(fila).locator("td").nth(columna).locator("input[type='checkbox']").first
+
+    @staticmethod
+    def _estado_en_celda(estados: List[List[Optional[bool]]], fila: int, columna: int) -> Optional[bool]:
+        """Estado de un checkbox en el resultado de `_SCRIPT_ESTADOS_CHECKBOX` (`None` si la celda ya no existe)."""
+        if fila >= len(estados) or columna >= len(estados[fila]):
+            return None
+        return estados[fila][columna]
+
+    def _marcar_en_lote(self, tabla_selector: Locator, instantanea: InstantaneaTabla, filas: List[int], marcar: bool,
+                        nombre_base: str, directorio: str, accion: str, evidencia_por_checkbox: bool,
+                        pausa_interaccion: Union[int, float]) -> bool:
+        """
+        Núcleo del modo lote de los checkboxes, sin esperas iniciales ni manejo de errores propio
+        (lo aportan las funciones públicas que lo usan). Hace clic, en un bucle ajustado, solo en
+        los checkboxes de `filas` cuyo estado en la instantánea difiere de `marcar`, espera una
+        única vez a que el DOM se estabilice y verifica todos los estados con un solo `evaluate`.
+        Las métricas se registran bajo el nombre de `accion`.
+        """
+        estado_deseado = "MARCADO" if marcar else "DESMARCADO"
+        # {fila: columna de la primera celda con checkbox de la fila}.
+        checkbox_de_fila: Dict[int, int] = {}
+        for fila, columna in instantanea.posiciones_casillas():
+            checkbox_de_fila.setdefault(fila, columna)
+        ids = instantanea.columnas[0] if instantanea.num_columnas else [None] * instantanea.num_filas
+
+        sin_checkbox = [fila for fila in filas if fila not in checkbox_de_fila]
+        if sin_checkbox:
+            self.logger.error(f"\n❌ --> FALLO: Las filas {[fila + 1 for fila in sin_checkbox][:20]} no contienen ningún checkbox.")
+            self.base.tomar_captura(f"{nombre_base}_lote_filas_sin_checkbox", directorio, es_fallo=True)
+            return False
+
+        a_cambiar = [fila for fila in filas if instantanea.casillas[checkbox_de_fila[fila]][fila] is not marcar]
+        self.logger.info("\n%s de %s checkbox(es) necesitan un clic para quedar %s; el resto ya lo está.", len(a_cambiar), len(filas), estado_deseado)
+
+        # --- Medición de rendimiento: Inicio de la interacción en lote ---
+        start_time_interaction = time.perf_counter()
+        for fila in a_cambiar:
+            checkbox = self._checkbox_en_celda(tabla_selector, fila, checkbox_de_fila[fila])
+            if evidencia_por_checkbox:
+                self.base.resaltar_elemento(checkbox)
+                self.base.tomar_captura(f"{nombre_base}_lote_fila_{fila + 1}_resaltado", directorio)
+                self.base.esperar_fijo(pausa_interaccion)
+            checkbox.click()
+        if a_cambiar:
+            self.base.esperar_estabilidad(pausa_interaccion) # Una sola espera para todos los clics
+        end_time_interaction = time.perf_counter()
+        duration_interaction = end_time_interaction - start_time_interaction
+        self.logger.info("PERFORMANCE: Tiempo de interacción en lote con %s checkbox(es): %.4f segundos.", len(a_cambiar), duration_interaction)
+        self.base.registrar_metrica(accion, duration_interaction, medicion="batch_interaction", locator=tabla_selector)
+
+        # --- Medición de rendimiento: Inicio de la verificación en lote ---
+        start_time_verification = time.perf_counter()
+        estados = tabla_selector.evaluate(self._SCRIPT_ESTADOS_CHECKBOX)
+        fallidas = [fila for fila in filas if self._estado_en_celda(estados, fila, checkbox_de_fila[fila]) is not marcar]
+        end_time_verification = time.perf_counter()
+        duration_verification = end_time_verification - start_time_verification
+        self.logger.info("PERFORMANCE: Tiempo de verificación en lote de %s estado(s) de checkbox: %.4f segundos.", len(filas), duration_verification)
+        self.base.registrar_metrica(accion, duration_verification, medicion="batch_verification", locator=tabla_selector)
+
+        if fallidas:
+            self.logger.error(f"\n❌ FALLO: {len(fallidas)} de {len(filas)} checkbox(es) no quedaron {estado_deseado}. "
+                              f"Productos ID: {[ids[fila] for fila in fallidas][:20]}")
+            self.base.tomar_captura(f"{nombre_base}_lote_fallo", directorio, es_fallo=True)
+            return False
+
+        self.logger.info("\n✅ ÉXITO: Los %s checkbox(es) quedaron %s.", len(filas), estado_deseado)
+        self.base.tomar_captura(f"{nombre_base}_lote_ok", directorio)
+        return True
+
+    def _extraer_instantanea(self, tabla_selector: Locator) -> InstantaneaTabla:
+        """
+        Ejecuta el script de instantánea sobre la tabla (una sola llamada `evaluate`) sin esperas,
+        capturas ni logs propios. Lo usan `snapshot` y las verificaciones de tablas, que ya
+        gestionan sus propias esperas y errores.
+        """
+        return InstantaneaTabla.desde_evaluate(tabla_selector.evaluate(self._SCRIPT_SNAPSHOT_TABLA))
@@ -2,6 +2,8 @@ import time
 from typing import Union
 from playwright.sync_api import Page, Locator, expect, Error, TimeoutError
 
+from src.utils.cronometro import medir_accion
+
 class KeyboardActions:
     def __init__(self, base_page):
         self.base = base_page
@@ -10,6 +12,7 @@ class KeyboardActions:
         
     # 55- Función para presionar la tecla TAB en el teclado
     # Integra pruebas de rendimiento para medir el tiempo de ejecución de la acción.
+    @medir_accion
     def presionar_tecla_tab(self, tiempo_espera_post_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la tecla 'TAB' en el teclado.
@@ -26,25 +29,26 @@ class KeyboardActions:
         Raises:
             Exception: Si ocurre algún error inesperado durante la simulación de la tecla TAB.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Presionando la tecla TAB y esperando {tiempo_espera_post_tab} segundos ---")
+        self.logger.info("\n--- %s: Presionando la tecla TAB y esperando %s segundos ---", nombre_paso, tiempo_espera_post_tab)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # --- Medición de rendimiento: Inicio de la acción 'keyboard.press' ---
-            start_time_press_action = time.time()
+            start_time_press_action = time.perf_counter()
             self.page.keyboard.press("Tab")
             # --- Medición de rendimiento: Fin de la acción 'keyboard.press' ---
-            end_time_press_action = time.time()
+            end_time_press_action = time.perf_counter()
             duration_press_action = end_time_press_action - start_time_press_action
-            self.logger.info(f"PERFORMANCE: Tiempo de la acción 'keyboard.press(\"Tab\")': {duration_press_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de la acción 'keyboard.press(\"Tab\")': %.4f segundos.", duration_press_action)
+            self.base.registrar_metrica("presionar_tecla_tab", duration_press_action, medicion="press_action")
             
             self.logger.info("\nTecla TAB presionada exitosamente.")
 
-            # Espera fija después de presionar TAB (configuracion por parametro)
+            # Espera de estabilidad después de presionar TAB (el parámetro es el límite superior)
             if tiempo_espera_post_tab > 0:
-                self.base.esperar_fijo(tiempo_espera_post_tab)
+                self.base.esperar_estabilidad(tiempo_espera_post_tab)
 
         except Exception as e:
             error_msg = (
@@ -59,12 +63,14 @@ class KeyboardActions:
             raise AssertionError(f"\nError al presionar la tecla TAB: {e}") from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (Tab_Press): {duration_total_operation:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo total de la operación (Tab_Press): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("presionar_tecla_tab", duration_total_operation, medicion="total_operation")
     
     # 74- Función para presionar la tecla TAB y verificar que el foco cambie al elemento esperado.
     # Combina la acción de TAB con una validación directa del foco, aceptando tanto selectores como objetos Locator.
+    @medir_accion
     def presionar_tab_y_verificar_foco(self, selector_o_locator_esperado: Union[str, Locator], nombre_base: str, direccion: str, tiempo_espera_post_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la tecla 'TAB' y verifica que el foco del navegador
@@ -96,12 +102,12 @@ class KeyboardActions:
             localizador = selector_o_locator_esperado
 
         paso_descripcion = nombre_paso if nombre_paso else f"Verificando el cambio de foco a '{localizador}' después de presionar TAB."
-        self.logger.info(f"\n--- {paso_descripcion} ---")
+        self.logger.info("\n--- %s ---", paso_descripcion)
 
         try:
             # 2. Resaltar el elemento esperado para una confirmación visual.
-            self.logger.info(f"✨ Resaltando el elemento esperado para el foco: '{localizador}'...")
-            localizador.highlight()
+            self.logger.info("✨ Resaltando el elemento esperado para el foco: '%s'...", localizador)
+            self.base.resaltar_elemento(localizador)
             
             # 3. Presionar la tecla TAB utilizando la función existente.
             self.presionar_tecla_tab(tiempo_espera_post_tab=tiempo_espera_post_tab, nombre_paso="Presionando TAB para cambiar de foco")
@@ -109,12 +115,12 @@ class KeyboardActions:
             # 4. La verificación clave con `expect` para asegurar que el foco se movió correctamente.
             expect(localizador).to_be_focused()
             
-            self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
+            self.logger.info("\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '%s'.", localizador)
 
         except AssertionError as ae:
             mensaje_error = f"\n❌ FALLO de Verificación - {paso_descripcion}\n{ae}"
             self.logger.error(mensaje_error)
-            self.base.tomar_captura(f"{nombre_base}_foco_fallido", direccion)
+            self.base.tomar_captura(f"{nombre_base}_foco_fallido", direccion, es_fallo=True)
             raise ae
         except Exception as e:
             mensaje_error = (
@@ -122,11 +128,12 @@ class KeyboardActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.base.tomar_captura(f"{nombre_base}_error_inesperado", direccion)
+            self.base.tomar_captura(f"{nombre_base}_error_inesperado", direccion, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar el foco: {e}") from e
                 
     # 75- Función para presionar la combinación de teclas SHIFT + TAB en el teclado
     # Integra pruebas de rendimiento para medir el tiempo de ejecución de la acción.
+    @medir_accion
     def presionar_shift_tab(self, tiempo_espera_post_shift_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la combinación de teclas 'Shift + Tab' en el teclado.
@@ -146,25 +153,26 @@ class KeyboardActions:
         Raises:
             Exception: Si ocurre algún error inesperado durante la simulación de la combinación de teclas.
         """
-        self.logger.info(f"\n--- {nombre_paso}: Presionando la combinación de teclas SHIFT + TAB y esperando {tiempo_espera_post_shift_tab} segundos ---")
+        self.logger.info("\n--- %s: Presionando la combinación de teclas SHIFT + TAB y esperando %s segundos ---", nombre_paso, tiempo_espera_post_shift_tab)
 
         # --- Medición de rendimiento: Inicio total de la función ---
-        start_time_total_operation = time.time()
+        start_time_total_operation = time.perf_counter()
 
         try:
             # --- Medición de rendimiento: Inicio de la acción 'keyboard.press' ---
-            start_time_press_action = time.time()
+            start_time_press_action = time.perf_counter()
             self.page.keyboard.press("Shift+Tab")
             # --- Medición de rendimiento: Fin de la acción 'keyboard.press' ---
-            end_time_press_action = time.time()
+            end_time_press_action = time.perf_counter()
             duration_press_action = end_time_press_action - start_time_press_action
-            self.logger.info(f"\nPERFORMANCE: Tiempo de la acción 'keyboard.press(\"Shift+Tab\")': {duration_press_action:.4f} segundos.")
+            self.logger.info("\nPERFORMANCE: Tiempo de la acción 'keyboard.press(\"Shift+Tab\")': %.4f segundos.", duration_press_action)
+            self.base.registrar_metrica("presionar_shift_tab", duration_press_action, medicion="press_action")
             
             self.logger.info("\nCombinación de teclas SHIFT + TAB presionada exitosamente.")
 
-            # Espera fija después de presionar SHIFT + TAB (configuracion por parametro)
+            # Espera de estabilidad después de presionar SHIFT + TAB (el parámetro es el límite superior)
             if tiempo_espera_post_shift_tab > 0:
-                self.base.esperar_fijo(tiempo_espera_post_shift_tab)
+                self.base.esperar_estabilidad(tiempo_espera_post_shift_tab)
 
         except Exception as e:
             error_msg = (
@@ -176,13 +184,15 @@ class KeyboardActions:
             raise AssertionError(f"\nError al presionar la combinación de teclas SHIFT + TAB: {e}") from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
-            end_time_total_operation = time.time()
+            end_time_total_operation = time.perf_counter()
             duration_total_operation = end_time_total_operation - start_time_total_operation
-            self.logger.info(f"\nPERFORMANCE: Tiempo total de la operación (Shift_Tab_Press): {duration_total_operation:.4f} segundos.")
+            self.logger.info("\nPERFORMANCE: Tiempo total de la operación (Shift_Tab_Press): %.4f segundos.", duration_total_operation)
+            self.base.registrar_metrica("presionar_shift_tab", duration_total_operation, medicion="total_operation")
     
     # 76- Función para presionar la combinación de teclas SHIFT + TAB y verificar que el foco cambie al elemento esperado.
     # Combina la acción de SHIFT + TAB con una validación directa del foco, aceptando
     # selectores o objetos Locator.
+    @medir_accion
     def presionar_shift_tab_y_verificar_foco(self, selector_o_locator_esperado: Union[str, Locator], nombre_base: str, direccion: str, tiempo_espera_post_shift_tab: float = 0.5, nombre_paso: str = "") -> None:
         """
         Simula la acción de presionar la combinación de teclas 'Shift + Tab' y verifica
@@ -215,27 +225,27 @@ class KeyboardActions:
             localizador = selector_o_locator_esperado
 
         paso_descripcion = nombre_paso if nombre_paso else f"Verificando el cambio de foco a '{localizador}' después de presionar SHIFT + TAB."
-        self.logger.info(f"\n--- {paso_descripcion} ---")
+        self.logger.info("\n--- %s ---", paso_descripcion)
 
         try:
-            self.logger.info(f"✨ Resaltando el elemento esperado para el foco: '{localizador}'...")
-            localizador.highlight()
+            self.logger.info("✨ Resaltando el elemento esperado para el foco: '%s'...", localizador)
+            self.base.resaltar_elemento(localizador)
             # 2. Presionar la combinación de teclas SHIFT + TAB utilizando la función existente.
             self.presionar_shift_tab(tiempo_espera_post_shift_tab=tiempo_espera_post_shift_tab, nombre_paso="Presionando SHIFT + TAB para cambiar de foco")
 
             # 3. Resaltar el elemento esperado para una confirmación visual.
-            self.logger.info(f"\nVerificando que el foco se haya movido al elemento: '{localizador}'...")
+            self.logger.info("\nVerificando que el foco se haya movido al elemento: '%s'...", localizador)
             
             # 4. La verificación clave con `expect` de Playwright.
             #    `to_be_focused()` verifica si el elemento actualmente tiene el foco.
             expect(localizador).to_be_focused()
             
-            self.logger.info(f"\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '{localizador}'.")
+            self.logger.info("\n✅ ÉXITO - El foco se encuentra en el elemento esperado: '%s'.", localizador)
 
         except AssertionError as ae:
             mensaje_error = f"\n❌ FALLO de Verificación - {paso_descripcion}\n{ae}"
             self.logger.error(mensaje_error)
-            self.tomar_captura(f"{nombre_base}_foco_fallido", direccion)
+            self.tomar_captura(f"{nombre_base}_foco_fallido", direccion, es_fallo=True)
             raise ae
         except Exception as e:
             mensaje_error = (
@@ -243,5 +253,5 @@ class KeyboardActions:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", direccion)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", direccion, es_fallo=True)
             raise AssertionError(f"\nError inesperado al verificar el foco: {e}") from e
\ No newline at end of file
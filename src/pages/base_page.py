@@ -1,47 +1,112 @@
 import os
 import time
-import logging
 from datetime import datetime
-from typing import Union, Optional, Dict, Any, List
+from importlib import import_module
+from typing import TYPE_CHECKING, Union, Optional, Dict, Any, List, Tuple
 
 from playwright.sync_api import Page, Dialog, Locator, Error, TimeoutError
 
-# --- Importación de las nuevas clases de acciones ---
-from .actions_elementos import ElementActions
-from .actions_tablas import TableActions
-from .actions_archivos import FileActions
-from .actions_dialogos import DialogActions
-from .actions_dropdowns import DropdownActions
-from .actions_teclado import KeyboardActions
-from .actions_navegacion import NavigationActions
-
-from src.utils.logger import setup_logger
-from src.utils.config import LOGGER_DIR, SCREENSHOT_DIR
-
-# Asegúrate de importar la clase de localizadores
-from src.locator.locator_home import HomeLocatorsPage
-from src.locator.locator_registro import RegistroLocatorsPage
-from src.locator.locator_login import LoginLocatorsPage
-from src.locator.locator_dashboard import DasboardLocatorsPage
+from src.utils.logger import obtener_logger_test
+from src.utils.config import LOGGER_DIR, SCREENSHOT_DIR, ALMACEN_CAPTURAS
+from src.utils.perfiles_ejecucion import obtener_perfil_activo
+from src.utils.escritor_evidencias import EscritorEvidencias
+from src.utils.almacen_evidencias import AlmacenEvidencias
+from src.utils.politica_capturas import crear_politica_capturas, OMITIR, BUFFER
+from src.utils.formato_capturas import OpcionesCaptura
+from src.utils.metricas import obtener_registro_metricas, describir_locator
+
+# Las clases de acciones y de localizadores se importan solo para el análisis de tipos:
+# en ejecución, BasePage las importa y las construye la primera vez que se usan.
+if TYPE_CHECKING:
+    from .actions_elementos import ElementActions
+    from .actions_tablas import TableActions
+    from .actions_archivos import FileActions
+    from .actions_dialogos import DialogActions
+    from .actions_dropdowns import DropdownActions
+    from .actions_teclado import KeyboardActions
+    from .actions_navegacion import NavigationActions
+    from src.locator.locator_home import HomeLocatorsPage
+    from src.locator.locator_registro import RegistroLocatorsPage
+    from src.locator.locator_login import LoginLocatorsPage
+    from src.locator.locator_dashboard import DasboardLocatorsPage
 
 class BasePage:
     """
     Clase base que actúa como un agregador para todas las clases de acciones.
     Inicializa la página, el logger y todas las clases de acciones específicas,
     proporcionando un punto de entrada único y organizado para las pruebas.
+
+    Las clases de acciones (`element`, `table`, `file`, ...) y de localizadores (`home`, `registro`, ...)
+    se importan y se construyen la primera vez que el test accede a ellas (ver `__getattr__`), de modo
+    que un test de interfaz no paga la importación de pandas, openpyxl ni xml.etree, que solo se
+    cargan al usar `base_page.file` (o, en el caso de pandas, al verificar una tabla).
     """
 
+    # Atributos de construcción diferida: {atributo: (módulo, clase, recibe la Page en lugar de BasePage)}.
+    _ATRIBUTOS_DIFERIDOS: Dict[str, Tuple[str, str, bool]] = {
+        "element": (".actions_elementos", "ElementActions", False),
+        "table": (".actions_tablas", "TableActions", False),
+        "file": (".actions_archivos", "FileActions", False),
+        "dialog": (".actions_dialogos", "DialogActions", False),
+        "dropdown": (".actions_dropdowns", "DropdownActions", False),
+        "keyboard": (".actions_teclado", "KeyboardActions", False),
+        "navigation": (".actions_navegacion", "NavigationActions", False),
+        "home": ("src.locator.locator_home", "HomeLocatorsPage", True),
+        "registro": ("src.locator.locator_registro", "RegistroLocatorsPage", True),
+        "login": ("src.locator.locator_login", "LoginLocatorsPage", True),
+        "dashboard": ("src.locator.locator_dashboard", "DasboardLocatorsPage", True),
+    }
+
+    element: "ElementActions"
+    table: "TableActions"
+    file: "FileActions"
+    dialog: "DialogActions"
+    dropdown: "DropdownActions"
+    keyboard: "KeyboardActions"
+    navigation: "NavigationActions"
+    home: "HomeLocatorsPage"
+    registro: "RegistroLocatorsPage"
+    login: "LoginLocatorsPage"
+    dashboard: "DasboardLocatorsPage"
+
     #1- Creamos una función incial 'Constructor'-----ES IMPORTANTE TENER ESTE INICIADOR-----
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, nombre_test: Optional[str] = None, etiquetas_metricas: Optional[Dict[str, str]] = None,
+                 id_test: Optional[str] = None):
         """
         Inicializa la clase Funciones_Globales con un objeto Page de Playwright.
 
         Args:
             page (Page): El objeto de página de Playwright que representa la pestaña
                          del navegador activa.
+            nombre_test (Optional[str]): Nombre del test en curso, usado como contexto de los logs.
+            etiquetas_metricas (Optional[Dict[str, str]]): Etiquetas 'navegador' y 'dispositivo' que se añaden
+                                                            a las métricas de tiempo de las acciones.
+            id_test (Optional[str]): Identificador único del test (el nodeid de pytest), usado para nombrar
+                                     el manifiesto de capturas del almacén por contenido. Por defecto,
+                                     `nombre_test`.
         """
         self.page = page
-        self.logger = setup_logger(name='AutomationFramework', console_level=logging.INFO, file_level=logging.DEBUG)
+        # Logger compartido del proceso (QueueHandler): emitir solo encola; el test se añade como contexto.
+        # Niveles desde LOG_NIVEL_CONSOLA / LOG_NIVEL_ARCHIVO; el formateo de los mensajes es diferido.
+        self.logger = obtener_logger_test(nombre_test, name='AutomationFramework')
+        
+        # --- Perfil de ejecución (slow_mo, esperas, resaltado y política de capturas) ---
+        self.perfil = obtener_perfil_activo()
+        
+        # --- Escritor asíncrono de capturas: la escritura en disco sale del camino crítico del test ---
+        self.evidencias = EscritorEvidencias(logger=self.logger)
+        
+        # --- Almacén deduplicado por contenido (solo si ALMACEN_CAPTURAS='contenido') ---
+        self.almacen: Optional[AlmacenEvidencias] = None
+        if ALMACEN_CAPTURAS == "contenido":
+            self.almacen = AlmacenEvidencias(self.evidencias, nombre_test=id_test or nombre_test)
+        
+        # --- Política de capturas (siempre, solo-fallos, cada-n o buffer-circular), con estado propio del test ---
+        self.politica_capturas = crear_politica_capturas()
+        
+        # --- Registro de métricas de tiempo (compartido por el proceso) y etiquetas de este test ---
+        self.metricas = obtener_registro_metricas()
+        self.etiquetas_metricas = etiquetas_metricas or {}
         
         # --- Banderas para manejo de eventos de diálogo ---
         self._alerta_detectada = False
@@ -53,20 +118,27 @@ class BasePage:
         self._all_new_pages_opened_by_click: List[Page] = []
         self.page.context.on("page", self._on_new_page)
         
-        # --- Instanciación de las clases de acciones (mejora de arquitectura) ---
-        self.element = ElementActions(self)
-        self.table = TableActions(self)
-        self.file = FileActions(self)
-        self.dialog = DialogActions(self)
-        self.dropdown = DropdownActions(self)
-        self.keyboard = KeyboardActions(self)
-        self.navigation = NavigationActions(self)
+        # --- Las clases de acciones y de localizadores se construyen al primer acceso (ver __getattr__) ---
         
-        # --- Instancia de la clase de localizadores de la página de inicio ---
-        self.home = HomeLocatorsPage(self.page)
-        self.registro = RegistroLocatorsPage(self.page)
-        self.login = LoginLocatorsPage(self.page)
-        self.dashboard = DasboardLocatorsPage(self.page)
+    def __getattr__(self, nombre: str) -> Any:
+        """
+        Construye, la primera vez que se accede a ellos, los atributos de `_ATRIBUTOS_DIFERIDOS`:
+        importa su módulo, crea la instancia y la guarda en la instancia de BasePage, de modo que los
+        accesos siguientes son lecturas normales de atributo y no vuelven a pasar por aquí.
+        Python solo llama a este método cuando el atributo no existe en la instancia.
+
+        Raises:
+            AttributeError: Si `nombre` no es un atributo de construcción diferida.
+        """
+        definicion = type(self)._ATRIBUTOS_DIFERIDOS.get(nombre)
+        if definicion is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{nombre}'")
+        modulo, clase, recibe_pagina = definicion
+        inicio = time.perf_counter()
+        instancia = getattr(import_module(modulo, __package__), clase)(self.page if recibe_pagina else self)
+        self.__dict__[nombre] = instancia
+        self.logger.debug("PERFORMANCE: '%s' (%s) construido al primer uso en %.4f segundos.", nombre, clase, time.perf_counter() - inicio)
+        return instancia
         
     #2- Función para generar el nombre de archivo con marca de tiempo
     def _generar_nombre_archivo_con_timestamp(self, prefijo):
@@ -75,45 +147,299 @@ class BasePage:
         return f"{timestamp}_{prefijo}"
     
     #3- Función para tomar captura de pantalla
-    def tomar_captura(self, nombre_base, directorio):
+    def tomar_captura(self, nombre_base, directorio, locator: Optional[Locator] = None, es_fallo: bool = False):
         """
         Toma una captura de pantalla de la página y la guarda en el directorio especificado.
-        Por defecto, usa SCREENSHOT_DIR de config.py.
+        Por defecto, usa SCREENSHOT_DIR de config.py. Respeta la política de capturas activa:
+        'siempre' guarda todas; 'solo-fallos' omite las de pasos exitosos; 'cada-n' guarda una de
+        cada N capturas exitosas; 'buffer-circular' retiene en memoria las últimas K capturas
+        exitosas y solo las escribe, junto a la del fallo, cuando un paso falla.
+
+        Las capturas de pasos exitosos usan el formato configurado en la política (PNG, JPEG o WebP,
+        calidad, escala y ancho máximo) y, si está habilitado, se recortan al `locator` de la acción.
+        Las capturas de fallo se guardan siempre en PNG sin pérdida de la página completa.
+
+        Que una captura documente un fallo lo indica quien la toma (`es_fallo=True` en los bloques
+        `except` y en las ramas de fallo de las acciones); no se deduce de su nombre, porque los
+        pasos exitosos de las pruebas negativas (por ejemplo, 'formato_invalido') también contienen
+        palabras como 'invalid' o 'error'.
+
+        Solo la obtención de los bytes ocurre en el hilo del test; la escritura en disco (y la
+        recodificación, si aplica) se delega al escritor asíncrono de evidencias, que se vacía al
+        finalizar el test.
 
         Args:
             nombre_base (str): El nombre base para el archivo de la captura de pantalla.
             directorio (str): El directorio donde se guardará la captura. Por defecto, SCREENSHOT_DIR.
+            locator (Locator, opcional): Elemento de la acción, usado para recortar las capturas de pasos.
+            es_fallo (bool): `True` si la captura documenta un fallo: se guarda con cualquier política,
+                             en PNG de página completa, y antes se persiste el buffer circular.
+                             Por defecto, `False`.
         """
+        decision = self.politica_capturas.decidir(es_fallo)
+        if decision == OMITIR:
+            self.logger.debug("\n Captura '%s' omitida por la política de capturas '%s'.", nombre_base, self.politica_capturas.nombre)
+            return
+
         try:
             if not os.path.exists(directorio):
                 os.makedirs(directorio)
-                self.logger.info(f"\n Directorio creado para capturas de pantalla: {directorio}") #
+                self.logger.info("\n Directorio creado para capturas de pantalla: %s", directorio) #
 
+            opciones = self.politica_capturas.opciones(es_fallo)
             nombre_archivo = self._generar_nombre_archivo_con_timestamp(nombre_base) #
-            ruta_completa = os.path.join(directorio, f"{nombre_archivo}.png") # Cambiado a .png para mejor calidad
-            self.page.screenshot(path=ruta_completa) #
-            self.logger.info(f"\n 📸 Captura de pantalla guardada en: {ruta_completa}") #
+            ruta_completa = os.path.join(directorio, f"{nombre_archivo}.{opciones.extension}")
+            datos_captura = self._obtener_bytes_captura(opciones, locator) # Sin 'path': Playwright devuelve los bytes sin escribir en disco
+
+            if decision == BUFFER:
+                self.politica_capturas.agregar_al_buffer(ruta_completa, datos_captura)
+                self.logger.debug("\n Captura '%s' retenida en el buffer circular.", nombre_base)
+                return
+
+            if es_fallo:
+                # Antes de la captura del fallo se persisten los pasos previos retenidos en memoria.
+                self.persistir_buffer_capturas()
+            self._persistir_captura(ruta_completa, datos_captura, opciones.procesador())
+            self.logger.info("\n 📸 Captura de pantalla encolada para guardarse en: %s", ruta_completa) #
         except Exception as e:
             self.logger.error(f"\n ❌ Error al tomar captura de pantalla '{nombre_base}': {e}") #
-        
+
+    def _obtener_bytes_captura(self, opciones: OpcionesCaptura, locator: Optional[Locator] = None) -> bytes:
+        """
+        Obtiene los bytes de una captura según sus opciones. Si se pide recortar al elemento y este
+        no está visible (por ejemplo, tras una navegación), se captura el viewport sin esperar.
+        """
+        argumentos = opciones.argumentos_playwright()
+        if locator is not None and opciones.recortar_elemento:
+            try:
+                if locator.is_visible():
+                    return locator.screenshot(timeout=1000, **argumentos)
+            except Exception as e:
+                self.logger.debug("\n No se pudo recortar la captura al elemento; se captura el viewport: %s", e)
+        return self.page.screenshot(full_page=opciones.pagina_completa, **argumentos)
+
+    def _persistir_captura(self, ruta_completa: str, datos: bytes, procesar=None) -> None:
+        """
+        Envía una captura a disco: en el almacén por contenido (un objeto por imagen única más
+        una entrada en el manifiesto) o, por defecto, como archivo con marca de tiempo.
+        `procesar` es la recodificación que el escritor aplica en su hilo antes de guardar.
+        """
+        if self.almacen is not None:
+            nombre_paso, extension = os.path.splitext(os.path.basename(ruta_completa))
+            self.almacen.guardar(os.path.dirname(ruta_completa), nombre_paso, datos,
+                                 extension=extension.lstrip("."), procesar=procesar)
+        else:
+            self.evidencias.escribir(ruta_completa, datos, procesar=procesar)
+
+    #3.1- Función para persistir las capturas retenidas en el buffer circular
+    def persistir_buffer_capturas(self) -> int:
+        """
+        Escribe en disco las capturas retenidas por la política 'buffer-circular'. Se invoca
+        automáticamente al tomar una captura de fallo y desde el fixture `base_page` si el test falla.
+
+        Returns:
+            int: Número de capturas enviadas a disco.
+        """
+        capturas = self.politica_capturas.extraer_buffer()
+        # El buffer solo retiene capturas de pasos exitosos, por lo que comparten su recodificación.
+        procesar = self.politica_capturas.opciones_pasos.procesador()
+        for ruta, datos in capturas:
+            self._persistir_captura(ruta, datos, procesar)
+        if capturas:
+            self.logger.info("\n 📸 %s captura(s) del buffer circular encoladas para guardarse por fallo.", len(capturas))
+        return len(capturas)
+
+    #3.2- Función para finalizar las evidencias pendientes al terminar el test
+    def finalizar_evidencias(self, timeout: Optional[float] = 30.0) -> Dict[str, float]:
+        """
+        Escribe el manifiesto del almacén por contenido (si está activo), espera a que se escriban
+        en disco todas las capturas encoladas y cierra el escritor. Se invoca en el teardown del
+        fixture `base_page`.
+
+        Args:
+            timeout (Optional[float]): Tiempo máximo de espera en segundos. Por defecto, 30.0.
+
+        Returns:
+            Dict[str, float]: Métricas de la cola de evidencias (encoladas, escritas, backpressure, etc.).
+        """
+        if self.almacen is not None:
+            self.almacen.escribir_manifiestos()
+        completado = self.evidencias.cerrar(timeout=timeout)
+        metricas = self.evidencias.metricas()
+        if self.almacen is not None:
+            metricas.update(self.almacen.metricas())
+        if completado:
+            self.logger.info("\n📦 Evidencias escritas en disco. Métricas de la cola: %s", metricas)
+        else:
+            self.logger.warning(f"\n⚠️ No se escribieron todas las evidencias en {timeout}s. Métricas de la cola: {metricas}")
+        return metricas
+
+    #3.3- Función para registrar la duración de una acción en el registro de métricas
+    def registrar_metrica(self, accion: str, duracion: float, medicion: Optional[str] = None,
+                          locator: Optional[Union[str, Locator]] = None) -> None:
+        """
+        Registra una duración en el registro de métricas del proceso, con las etiquetas de
+        acción, locator, navegador y dispositivo. Las métricas se exportan a JSON y CSV al
+        finalizar la sesión.
+
+        Args:
+            accion (str): Nombre de la acción (normalmente, el nombre del método).
+            duracion (float): Duración en segundos.
+            medicion (Optional[str]): Parte de la acción medida (por ejemplo, 'total_operation').
+                                      Si se indica, el temporizador se llama '<accion>.<medicion>'.
+            locator (Optional[Union[str, Locator]]): Elemento sobre el que se actuó.
+        """
+        nombre = f"{accion}.{medicion}" if medicion else accion
+        self.metricas.registrar(nombre, duracion, accion=accion, locator=describir_locator(locator),
+                                navegador=self.etiquetas_metricas.get("navegador"),
+                                dispositivo=self.etiquetas_metricas.get("dispositivo"))
+
     #4- unción basica para tiempo de espera que espera recibir el parametro tiempo
     #En caso de no pasar el tiempo por parametro, el mismo tendra un valor de medio segundo
     def esperar_fijo(self, tiempo=0.5):
         """
-        Espera un tiempo fijo en segundos.
+        Espera un tiempo fijo en segundos, escalado por el `factor_esperas` del perfil de
+        ejecución activo. Con el perfil 'throughput' (factor 0) no se duerme en absoluto.
 
         Args:
             tiempo (Union[int, float]): El tiempo en segundos a esperar. Por defecto, 0.5 segundos.
         """
-        self.logger.debug(f"\n Esperando fijo por {tiempo} segundos...") #
+        self.logger.debug("\n Esperando fijo por %s segundos...", tiempo) #
         try:
-            time.sleep(tiempo) #
-            self.logger.info(f"Espera fija de {tiempo} segundos completada.") #
+            tiempo_efectivo = tiempo * self.perfil.factor_esperas
+            if tiempo_efectivo <= 0:
+                self.logger.debug("Espera fija de %s segundos omitida por el perfil de ejecución '%s'.", tiempo, self.perfil.nombre)
+                return
+            time.sleep(tiempo_efectivo) #
+            self.logger.info("Espera fija de %s segundos completada.", tiempo_efectivo) #
         except TypeError:
             self.logger.error(f"\n ❌ Error: El tiempo de espera debe ser un número. Se recibió: {tiempo}") #
         except Exception as e:
             self.logger.error(f"\n ❌ Ocurrió un error inesperado durante la espera fija: {e}") #
         
+    # Script que resuelve en cuanto el DOM deja de mutar durante 'quietudMs' o al agotarse 'maxMs'.
+    _SCRIPT_DOM_QUIETO = """
+    ([quietudMs, maxMs]) => new Promise(resolve => {
+        let temporizador = null;
+        let limite = null;
+        const observador = new MutationObserver(() => {
+            clearTimeout(temporizador);
+            temporizador = setTimeout(() => terminar(true), quietudMs);
+        });
+        const terminar = (estable) => {
+            observador.disconnect();
+            clearTimeout(temporizador);
+            clearTimeout(limite);
+            resolve(estable);
+        };
+        observador.observe(document, { subtree: true, childList: true, attributes: true, characterData: true });
+        temporizador = setTimeout(() => terminar(true), quietudMs);
+        limite = setTimeout(() => terminar(false), maxMs);
+    })
+    """
+
+    # Script que resuelve cuando terminan las animaciones/transiciones CSS en curso o al agotarse 'maxMs'.
+    _SCRIPT_ANIMACIONES_TERMINADAS = """
+    (maxMs) => {
+        const enCurso = document.getAnimations().filter(a => a.playState === 'running' && a.effect && isFinite(a.effect.getComputedTiming().endTime));
+        if (enCurso.length === 0) return true;
+        const limite = new Promise(resolve => setTimeout(() => resolve(false), maxMs));
+        const terminadas = Promise.all(enCurso.map(a => a.finished.catch(() => null))).then(() => true);
+        return Promise.race([terminadas, limite]);
+    }
+    """
+
+    CONDICIONES_ESTABILIDAD = ("dom", "red", "animaciones", "locator")
+
+    #4.1- Función de espera por condición (settle wait) que sustituye a las esperas fijas tras una acción
+    def esperar_estabilidad(self, tiempo_max: Union[int, float] = 0.5, condicion: str = "dom", locator: Optional[Locator] = None,
+                            estado: str = "visible", ventana_quietud_ms: int = 100) -> bool:
+        """
+        Espera a que la página se "asiente" tras una acción y retorna en cuanto se cumple la condición.
+        A diferencia de `esperar_fijo`, el tiempo indicado es solo el **límite superior**: si la página
+        ya está lista, la espera dura lo mínimo imprescindible.
+
+        Respeta el `factor_esperas` del perfil de ejecución, igual que `esperar_fijo`: el límite y la
+        ventana de quietud se escalan por el factor y, con factor `0` (perfil 'throughput'), las
+        condiciones 'dom', 'red' y 'animaciones' retornan de inmediato, sin viaje al navegador; la
+        sincronización con la acción siguiente queda a cargo de la espera automática de Playwright
+        (actionability). La condición 'locator' nunca se omite ni se acorta, porque espera un
+        estado concreto de la página que el test necesita, y retorna en cuanto se cumple.
+
+        Condiciones disponibles:
+            - 'dom': el DOM no registra mutaciones durante `ventana_quietud_ms`.
+            - 'red': no hay peticiones de red en curso (`networkidle`).
+            - 'animaciones': finalizan las animaciones y transiciones CSS en curso.
+            - 'locator': el `locator` alcanza el `estado` indicado ('visible', 'hidden', 'attached', 'detached').
+
+        Args:
+            tiempo_max (Union[int, float]): Límite superior de la espera en segundos. Por defecto, 0.5.
+            condicion (str): Condición de estabilidad a esperar. Por defecto, 'dom'.
+            locator (Optional[Locator]): Locator requerido cuando `condicion` es 'locator'.
+            estado (str): Estado del locator a esperar. Por defecto, 'visible'.
+            ventana_quietud_ms (int): Milisegundos sin mutaciones para considerar el DOM estable. Por defecto, 100.
+
+        Returns:
+            bool: `True` si la condición se cumplió antes del límite (o si el perfil omite la espera);
+                  `False` si se agotó el tiempo (la espera nunca falla la prueba: es una
+                  sincronización, no una aserción).
+
+        Raises:
+            ValueError: Si la condición no es válida o falta el locator para la condición 'locator'.
+        """
+        if condicion not in self.CONDICIONES_ESTABILIDAD:
+            raise ValueError(f"\nCondición de estabilidad '{condicion}' no válida. Opciones: {self.CONDICIONES_ESTABILIDAD}")
+        if condicion == "locator" and locator is None:
+            raise ValueError("\nLa condición de estabilidad 'locator' requiere un Locator.")
+
+        if condicion != "locator":
+            factor = self.perfil.factor_esperas
+            if factor <= 0:
+                self.logger.debug("Espera de estabilidad ('%s') omitida por el perfil '%s'.", condicion, self.perfil.nombre)
+                return True
+            tiempo_max = tiempo_max * factor
+            ventana_quietud_ms = max(int(ventana_quietud_ms * factor), 1)
+
+        tiempo_max_ms = max(int(tiempo_max * 1000), 1)
+        start_time_settle = time.perf_counter()
+        estable = False
+        try:
+            if condicion == "dom":
+                estable = bool(self.page.evaluate(self._SCRIPT_DOM_QUIETO, [min(ventana_quietud_ms, tiempo_max_ms), tiempo_max_ms]))
+            elif condicion == "red":
+                self.page.wait_for_load_state("networkidle", timeout=tiempo_max_ms)
+                estable = True
+            elif condicion == "animaciones":
+                estable = bool(self.page.evaluate(self._SCRIPT_ANIMACIONES_TERMINADAS, tiempo_max_ms))
+            else:
+                locator.wait_for(state=estado, timeout=tiempo_max_ms)
+                estable = True
+        except TimeoutError:
+            estable = False
+        except Error as e:
+            # Una navegación en curso puede destruir el contexto de ejecución del script; no es un fallo.
+            self.logger.debug("\n Espera de estabilidad '%s' interrumpida por Playwright: %s", condicion, e)
+            estable = False
+
+        duration_settle = time.perf_counter() - start_time_settle
+        if estable:
+            self.logger.debug("Página estable ('%s') en %.4f segundos (límite: %ss).", condicion, duration_settle, tiempo_max)
+        else:
+            self.logger.debug("Límite de %ss alcanzado esperando estabilidad ('%s') tras %.4f segundos.", tiempo_max, condicion, duration_settle)
+        return estable
+
+    #4.2- Función para resaltar un elemento según el perfil de ejecución
+    def resaltar_elemento(self, locator: Locator) -> None:
+        """
+        Resalta visualmente un elemento solo si el perfil de ejecución activo lo permite.
+        En el perfil 'throughput' se evita la llamada a `highlight()` y su viaje al navegador.
+
+        Args:
+            locator (Locator): El elemento a resaltar.
+        """
+        if self.perfil.resaltar:
+            locator.highlight()
+
     #5- Función para indicar el tiempo que se tardará en hacer el scroll
     def scroll_pagina(self, horz, vert, tiempo: Union[int, float] = 0.5):
         """
@@ -122,20 +448,21 @@ class BasePage:
         Args:
             horz (int): Cantidad de scroll horizontal. Por defecto, 0.
             vert (int): Cantidad de scroll vertical. Por defecto, 0.
-            tiempo (Union[int, float]): Tiempo de espera después del scroll en segundos. Por defecto, 0.5.
+            tiempo (Union[int, float]): Tiempo máximo de espera de estabilidad después del scroll en segundos. Por defecto, 0.5.
         """
-        self.logger.debug(f"Realizando scroll - Horizontal: {horz}, Vertical: {vert}. Espera: {tiempo} segundos.") #
+        self.logger.debug("Realizando scroll - Horizontal: %s, Vertical: %s. Espera: %s segundos.", horz, vert, tiempo) #
         try:
             # --- Medición de rendimiento: Inicio de la acción de scroll ---
-            start_time_scroll_action = time.time()
+            start_time_scroll_action = time.perf_counter()
             self.page.mouse.wheel(horz, vert)
             # --- Medición de rendimiento: Fin de la acción de scroll ---
-            end_time_scroll_action = time.time()
+            end_time_scroll_action = time.perf_counter()
             duration_scroll_action = end_time_scroll_action - start_time_scroll_action
-            self.logger.info(f"PERFORMANCE: Duración de la acción de scroll (Playwright API): {duration_scroll_action:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Duración de la acción de scroll (Playwright API): %.4f segundos.", duration_scroll_action)
+            self.registrar_metrica("scroll_pagina", duration_scroll_action, medicion="scroll_action")
             
-            self.esperar_fijo(tiempo) # Reutiliza la función esperar_fijo para el log y manejo de errores
-            self.logger.info(f"Scroll completado (H: {horz}, V: {vert}).") #
+            self.esperar_estabilidad(tiempo) # Espera a que el DOM se asiente tras el scroll ('tiempo' como máximo)
+            self.logger.info("Scroll completado (H: %s, V: %s).", horz, vert) #
         except Exception as e:
             self.logger.error(f"❌ Error al realizar scroll en la página: {e}") #
     
@@ -155,10 +482,10 @@ class BasePage:
                                         Un valor más alto simula un deslizamiento más lento.
         """
         nombre_paso = f"Desplazamiento táctil (Swipe) vertical: {vert} píxeles"
-        self.logger.info(f"\n--- {nombre_paso} ---")
+        self.logger.info("\n--- %s ---", nombre_paso)
 
         # --- Medición de rendimiento: Inicio de la acción de scroll táctil ---
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Define un punto fijo en la pantalla para el inicio y el fin del gesto.
         # Se usa 500 como punto de referencia para el ancho (centro) y se ajusta la altura.
@@ -170,7 +497,7 @@ class BasePage:
         start_y = 500
         end_y = 500 + vert
         
-        self.logger.debug(f"\n Simulando swipe desde ({start_x}, {start_y}) a ({start_x}, {end_y})")
+        self.logger.debug("\n Simulando swipe desde (%s, %s) a (%s, %s)", start_x, start_y, start_x, end_y)
 
         try:
             # 1. Toca la pantalla en el punto de inicio.
@@ -186,9 +513,9 @@ class BasePage:
             time.sleep(tiempo_deslizamiento_ms / 1000)
 
             # --- Medición de rendimiento: Fin de la acción ---
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
-            self.logger.info(f"\n✅ ÉXITO: Desplazamiento táctil completado en {duration:.4f} segundos.")
+            self.logger.info("\n✅ ÉXITO: Desplazamiento táctil completado en %.4f segundos.", duration)
             
         except Error as e:
             error_msg = (
@@ -196,7 +523,7 @@ class BasePage:
                 f"\nDetalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_scroll_tactil_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_scroll_tactil_playwright", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
         
         except Exception as e:
@@ -205,7 +532,7 @@ class BasePage:
                 f"\nDetalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_scroll_tactil_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_scroll_tactil_inesperado", directorio, es_fallo=True)
             raise AssertionError(error_msg) from e
         
     # --- Manejadores y funciones para Alertas y Confirmaciones ---
@@ -240,15 +567,15 @@ class BasePage:
             Función callback interna que se ejecuta cuando Playwright detecta un diálogo (alerta, confirmación, etc.).
             """
             # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
-            self.logger.info(f"\n--- [LISTENER START] Procesando diálogo tipo: '{dialog.type}'. ---")
+            start_time_handler_execution = time.perf_counter()
+            self.logger.info("\n--- [LISTENER START] Procesando diálogo tipo: '%s'. ---", dialog.type)
 
             try:
                 self._alerta_detectada = True
                 self._alerta_mensaje_capturado = dialog.message
                 self._alerta_tipo_capturado = dialog.type
                 
-                self.logger.info(f"\n--> [LISTENER ON - Simple Alert] Alerta detectada: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
+                self.logger.info("\n--> [LISTENER ON - Simple Alert] Alerta detectada: Tipo='%s', Mensaje='%s'", dialog.type, dialog.message)
                 
                 # Aceptamos el diálogo. Esto simula hacer clic en "Aceptar" o "OK".
                 # Para un 'prompt', puedes pasar un texto: dialog.accept("texto de respuesta")
@@ -261,9 +588,10 @@ class BasePage:
                 self.logger.error(f"\n❌ ERROR en el handler de alerta para '{dialog.type}' (Mensaje: '{dialog.message}'). Detalles: {e}", exc_info=True)
             finally:
                 # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
+                end_time_handler_execution = time.perf_counter()
                 duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de alerta: {duration_handler_execution:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de ejecución del handler de alerta: %.4f segundos.", duration_handler_execution)
+                self.registrar_metrica("_get_simple_alert_handler_for_on", duration_handler_execution, medicion="handler_execution")
                 self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
@@ -304,15 +632,15 @@ class BasePage:
             (especialmente 'confirm' o 'prompt').
             """
             # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
-            self.logger.info(f"\n--- [LISTENER START] Procesando diálogo de confirmación tipo: '{dialog.type}'. ---")
+            start_time_handler_execution = time.perf_counter()
+            self.logger.info("\n--- [LISTENER START] Procesando diálogo de confirmación tipo: '%s'. ---", dialog.type)
 
             try:
                 self._alerta_detectada = True
                 self._alerta_mensaje_capturado = dialog.message
                 self._alerta_tipo_capturado = dialog.type
                 
-                self.logger.info(f"\n--> [LISTENER ON - Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'")
+                self.logger.info("\n--> [LISTENER ON - Dinámico] Diálogo detectado: Tipo='%s', Mensaje='%s'", dialog.type, dialog.message)
                 
                 if accion == 'accept':
                     # Acepta el diálogo (equivalente a hacer clic en "OK" o "Aceptar").
@@ -335,9 +663,10 @@ class BasePage:
                 self.logger.error(f"\n❌ ERROR en el handler de diálogo para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}'). Detalles: {e}", exc_info=True)
             finally:
                 # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
+                end_time_handler_execution = time.perf_counter()
                 duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de diálogo de confirmación: {duration_handler_execution:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de ejecución del handler de diálogo de confirmación: %.4f segundos.", duration_handler_execution)
+                self.registrar_metrica("_get_confirmation_dialog_handler_for_on", duration_handler_execution, medicion="handler_execution")
                 self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
@@ -382,8 +711,8 @@ class BasePage:
             (especialmente de tipo 'prompt').
             """
             # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-            start_time_handler_execution = time.time()
-            self.logger.info(f"\n--- [LISTENER START] Procesando diálogo de prompt tipo: '{dialog.type}'. ---")
+            start_time_handler_execution = time.perf_counter()
+            self.logger.info("\n--- [LISTENER START] Procesando diálogo de prompt tipo: '%s'. ---", dialog.type)
 
             try:
                 self._alerta_detectada = True
@@ -391,13 +720,13 @@ class BasePage:
                 self._alerta_tipo_capturado = dialog.type
                 self._alerta_input_capturado = input_text # Almacena el texto que se intentó introducir
 
-                self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Diálogo detectado: Tipo='{dialog.type}', Mensaje='{dialog.message}'.")
+                self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Diálogo detectado: Tipo='%s', Mensaje='%s'.", dialog.type, dialog.message)
                 
                 if accion == 'accept':
                     if dialog.type == "prompt":
                         # Acepta el prompt e introduce el texto proporcionado.
                         dialog.accept(input_text)
-                        self.logger.info(f"\n--> [LISTENER ON - Prompt Dinámico] Texto '{input_text}' introducido y prompt ACEPTADO.")
+                        self.logger.info("\n--> [LISTENER ON - Prompt Dinámico] Texto '%s' introducido y prompt ACEPTADO.", input_text)
                     else:
                         # Si no es un prompt pero se especificó 'accept', lo acepta sin texto.
                         self.logger.warning(f"\n--> [LISTENER ON - Prompt Dinámico] Se solicitó 'accept' con texto para un diálogo no-prompt ('{dialog.type}'). Aceptando sin texto.")
@@ -421,9 +750,10 @@ class BasePage:
                 self.logger.error(f"\n❌ ERROR en el handler de prompt para '{dialog.type}' (Mensaje: '{dialog.message}', Acción: '{accion}', Texto: '{input_text}'). Detalles: {e}", exc_info=True)
             finally:
                 # --- Medición de rendimiento: Fin de la ejecución del handler ---
-                end_time_handler_execution = time.time()
+                end_time_handler_execution = time.perf_counter()
                 duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-                self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de diálogo de prompt: {duration_handler_execution:.4f} segundos.")
+                self.logger.info("PERFORMANCE: Tiempo de ejecución del handler de diálogo de prompt: %.4f segundos.", duration_handler_execution)
+                self.registrar_metrica("_get_prompt_dialog_handler_for_on", duration_handler_execution, medicion="handler_execution")
                 self.logger.info("\n--- [LISTENER END] Diálogo procesado. ---")
 
         return handler
@@ -449,7 +779,7 @@ class BasePage:
                          Este es proporcionado automáticamente por Playwright cuando se dispara el evento.
         """
         # --- Medición de rendimiento: Inicio de la ejecución del handler ---
-        start_time_handler_execution = time.time()
+        start_time_handler_execution = time.perf_counter()
         self.logger.info("\n--- [LISTENER START] Procesando evento de nueva página. ---")
 
         try:
@@ -462,7 +792,7 @@ class BasePage:
             self._popup_title_capturado = page.title() 
             self._all_new_pages_opened_by_click.append(page) # Añadir la nueva página a la lista
 
-            self.logger.info(f"\n🌐 Nueva página (popup/pestaña) detectada. URL: '{page.url}', Título: '{page.title()}'")
+            self.logger.info("\n🌐 Nueva página (popup/pestaña) detectada. URL: '%s', Título: '%s'", page.url, page.title())
             # Opcional: Si solo te interesa la primera popup o una específica, podrías manejarlo aquí.
             # Por ahora, solo la añadimos a la lista para seguimiento.
 
@@ -471,9 +801,10 @@ class BasePage:
             self.logger.error(f"\n❌ ERROR en el handler de nueva página. Detalles: {e}", exc_info=True)
         finally:
             # --- Medición de rendimiento: Fin de la ejecución del handler ---
-            end_time_handler_execution = time.time()
+            end_time_handler_execution = time.perf_counter()
             duration_handler_execution = end_time_handler_execution - start_time_handler_execution
-            self.logger.info(f"PERFORMANCE: Tiempo de ejecución del handler de nueva página: {duration_handler_execution:.4f} segundos.")
+            self.logger.info("PERFORMANCE: Tiempo de ejecución del handler de nueva página: %.4f segundos.", duration_handler_execution)
+            self.registrar_metrica("_on_new_page", duration_handler_execution, medicion="handler_execution")
             self.logger.info("\n--- [LISTENER END] Evento de nueva página procesado. ---")
         
     
\ No newline at end of file
@@ -8,9 +8,138 @@ from datetime import datetime
 import os
 from typing import Generator
 from src.utils import config
+from src.utils.config import BASELINE_RENDIMIENTO, PERF_UMBRAL_ABSOLUTO
 #from src.utils.config import BASE_URL
 from src.pages.base_page import BasePage
 from src.locator.locator_obstaculoPantalla import ObstaculosLocators
+from src.utils.pool_navegadores import PoolNavegadores
+from src.utils.perfiles_ejecucion import PERFILES, MODOS_RETENCION_TRAZAS, establecer_perfil_activo, obtener_perfil_activo
+from src.utils.politica_capturas import POLITICAS_CAPTURAS, establecer_politica_activa
+from src.utils.logger import detener_logging
+from src.utils.metricas import obtener_registro_metricas
+from src.utils.regresion_rendimiento import MODOS_REGRESION_RENDIMIENTO, PluginRegresionRendimiento
+
+def pytest_addoption(parser):
+    """
+    Registra las opciones de línea de comandos para seleccionar el perfil de ejecución,
+    el modo de retención de trazas y videos y la política de capturas.
+    """
+    parser.addoption(
+        "--perfil-ejecucion",
+        action="store",
+        default=None,
+        choices=list(PERFILES),
+        help="Perfil de ejecución: demo, debug o throughput. Por defecto, la variable de entorno PERFIL_EJECUCION o 'demo'."
+    )
+    parser.addoption(
+        "--retencion-trazas",
+        action="store",
+        default=None,
+        choices=list(MODOS_RETENCION_TRAZAS),
+        help="Retención de trazas y videos: on, retain-on-failure u off. Por defecto, RETENCION_TRAZAS o la del perfil activo."
+    )
+    parser.addoption(
+        "--politica-capturas",
+        action="store",
+        default=None,
+        choices=list(POLITICAS_CAPTURAS),
+        help="Política de capturas: siempre, solo-fallos, cada-n o buffer-circular. Por defecto, POLITICA_CAPTURAS o la del perfil activo."
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store_true",
+        default=False,
+        help="Escribe el p95 de cada paso de esta ejecución como línea base de rendimiento (BASELINE_RENDIMIENTO)."
+    )
+    parser.addoption(
+        "--perf-modo",
+        action="store",
+        default="warn",
+        choices=list(MODOS_REGRESION_RENDIMIENTO),
+        help="Qué hacer si el p95 de un paso supera la línea base: warn (informar), fail (fallar la sesión) u off."
+    )
+    parser.addoption(
+        "--perf-umbral",
+        action="store",
+        type=float,
+        default=config.PERF_UMBRAL,
+        help="Aumento relativo del p95 respecto a la línea base que se considera regresión (0.20 = 20 %%)."
+    )
+
+def pytest_configure(config):
+    """
+    Activa el perfil de ejecución y la política de capturas indicados por línea de comandos (si los hay)
+    y registra el plugin de regresión de rendimiento (línea base y comparación del p95 por paso).
+    Se ejecuta también en cada worker de pytest-xdist, que recibe las mismas opciones.
+    """
+    perfil = config.getoption("--perfil-ejecucion")
+    if perfil:
+        establecer_perfil_activo(perfil)
+    politica = config.getoption("--politica-capturas")
+    if politica:
+        establecer_politica_activa(politica)
+    config.pluginmanager.register(
+        PluginRegresionRendimiento(
+            ruta_baseline=BASELINE_RENDIMIENTO,
+            escribir=config.getoption("--perf-baseline"),
+            modo=config.getoption("--perf-modo"),
+            umbral=config.getoption("--perf-umbral"),
+            umbral_absoluto=PERF_UMBRAL_ABSOLUTO,
+        ),
+        "regresion_rendimiento",
+    )
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Exporta el registro de métricas de tiempo de las acciones a JSON y CSV en METRICAS_DIR.
+    Con pytest-xdist cada worker exporta su propio par de archivos, sufijado con su identificador.
+    """
+    registro = obtener_registro_metricas()
+    if not registro.series():
+        return
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    nombre = f"metricas_{timestamp}_{worker}" if worker else f"metricas_{timestamp}"
+    ruta_json = registro.exportar_json(os.path.join(config.METRICAS_DIR, f"{nombre}.json"))
+    registro.exportar_csv(os.path.join(config.METRICAS_DIR, f"{nombre}.csv"))
+    print(f"\nMétricas de tiempo exportadas en: {ruta_json}")
+
+def pytest_unconfigure(config):
+    """
+    Detiene el hilo del logger compartido al terminar la sesión (o el worker de xdist),
+    garantizando que los registros encolados se escriban antes de salir.
+    """
+    detener_logging()
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Guarda el reporte de cada fase (setup, call, teardown) en el item como 'rep_<fase>'
+    para que los fixtures puedan consultar en su teardown si el test falló.
+    """
+    outcome = yield
+    reporte = outcome.get_result()
+    setattr(item, f"rep_{reporte.when}", reporte)
+
+def _test_fallo(request) -> bool:
+    """
+    Indica si el test asociado a 'request' falló en la fase de setup o de ejecución.
+    """
+    for fase in ("rep_setup", "rep_call"):
+        reporte = getattr(request.node, fase, None)
+        if reporte is not None and reporte.failed:
+            return True
+    return False
+
+def _obtener_retencion_trazas(request) -> str:
+    """
+    Resuelve el modo de retención de trazas y videos: línea de comandos, variable de
+    entorno RETENCION_TRAZAS o, en su defecto, el del perfil de ejecución activo.
+    """
+    modo = request.config.getoption("--retencion-trazas") or config.RETENCION_TRAZAS or obtener_perfil_activo().retencion_trazas
+    if modo not in MODOS_RETENCION_TRAZAS:
+        raise ValueError(f"\nModo de retención de trazas '{modo}' no válido. Opciones: {MODOS_RETENCION_TRAZAS}")
+    return modo
 
 # Función para generar IDs legibles
 def generar_ids_browser(param):
@@ -26,6 +155,20 @@ def generar_ids_browser(param):
     else:
         return f"{browser}-{resolution['width']}x{resolution['height']}"
 
+@pytest.fixture(scope="session")
+def pool_navegadores(playwright: Playwright) -> Generator[PoolNavegadores, None, None]:
+    """
+    Fixture de sesión que mantiene un navegador por motor en cada worker de pytest-xdist.
+    Los tests reciben un contexto nuevo sobre el navegador compartido en lugar de lanzar
+    un proceso de navegador propio. Al finalizar la sesión imprime los lanzamientos y hits del pool.
+    """
+    perfil = obtener_perfil_activo()
+    print(f"\nPerfil de ejecución activo: {perfil}")
+    pool = PoolNavegadores(playwright, headless=True, slow_mo=perfil.slow_mo)
+    yield pool
+    print(f"\n{pool.resumen()}")
+    pool.cerrar()
+
 @pytest.fixture(
     scope="function",
     params=[
@@ -40,35 +183,40 @@ def generar_ids_browser(param):
     ],
     ids=generar_ids_browser # <--- Usar la función para generar IDs
 )
-def playwright_page(playwright: Playwright, request) -> Generator[Page, None, None]:
+def playwright_page(playwright: Playwright, pool_navegadores: PoolNavegadores, request) -> Generator[Page, None, None]:
     """
-    Fixture base para configurar el navegador, contexto y página de Playwright con configuraciones comunes.
-    Maneja el lanzamiento del navegador, la creación del contexto (con grabación de video y emulación de dispositivos),
-    el rastreo (tracing) y la navegación de la página a una URL específica. También renombra el archivo de video al finalizar.
+    Fixture base para configurar el contexto y la página de Playwright con configuraciones comunes.
+    Obtiene el navegador del pool de la sesión (un proceso por motor y worker), crea un contexto
+    nuevo por test (con grabación de video y emulación de dispositivos), gestiona el rastreo (tracing)
+    y renombra el archivo de video al finalizar.
+
+    La retención de trazas y videos depende del modo resuelto por `_obtener_retencion_trazas`:
+    con 'retain-on-failure' la traza de un test exitoso se descarta sin escribir el .zip y su video
+    se elimina; con 'off' no se inicia el rastreo ni se graba video.
     """
     param = request.param
     browser_type = param["browser"]
     resolution = param["resolution"]
     device_name = param["device"]
 
-    browser_instance = None
+    retencion = _obtener_retencion_trazas(request)
+    grabar = retencion != "off"
+
     context = None
     page = None
+    trace_path = None
+    tracing_iniciado = False
 
     try:
-        if browser_type == "chromium":
-            browser_instance = playwright.chromium.launch(headless=True, slow_mo=500)
-        elif browser_type == "firefox":
-            browser_instance = playwright.firefox.launch(headless=True, slow_mo=500)
-        elif browser_type == "webkit":
-            browser_instance = playwright.webkit.launch(headless=True, slow_mo=500)
-        else:
-            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
+        # El navegador se reutiliza entre tests; solo el contexto es exclusivo de cada test.
+        browser_instance = pool_navegadores.obtener_navegador(browser_type)
 
-        context_options = {
-            "record_video_dir": config.VIDEO_DIR,
-            "record_video_size": {"width": 1920, "height": 1080}
-        }
+        context_options = {}
+        if grabar:
+            context_options = {
+                "record_video_dir": config.VIDEO_DIR,
+                "record_video_size": {"width": 1920, "height": 1080}
+            }
 
         if device_name:
             device = playwright.devices[device_name]
@@ -90,19 +238,27 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
         trace_file_name = f"traceview_{current_time}_{browser_type}_{trace_name_suffix}.zip"
         trace_path = os.path.join(config.TRACEVIEW_DIR, trace_file_name)
 
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        if grabar:
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+            tracing_iniciado = True
 
         yield page
 
     finally:
+        conservar_evidencias = retencion == "on" or (retencion == "retain-on-failure" and _test_fallo(request))
+
         if context:
-            context.tracing.stop(path=trace_path)
+            if tracing_iniciado:
+                # Sin 'path' Playwright descarta la traza en lugar de escribir el .zip en disco.
+                context.tracing.stop(path=trace_path if conservar_evidencias else None)
             context.close()
             
-        if browser_instance:
-            browser_instance.close()
-            
-        if page and page.video:
+        if page and page.video and not conservar_evidencias:
+            try:
+                page.video.delete()
+            except Exception as e:
+                print(f"\nError al descartar el video del test exitoso: {e}")
+        elif page and page.video:
             video_path = page.video.path()
             new_video_name = datetime.now().strftime("%Y%m%d-%H%M%S") + ".webm"
             new_video_path = os.path.join(config.VIDEO_DIR, new_video_name)
@@ -114,13 +270,26 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
                 
 # --- Fixture principal de la arquitectura ---
 @pytest.fixture(scope="function")
-def base_page(playwright_page: Page) -> BasePage:
+def base_page(playwright_page: Page, request) -> Generator[BasePage, None, None]:
     """
     Fixture que inicializa la clase BasePage con el objeto 'page' de Playwright.
     Esto proporciona acceso a todas las clases de acciones (elementos, tablas, etc.)
-    en cada test que lo requiera.
+    en cada test que lo requiera. Etiqueta las métricas de tiempo con el navegador y el
+    dispositivo del test. Al finalizar el test persiste el buffer circular de
+    capturas si el test falló y vacía la cola de capturas pendientes.
     """
-    return BasePage(playwright_page)
+    param = request.node.callspec.params.get("playwright_page", {}) if hasattr(request.node, "callspec") else {}
+    etiquetas_metricas = {
+        "navegador": param.get("browser"),
+        "dispositivo": param.get("device") or (f"{param['resolution']['width']}x{param['resolution']['height']}" if param.get("resolution") else None),
+    }
+    # El nodeid (módulo::test[parámetros]) distingue tests homónimos de distintos módulos en los manifiestos de capturas.
+    instancia = BasePage(playwright_page, nombre_test=request.node.name, etiquetas_metricas=etiquetas_metricas,
+                         id_test=request.node.nodeid)
+    yield instancia
+    if _test_fallo(request):
+        instancia.persistir_buffer_capturas()
+    instancia.finalizar_evidencias()
 
 # --- Ejemplo de nuevos fixtures de pre-condición ---
 @pytest.fixture
@@ -41,24 +41,27 @@ def test_validar_elementos_en_home(set_up_Home: BasePage) -> None:
     base_page = set_up_Home
      # ¡Correcto! Ahora se accede al localizador a través de la instancia de la página
     # que ya contiene la instancia de HomeLocatorsPage.
-    base_page.element.validar_elemento_visible(base_page.home.nombreHome, "validar_nombreHome_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.campoUsername, "validar_campoUsername_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.home.campoUsername, "verificar_campoUsername_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.campoPassword, "validar_campoPassword_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.home.campoPassword, "verificar_campoPassword_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.botonLogin, "validar_botonLogin_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.botonRegistrarse, "validar_botonRegistrarse_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.nombreBannerCentral, "validar_nombreBannerCentral_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.imagenBannerCentral, "validar_imagenBannerCentral_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.contenedoresDeOpcionesPopularMake, "validar_contenedoresDeOpcionesPopularMake_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.nombreDivPopularMake, "validar_nombreDivPopularMake_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.imagenDivPopularMake, "validar_imagenDivPopularMake_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.contenedoresDeOpcionesModel, "validar_contenedoresDeOpcionesModel_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.nombreDivPopularModel, "validar_nombreDivPopularModel_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.imagenDivPopularModel, "validar_imagenDivPopularModel_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.contenedoresDeOpcionesOverallRating, "validar_contenedoresDeOpcionesOverallRating_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.nombreDivOverallRating, "validar_nombreDivOverallRating_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.home.imagenDivOverallRating, "validar_imagenDivOverallRating_visible", config.SCREENSHOT_DIR)
+    # Todos los elementos se validan juntos, bajo un único plazo y con una sola captura.
+    base_page.element.validar_elementos_visibles([
+        base_page.home.nombreHome,
+        base_page.home.campoUsername,
+        (base_page.home.campoUsername, "vacio"),
+        base_page.home.campoPassword,
+        (base_page.home.campoPassword, "vacio"),
+        base_page.home.botonLogin,
+        base_page.home.botonRegistrarse,
+        base_page.home.nombreBannerCentral,
+        base_page.home.imagenBannerCentral,
+        base_page.home.contenedoresDeOpcionesPopularMake,
+        base_page.home.nombreDivPopularMake,
+        base_page.home.imagenDivPopularMake,
+        base_page.home.contenedoresDeOpcionesModel,
+        base_page.home.nombreDivPopularModel,
+        base_page.home.imagenDivPopularModel,
+        base_page.home.contenedoresDeOpcionesOverallRating,
+        base_page.home.nombreDivOverallRating,
+        base_page.home.imagenDivOverallRating,
+    ], "validar_elementos_home", config.SCREENSHOT_DIR)
     
 def test_redireccionamiento_contenedor_popular_make(set_up_Home: BasePage) -> None:
     """
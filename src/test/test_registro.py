@@ -60,33 +60,30 @@ def test_validar_elementos_en_registro(set_up_Registrar: BasePage) -> None:
     base_page.element.verificar_texto_contenido(base_page.registro.labelPassword, "Password", "validar_texto_labelPassword", config.SCREENSHOT_DIR)
     base_page.element.verificar_texto_contenido(base_page.registro.labelConfirmPassword, "Confirm Password", "validar_texto_labelConfirmPassword", config.SCREENSHOT_DIR)
 
-    # 2. Visibilidad y estado inicial de los campos de entrada
-    # Se valida que los campos estén visibles y vacíos al inicio.
-    base_page.element.validar_elemento_visible(base_page.registro.campoUserName, "validar_campoUserName_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.registro.campoUserName, "verificar_campoUserName_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_no_visible(base_page.registro.mensajeUserNameVacio, "validar_mensajeUserNameVacio_no_visible", config.SCREENSHOT_DIR)
-    
-    base_page.element.validar_elemento_visible(base_page.registro.campoNombre, "validar_campoNombre_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.registro.campoNombre, "verificar_campoNombre_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_no_visible(base_page.registro.mensajeNombreVacio, "validar_mensajeNombreVacio_no_visible", config.SCREENSHOT_DIR)
-
-    base_page.element.validar_elemento_visible(base_page.registro.campoApellido, "validar_campoApellido_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.registro.campoApellido, "verificar_campoApellido_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_no_visible(base_page.registro.mensajeApellidoVacio, "validar_mensajeApellidoVacio_no_visible", config.SCREENSHOT_DIR)
-
-    base_page.element.validar_elemento_visible(base_page.registro.campoPassword, "validar_campoPassword_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.registro.campoPassword, "verificar_campoPassword_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_no_visible(base_page.registro.mensajePasswordVacio, "validar_mensajePasswordVacio_no_visible", config.SCREENSHOT_DIR)
-    
-    base_page.element.validar_elemento_visible(base_page.registro.campoConfirmPassword, "validar_campoConfirmPassword_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_vacio(base_page.registro.campoConfirmPassword, "verificar_campoConfirmPassword_vacío", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_no_visible(base_page.registro.mensajeConfirmPasswordVacio, "validar_mensajeConfirmPasswordVacio_no_visible", config.SCREENSHOT_DIR)
-    
-    # 3. Estado inicial de los botones
-    base_page.element.validar_elemento_visible(base_page.registro.botonRegistrar, "validar_botónRegistrar_visible", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_desactivado(base_page.registro.botonRegistrar, "verificar_botonRegistrar_desactivado", config.SCREENSHOT_DIR)
-    base_page.element.validar_elemento_visible(base_page.registro.botonCancelar, "validar_botóCancelar_visible", config.SCREENSHOT_DIR)
-    base_page.element.verificar_elemento_habilitado(base_page.registro.botonCancelar, "verificar_botonCancelar_habilitado", config.SCREENSHOT_DIR)
+    # 2. Visibilidad y estado inicial de los campos de entrada y de los botones.
+    # Se valida que los campos estén visibles y vacíos al inicio, sin mensajes de error,
+    # con el botón 'Register' deshabilitado y 'Cancel' habilitado; todo bajo un único plazo.
+    base_page.element.validar_elementos_visibles([
+        base_page.registro.campoUserName,
+        (base_page.registro.campoUserName, "vacio"),
+        (base_page.registro.mensajeUserNameVacio, "oculto"),
+        base_page.registro.campoNombre,
+        (base_page.registro.campoNombre, "vacio"),
+        (base_page.registro.mensajeNombreVacio, "oculto"),
+        base_page.registro.campoApellido,
+        (base_page.registro.campoApellido, "vacio"),
+        (base_page.registro.mensajeApellidoVacio, "oculto"),
+        base_page.registro.campoPassword,
+        (base_page.registro.campoPassword, "vacio"),
+        (base_page.registro.mensajePasswordVacio, "oculto"),
+        base_page.registro.campoConfirmPassword,
+        (base_page.registro.campoConfirmPassword, "vacio"),
+        (base_page.registro.mensajeConfirmPasswordVacio, "oculto"),
+        base_page.registro.botonRegistrar,
+        (base_page.registro.botonRegistrar, "deshabilitado"),
+        base_page.registro.botonCancelar,
+        (base_page.registro.botonCancelar, "habilitado"),
+    ], "validar_elementos_registro", config.SCREENSHOT_DIR)
     
 def test_validar_mensajes_campos_vacios(set_up_Registrar: BasePage) -> None:
     """
@@ -463,11 +460,14 @@ def test_registro_usuario_exitosamente(set_up_Registrar: BasePage) -> None:
     datos_usuario = generador_datos.generar_usuario_aleatorio()
     
     # 1. Rellena el formulario con datos que no cumplen los requisitos del nombre de usuario.
-    base_page.element.rellenar_campo_de_texto(base_page.registro.campoUserName, datos_usuario["username"], "rellenar_campoUserName", config.SCREENSHOT_DIR)
-    base_page.element.rellenar_campo_de_texto(base_page.registro.campoNombre, datos_usuario["first_name"], "rellenar_campoNombre", config.SCREENSHOT_DIR)
-    base_page.element.rellenar_campo_de_texto(base_page.registro.campoApellido, datos_usuario["last_name"], "rellenar_campoApellido", config.SCREENSHOT_DIR)
-    base_page.element.rellenar_campo_de_texto(base_page.registro.campoPassword, datos_usuario["password"], "rellenar_campoPassword", config.SCREENSHOT_DIR)
-    base_page.element.rellenar_campo_de_texto(base_page.registro.campoConfirmPassword, datos_usuario["confirm_password"], "rellenar_campoConfirmPassword", config.SCREENSHOT_DIR) 
+    #    Todos los campos se rellenan en una sola pasada y se verifican con una única llamada al navegador.
+    base_page.element.llenar_formulario({
+        base_page.registro.campoUserName: datos_usuario["username"],
+        base_page.registro.campoNombre: datos_usuario["first_name"],
+        base_page.registro.campoApellido: datos_usuario["last_name"],
+        base_page.registro.campoPassword: datos_usuario["password"],
+        base_page.registro.campoConfirmPassword: datos_usuario["confirm_password"],
+    }, "rellenar_formulario_registro", config.SCREENSHOT_DIR)
     
     # 2. Hace clic en el botón 'Register' para intentar completar el registro.
     base_page.element.hacer_clic_en_elemento(base_page.registro.botonRegistrar, "Clic_botonRegistrar", config.SCREENSHOT_DIR)
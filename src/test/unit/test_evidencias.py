@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+
+import pytest
+
+from src.utils import formato_capturas
+from src.utils.almacen_evidencias import AlmacenEvidencias
+from src.utils.escritor_evidencias import EscritorEvidencias
+from src.utils.formato_capturas import OpcionesCaptura
+from src.utils.politica_capturas import BUFFER, GUARDAR, OMITIR, PoliticaCapturas
+
+
+@pytest.fixture
+def escritor():
+    escritor = EscritorEvidencias(max_workers=1)
+    yield escritor
+    escritor.cerrar()
+
+
+# --- AlmacenEvidencias ---
+
+def test_almacen_deduplica_capturas_identicas(escritor, tmp_path) -> None:
+    """
+    Una captura idéntica se registra en el manifiesto pero no se vuelve a escribir.
+    """
+    almacen = AlmacenEvidencias(escritor, "src/test/test_home.py::test_ingresar_a_home[chromium]")
+    directorio = str(tmp_path)
+
+    ruta_1 = almacen.guardar(directorio, "antes_clic", b"captura")
+    escritor.vaciar()
+    ruta_2 = almacen.guardar(directorio, "despues_clic", b"captura")
+    almacen.guardar(directorio, "otra", b"distinta")
+    escritor.vaciar()
+
+    assert ruta_1 == ruta_2 and os.path.exists(ruta_1)
+    assert almacen.metricas() == {"capturas_unicas": 2, "capturas_duplicadas": 1, "bytes_ahorrados": len(b"captura")}
+
+    [ruta_manifiesto] = almacen.escribir_manifiestos()
+    assert os.path.basename(ruta_manifiesto) == "src_test_test_home.py__test_ingresar_a_home_chromium_.json"
+    with open(ruta_manifiesto, encoding="utf-8") as archivo:
+        manifiesto = json.load(archivo)
+    assert [captura["paso"] for captura in manifiesto["capturas"]] == ["antes_clic", "despues_clic", "otra"]
+    assert manifiesto["capturas"][0]["hash"] == manifiesto["capturas"][1]["hash"]
+
+
+def test_almacen_escribe_la_misma_captura_en_otro_formato(escritor, tmp_path) -> None:
+    """
+    La deduplicación es por ruta del objeto: la misma captura en otro formato sí se escribe.
+    """
+    almacen = AlmacenEvidencias(escritor, "formatos")
+
+    ruta_png = almacen.guardar(str(tmp_path), "paso", b"captura")
+    ruta_webp = almacen.guardar(str(tmp_path), "paso", b"captura", extension="webp")
+    escritor.vaciar()
+
+    assert ruta_png != ruta_webp
+    assert os.path.exists(ruta_png) and os.path.exists(ruta_webp)
+    assert almacen.metricas()["capturas_duplicadas"] == 0
+
+
+def test_almacen_reintenta_una_escritura_fallida(escritor, tmp_path) -> None:
+    """
+    Si la escritura de un objeto falla, la siguiente captura con el mismo contenido la reintenta.
+    """
+    def fallar(datos: bytes) -> bytes:
+        raise OSError("disco lleno")
+
+    almacen = AlmacenEvidencias(escritor, "reintento")
+
+    ruta = almacen.guardar(str(tmp_path), "paso_1", b"captura", procesar=fallar)
+    escritor.vaciar()
+    assert not os.path.exists(ruta)
+
+    assert almacen.guardar(str(tmp_path), "paso_2", b"captura") == ruta
+    escritor.vaciar()
+    assert os.path.exists(ruta)
+    assert almacen.metricas()["capturas_unicas"] == 2
+
+
+# --- PoliticaCapturas ---
+
+def test_politica_cada_n() -> None:
+    """
+    'cada-n' guarda la primera captura exitosa y luego una de cada N; los fallos siempre se guardan.
+    """
+    politica = PoliticaCapturas("cada-n", cada_n=3)
+
+    decisiones = [politica.decidir(es_fallo=False) for _ in range(7)]
+
+    assert decisiones == [GUARDAR, OMITIR, OMITIR, GUARDAR, OMITIR, OMITIR, GUARDAR]
+    assert politica.decidir(es_fallo=True) == GUARDAR
+
+
+@pytest.mark.parametrize("nombre, exito, fallo", [
+    ("siempre", GUARDAR, GUARDAR),
+    ("solo-fallos", OMITIR, GUARDAR),
+    ("buffer-circular", BUFFER, GUARDAR),
+])
+def test_politica_decisiones(nombre, exito, fallo) -> None:
+    """
+    Decisión de cada política para una captura de paso exitoso y una de fallo.
+    """
+    politica = PoliticaCapturas(nombre)
+    assert politica.decidir(es_fallo=False) == exito
+    assert politica.decidir(es_fallo=True) == fallo
+    assert politica.opciones(es_fallo=True) is politica.opciones_fallo
+
+
+def test_politica_buffer_circular_descarta_las_mas_antiguas() -> None:
+    """
+    El buffer retiene solo las últimas capturas y se vacía al extraerlas.
+    """
+    politica = PoliticaCapturas("buffer-circular", tamano_buffer=2)
+    for i in range(3):
+        politica.agregar_al_buffer(f"paso_{i}.png", bytes([i]))
+
+    assert [ruta for ruta, _ in politica.extraer_buffer()] == ["paso_1.png", "paso_2.png"]
+    assert politica.extraer_buffer() == []
+
+
+@pytest.mark.parametrize("argumentos", [{"nombre": "a-veces"}, {"nombre": "cada-n", "cada_n": 0}])
+def test_politica_parametros_invalidos(argumentos) -> None:
+    """
+    Una política inexistente o un parámetro no positivo se rechazan con ValueError.
+    """
+    with pytest.raises(ValueError):
+        PoliticaCapturas(**argumentos)
+
+
+# --- OpcionesCaptura ---
+
+def test_opciones_sin_pillow_se_degradan_con_una_advertencia(monkeypatch, caplog) -> None:
+    """
+    Sin Pillow, 'webp' pasa a 'jpeg' y 'ancho_maximo' se ignora, advirtiéndolo una sola vez por proceso.
+    """
+    monkeypatch.setattr(formato_capturas, "Image", None)
+    monkeypatch.setattr(formato_capturas, "_advertencia_pillow_emitida", False)
+    # El logger del framework no propaga una vez configurado por los tests de interfaz.
+    monkeypatch.setattr(logging.getLogger("AutomationFramework"), "propagate", True)
+
+    with caplog.at_level(logging.WARNING, logger="AutomationFramework"):
+        opciones = OpcionesCaptura(formato="webp", ancho_maximo=800)
+        OpcionesCaptura(formato="webp")
+
+    assert (opciones.formato, opciones.ancho_maximo, opciones.procesador()) == ("jpeg", 0, None)
+    advertencias = [registro for registro in caplog.records if "Pillow" in registro.getMessage()]
+    assert len(advertencias) == 1
+    assert "webp" in advertencias[0].getMessage() and "ancho_maximo=800" in advertencias[0].getMessage()
+    assert OpcionesCaptura(formato="png").formato == "png"
@@ -0,0 +1,76 @@
+from src.utils.metricas import LIMITES_BUCKETS, RegistroMetricas, SerieMetrica, describir_locator
+
+
+class _LocatorFalso:
+    """Objeto con la representación de un Locator de Playwright."""
+
+    def __repr__(self):
+        return "<Locator frame=<Frame name= url='about:blank'> selector='#login >> nth=0'>"
+
+
+def test_describir_locator() -> None:
+    """
+    Un locator se describe por su selector; una cadena por sí misma y None como cadena vacía.
+    """
+    assert describir_locator(_LocatorFalso()) == "#login >> nth=0"
+    assert describir_locator("text=Enviar") == "text=Enviar"
+    assert describir_locator(None) == ""
+
+
+def test_percentil_rango_mas_cercano() -> None:
+    """
+    El percentil usa el método del rango más cercano y devuelve 0.0 sin muestras.
+    """
+    serie = SerieMetrica("paso", {})
+    assert serie.percentil(95) == 0.0
+    for valor in [5, 1, 4, 2, 3]:
+        serie.agregar(valor)
+    assert serie.percentil(50) == 3
+    assert serie.percentil(95) == 5
+    assert serie.percentil(0) == 1
+
+
+def test_buckets_acumulativos() -> None:
+    """
+    Cada muestra cae en el primer bucket cuyo límite es mayor o igual que ella.
+    """
+    serie = SerieMetrica("paso", {})
+    for valor in [0.005, 0.2, 100.0]:
+        serie.agregar(valor)
+    buckets = serie.resumen()["buckets"]
+    assert buckets[f"le_{LIMITES_BUCKETS[0]}"] == 1
+    assert buckets["le_0.25"] == 2
+    assert buckets[f"le_{LIMITES_BUCKETS[-1]}"] == 2
+    assert buckets["le_inf"] == 3
+
+
+def test_registrar_agrupa_por_etiquetas() -> None:
+    """
+    Las etiquetas None se descartan y las demás se convierten a texto al agrupar las series.
+    """
+    registro = RegistroMetricas()
+    registro.registrar("paso", 0.1, accion="clic", dispositivo=None, reintentos=2)
+    registro.registrar("paso", 0.3, reintentos="2", accion="clic")
+    registro.registrar("paso", 0.2, accion="escribir")
+
+    series = {serie.etiquetas.get("accion"): serie for serie in registro.series()}
+    assert len(series) == 2
+    assert series["clic"].etiquetas == {"accion": "clic", "reintentos": "2"}
+    assert series["clic"].muestras == [0.1, 0.3]
+
+
+def test_exportar_json_y_csv(tmp_path) -> None:
+    """
+    La exportación escribe una fila por serie en CSV y el resumen completo en JSON.
+    """
+    registro = RegistroMetricas()
+    registro.registrar("b.total", 0.2, accion="b")
+    registro.registrar("a.total", 0.1, accion="a")
+
+    ruta_csv = registro.exportar_csv(str(tmp_path / "metricas.csv"))
+    ruta_json = registro.exportar_json(str(tmp_path / "metricas.json"))
+
+    lineas = open(ruta_csv, encoding="utf-8").read().splitlines()
+    assert lineas[0].startswith("nombre,accion,locator,navegador,dispositivo,conteo")
+    assert [linea.split(",")[0] for linea in lineas[1:]] == ["a.total", "b.total"]
+    assert '"limites_buckets"' in open(ruta_json, encoding="utf-8").read()
@@ -0,0 +1,36 @@
+import pytest
+
+from src.utils.paginacion import plantilla_url_paginas
+
+
+def test_plantilla_no_confunde_el_numero_de_pagina_con_otros_parametros() -> None:
+    """
+    En '?page=2&size=20' se sustituye el número de página, no el '2' de '20'.
+    """
+    enlaces = {
+        "1": "https://ejemplo.com/lista?size=20",
+        "2": "https://ejemplo.com/lista?page=2&size=20",
+        "3": "https://ejemplo.com/lista?page=3&size=20",
+    }
+    assert plantilla_url_paginas(enlaces) == "https://ejemplo.com/lista?page={pagina}&size=20"
+
+
+def test_plantilla_usa_la_ultima_aparicion_del_numero() -> None:
+    """
+    El número se sustituye en su última aparición como número completo.
+    """
+    enlaces = {"2": "/v2/productos/pagina/2", "3": "/v2/productos/pagina/3"}
+    assert plantilla_url_paginas(enlaces) == "/v2/productos/pagina/{pagina}"
+
+
+@pytest.mark.parametrize("enlaces", [
+    {"2": "#", "3": "#"},
+    {"2": "javascript:irPagina(2)", "3": "javascript:irPagina(3)"},
+    {"2": "/lista?page=2", "3": "/otra?p=3"},
+    {},
+])
+def test_plantilla_none_si_las_paginas_no_son_direccionables(enlaces) -> None:
+    """
+    Sin un patrón común de URL la tabla solo se recorre haciendo clic.
+    """
+    assert plantilla_url_paginas(enlaces) is None
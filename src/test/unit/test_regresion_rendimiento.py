@@ -0,0 +1,102 @@
+import pytest
+
+from src.utils.metricas import RegistroMetricas
+from src.utils.regresion_rendimiento import (
+    cargar_baseline, clave_paso, comparar_con_baseline, escribir_baseline, percentiles_por_paso,
+)
+
+
+def _paso(p95: float) -> dict:
+    return {"nombre": "hacer_clic_en_elemento.total", "navegador": "chromium", "dispositivo": "", "p95": p95, "conteo": 20}
+
+
+def test_clave_paso_ignora_el_locator() -> None:
+    """
+    La clave de un paso no incluye el locator: un cambio de selector no invalida la línea base.
+    """
+    etiquetas = {"accion": "clic", "locator": "#enviar", "navegador": "chromium", "dispositivo": "Pixel 5"}
+    assert clave_paso("hacer_clic_en_elemento.total", etiquetas) == "hacer_clic_en_elemento.total|chromium|Pixel 5"
+    assert clave_paso("navegar.total", {}) == "navegar.total||"
+
+
+def test_comparar_con_baseline_umbral_relativo() -> None:
+    """
+    Solo es regresión un p95 que supera la línea base en más del umbral relativo.
+    """
+    baseline = {"a": _paso(1.0), "b": _paso(1.0)}
+    actuales = {"a": _paso(1.19), "b": _paso(1.5)}
+
+    regresiones = comparar_con_baseline(actuales, baseline, umbral=0.20)
+
+    assert regresiones == [{"paso": "b", "p95_base": 1.0, "p95_actual": 1.5, "aumento": 0.5}]
+
+
+def test_comparar_con_baseline_umbral_absoluto() -> None:
+    """
+    Un aumento relativo grande sobre un paso muy rápido no es regresión si no supera el umbral absoluto.
+    """
+    baseline = {"rapido": _paso(0.010), "lento": _paso(2.0)}
+    actuales = {"rapido": _paso(0.030), "lento": _paso(3.0)}
+
+    regresiones = comparar_con_baseline(actuales, baseline, umbral=0.20, umbral_absoluto=0.05)
+
+    assert [r["paso"] for r in regresiones] == ["lento"]
+    assert comparar_con_baseline(actuales, baseline, umbral=0.20)[0]["paso"] == "rapido"
+
+
+def test_comparar_con_baseline_ordena_y_omite_pasos_sin_base() -> None:
+    """
+    Los pasos nuevos o con p95 base nulo no se comparan; las regresiones se ordenan de mayor a menor aumento.
+    """
+    baseline = {"x": _paso(1.0), "y": _paso(1.0), "cero": _paso(0.0)}
+    actuales = {"x": _paso(1.3), "y": _paso(2.0), "cero": _paso(5.0), "nuevo": _paso(9.0)}
+
+    regresiones = comparar_con_baseline(actuales, baseline, umbral=0.10)
+
+    assert [(r["paso"], r["aumento"]) for r in regresiones] == [("y", 1.0), ("x", 0.3)]
+
+
+def test_percentiles_por_paso_combina_workers() -> None:
+    """
+    Las muestras exportadas por varios workers se combinan antes de calcular el p95, agrupando
+    por navegador y dispositivo y excluyendo los temporizadores de CPU.
+    """
+    worker_1, worker_2 = RegistroMetricas(), RegistroMetricas()
+    for i in range(1, 11):
+        worker_1.registrar("validar.total", i / 10, accion="validar", locator="#a", navegador="chromium")
+        worker_2.registrar("validar.total", i, accion="validar", locator="#b", navegador="chromium")
+    worker_1.registrar("validar.cpu", 0.5, accion="validar", navegador="chromium")
+    worker_2.registrar("validar.total", 7.0, accion="validar", navegador="firefox")
+
+    controlador = RegistroMetricas()
+    controlador.combinar_muestras(worker_1.exportar_muestras())
+    controlador.combinar_muestras(worker_2.exportar_muestras())
+    pasos = percentiles_por_paso(controlador)
+
+    assert set(pasos) == {"validar.total|chromium|", "validar.total|firefox|"}
+    chromium = pasos["validar.total|chromium|"]
+    assert chromium["conteo"] == 20
+    # Rango más cercano del p95 sobre 20 muestras: la 19.ª ordenada (0.1..1.0 y 1..10).
+    assert chromium["p95"] == 9
+    assert pasos["validar.total|firefox|"]["p95"] == 7.0
+
+
+def test_baseline_ida_y_vuelta(tmp_path) -> None:
+    """
+    La línea base escrita se vuelve a cargar con los mismos pasos; sin archivo se obtiene None.
+    """
+    ruta = str(tmp_path / "rendimiento" / "baseline.json")
+    assert cargar_baseline(ruta) is None
+
+    pasos = {"validar.total|chromium|": _paso(0.25)}
+    assert escribir_baseline(ruta, pasos) == ruta
+    assert cargar_baseline(ruta) == pasos
+
+
+@pytest.mark.parametrize("umbral, esperadas", [(0.0, 1), (0.5, 1), (1.0, 0)])
+def test_comparar_con_baseline_limite_del_umbral(umbral: float, esperadas: int) -> None:
+    """
+    Un p95 exactamente igual al límite (base * (1 + umbral)) no se considera regresión.
+    """
+    regresiones = comparar_con_baseline({"a": _paso(2.0)}, {"a": _paso(1.0)}, umbral=umbral)
+    assert len(regresiones) == esperadas
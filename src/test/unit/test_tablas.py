@@ -0,0 +1,242 @@
+import pytest
+
+from src.utils.diferencia_tablas import diferenciar_instantaneas
+from src.utils.indice_tabla import IndiceTabla
+from src.utils.instantanea_tabla import InstantaneaTabla
+from src.utils.verificacion_tablas import VerificadorTabla
+
+
+def _instantanea(encabezados, filas, casillas=None) -> InstantaneaTabla:
+    """
+    Construye una instantánea a partir de filas de texto y, opcionalmente, del estado de los
+    checkboxes por fila ({índice de columna: marcado}).
+    """
+    num_columnas = max([len(encabezados)] + [len(fila) for fila in filas])
+    columnas = [[fila[j] if j < len(fila) else None for fila in filas] for j in range(num_columnas)]
+    estados = [[(casillas or {}).get(i, {}).get(j) for i in range(len(filas))] for j in range(num_columnas)]
+    textos = [" ".join(celda for celda in fila if celda) for fila in filas]
+    return InstantaneaTabla(encabezados, columnas, estados, [{} for _ in filas], textos)
+
+
+ENCABEZADOS = ["ID", "Name", "Price", "Select"]
+
+
+def _productos(casillas=None) -> InstantaneaTabla:
+    return _instantanea(ENCABEZADOS, [
+        ["1", "Laptop", "1200", ""],
+        ["2", "Smartphone", "800", ""],
+        ["3", "Tablet", "300", ""],
+    ], casillas)
+
+
+# --- InstantaneaTabla ---
+
+def test_instantanea_nombres_columnas_y_filas() -> None:
+    """
+    Las columnas sin encabezado se nombran 'columna_<n>' y las filas se leen como diccionarios.
+    """
+    instantanea = _instantanea(["ID", ""], [["1", "a", "x"], ["2", "b"]])
+
+    assert instantanea.nombres_columnas() == ["ID", "columna_2", "columna_3"]
+    assert instantanea.fila(1) == {"ID": "2", "columna_2": "b", "columna_3": None}
+    assert list(instantanea.filas())[0]["columna_3"] == "x"
+    assert instantanea.columna("ID") == ["1", "2"]
+    with pytest.raises(KeyError):
+        instantanea.columna("Precio")
+
+
+def test_instantanea_casillas_y_concatenar() -> None:
+    """
+    Las posiciones de los checkboxes siguen el orden del documento y la concatenación une las páginas.
+    """
+    pagina_1 = _productos(casillas={0: {3: False}, 2: {3: True}})
+    pagina_2 = _instantanea(ENCABEZADOS[:2], [["4", "Monitor"]])
+
+    assert pagina_1.posiciones_casillas() == [(0, 3), (2, 3)]
+    assert pagina_1.casilla(2, "Select") is True
+
+    unida = InstantaneaTabla.concatenar([pagina_1, pagina_2])
+    assert unida.num_filas == 4
+    assert unida.columna("Name")[-1] == "Monitor"
+    assert unida.columna("Price")[-1] is None
+    assert unida.desde_evaluate(unida.a_diccionario()).textos_filas == unida.textos_filas
+
+
+# --- IndiceTabla ---
+
+def test_indice_busqueda_exacta() -> None:
+    """
+    La búsqueda exacta devuelve las coordenadas (fila, columna) de cada celda con ese texto.
+    """
+    indice = IndiceTabla(_instantanea(["A", "B"], [["x", "y"], ["y", "x"], ["z", "x"]]))
+
+    assert indice.buscar_exacto("x") == [(0, 0), (1, 1), (2, 1)]
+    assert indice.buscar_exacto("no existe") == []
+
+
+@pytest.mark.parametrize("texto, filas", [
+    ("phone", [1]),
+    ("LAPTOP 1200", [0]),
+    ("00", [0, 1, 2]),
+    ("t", [0, 1, 2]),
+    ("tablet 9", []),
+    ("zzz", []),
+])
+def test_indice_busqueda_parcial(texto, filas) -> None:
+    """
+    La búsqueda parcial no distingue mayúsculas, usa los n-gramas y recorre las filas con consultas cortas.
+    """
+    assert IndiceTabla(_productos()).buscar_parcial(texto) == filas
+
+
+# --- diferenciar_instantaneas ---
+
+def test_diferencia_por_columna_clave() -> None:
+    """
+    Emparejando por 'ID', un reordenamiento no es un cambio y se detectan altas, bajas y celdas modificadas.
+    """
+    antes = _productos(casillas={0: {3: False}, 1: {3: False}, 2: {3: False}})
+    despues = _instantanea(ENCABEZADOS, [
+        ["2", "Smartphone", "850", ""],
+        ["1", "Laptop", "1200", ""],
+        ["4", "Monitor", "200", ""],
+    ], casillas={0: {3: False}, 1: {3: True}, 2: {3: False}})
+
+    diferencia = diferenciar_instantaneas(antes, despues, columna_clave="ID")
+
+    assert diferencia.columna_clave == "ID"
+    assert [fila["Name"] for fila in diferencia.agregadas] == ["Monitor"]
+    assert [fila["Name"] for fila in diferencia.eliminadas] == ["Tablet"]
+    assert diferencia.claves_cambiadas() == ["1", "2"]
+    assert diferencia.cambios_de("1") == [
+        {"clave": "1", "columna": "Select", "tipo": "checkbox", "antes": False, "despues": True},
+    ]
+    assert diferencia.cambios_de("2") == [
+        {"clave": "2", "columna": "Price", "tipo": "texto", "antes": "800", "despues": "850"},
+    ]
+    assert not diferencia.sin_cambios
+
+
+def test_diferencia_por_posicion() -> None:
+    """
+    Sin columna clave las filas se emparejan por posición y la clave es el índice de la fila.
+    """
+    despues = _instantanea(ENCABEZADOS, [
+        ["1", "Laptop", "1200", ""],
+        ["3", "Tablet", "300", ""],
+    ])
+
+    diferencia = diferenciar_instantaneas(_productos(), despues)
+
+    assert diferencia.columna_clave is None
+    assert [fila["ID"] for fila in diferencia.eliminadas] == ["3"]
+    assert diferencia.agregadas == []
+    assert [(c["clave"], c["columna"]) for c in diferencia.cambios] == [(1, "ID"), (1, "Name"), (1, "Price")]
+    assert "fila=1, columna 'Name' (texto): 'Smartphone' -> 'Tablet'" in diferencia.texto()
+
+
+def test_diferencia_sin_cambios_y_columnas() -> None:
+    """
+    Dos instantáneas iguales no tienen diferencias; una columna nueva se reporta como columna agregada.
+    """
+    assert diferenciar_instantaneas(_productos(), _productos(), "ID").texto() == "Sin cambios."
+
+    con_stock = _instantanea(ENCABEZADOS + ["Stock"], [["1", "Laptop", "1200", "", "5"]])
+    diferencia = diferenciar_instantaneas(_productos(), con_stock, columna_clave=0)
+    assert diferencia.columnas_agregadas == ["Stock"]
+    assert diferencia.columnas_eliminadas == []
+
+
+def test_diferencia_columna_clave_invalida() -> None:
+    """
+    Una columna clave inexistente o con valores repetidos no permite emparejar las filas.
+    """
+    with pytest.raises(KeyError):
+        diferenciar_instantaneas(_productos(), _productos(), columna_clave="SKU")
+    with pytest.raises(KeyError):
+        diferenciar_instantaneas(_productos(), _productos(), columna_clave=9)
+
+    repetidas = _instantanea(ENCABEZADOS, [["1", "Laptop", "1200", ""], ["1", "Laptop", "1100", ""]])
+    with pytest.raises(ValueError):
+        diferenciar_instantaneas(repetidas, _productos(), columna_clave="ID")
+
+
+def test_diferencia_con_encabezados_repetidos() -> None:
+    """
+    Los encabezados repetidos se comparan como columnas distintas y no pueden usarse como clave por nombre.
+    """
+    antes = _instantanea(["ID", "A", "A"], [["1", "x", "y"], ["2", "p", "q"]])
+    despues = _instantanea(["ID", "A", "A"], [["1", "x", "z"], ["3", "m", "n"]])
+
+    assert antes.nombres_columnas() == ["ID", "A", "A_2"]
+    diferencia = diferenciar_instantaneas(antes, despues, columna_clave="ID")
+
+    assert diferencia.cambios == [{"clave": "1", "columna": "A_2", "tipo": "texto", "antes": "y", "despues": "z"}]
+    assert diferencia.eliminadas == [{"ID": "2", "A": "p", "A_2": "q"}]
+    assert diferencia.agregadas == [{"ID": "3", "A": "m", "A_2": "n"}]
+    assert diferenciar_instantaneas(antes, antes, columna_clave=1).sin_cambios
+    with pytest.raises(KeyError):
+        diferenciar_instantaneas(antes, despues, columna_clave="A")
+
+
+# --- VerificadorTabla ---
+
+def test_verificador_tabla_valida() -> None:
+    """
+    Una tabla correcta pasa todas las verificaciones encadenadas.
+    """
+    reporte = (VerificadorTabla(_productos())
+               .numerica("Price").regex("Name", r"[A-Z]\w+").unica("ID").ordenada("ID").reporte)
+    assert reporte.ok
+    assert reporte.discrepancias == []
+
+
+def test_verificador_tabla_reporta_filas_con_fallo() -> None:
+    """
+    Cada verificación anota la fila (desde 1), la columna y el valor que falla.
+    """
+    instantanea = _instantanea(["ID", "Price"], [["1", "10"], ["3", "abc"], ["2", "5"], ["3", "7"]])
+
+    reporte = VerificadorTabla(instantanea).numerica("Price").unica("ID").ordenada("ID").reporte
+
+    assert not reporte.ok
+    encontradas = [(d["verificacion"], d["fila"], d["valor"]) for d in reporte.discrepancias]
+    assert ("numerica", 2, "abc") in encontradas
+    assert ("unica", 2, "3") in encontradas and ("unica", 4, "3") in encontradas
+    assert ("orden", 3, "2") in encontradas
+    assert reporte.filas_con_fallo() == [2, 3, 4]
+
+
+
+def test_verificador_numerica_acepta_lo_mismo_que_float() -> None:
+    """
+    La verificación numérica usa el criterio de `float()`: 'nan', '1_000' o dígitos arábigo-índicos son números.
+    """
+    valores = ["12", " 1e3 ", "nan", "NaN", "1_000", "١٢", "\xa012", "-inf", "1,5", "", "12abc", None]
+    instantanea = _instantanea(["Price", "Otra"], [[valor, "x"] for valor in valores])
+
+    reporte = VerificadorTabla(instantanea).numerica("Price").reporte
+
+    assert [d["valor"] for d in reporte.discrepancias] == ["1,5", "", "12abc", None]
+    vacias = VerificadorTabla(instantanea).numerica("Price", permitir_vacias=True).reporte
+    assert [d["valor"] for d in vacias.discrepancias] == ["1,5", "12abc"]
+
+def test_verificador_filas_esperadas_con_checkbox() -> None:
+    """
+    Las filas esperadas comparan texto sin espacios alrededor y el estado de los checkboxes.
+    """
+    instantanea = _productos(casillas={0: {3: True}, 1: {3: False}, 2: {3: False}})
+    esperadas = [
+        {"ID": "1", "Name": " Laptop ", "Select": True},
+        {"ID": "2", "Name": "Smartphone", "Select": True},
+        {"ID": "3", "Name": "Tablets"},
+    ]
+
+    reporte = VerificadorTabla(instantanea).filas_esperadas(esperadas).reporte
+
+    assert [(d["verificacion"], d["fila"], d["columna"]) for d in reporte.discrepancias] == [
+        ("fila_esperada", 3, "Name"),
+        ("checkbox", 2, "Select"),
+    ]
+    faltante = VerificadorTabla(instantanea).filas_esperadas(esperadas[:2]).reporte
+    assert faltante.discrepancias[0]["verificacion"] == "num_filas"
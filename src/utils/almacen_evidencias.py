@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set
+
+from .escritor_evidencias import EscritorEvidencias
+
+
+class AlmacenEvidencias:
+    """
+    Almacén de capturas direccionado por contenido (content-addressed).
+
+    Cada captura se identifica por el hash SHA-256 de sus bytes y se guarda una sola vez
+    en `<directorio>/objetos/<hh>/<hash>.<extensión>`. Las capturas consecutivas idénticas (por
+    ejemplo, `_antes_` y `_despues_` de una acción sin efecto visual) no vuelven a escribirse.
+    La deduplicación se hace por ruta del objeto, de modo que la misma captura guardada en otro
+    formato (PNG, JPEG, WebP) sí se escribe. Un manifiesto JSON por test relaciona cada paso
+    con el hash de su captura.
+    """
+
+    # Objetos que este proceso ya escribió con éxito, compartidos entre tests para evitar
+    # comprobaciones en disco. Una ruta solo entra aquí desde la notificación de escritura
+    # correcta del escritor: si la escritura falla, la siguiente captura igual la reintenta.
+    _rutas_escritas: Set[str] = set()
+    # Objetos encolados en el escritor y aún sin terminar, para no encolar dos veces el mismo.
+    _rutas_en_escritura: Set[str] = set()
+    _lock_rutas = threading.Lock()
+
+    def __init__(self, escritor: EscritorEvidencias, nombre_test: Optional[str] = None, extension: str = "png"):
+        """
+        Args:
+            escritor (EscritorEvidencias): Escritor asíncrono que realiza la escritura en disco.
+            nombre_test (str, opcional): Identificador del test (por ejemplo, el nodeid de pytest),
+                                         usado para nombrar el manifiesto.
+            extension (str): Extensión de los objetos almacenados. Por defecto, 'png'.
+        """
+        self.escritor = escritor
+        self.nombre_test = nombre_test or f"test_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        self.extension = extension
+        self._entradas: Dict[str, List[Dict[str, str]]] = {}
+        self.capturas_unicas = 0
+        self.capturas_duplicadas = 0
+        self.bytes_ahorrados = 0
+
+    def guardar(self, directorio: str, nombre_paso: str, datos: bytes, extension: Optional[str] = None,
+                procesar: Optional[Callable[[bytes], bytes]] = None) -> str:
+        """
+        Registra una captura en el manifiesto y la escribe solo si su contenido es nuevo.
+
+        Args:
+            directorio (str): Directorio raíz de las evidencias (por ejemplo, SCREENSHOT_DIR).
+            nombre_paso (str): Nombre del paso que originó la captura.
+            datos (bytes): Bytes de la captura, tal como los devolvió Playwright (el hash se calcula sobre ellos).
+            extension (str, opcional): Extensión del objeto. Por defecto, la del almacén.
+            procesar (Callable[[bytes], bytes], opcional): Recodificación aplicada por el escritor antes de guardar.
+
+        Returns:
+            str: Ruta del objeto que contiene la captura.
+        """
+        hash_contenido = hashlib.sha256(datos).hexdigest()
+        ruta_relativa = os.path.join("objetos", hash_contenido[:2], f"{hash_contenido}.{extension or self.extension}")
+        ruta_objeto = os.path.join(directorio, ruta_relativa)
+
+        with self._lock_rutas:
+            es_nuevo = (ruta_objeto not in self._rutas_escritas and ruta_objeto not in self._rutas_en_escritura
+                        and not os.path.exists(ruta_objeto))
+            if es_nuevo:
+                self._rutas_en_escritura.add(ruta_objeto)
+
+        if es_nuevo:
+            try:
+                self.escritor.escribir(ruta_objeto, datos, procesar=procesar, al_terminar=self._al_terminar_escritura)
+            except Exception:
+                self._al_terminar_escritura(ruta_objeto, False)
+                raise
+            self.capturas_unicas += 1
+        else:
+            self.capturas_duplicadas += 1
+            self.bytes_ahorrados += len(datos)
+
+        self._entradas.setdefault(directorio, []).append({
+            "paso": nombre_paso,
+            "hash": hash_contenido,
+            "objeto": ruta_relativa.replace(os.sep, "/"),
+        })
+        return ruta_objeto
+
+    @classmethod
+    def _al_terminar_escritura(cls, ruta_objeto: str, exito: bool) -> None:
+        """
+        Notificación del escritor al terminar la escritura de un objeto: solo las escrituras
+        correctas cuentan como objetos conocidos.
+        """
+        with cls._lock_rutas:
+            cls._rutas_en_escritura.discard(ruta_objeto)
+            if exito:
+                cls._rutas_escritas.add(ruta_objeto)
+
+    def escribir_manifiestos(self) -> List[str]:
+        """
+        Escribe el manifiesto del test (paso -> hash) en `<directorio>/manifiestos/` por cada
+        directorio de evidencias utilizado.
+
+        Returns:
+            List[str]: Rutas de los manifiestos escritos.
+        """
+        rutas = []
+        nombre_archivo = "".join(c if c.isalnum() or c in "-_." else "_" for c in self.nombre_test)
+        for directorio, entradas in self._entradas.items():
+            ruta_manifiesto = os.path.join(directorio, "manifiestos", f"{nombre_archivo}.json")
+            os.makedirs(os.path.dirname(ruta_manifiesto), exist_ok=True)
+            with open(ruta_manifiesto, "w", encoding="utf-8") as archivo:
+                json.dump({"test": self.nombre_test, "capturas": entradas}, archivo, indent=2, ensure_ascii=False)
+            rutas.append(ruta_manifiesto)
+        return rutas
+
+    def metricas(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Capturas únicas escritas, duplicadas evitadas y bytes ahorrados.
+        """
+        return {
+            "capturas_unicas": self.capturas_unicas,
+            "capturas_duplicadas": self.capturas_duplicadas,
+            "bytes_ahorrados": self.bytes_ahorrados,
+        }
@@ -0,0 +1,60 @@
+import logging
+import timeit
+
+from .logger import LoggerFramework, diferir
+
+
+class _LocatorSimulado:
+    """
+    Objeto con un repr costoso, similar al de un Locator de Playwright con selectores encadenados.
+    """
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def __repr__(self):
+        return f"<Locator frame=<Frame name= url='about:blank'> selector='{' >> '.join([self.selector] * 20)}'>"
+
+
+def medir_costo_logging(iteraciones: int = 100_000) -> dict:
+    """
+    Mide el costo por llamada de un `logger.debug` con el nivel DEBUG desactivado, comparando
+    f-strings (formateo inmediato) con el formato diferido de `LoggerFramework`.
+
+    Args:
+        iteraciones (int): Número de llamadas por variante. Por defecto, 100000.
+
+    Returns:
+        dict: Microsegundos por llamada de cada variante y el ahorro relativo.
+    """
+    logger_base = logging.getLogger("benchmark_logging")
+    logger_base.handlers = [logging.NullHandler()]
+    logger_base.propagate = False
+    logger_base.setLevel(logging.INFO)
+    logger = LoggerFramework(logger_base, "benchmark")
+
+    locator = _LocatorSimulado("table#tabla >> tbody tr")
+    fila_texto = "Nombre | Apellido | Correo | 123.45 | Activo" * 5
+
+    def _eager():
+        logger.debug(f"\nAnalizando fila {1}: '{fila_texto}' en la tabla '{locator}'.")
+
+    def _diferido():
+        logger.debug("\nAnalizando fila %s: '%s' en la tabla '%s'.", 1, fila_texto, locator)
+
+    def _diferido_calculo():
+        logger.debug("\nAnalizando fila %s: '%s'.", 1, diferir(lambda: fila_texto.upper()))
+
+    resultados = {}
+    for nombre, funcion in (("f_string", _eager), ("diferido", _diferido), ("diferido_con_calculo", _diferido_calculo)):
+        segundos = min(timeit.repeat(funcion, number=iteraciones, repeat=3))
+        resultados[nombre] = round(segundos / iteraciones * 1_000_000, 4)
+    resultados["ahorro_relativo"] = round(1 - resultados["diferido"] / resultados["f_string"], 4)
+    return resultados
+
+
+if __name__ == "__main__":
+    # Uso: python -m src.utils.benchmark_logging
+    for clave, valor in medir_costo_logging().items():
+        unidad = "" if clave == "ahorro_relativo" else " µs/llamada"
+        print(f"{clave}: {valor}{unidad}")
@@ -40,6 +40,53 @@ DASHBOARD_URL = os.getenv("DASHBOARD_URL")
 # Si necesitas una URL para APIs, la cargas de la misma manera
 API_URL = os.getenv("API_URL")
 
+# --- Niveles de logging ---
+# Niveles mínimos para consola y archivo ('DEBUG', 'INFO', 'WARNING', ...). Con ambos en INFO o superior,
+# los mensajes de depuración de las acciones no se formatean ni evalúan sus argumentos diferidos.
+LOG_NIVEL_CONSOLA = os.getenv("LOG_NIVEL_CONSOLA", "INFO").upper()
+LOG_NIVEL_ARCHIVO = os.getenv("LOG_NIVEL_ARCHIVO", "DEBUG").upper()
+
+# --- Perfil de ejecución ---
+# Controla slow_mo, esperas fijas, resaltado y política de capturas ('demo', 'debug' o 'throughput').
+# Puede sobrescribirse desde la línea de comandos con --perfil-ejecucion.
+PERFIL_EJECUCION = os.getenv("PERFIL_EJECUCION", "demo")
+
+# Retención de trazas y videos ('on', 'retain-on-failure' u 'off'). Si no se define,
+# se usa la del perfil de ejecución activo. Puede sobrescribirse con --retencion-trazas.
+RETENCION_TRAZAS = os.getenv("RETENCION_TRAZAS")
+
+# Política de capturas ('siempre', 'solo-fallos', 'cada-n' o 'buffer-circular'). Si no se define,
+# se usa la del perfil de ejecución activo. Puede sobrescribirse con --politica-capturas.
+POLITICA_CAPTURAS = os.getenv("POLITICA_CAPTURAS")
+# Para 'cada-n': se guarda una de cada N capturas de pasos exitosos.
+CAPTURAS_CADA_N = int(os.getenv("CAPTURAS_CADA_N", "5"))
+# Para 'buffer-circular': número de capturas retenidas en memoria hasta que falla un paso.
+CAPTURAS_TAMANO_BUFFER = int(os.getenv("CAPTURAS_TAMANO_BUFFER", "10"))
+
+# Formato de las capturas de pasos exitosos. Las de fallo se guardan siempre en PNG de página completa.
+# Formato: 'png', 'jpeg' o 'webp' (webp y la reducción de ancho requieren Pillow; sin él se usa jpeg, con una advertencia).
+CAPTURAS_PASOS_FORMATO = os.getenv("CAPTURAS_PASOS_FORMATO", "png")
+# Calidad (1-100) para jpeg y webp.
+CAPTURAS_PASOS_CALIDAD = int(os.getenv("CAPTURAS_PASOS_CALIDAD", "70"))
+# Escala: 'device' (resolución del dispositivo) o 'css' (un píxel por píxel CSS).
+CAPTURAS_PASOS_ESCALA = os.getenv("CAPTURAS_PASOS_ESCALA", "device")
+# Si las capturas de pasos se recortan al elemento de la acción cuando esta lo proporciona.
+CAPTURAS_PASOS_RECORTAR_ELEMENTO = os.getenv("CAPTURAS_PASOS_RECORTAR_ELEMENTO", "false").lower() in ("1", "true", "si", "sí")
+# Ancho máximo en píxeles de las capturas de pasos (0 = sin reducción).
+CAPTURAS_PASOS_ANCHO_MAXIMO = int(os.getenv("CAPTURAS_PASOS_ANCHO_MAXIMO", "0"))
+
+# Almacenamiento de capturas: 'timestamp' (un archivo por captura con marca de tiempo) o
+# 'contenido' (almacén deduplicado por hash SHA-256 con un manifiesto por test).
+ALMACEN_CAPTURAS = os.getenv("ALMACEN_CAPTURAS", "timestamp")
+
+# --- Regresión de rendimiento ---
+# Archivo de línea base con el p95 por paso, escrito por una ejecución con --perf-baseline.
+BASELINE_RENDIMIENTO = os.getenv("BASELINE_RENDIMIENTO", os.path.join(PROJECT_ROOT, "test", "rendimiento", "baseline_rendimiento.json"))
+# Aumento relativo del p95 (0.20 = 20 %) a partir del cual un paso se considera una regresión.
+PERF_UMBRAL = float(os.getenv("PERF_UMBRAL", "0.20"))
+# Aumento absoluto mínimo (en segundos) para considerar una regresión; evita falsos positivos en pasos muy rápidos.
+PERF_UMBRAL_ABSOLUTO = float(os.getenv("PERF_UMBRAL_ABSOLUTO", "0.05"))
+
 # --- Rutas de Almacenamiento de Evidencias ---
 
 # Directorio base donde se guardarán todas las evidencias.
@@ -62,6 +109,10 @@ SCREENSHOT_DIR = os.path.join(EVIDENCE_BASE_DIR, "imagen")
 # Se creará '.../PRACTICA-RV/PRV/test/reportes/log'
 LOGGER_DIR = os.path.join(EVIDENCE_BASE_DIR, "log")
 
+# Ruta para las métricas de tiempo de las acciones (JSON y CSV por sesión).
+# Se creará '.../PRACTICA-RV/PRV/test/reportes/metricas'
+METRICAS_DIR = os.path.join(EVIDENCE_BASE_DIR, "metricas")
+
 # --- Nueva ruta para archivos fuente ---
 # Se creará '.../.../src/test/archivos_data_escritura'
 SOURCE_FILES_DIR_DATA_WRITE = os.path.join(PROJECT_ROOT, "test", "files", "files_data_write")
@@ -88,6 +139,7 @@ def ensure_directories_exist():
     os.makedirs(SOURCE_FILES_DIR_UPLOAD, exist_ok=True)
     os.makedirs(SOURCE_FILES_DIR_DOWNLOAD, exist_ok=True)
     os.makedirs(LOGGER_DIR, exist_ok=True)
+    os.makedirs(METRICAS_DIR, exist_ok=True)
     print(f"Directorios verificados/creados: {EVIDENCE_BASE_DIR}, \
         {SOURCE_FILES_DIR_UPLOAD}, \
             {SOURCE_FILES_DIR_DOWNLOAD}, \
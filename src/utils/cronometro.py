@@ -0,0 +1,135 @@
+import functools
+import inspect
+import time
+from typing import Callable, Optional
+
+from playwright.sync_api import Locator
+
+from .metricas import RegistroMetricas
+
+_NS_POR_SEGUNDO = 1_000_000_000
+
+
+class Cronometro:
+    """
+    Primitiva de medición de tiempo del framework, basada en relojes monotónicos de alta
+    resolución: `time.perf_counter_ns` para el tiempo de pared (inmune a ajustes de NTP) y
+    `time.thread_time_ns` para el tiempo de CPU del hilo del test. La diferencia entre ambos
+    es, en su mayoría, espera (navegador, red, driver de Playwright).
+
+    Se usa como gestor de contexto:
+
+        with Cronometro("hacer_clic_en_elemento", registro, accion="hacer_clic_en_elemento") as cronometro:
+            locator.click()
+        cronometro.duracion  # segundos de pared
+
+    Si recibe un nombre y un registro, al salir registra la duración de pared como '<nombre>'
+    y la de CPU como '<nombre>.cpu'.
+    """
+
+    __slots__ = ("nombre", "registro", "etiquetas", "_inicio_ns", "_inicio_cpu_ns", "duracion_ns", "cpu_ns")
+
+    def __init__(self, nombre: Optional[str] = None, registro: Optional[RegistroMetricas] = None, **etiquetas):
+        """
+        Args:
+            nombre (str, opcional): Nombre del temporizador en el registro de métricas.
+            registro (RegistroMetricas, opcional): Registro donde publicar las duraciones al salir.
+            **etiquetas: Etiquetas de la métrica (accion, locator, navegador, dispositivo, ...).
+        """
+        self.nombre = nombre
+        self.registro = registro
+        self.etiquetas = etiquetas
+        self._inicio_ns = 0
+        self._inicio_cpu_ns = 0
+        self.duracion_ns = 0
+        self.cpu_ns = 0
+
+    def iniciar(self) -> "Cronometro":
+        """Inicia (o reinicia) la medición."""
+        self._inicio_cpu_ns = time.thread_time_ns()
+        self._inicio_ns = time.perf_counter_ns()
+        return self
+
+    def detener(self) -> float:
+        """
+        Detiene la medición, publica las duraciones si hay registro y devuelve la duración de pared.
+
+        Returns:
+            float: Duración de pared en segundos.
+        """
+        self.duracion_ns = time.perf_counter_ns() - self._inicio_ns
+        self.cpu_ns = time.thread_time_ns() - self._inicio_cpu_ns
+        if self.registro is not None and self.nombre:
+            self.registro.registrar(self.nombre, self.duracion, **self.etiquetas)
+            self.registro.registrar(f"{self.nombre}.cpu", self.cpu, **self.etiquetas)
+        return self.duracion
+
+    @property
+    def duracion(self) -> float:
+        """Duración de pared en segundos."""
+        return self.duracion_ns / _NS_POR_SEGUNDO
+
+    @property
+    def cpu(self) -> float:
+        """Tiempo de CPU del hilo en segundos."""
+        return self.cpu_ns / _NS_POR_SEGUNDO
+
+    @property
+    def transcurrido(self) -> float:
+        """Segundos de pared transcurridos desde `iniciar`, sin detener el cronómetro."""
+        return (time.perf_counter_ns() - self._inicio_ns) / _NS_POR_SEGUNDO
+
+    def __enter__(self) -> "Cronometro":
+        return self.iniciar()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.detener()
+        return False
+
+
+def _indice_locator(funcion: Callable) -> Optional[int]:
+    """
+    Devuelve la posición (sin contar `self`) del primer parámetro que representa el elemento
+    de la acción (su nombre contiene 'selector' o 'locator'), o `None` si no existe.
+    """
+    parametros = list(inspect.signature(funcion).parameters)[1:]
+    for indice, nombre in enumerate(parametros):
+        if "selector" in nombre or "locator" in nombre:
+            return indice
+    return None
+
+
+def medir_accion(funcion: Callable) -> Callable:
+    """
+    Decorador para los métodos de las clases de acciones: mide la duración total de la acción
+    (pared y CPU) con `Cronometro` y la publica mediante `BasePage.registrar_metrica` como
+    '<metodo>.total' y '<metodo>.cpu', tanto si la acción termina bien como si lanza una excepción.
+
+    Args:
+        funcion (Callable): Método de una clase de acciones (con `self.base`) o de BasePage.
+
+    Returns:
+        Callable: El método decorado.
+    """
+    indice_locator = _indice_locator(funcion)
+    nombre_parametro = list(inspect.signature(funcion).parameters)[1:][indice_locator] if indice_locator is not None else None
+
+    @functools.wraps(funcion)
+    def envoltura(self, *args, **kwargs):
+        cronometro = Cronometro().iniciar()
+        try:
+            return funcion(self, *args, **kwargs)
+        finally:
+            cronometro.detener()
+            base = getattr(self, "base", self)
+            registrar = getattr(base, "registrar_metrica", None)
+            if registrar is not None:
+                locator = None
+                if nombre_parametro is not None:
+                    locator = args[indice_locator] if len(args) > indice_locator else kwargs.get(nombre_parametro)
+                    if not isinstance(locator, (str, Locator)):
+                        locator = None
+                registrar(funcion.__name__, cronometro.duracion, medicion="total", locator=locator)
+                registrar(funcion.__name__, cronometro.cpu, medicion="cpu", locator=locator)
+
+    return envoltura
@@ -0,0 +1,160 @@
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .instantanea_tabla import InstantaneaTabla
+
+# Valor con el que se comparan las celdas inexistentes, para distinguirlas de las celdas vacías.
+_SIN_CELDA = "\x00sin_celda"
+
+
+class DiferenciaTablas:
+    """
+    Diferencia entre dos instantáneas de la misma tabla, emparejando las filas por una columna clave
+    o, si no se indica ninguna, por su posición (la clave es entonces el índice de la fila, desde 0).
+
+    - `agregadas`: filas (como diccionarios) presentes solo en la instantánea posterior.
+    - `eliminadas`: filas presentes solo en la instantánea anterior.
+    - `cambios`: celdas modificadas en las filas comunes, con su clave, columna, tipo
+      ('texto' o 'checkbox') y los valores anterior y posterior.
+    """
+
+    def __init__(self, columna_clave: Optional[str], agregadas: List[Dict[str, Any]], eliminadas: List[Dict[str, Any]],
+                 cambios: List[Dict[str, Any]], columnas_agregadas: List[str], columnas_eliminadas: List[str]):
+        self.columna_clave = columna_clave
+        self.agregadas = agregadas
+        self.eliminadas = eliminadas
+        self.cambios = cambios
+        self.columnas_agregadas = columnas_agregadas
+        self.columnas_eliminadas = columnas_eliminadas
+
+    @property
+    def sin_cambios(self) -> bool:
+        """`True` si ambas instantáneas tienen las mismas filas, columnas y valores."""
+        return not (self.agregadas or self.eliminadas or self.cambios or self.columnas_agregadas or self.columnas_eliminadas)
+
+    def claves_cambiadas(self) -> List[Any]:
+        """Claves de las filas comunes con al menos una celda modificada, en orden de aparición."""
+        return list(dict.fromkeys(cambio["clave"] for cambio in self.cambios))
+
+    def cambios_de(self, clave: Any) -> List[Dict[str, Any]]:
+        """Celdas modificadas de la fila con la clave indicada."""
+        return [cambio for cambio in self.cambios if cambio["clave"] == clave]
+
+    def texto(self, max_lineas: int = 50) -> str:
+        """
+        Devuelve un resumen legible de la diferencia.
+
+        Args:
+            max_lineas (int): Número máximo de celdas modificadas listadas.
+        """
+        if self.sin_cambios:
+            return "Sin cambios."
+        lineas = [f"{len(self.agregadas)} fila(s) agregada(s), {len(self.eliminadas)} eliminada(s), "
+                  f"{len(self.claves_cambiadas())} modificada(s) ({len(self.cambios)} celda(s))."]
+        if self.columnas_agregadas or self.columnas_eliminadas:
+            lineas.append(f"  Columnas agregadas: {self.columnas_agregadas}; eliminadas: {self.columnas_eliminadas}")
+        for fila in self.agregadas[:max_lineas]:
+            lineas.append(f"  + {fila}")
+        for fila in self.eliminadas[:max_lineas]:
+            lineas.append(f"  - {fila}")
+        for cambio in self.cambios[:max_lineas]:
+            lineas.append(f"  ~ {self.columna_clave or 'fila'}={cambio['clave']!r}, columna '{cambio['columna']}' ({cambio['tipo']}): "
+                          f"{cambio['antes']!r} -> {cambio['despues']!r}")
+        return "\n".join(lineas)
+
+    def __str__(self):
+        return self.texto()
+
+
+def _indexar(datos: pd.DataFrame, claves: pd.Series, descripcion: str) -> pd.DataFrame:
+    """Usa las claves como índice del DataFrame, exigiendo que sean únicas."""
+    duplicadas = claves[claves.duplicated()]
+    if not duplicadas.empty:
+        raise ValueError(f"La columna clave tiene valores repetidos en la instantánea {descripcion}: {list(dict.fromkeys(duplicadas))[:10]}")
+    indexado = datos.copy()
+    indexado.index = pd.Index(claves.to_numpy(), dtype=object)
+    return indexado
+
+
+def _celdas_distintas(antes: pd.DataFrame, despues: pd.DataFrame, tipo: str) -> List[Dict[str, Any]]:
+    """Compara dos DataFrames alineados (mismo índice y columnas) y devuelve las celdas distintas."""
+    izquierda = antes.astype(object).where(antes.notna(), _SIN_CELDA)
+    derecha = despues.astype(object).where(despues.notna(), _SIN_CELDA)
+    filas, columnas = np.nonzero((izquierda.to_numpy() != derecha.to_numpy()))
+    return [{"clave": antes.index[i], "columna": antes.columns[j], "tipo": tipo,
+             "antes": antes.iat[i, j], "despues": despues.iat[i, j]} for i, j in zip(filas, columnas)]
+
+
+def diferenciar_instantaneas(antes: InstantaneaTabla, despues: InstantaneaTabla,
+                             columna_clave: Optional[Union[str, int]] = None) -> DiferenciaTablas:
+    """
+    Calcula la diferencia entre dos instantáneas de una tabla en una pasada vectorizada:
+    las filas se emparejan por `columna_clave` y se comparan a la vez todas las celdas de
+    texto y todos los estados de checkbox de las filas y columnas comunes.
+
+    Args:
+        antes (InstantaneaTabla): Instantánea anterior a la acción.
+        despues (InstantaneaTabla): Instantánea posterior a la acción.
+        columna_clave (Optional[Union[str, int]]): Nombre o índice de la columna que identifica
+                                                   cada fila. Si es `None`, las filas se emparejan
+                                                   por posición.
+
+    Returns:
+        DiferenciaTablas: Filas agregadas, eliminadas y celdas modificadas.
+
+    Raises:
+        KeyError: Si la columna clave no existe en alguna de las instantáneas o si su nombre
+                  coincide con más de un encabezado.
+        ValueError: Si la columna clave tiene valores repetidos.
+    """
+    datos_antes, datos_despues = antes.a_dataframe(), despues.a_dataframe()
+    casillas_antes, casillas_despues = antes.a_dataframe(casillas=True), despues.a_dataframe(casillas=True)
+
+    if columna_clave is None:
+        nombre_clave = None
+        claves_antes = pd.Series(range(antes.num_filas), dtype=object)
+        claves_despues = pd.Series(range(despues.num_filas), dtype=object)
+    else:
+        if isinstance(columna_clave, int):
+            if not 0 <= columna_clave < len(datos_antes.columns):
+                raise KeyError(f"La columna clave {columna_clave} no existe. Encabezados disponibles: {antes.encabezados}")
+            nombre_clave = datos_antes.columns[columna_clave]
+        else:
+            for instantanea in (antes, despues):
+                if instantanea.encabezados.count(columna_clave) > 1:
+                    raise KeyError(f"La columna clave '{columna_clave}' es ambigua: varios encabezados tienen ese nombre "
+                                   f"({instantanea.nombres_columnas()}). Indica la columna por su índice.")
+            nombre_clave = columna_clave
+        if nombre_clave not in datos_antes.columns or nombre_clave not in datos_despues.columns:
+            raise KeyError(f"La columna clave '{nombre_clave}' no existe en ambas instantáneas.")
+        claves_antes = datos_antes[nombre_clave]
+        claves_despues = datos_despues[nombre_clave]
+    datos_antes = _indexar(datos_antes, claves_antes, "anterior")
+    datos_despues = _indexar(datos_despues, claves_despues, "posterior")
+    casillas_antes = _indexar(casillas_antes, claves_antes, "anterior")
+    casillas_despues = _indexar(casillas_despues, claves_despues, "posterior")
+
+    en_despues = datos_antes.index.isin(datos_despues.index)
+    en_antes = datos_despues.index.isin(datos_antes.index)
+    agregadas = datos_despues[~en_antes].to_dict("records")
+    eliminadas = datos_antes[~en_despues].to_dict("records")
+
+    columnas_comunes = [columna for columna in datos_antes.columns if columna in datos_despues.columns]
+    comunes = datos_antes.index[en_despues]
+    cambios = _celdas_distintas(datos_antes.loc[comunes, columnas_comunes], datos_despues.loc[comunes, columnas_comunes], "texto")
+    cambios += _celdas_distintas(casillas_antes.loc[comunes, columnas_comunes], casillas_despues.loc[comunes, columnas_comunes], "checkbox")
+    # Orden estable: por posición de la fila en la instantánea anterior y luego por columna.
+    posicion = {clave: i for i, clave in enumerate(comunes)}
+    orden_columna = {columna: j for j, columna in enumerate(columnas_comunes)}
+    cambios.sort(key=lambda cambio: (posicion[cambio["clave"]], orden_columna[cambio["columna"]], cambio["tipo"]))
+
+    return DiferenciaTablas(
+        columna_clave=nombre_clave,
+        agregadas=agregadas,
+        eliminadas=eliminadas,
+        cambios=cambios,
+        columnas_agregadas=[columna for columna in datos_despues.columns if columna not in datos_antes.columns],
+        columnas_eliminadas=[columna for columna in datos_antes.columns if columna not in datos_despues.columns],
+    )
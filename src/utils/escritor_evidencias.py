@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+
+class EscritorEvidencias:
+    """
+    Escritor asíncrono de evidencias (capturas de pantalla) con cola acotada.
+
+    El hilo del test solo obtiene los bytes de la captura y los entrega a este escritor,
+    que realiza el procesamiento y la escritura en disco en un pool de hilos. Si la cola
+    alcanza su capacidad máxima, `escribir` bloquea al llamador hasta que se libere un
+    hueco (backpressure), evitando que la memoria crezca sin límite.
+    """
+
+    def __init__(self, max_workers: int = 2, capacidad_cola: int = 16, logger=None):
+        """
+        Args:
+            max_workers (int): Número de hilos dedicados a procesar y escribir evidencias. Por defecto, 2.
+            capacidad_cola (int): Número máximo de evidencias pendientes antes de aplicar backpressure. Por defecto, 16.
+            logger (logging.Logger, opcional): Logger para registrar errores de escritura.
+        """
+        self.capacidad_cola = capacidad_cola
+        self.logger = logger
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="escritor_evidencias")
+        self._huecos = threading.BoundedSemaphore(capacidad_cola)
+        self._lock = threading.Lock()
+        self._pendientes: List[Future] = []
+        self._cerrado = False
+
+        # --- Métricas de la cola ---
+        self.encoladas = 0
+        self.escritas = 0
+        self.errores = 0
+        self.esperas_backpressure = 0
+        self.tiempo_backpressure = 0.0
+        self.max_en_cola = 0
+        self._en_cola = 0
+
+    def escribir(self, ruta: str, datos: bytes, procesar: Optional[Callable[[bytes], bytes]] = None,
+                 al_terminar: Optional[Callable[[str, bool], None]] = None) -> None:
+        """
+        Encola la escritura de una evidencia y retorna de inmediato (salvo backpressure).
+
+        Args:
+            ruta (str): Ruta completa del archivo a escribir.
+            datos (bytes): Contenido de la evidencia (por ejemplo, los bytes PNG de la captura).
+            procesar (Callable[[bytes], bytes], opcional): Transformación aplicada a los bytes en el
+                hilo de escritura (por ejemplo, recodificación o compresión) antes de guardarlos.
+            al_terminar (Callable[[str, bool], None], opcional): Se invoca en el hilo de escritura al
+                terminar, con la ruta y `True` si la evidencia quedó en disco o `False` si falló.
+
+        Raises:
+            RuntimeError: Si el escritor ya fue cerrado.
+        """
+        if self._cerrado:
+            raise RuntimeError("\nEl escritor de evidencias está cerrado; no se aceptan nuevas escrituras.")
+
+        if not self._huecos.acquire(blocking=False):
+            inicio_espera = time.perf_counter()
+            self._huecos.acquire()
+            with self._lock:
+                self.esperas_backpressure += 1
+                self.tiempo_backpressure += time.perf_counter() - inicio_espera
+
+        with self._lock:
+            self.encoladas += 1
+            self._en_cola += 1
+            self.max_en_cola = max(self.max_en_cola, self._en_cola)
+            futuro = self._executor.submit(self._escribir_en_disco, ruta, datos, procesar, al_terminar)
+            self._pendientes.append(futuro)
+
+    def _escribir_en_disco(self, ruta: str, datos: bytes, procesar: Optional[Callable[[bytes], bytes]],
+                           al_terminar: Optional[Callable[[str, bool], None]] = None) -> None:
+        """
+        Procesa y escribe una evidencia. Se ejecuta en un hilo del pool.
+        """
+        exito = False
+        try:
+            if procesar is not None:
+                datos = procesar(datos)
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            # Escritura atómica: otro proceso (worker de xdist) nunca ve un archivo a medio escribir.
+            ruta_temporal = f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(ruta_temporal, "wb") as archivo:
+                archivo.write(datos)
+            os.replace(ruta_temporal, ruta)
+            exito = True
+            with self._lock:
+                self.escritas += 1
+        except Exception as e:
+            with self._lock:
+                self.errores += 1
+            if self.logger:
+                self.logger.error(f"\n ❌ Error al escribir la evidencia '{ruta}': {e}")
+        finally:
+            with self._lock:
+                self._en_cola -= 1
+            self._huecos.release()
+            if al_terminar is not None:
+                try:
+                    al_terminar(ruta, exito)
+                except Exception as e:
+                    if self.logger:
+                        self.logger.error(f"\n ❌ Error en la notificación de escritura de '{ruta}': {e}")
+
+    def vaciar(self, timeout: Optional[float] = None) -> bool:
+        """
+        Espera a que todas las evidencias encoladas hasta el momento se escriban en disco.
+
+        Args:
+            timeout (float, opcional): Tiempo máximo de espera en segundos. `None` espera indefinidamente.
+
+        Returns:
+            bool: `True` si no quedan escrituras pendientes; `False` si se agotó el tiempo.
+        """
+        with self._lock:
+            pendientes = list(self._pendientes)
+            self._pendientes.clear()
+        _, no_terminadas = wait(pendientes, timeout=timeout)
+        if no_terminadas:
+            with self._lock:
+                self._pendientes.extend(no_terminadas)
+            return False
+        return True
+
+    def metricas(self) -> Dict[str, float]:
+        """
+        Devuelve las métricas de la cola de evidencias.
+
+        Returns:
+            Dict[str, float]: Encoladas, escritas, errores, esperas por backpressure,
+                              tiempo bloqueado por backpressure (s), máximo en cola y en cola actualmente.
+        """
+        with self._lock:
+            return {
+                "encoladas": self.encoladas,
+                "escritas": self.escritas,
+                "errores": self.errores,
+                "esperas_backpressure": self.esperas_backpressure,
+                "tiempo_backpressure": round(self.tiempo_backpressure, 4),
+                "max_en_cola": self.max_en_cola,
+                "en_cola": self._en_cola,
+                "capacidad_cola": self.capacidad_cola,
+            }
+
+    def cerrar(self, timeout: Optional[float] = None) -> bool:
+        """
+        Vacía la cola y libera el pool de hilos. Tras cerrarlo no se aceptan nuevas escrituras.
+
+        Args:
+            timeout (float, opcional): Tiempo máximo de espera en segundos para vaciar la cola.
+
+        Returns:
+            bool: `True` si todas las evidencias se escribieron antes de cerrar.
+        """
+        self._cerrado = True
+        completado = self.vaciar(timeout=timeout)
+        self._executor.shutdown(wait=completado)
+        return completado
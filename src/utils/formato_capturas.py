@@ -0,0 +1,160 @@
+import io
+import logging
+from typing import Callable, Dict, Optional
+
+try:
+    # Pillow (incluido en requirements.txt) solo se usa para codificar WebP y para reducir la
+    # resolución; si falta, esas opciones se descartan con una advertencia.
+    from PIL import Image
+except ImportError:  # pragma: no cover - depende del entorno
+    Image = None
+
+from .config import (
+    CAPTURAS_PASOS_FORMATO, CAPTURAS_PASOS_CALIDAD, CAPTURAS_PASOS_ESCALA,
+    CAPTURAS_PASOS_RECORTAR_ELEMENTO, CAPTURAS_PASOS_ANCHO_MAXIMO,
+)
+
+# Formatos de captura admitidos. Playwright codifica 'png' y 'jpeg' de forma nativa;
+# 'webp' se obtiene recodificando el PNG con Pillow en el hilo del escritor de evidencias.
+FORMATOS_CAPTURA = ("png", "jpeg", "webp")
+ESCALAS_CAPTURA = ("device", "css")
+EXTENSIONES_FORMATO = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+# La advertencia por falta de Pillow se emite una sola vez por proceso.
+_advertencia_pillow_emitida = False
+
+
+def _advertir_sin_pillow(formato: str, ancho_maximo: int) -> None:
+    """
+    Advierte (una vez por proceso) de que las opciones que requieren Pillow se descartan.
+    """
+    global _advertencia_pillow_emitida
+    if _advertencia_pillow_emitida:
+        return
+    _advertencia_pillow_emitida = True
+    descartadas = []
+    if formato == "webp":
+        descartadas.append("formato 'webp' (se usa 'jpeg')")
+    if ancho_maximo > 0:
+        descartadas.append(f"ancho_maximo={ancho_maximo} (se captura sin reducir)")
+    logging.getLogger("AutomationFramework").warning(
+        "\n⚠️ ADVERTENCIA: Pillow no está instalado; se ignoran las opciones de captura: %s. "
+        "Instálalo con 'pip install -r requirements.txt'.", ", ".join(descartadas))
+
+
+class OpcionesCaptura:
+    """
+    Describe cómo se obtiene y codifica una captura de pantalla: formato y calidad,
+    escala, recorte al elemento de la acción, reducción de resolución y página completa.
+    """
+
+    def __init__(self, formato: str = "png", calidad: int = 80, escala: str = "device",
+                 recortar_elemento: bool = False, ancho_maximo: int = 0, pagina_completa: bool = False):
+        """
+        Args:
+            formato (str): 'png' (sin pérdida), 'jpeg' o 'webp'. Por defecto, 'png'.
+            calidad (int): Calidad de 1 a 100 para 'jpeg' y 'webp'. Se ignora en 'png'. Por defecto, 80.
+            escala (str): 'device' captura a la resolución del dispositivo; 'css' a un píxel por píxel CSS,
+                          lo que reduce el tamaño en pantallas de alta densidad. Por defecto, 'device'.
+            recortar_elemento (bool): Si se recorta la captura al locator de la acción cuando se proporciona.
+            ancho_maximo (int): Si es mayor que 0, reduce la imagen a ese ancho en píxeles (requiere Pillow;
+                                sin él se ignora, con una advertencia).
+            pagina_completa (bool): Si se captura la página completa en lugar del viewport.
+
+        Raises:
+            ValueError: Si el formato, la escala o la calidad no son válidos.
+        """
+        formato = (formato or "png").strip().lower()
+        if formato == "jpg":
+            formato = "jpeg"
+        if formato not in FORMATOS_CAPTURA:
+            raise ValueError(f"\nEl formato de captura '{formato}' no existe. Formatos disponibles: {list(FORMATOS_CAPTURA)}")
+        if escala not in ESCALAS_CAPTURA:
+            raise ValueError(f"\nLa escala de captura '{escala}' no existe. Escalas disponibles: {list(ESCALAS_CAPTURA)}")
+        if not 1 <= calidad <= 100:
+            raise ValueError(f"\nLa calidad de captura ({calidad}) debe estar entre 1 y 100.")
+        if (formato == "webp" or ancho_maximo > 0) and Image is None:
+            # Sin Pillow no se puede recodificar: se degrada al formato con pérdida nativo de Playwright.
+            _advertir_sin_pillow(formato, ancho_maximo)
+            formato = "jpeg" if formato == "webp" else formato
+            ancho_maximo = 0
+        self.formato = formato
+        self.calidad = calidad
+        self.escala = escala
+        self.recortar_elemento = recortar_elemento
+        self.ancho_maximo = ancho_maximo
+        self.pagina_completa = pagina_completa
+
+    @property
+    def extension(self) -> str:
+        """Extensión de archivo correspondiente al formato final."""
+        return EXTENSIONES_FORMATO[self.formato]
+
+    def argumentos_playwright(self) -> Dict:
+        """
+        Devuelve los argumentos para `page.screenshot` / `locator.screenshot`. Para 'webp'
+        se captura en PNG y la recodificación la realiza `procesador()`.
+
+        Returns:
+            Dict: Argumentos 'type', 'scale' y, si aplica, 'quality'.
+        """
+        argumentos = {"type": "jpeg" if self.formato == "jpeg" else "png", "scale": self.escala}
+        if self.formato == "jpeg":
+            argumentos["quality"] = self.calidad
+        return argumentos
+
+    def procesador(self) -> Optional[Callable[[bytes], bytes]]:
+        """
+        Devuelve la transformación que el escritor de evidencias aplica en su hilo
+        (recodificación a WebP y/o reducción de resolución), o `None` si no hace falta.
+
+        Returns:
+            Callable[[bytes], bytes] | None: Función de bytes a bytes.
+        """
+        if self.formato != "webp" and self.ancho_maximo <= 0:
+            return None
+        formato_pil = {"png": "PNG", "jpeg": "JPEG", "webp": "WEBP"}[self.formato]
+        calidad = self.calidad
+        ancho_maximo = self.ancho_maximo
+
+        def _procesar(datos: bytes) -> bytes:
+            imagen = Image.open(io.BytesIO(datos))
+            if ancho_maximo > 0 and imagen.width > ancho_maximo:
+                alto = max(1, round(imagen.height * ancho_maximo / imagen.width))
+                imagen = imagen.resize((ancho_maximo, alto))
+            if formato_pil == "JPEG" and imagen.mode != "RGB":
+                imagen = imagen.convert("RGB")
+            salida = io.BytesIO()
+            if formato_pil == "PNG":
+                imagen.save(salida, format=formato_pil, optimize=True)
+            else:
+                imagen.save(salida, format=formato_pil, quality=calidad)
+            return salida.getvalue()
+
+        return _procesar
+
+    def __repr__(self):
+        return (f"OpcionesCaptura(formato='{self.formato}', calidad={self.calidad}, escala='{self.escala}', "
+                f"recortar_elemento={self.recortar_elemento}, ancho_maximo={self.ancho_maximo}, "
+                f"pagina_completa={self.pagina_completa})")
+
+
+# Las capturas de fallo se conservan siempre sin pérdida y de la página completa.
+OPCIONES_CAPTURA_FALLO = OpcionesCaptura(formato="png", escala="device", pagina_completa=True)
+
+
+def crear_opciones_captura_pasos() -> OpcionesCaptura:
+    """
+    Crea las opciones de las capturas de pasos exitosos a partir de las variables de entorno
+    CAPTURAS_PASOS_* (por defecto, PNG sin pérdida del viewport, como históricamente).
+
+    Returns:
+        OpcionesCaptura: Opciones para las capturas de pasos.
+    """
+    return OpcionesCaptura(
+        formato=CAPTURAS_PASOS_FORMATO,
+        calidad=CAPTURAS_PASOS_CALIDAD,
+        escala=CAPTURAS_PASOS_ESCALA,
+        recortar_elemento=CAPTURAS_PASOS_RECORTAR_ELEMENTO,
+        ancho_maximo=CAPTURAS_PASOS_ANCHO_MAXIMO,
+    )
@@ -0,0 +1,76 @@
+from collections import defaultdict
+from typing import Dict, List, Set, Tuple
+
+from .instantanea_tabla import InstantaneaTabla
+
+# Longitud de los n-gramas del índice de subcadenas.
+LONGITUD_NGRAMA = 3
+
+
+class IndiceTabla:
+    """
+    Índice en memoria de una `InstantaneaTabla` para búsquedas repetidas sobre la misma tabla.
+
+    - Índice exacto: diccionario {texto de la celda: [(fila, columna), ...]}, búsqueda O(1).
+    - Índice de subcadenas: diccionario {n-grama en minúsculas: {filas}} sobre el texto de cada
+      fila. Una búsqueda parcial intersecta los conjuntos de los n-gramas del texto buscado y solo
+      confirma con `in` las filas candidatas, en lugar de recorrer todas las filas.
+
+    Filas y columnas empiezan en 0, como en la instantánea.
+    """
+
+    def __init__(self, instantanea: InstantaneaTabla, longitud_ngrama: int = LONGITUD_NGRAMA):
+        """
+        Args:
+            instantanea (InstantaneaTabla): Instantánea de la tabla a indexar.
+            longitud_ngrama (int): Longitud de los n-gramas del índice de subcadenas. Por defecto, 3.
+        """
+        self.instantanea = instantanea
+        self.longitud_ngrama = longitud_ngrama
+        self._exacto: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._ngramas: Dict[str, Set[int]] = defaultdict(set)
+        self._textos_minusculas: List[str] = [texto.lower() for texto in instantanea.textos_filas]
+
+        for j, columna in enumerate(instantanea.columnas):
+            for i, texto in enumerate(columna):
+                if texto is not None:
+                    self._exacto[texto].append((i, j))
+        for coordenadas in self._exacto.values():
+            coordenadas.sort()
+
+        for i, texto in enumerate(self._textos_minusculas):
+            for ngrama in self._ngramas_de(texto):
+                self._ngramas[ngrama].add(i)
+
+    def _ngramas_de(self, texto: str) -> Set[str]:
+        """Conjunto de n-gramas de un texto."""
+        n = self.longitud_ngrama
+        return {texto[k:k + n] for k in range(len(texto) - n + 1)}
+
+    def buscar_exacto(self, texto: str) -> List[Tuple[int, int]]:
+        """
+        Devuelve las celdas cuyo texto (sin espacios alrededor) es exactamente `texto`.
+
+        Returns:
+            List[Tuple[int, int]]: Coordenadas (fila, columna), ordenadas por fila y columna.
+        """
+        return list(self._exacto.get(texto, ()))
+
+    def buscar_parcial(self, texto: str) -> List[int]:
+        """
+        Devuelve las filas cuyo texto contiene `texto`, sin distinguir mayúsculas y minúsculas.
+
+        Returns:
+            List[int]: Índices de las filas con coincidencia, en orden.
+        """
+        buscado = texto.lower()
+        if len(buscado) < self.longitud_ngrama:
+            # Demasiado corto para el índice de n-gramas: se recorre el texto ya en minúsculas.
+            candidatas = range(len(self._textos_minusculas))
+        else:
+            conjuntos = sorted((self._ngramas.get(ngrama, set()) for ngrama in self._ngramas_de(buscado)), key=len)
+            candidatas = sorted(set.intersection(*conjuntos)) if conjuntos[0] else []
+        return [i for i in candidatas if buscado in self._textos_minusculas[i]]
+
+    def __repr__(self):
+        return f"IndiceTabla(filas={self.instantanea.num_filas}, valores={len(self._exacto)}, ngramas={len(self._ngramas)})"
@@ -0,0 +1,193 @@
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class InstantaneaTabla:
+    """
+    Instantánea (snapshot) de una tabla HTML en memoria, orientada a columnas.
+
+    Se obtiene con una única llamada `evaluate` (ver `TableActions.snapshot`), por lo que
+    todas las verificaciones posteriores se ejecutan en Python sin más viajes al navegador.
+    Las celdas inexistentes (filas con menos `<td>` que columnas) se representan con `None`.
+    """
+
+    def __init__(self, encabezados: List[str], columnas: List[List[Optional[str]]],
+                 casillas: List[List[Optional[bool]]], atributos: List[Dict[str, str]], textos_filas: List[str]):
+        """
+        Args:
+            encabezados (List[str]): Texto de cada encabezado `<th>`.
+            columnas (List[List[Optional[str]]]): Texto de las celdas, una lista por columna.
+            casillas (List[List[Optional[bool]]]): Estado del checkbox de cada celda, una lista por
+                                                   columna (`None` si la celda no contiene checkbox).
+            atributos (List[Dict[str, str]]): Atributos de cada fila `<tr>` (id, class, data-*, ...).
+            textos_filas (List[str]): Texto completo de cada fila.
+        """
+        self.encabezados = encabezados
+        self.columnas = columnas
+        self.casillas = casillas
+        self.atributos = atributos
+        self.textos_filas = textos_filas
+
+    @classmethod
+    def desde_evaluate(cls, datos: Dict[str, Any]) -> "InstantaneaTabla":
+        """
+        Construye la instantánea a partir del resultado del script de `TableActions.snapshot`.
+        """
+        return cls(
+            encabezados=datos.get("encabezados", []),
+            columnas=datos.get("columnas", []),
+            casillas=datos.get("casillas", []),
+            atributos=datos.get("atributos", []),
+            textos_filas=datos.get("textos_filas", []),
+        )
+
+    @classmethod
+    def concatenar(cls, instantaneas: List["InstantaneaTabla"]) -> "InstantaneaTabla":
+        """
+        Une varias instantáneas de la misma tabla (por ejemplo, una por página de una tabla
+        paginada) en una sola, con las filas en el orden recibido. Los encabezados son los de
+        la primera instantánea que los tenga.
+        """
+        encabezados = next((instantanea.encabezados for instantanea in instantaneas if instantanea.encabezados), [])
+        num_columnas = max([len(encabezados)] + [instantanea.num_columnas for instantanea in instantaneas])
+        columnas: List[List[Optional[str]]] = [[] for _ in range(num_columnas)]
+        casillas: List[List[Optional[bool]]] = [[] for _ in range(num_columnas)]
+        atributos, textos_filas = [], []
+        for instantanea in instantaneas:
+            for j in range(num_columnas):
+                if j < instantanea.num_columnas:
+                    columnas[j].extend(instantanea.columnas[j])
+                    casillas[j].extend(instantanea.casillas[j])
+                else:
+                    columnas[j].extend([None] * instantanea.num_filas)
+                    casillas[j].extend([None] * instantanea.num_filas)
+            atributos.extend(instantanea.atributos)
+            textos_filas.extend(instantanea.textos_filas)
+        return cls(encabezados, columnas, casillas, atributos, textos_filas)
+
+    @property
+    def num_filas(self) -> int:
+        """Número de filas de datos (`tbody tr`)."""
+        return len(self.textos_filas)
+
+    @property
+    def num_columnas(self) -> int:
+        """Número de columnas (máximo entre encabezados y celdas por fila)."""
+        return len(self.columnas)
+
+    def nombres_columnas(self) -> List[str]:
+        """
+        Devuelve un nombre único para cada columna: el texto de su encabezado o, si falta o está
+        vacío, 'columna_<n>' (empezando en 1). Los encabezados repetidos se distinguen con un
+        sufijo a partir de su segunda aparición ('A', 'A_2', 'A_3', ...).
+        """
+        nombres = []
+        usados = set()
+        for j in range(self.num_columnas):
+            encabezado = self.encabezados[j] if j < len(self.encabezados) else ""
+            nombre = base = encabezado or f"columna_{j + 1}"
+            sufijo = 2
+            while nombre in usados:
+                nombre = f"{base}_{sufijo}"
+                sufijo += 1
+            usados.add(nombre)
+            nombres.append(nombre)
+        return nombres
+
+    def indice_columna(self, nombre: str) -> int:
+        """
+        Devuelve el índice de la columna cuyo encabezado coincide exactamente con `nombre`.
+
+        Returns:
+            int: Índice de la columna, o -1 si no existe.
+        """
+        return self.encabezados.index(nombre) if nombre in self.encabezados else -1
+
+    def columna(self, nombre_o_indice) -> List[Optional[str]]:
+        """
+        Devuelve el texto de todas las celdas de una columna.
+
+        Args:
+            nombre_o_indice (Union[str, int]): Encabezado o índice de la columna.
+
+        Raises:
+            KeyError: Si la columna no existe.
+        """
+        indice = nombre_o_indice if isinstance(nombre_o_indice, int) else self.indice_columna(nombre_o_indice)
+        if not 0 <= indice < self.num_columnas:
+            raise KeyError(f"\nLa columna '{nombre_o_indice}' no existe. Encabezados disponibles: {self.encabezados}")
+        return self.columnas[indice]
+
+    def valores_fila(self, indice_fila: int) -> List[Optional[str]]:
+        """
+        Devuelve el texto de las celdas de una fila, en el orden de las columnas.
+        """
+        return [columna[indice_fila] for columna in self.columnas]
+
+    def fila(self, indice_fila: int) -> Dict[str, Optional[str]]:
+        """
+        Devuelve una fila como diccionario {nombre de columna: texto de la celda}.
+        """
+        return dict(zip(self.nombres_columnas(), self.valores_fila(indice_fila)))
+
+    def filas(self) -> Iterator[Dict[str, Optional[str]]]:
+        """
+        Itera las filas como diccionarios {nombre de columna: texto de la celda}.
+        """
+        nombres = self.nombres_columnas()
+        for i in range(self.num_filas):
+            yield dict(zip(nombres, (columna[i] for columna in self.columnas)))
+
+    def casilla(self, indice_fila: int, nombre_o_indice) -> Optional[bool]:
+        """
+        Devuelve el estado del checkbox de una celda (`None` si la celda no contiene checkbox).
+        """
+        indice = nombre_o_indice if isinstance(nombre_o_indice, int) else self.indice_columna(nombre_o_indice)
+        if not 0 <= indice < self.num_columnas:
+            raise KeyError(f"\nLa columna '{nombre_o_indice}' no existe. Encabezados disponibles: {self.encabezados}")
+        return self.casillas[indice][indice_fila]
+
+    def posiciones_casillas(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve las coordenadas (fila, columna) de las celdas con checkbox, en el orden del documento
+        (fila a fila y, dentro de cada fila, de izquierda a derecha). Cada celda cuenta una sola vez
+        aunque contenga varios checkboxes, por lo que la posición k de la lista no equivale al
+        k-ésimo `tbody tr td input[type='checkbox']`: el checkbox se localiza por su fila y su celda.
+        """
+        return [(i, j) for i in range(self.num_filas) for j in range(self.num_columnas)
+                if self.casillas[j][i] is not None]
+
+    def a_dataframe(self, casillas: bool = False):
+        """
+        Carga la instantánea en un DataFrame de pandas: una columna por columna de la tabla
+        (con los nombres únicos de `nombres_columnas`) y una fila por fila de datos. pandas se importa
+        aquí para no cargarlo en los tests que no verifican tablas.
+
+        Args:
+            casillas (bool): Si es `True`, el DataFrame contiene el estado de los checkboxes
+                             (`True`/`False`/`None`) en lugar del texto de las celdas.
+
+        Returns:
+            pandas.DataFrame: Los datos de la tabla, con valores de tipo objeto (`None` para celdas inexistentes).
+        """
+        import pandas as pd
+
+        origen = self.casillas if casillas else self.columnas
+        datos = pd.DataFrame({j: pd.Series(columna, dtype=object) for j, columna in enumerate(origen)},
+                             index=range(self.num_filas))
+        datos.columns = self.nombres_columnas()
+        return datos
+
+    def a_diccionario(self) -> Dict[str, Any]:
+        """
+        Devuelve la instantánea como un diccionario serializable (por ejemplo, para guardarla en JSON).
+        """
+        return {
+            "encabezados": self.encabezados,
+            "columnas": self.columnas,
+            "casillas": self.casillas,
+            "atributos": self.atributos,
+            "textos_filas": self.textos_filas,
+        }
+
+    def __repr__(self):
+        return f"InstantaneaTabla(filas={self.num_filas}, columnas={self.num_columnas}, encabezados={self.encabezados})"
@@ -1,13 +1,140 @@
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from datetime import datetime
-from .config import LOGGER_DIR # Importa la ruta del directorio de logs desde config.py
+from typing import Any, Callable, Optional
+from .config import LOGGER_DIR, LOG_NIVEL_CONSOLA, LOG_NIVEL_ARCHIVO # Importa la ruta del directorio de logs desde config.py
+
+# --- Subsistema de logging compartido por todo el proceso ---
+# Los loggers del framework solo encolan registros (_QueueHandlerDiferido, sin formatearlos); un único
+# hilo (QueueListener) se encarga del formateo y de la escritura en consola y en un solo archivo por proceso.
+_cola_logs: Optional[queue.Queue] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+_handlers_salida = []
+_lock_logging = threading.Lock()
+
+# El campo %(test)s identifica el test que emitió cada línea dentro del archivo compartido.
+_FORMATO_LOG = '%(asctime)s - %(name)s - %(levelname)s - [%(test)s] - %(message)s'
+
+
+class _FiltroContextoTest(logging.Filter):
+    """
+    Garantiza que todos los registros tengan el campo de contexto 'test' (con '-' si el
+    emisor no lo proporcionó), para que el formateador no falle en el hilo del listener.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "test"):
+            record.test = "-"
+        return True
+
+
+class _QueueHandlerDiferido(logging.handlers.QueueHandler):
+    """
+    QueueHandler que no formatea en el hilo que emite el log. El `prepare` estándar llama a
+    `self.format(record)` antes de encolar, con lo que la interpolación de `%s` (incluidos los
+    repr de locators) se hace en el hilo del test. Aquí solo se encola una copia superficial
+    del registro y los handlers del listener construyen el mensaje.
+
+    En el hilo emisor solo se resuelve lo que no puede esperar al listener:
+    - `exc_info` se convierte a texto, porque el traceback referencia frames del hilo del test.
+    - Los argumentos `Diferido` se evalúan, porque su cálculo puede invocar a Playwright, que
+      no debe usarse desde el hilo del listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        copia = copy.copy(record)
+        if copia.exc_info:
+            if not copia.exc_text:
+                copia.exc_text = _formateador_excepciones.formatException(copia.exc_info)
+            copia.exc_info = None
+        if isinstance(copia.args, tuple) and any(isinstance(arg, Diferido) for arg in copia.args):
+            copia.args = tuple(arg.valor() if isinstance(arg, Diferido) else arg for arg in copia.args)
+        return copia
+
+
+# Solo se usa para convertir tracebacks a texto en `_QueueHandlerDiferido.prepare`.
+_formateador_excepciones = logging.Formatter()
+
+
+def iniciar_logging(console_level=logging.INFO, file_level=logging.DEBUG) -> logging.handlers.QueueHandler:
+    """
+    Inicia (una sola vez por proceso) el subsistema de logging basado en cola: un handler de
+    consola y un handler de archivo atendidos por un único hilo QueueListener. Las llamadas
+    posteriores reutilizan el mismo subsistema.
+
+    Con pytest-xdist cada worker es un proceso y escribe su propio archivo, sufijado con el
+    identificador del worker.
+
+    Args:
+        console_level (int): Nivel mínimo para la consola. Por defecto, logging.INFO.
+        file_level (int): Nivel mínimo para el archivo. Por defecto, logging.DEBUG.
+
+    Returns:
+        logging.handlers.QueueHandler: El handler que los loggers del framework comparten.
+    """
+    global _cola_logs, _queue_handler, _listener, _handlers_salida
+    with _lock_logging:
+        if _queue_handler is not None:
+            return _queue_handler
+
+        formatter = logging.Formatter(_FORMATO_LOG, datefmt='%Y-%m-%d %H:%M:%S')
+
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(console_level) # Nivel de log específico para la consola
+        console_handler.setFormatter(formatter)
+
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        worker = os.getenv("PYTEST_XDIST_WORKER")
+        log_file_name = f"automation_log_{timestamp}_{worker}.log" if worker else f"automation_log_{timestamp}.log"
+        os.makedirs(LOGGER_DIR, exist_ok=True)
+        file_handler = logging.FileHandler(os.path.join(LOGGER_DIR, log_file_name), encoding='utf-8')
+        file_handler.setLevel(file_level) # Nivel de log específico para el archivo
+        file_handler.setFormatter(formatter)
+
+        # Cola sin límite: emitir un log nunca bloquea el hilo del test.
+        _cola_logs = queue.Queue(-1)
+        _queue_handler = _QueueHandlerDiferido(_cola_logs)
+        _queue_handler.addFilter(_FiltroContextoTest())
+        _handlers_salida = [console_handler, file_handler]
+        _listener = logging.handlers.QueueListener(_cola_logs, *_handlers_salida, respect_handler_level=True)
+        _listener.start()
+        atexit.register(detener_logging)
+        return _queue_handler
+
+
+def detener_logging() -> None:
+    """
+    Detiene el hilo del listener tras procesar los registros pendientes y cierra los handlers
+    de salida. Es seguro llamarla varias veces; un `setup_logger` posterior reinicia el subsistema.
+    """
+    global _cola_logs, _queue_handler, _listener, _handlers_salida
+    with _lock_logging:
+        if _listener is None:
+            return
+        _listener.stop() # Vacía la cola antes de terminar el hilo
+        for handler in _handlers_salida:
+            handler.close()
+        for logger in list(logging.Logger.manager.loggerDict.values()):
+            if isinstance(logger, logging.Logger) and _queue_handler in logger.handlers:
+                logger.removeHandler(_queue_handler)
+        _cola_logs = _queue_handler = _listener = None
+        _handlers_salida = []
+
 
 def setup_logger(name='playwright_automation', console_level=logging.INFO, file_level=logging.DEBUG):
     """
     Configura y devuelve una instancia de logger para el framework de automatización,
     permitiendo niveles de logging separados para consola y archivo.
 
+    El logger se conecta al subsistema compartido (ver `iniciar_logging`): llamarla varias veces
+    no recrea handlers ni abre archivos nuevos, y emitir un mensaje solo lo encola.
+
     Args:
         name (str): El nombre del logger. Por defecto, 'playwright_automation'.
         console_level (int): El nivel mínimo de logging para los mensajes que se muestran en la consola.
@@ -18,6 +145,8 @@ def setup_logger(name='playwright_automation', console_level=logging.INFO, file_
     Returns:
         logging.Logger: Una instancia del logger configurado.
     """
+    queue_handler = iniciar_logging(console_level, file_level)
+
     # 1. Obtener o crear una instancia del logger
     logger = logging.getLogger(name)
 
@@ -28,31 +157,122 @@ def setup_logger(name='playwright_automation', console_level=logging.INFO, file_
     # 3. Evitar que los logs se propaguen a handlers de loggers padre, lo que evita duplicación
     logger.propagate = False
 
-    # 4. Limpiar handlers existentes para evitar duplicación si la función se llama varias veces
-    if logger.handlers:
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
+    # 4. Conectar el logger a la cola compartida una sola vez
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
+
+    return logger
+
 
-    # 5. Definir el formato de los mensajes de log
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+class Diferido:
+    """
+    Argumento de log cuyo valor solo se calcula si el mensaje llega a formatearse.
+    Útil para valores costosos (texto de una fila, repr de un locator, JSON de una estructura):
 
-    # 6. Configurar el handler para la consola (StreamHandler)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(console_level) # Nivel de log específico para la consola
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        self.logger.debug("Fila %s: '%s'", i, diferir(lambda: fila.text_content()))
 
-    # 7. Configurar el handler para el archivo (FileHandler)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file_name = f"automation_log_{timestamp}.log"
-    log_file_path = os.path.join(LOGGER_DIR, log_file_name)
+    El cálculo ocurre en el hilo que emite el log (nunca en el hilo del listener), por lo que
+    puede invocar a Playwright con seguridad. El resultado se memoriza tras la primera evaluación.
+    """
 
-    file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-    file_handler.setLevel(file_level) # Nivel de log específico para el archivo
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    __slots__ = ("_funcion", "_valor", "_evaluado")
 
-    return logger
+    def __init__(self, funcion: Callable[[], Any]):
+        self._funcion = funcion
+        self._valor = None
+        self._evaluado = False
+
+    def valor(self) -> Any:
+        if not self._evaluado:
+            self._valor = self._funcion()
+            self._evaluado = True
+        return self._valor
+
+    def __str__(self) -> str:
+        return str(self.valor())
+
+    def __repr__(self) -> str:
+        return repr(self.valor())
+
+    def __format__(self, especificacion: str) -> str:
+        return format(self.valor(), especificacion)
+
+    def __float__(self) -> float:
+        return float(self.valor())
+
+    def __int__(self) -> int:
+        return int(self.valor())
+
+
+def diferir(funcion: Callable[[], Any]) -> Diferido:
+    """
+    Envuelve un cálculo costoso para usarlo como argumento de log diferido (ver `Diferido`).
+
+    Args:
+        funcion (Callable[[], Any]): Función sin argumentos que produce el valor a registrar.
+
+    Returns:
+        Diferido: Argumento que solo se evalúa si el nivel del mensaje está activo.
+    """
+    return Diferido(funcion)
+
+
+class LoggerFramework(logging.LoggerAdapter):
+    """
+    Fachada de logging de las acciones del framework sobre el logger compartido.
+
+    Los mensajes se emiten con formato diferido al estilo de `logging` (`"texto %s", valor`) en
+    lugar de f-strings: si el nivel está desactivado no se construye el mensaje, no se convierten
+    los argumentos a texto (por ejemplo, el repr de un Locator) y los argumentos `Diferido` no se
+    evalúan. Añade el nombre del test como campo de contexto 'test' de cada registro.
+    """
+
+    def __init__(self, logger: logging.Logger, nombre_test: Optional[str] = None):
+        """
+        Args:
+            logger (logging.Logger): Logger subyacente conectado al subsistema compartido.
+            nombre_test (str, opcional): Nombre del test en curso. Si no se indica, se usa '-'.
+        """
+        super().__init__(logger, {"test": nombre_test or "-"})
+
+    @property
+    def depuracion_activa(self) -> bool:
+        """
+        Indica si los mensajes DEBUG se emiten. Permite omitir bloques completos que solo
+        preparan información de depuración (por ejemplo, reconstruir el texto de una fila).
+        """
+        return self.isEnabledFor(logging.DEBUG)
+
+
+def _nivel_logging(nivel) -> int:
+    """
+    Convierte un nivel expresado como texto ('DEBUG', 'INFO', ...) o entero en su valor numérico.
+    """
+    if isinstance(nivel, int):
+        return nivel
+    valor = logging.getLevelName(str(nivel).upper())
+    return valor if isinstance(valor, int) else logging.INFO
+
+
+def obtener_logger_test(nombre_test: Optional[str] = None, name='AutomationFramework',
+                        console_level=None, file_level=None) -> LoggerFramework:
+    """
+    Devuelve el logger compartido del framework con el nombre del test como campo de contexto,
+    en lugar de un archivo de log por test.
+
+    Args:
+        nombre_test (str, opcional): Nombre del test en curso. Si no se indica, se usa '-'.
+        name (str): El nombre del logger subyacente. Por defecto, 'AutomationFramework'.
+        console_level (int | str, opcional): Nivel mínimo para la consola. Por defecto, LOG_NIVEL_CONSOLA (INFO).
+        file_level (int | str, opcional): Nivel mínimo para el archivo. Por defecto, LOG_NIVEL_ARCHIVO (DEBUG).
+
+    Returns:
+        LoggerFramework: Fachada que difiere el formateo y añade el campo 'test' a cada registro.
+    """
+    console_level = _nivel_logging(LOG_NIVEL_CONSOLA if console_level is None else console_level)
+    file_level = _nivel_logging(LOG_NIVEL_ARCHIVO if file_level is None else file_level)
+    logger = setup_logger(name=name, console_level=console_level, file_level=file_level)
+    return LoggerFramework(logger, nombre_test)
 
 """# --- Ejemplo de uso (opcional, para testing rápido del logger) ---
 if __name__ == "__main__":
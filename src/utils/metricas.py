@@ -0,0 +1,233 @@
+import csv
+import json
+import math
+import os
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+# Límites superiores (en segundos) de los buckets del histograma de cada métrica.
+# El último bucket (+Inf) acumula las muestras mayores que el último límite.
+LIMITES_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Etiquetas con las que se agrupan las muestras.
+ETIQUETAS_METRICAS = ("accion", "locator", "navegador", "dispositivo")
+
+_PATRON_SELECTOR_LOCATOR = re.compile(r"selector='(.*)'>$")
+
+
+def describir_locator(locator) -> str:
+    """
+    Devuelve una descripción estable de un locator para usarla como etiqueta: el selector
+    si es un Locator de Playwright o el propio texto si es una cadena.
+
+    Args:
+        locator (Union[str, Locator, None]): Locator o selector.
+
+    Returns:
+        str: Selector del locator ('' si no se proporcionó).
+    """
+    if locator is None:
+        return ""
+    if isinstance(locator, str):
+        return locator
+    texto = repr(locator)
+    coincidencia = _PATRON_SELECTOR_LOCATOR.search(texto)
+    return coincidencia.group(1) if coincidencia else texto
+
+
+class SerieMetrica:
+    """
+    Muestras de un temporizador con nombre para una combinación concreta de etiquetas,
+    con su histograma por buckets y el cálculo de percentiles.
+    """
+
+    def __init__(self, nombre: str, etiquetas: Dict[str, str]):
+        """
+        Args:
+            nombre (str): Nombre del temporizador (por ejemplo, 'validar_elemento_visible.visible_check').
+            etiquetas (Dict[str, str]): Acción, locator, navegador y dispositivo de la serie.
+        """
+        self.nombre = nombre
+        self.etiquetas = etiquetas
+        self.muestras: List[float] = []
+        self.buckets: List[int] = [0] * (len(LIMITES_BUCKETS) + 1)
+
+    def agregar(self, duracion: float) -> None:
+        """
+        Agrega una muestra (en segundos) a la serie y a su bucket del histograma.
+        """
+        self.muestras.append(duracion)
+        self.buckets[bisect_left(LIMITES_BUCKETS, duracion)] += 1
+
+    def percentil(self, p: float) -> float:
+        """
+        Calcula el percentil `p` (0-100) por el método del rango más cercano.
+
+        Args:
+            p (float): Percentil a calcular, por ejemplo 95.
+
+        Returns:
+            float: Valor del percentil en segundos (0.0 si no hay muestras).
+        """
+        if not self.muestras:
+            return 0.0
+        ordenadas = sorted(self.muestras)
+        rango = max(1, math.ceil(p / 100 * len(ordenadas)))
+        return ordenadas[rango - 1]
+
+    def resumen(self) -> Dict:
+        """
+        Returns:
+            Dict: Nombre, etiquetas, conteo, suma, mínimo, máximo, media, p50, p95, p99 y buckets acumulativos.
+        """
+        total = sum(self.muestras)
+        cantidad = len(self.muestras)
+        # Buckets acumulativos: 'le_X' cuenta las muestras menores o iguales a X segundos.
+        buckets, acumulado = {}, 0
+        for limite, conteo in zip(LIMITES_BUCKETS, self.buckets):
+            acumulado += conteo
+            buckets[f"le_{limite}"] = acumulado
+        buckets["le_inf"] = cantidad
+        return {
+            "nombre": self.nombre,
+            **self.etiquetas,
+            "conteo": cantidad,
+            "suma": round(total, 6),
+            "min": round(min(self.muestras), 6) if cantidad else 0.0,
+            "max": round(max(self.muestras), 6) if cantidad else 0.0,
+            "media": round(total / cantidad, 6) if cantidad else 0.0,
+            "p50": round(self.percentil(50), 6),
+            "p95": round(self.percentil(95), 6),
+            "p99": round(self.percentil(99), 6),
+            "buckets": buckets,
+        }
+
+
+class RegistroMetricas:
+    """
+    Registro de métricas de tiempo del framework. Las acciones registran temporizadores con
+    nombre y etiquetas (acción, locator, navegador, dispositivo); el registro agrupa las
+    muestras en series, calcula histogramas y percentiles y las exporta a JSON o CSV al final
+    de la sesión, para comparar la latencia de la UI entre ejecuciones.
+    """
+
+    def __init__(self):
+        self._series: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], SerieMetrica] = {}
+        self._lock = threading.Lock()
+
+    def registrar(self, nombre: str, duracion: float, **etiquetas: str) -> None:
+        """
+        Registra una muestra de tiempo.
+
+        Args:
+            nombre (str): Nombre del temporizador.
+            duracion (float): Duración en segundos.
+            **etiquetas (str): Etiquetas de la muestra (accion, locator, navegador, dispositivo, ...).
+        """
+        etiquetas_normalizadas = {clave: str(valor) for clave, valor in etiquetas.items() if valor is not None}
+        clave = (nombre, tuple(sorted(etiquetas_normalizadas.items())))
+        with self._lock:
+            serie = self._series.get(clave)
+            if serie is None:
+                serie = self._series[clave] = SerieMetrica(nombre, etiquetas_normalizadas)
+            serie.agregar(duracion)
+
+    def series(self) -> List[SerieMetrica]:
+        """
+        Returns:
+            List[SerieMetrica]: Copia de la lista de series registradas.
+        """
+        with self._lock:
+            return list(self._series.values())
+
+    def resumen(self) -> List[Dict]:
+        """
+        Returns:
+            List[Dict]: Resumen de cada serie, ordenado por nombre.
+        """
+        return sorted((serie.resumen() for serie in self.series()), key=lambda r: (r["nombre"], r.get("accion", "")))
+
+    def exportar_json(self, ruta: str) -> str:
+        """
+        Exporta el resumen de todas las series (incluidos los buckets) a un archivo JSON.
+
+        Args:
+            ruta (str): Ruta del archivo a escribir.
+
+        Returns:
+            str: La ruta escrita.
+        """
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"limites_buckets": list(LIMITES_BUCKETS), "metricas": self.resumen()}, archivo, indent=2, ensure_ascii=False)
+        return ruta
+
+    def exportar_csv(self, ruta: str) -> str:
+        """
+        Exporta el resumen de todas las series a CSV, una fila por serie y una columna por bucket.
+
+        Args:
+            ruta (str): Ruta del archivo a escribir.
+
+        Returns:
+            str: La ruta escrita.
+        """
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        columnas_buckets = [f"le_{limite}" for limite in LIMITES_BUCKETS] + ["le_inf"]
+        columnas = ["nombre", *ETIQUETAS_METRICAS, "conteo", "suma", "min", "max", "media", "p50", "p95", "p99", *columnas_buckets]
+        with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=columnas, extrasaction="ignore")
+            escritor.writeheader()
+            for fila in self.resumen():
+                buckets = fila.pop("buckets")
+                escritor.writerow({**fila, **buckets})
+        return ruta
+
+    def exportar_muestras(self) -> List[Dict]:
+        """
+        Devuelve las muestras crudas de cada serie en un formato serializable (por ejemplo,
+        para enviarlas desde un worker de pytest-xdist al proceso controlador).
+
+        Returns:
+            List[Dict]: Una entrada por serie con 'nombre', 'etiquetas' y 'muestras'.
+        """
+        return [{"nombre": serie.nombre, "etiquetas": dict(serie.etiquetas), "muestras": list(serie.muestras)}
+                for serie in self.series()]
+
+    def combinar_muestras(self, series: List[Dict]) -> None:
+        """
+        Incorpora muestras exportadas por `exportar_muestras` desde otro registro.
+
+        Args:
+            series (List[Dict]): Entradas con 'nombre', 'etiquetas' y 'muestras'.
+        """
+        for entrada in series:
+            for duracion in entrada.get("muestras", []):
+                self.registrar(entrada["nombre"], duracion, **entrada.get("etiquetas", {}))
+
+    def limpiar(self) -> None:
+        """
+        Elimina todas las series registradas.
+        """
+        with self._lock:
+            self._series.clear()
+
+
+_registro: Optional[RegistroMetricas] = None
+_lock_registro = threading.Lock()
+
+
+def obtener_registro_metricas() -> RegistroMetricas:
+    """
+    Devuelve el registro de métricas del proceso (uno por worker de pytest-xdist).
+
+    Returns:
+        RegistroMetricas: El registro compartido.
+    """
+    global _registro
+    with _lock_registro:
+        if _registro is None:
+            _registro = RegistroMetricas()
+        return _registro
@@ -0,0 +1,33 @@
+import re
+from typing import Dict, Optional
+
+# Marcador del número de página en las plantillas de URL.
+MARCADOR_PAGINA = "{pagina}"
+
+
+def plantilla_url_paginas(enlaces: Dict[str, str]) -> Optional[str]:
+    """
+    Deduce una plantilla de URL para las páginas de una tabla paginada a partir de los enlaces
+    numéricos de su paginación (por ejemplo, {'2': '.../lista?page=2', '3': '.../lista?page=3'}
+    produce '.../lista?page={pagina}'). El número se sustituye en su última aparición como
+    número completo, de modo que '...?page=2&size=20' no confunde el '2' de '20'.
+
+    Args:
+        enlaces (Dict[str, str]): {número de página: href} de los enlaces de la paginación.
+
+    Returns:
+        Optional[str]: La plantilla con el marcador '{pagina}', o `None` si las páginas no son
+                       direccionables por URL (enlaces '#', 'javascript:' o sin un patrón común).
+    """
+    plantillas = set()
+    for numero, href in enlaces.items():
+        if not href or href.startswith("javascript:") or href.endswith("#"):
+            # Enlaces que no cambian la URL: la página solo se alcanza haciendo clic.
+            continue
+        apariciones = list(re.finditer(rf"(?<!\d){re.escape(numero)}(?!\d)", href))
+        if not apariciones:
+            # Típicamente la página 1, cuyo enlace omite el número ('.../lista').
+            continue
+        ultima = apariciones[-1]
+        plantillas.add(href[:ultima.start()] + MARCADOR_PAGINA + href[ultima.end():])
+    return plantillas.pop() if len(plantillas) == 1 else None
@@ -0,0 +1,89 @@
+from typing import Dict, Optional
+
+from .config import PERFIL_EJECUCION
+
+
+class PerfilEjecucion:
+    """
+    Agrupa en un único lugar los parámetros que controlan el "ritmo" de la ejecución:
+    el `slow_mo` de los navegadores, las esperas fijas posteriores a cada acción,
+    el resaltado de elementos, la política de capturas de pantalla y la retención de trazas y videos.
+    """
+
+    def __init__(self, nombre: str, slow_mo: float, factor_esperas: float, resaltar: bool, politica_capturas: str,
+                 retencion_trazas: str = "on"):
+        """
+        Args:
+            nombre (str): Nombre del perfil ('demo', 'debug' o 'throughput').
+            slow_mo (float): Retardo en milisegundos que Playwright aplica a cada operación.
+            factor_esperas (float): Multiplicador aplicado a `BasePage.esperar_fijo` y a `BasePage.esperar_estabilidad`
+                                    (salvo la condición 'locator'). `0` elimina las esperas.
+            resaltar (bool): Si las acciones resaltan los elementos con los que interactúan.
+            politica_capturas (str): Política de capturas por defecto ('siempre', 'solo-fallos', 'cada-n' o 'buffer-circular').
+            retencion_trazas (str): Retención de trazas y videos: 'on', 'retain-on-failure' u 'off'.
+        """
+        self.nombre = nombre
+        self.slow_mo = slow_mo
+        self.factor_esperas = factor_esperas
+        self.resaltar = resaltar
+        self.politica_capturas = politica_capturas
+        self.retencion_trazas = retencion_trazas
+
+    def __repr__(self):
+        return (f"PerfilEjecucion(nombre='{self.nombre}', slow_mo={self.slow_mo}, factor_esperas={self.factor_esperas}, "
+                f"resaltar={self.resaltar}, politica_capturas='{self.politica_capturas}', retencion_trazas='{self.retencion_trazas}')")
+
+
+# --- Perfiles disponibles ---
+# demo: comportamiento histórico del framework, pensado para ver la ejecución.
+# debug: sin slow_mo pero conservando esperas, resaltado y todas las capturas para depurar.
+# throughput: cero retardos artificiales; solo se guardan capturas, trazas y videos de fallos (regresiones nocturnas).
+PERFILES: Dict[str, PerfilEjecucion] = {
+    "demo": PerfilEjecucion("demo", slow_mo=500, factor_esperas=1.0, resaltar=True, politica_capturas="siempre",
+                            retencion_trazas="on"),
+    "debug": PerfilEjecucion("debug", slow_mo=0, factor_esperas=1.0, resaltar=True, politica_capturas="siempre",
+                             retencion_trazas="on"),
+    "throughput": PerfilEjecucion("throughput", slow_mo=0, factor_esperas=0.0, resaltar=False, politica_capturas="solo-fallos",
+                                  retencion_trazas="retain-on-failure"),
+}
+
+# Modos de retención de trazas (tracing) y videos del fixture playwright_page:
+# on: se graban y conservan siempre; retain-on-failure: se graban y solo se conservan si el test falla;
+# off: no se graban.
+MODOS_RETENCION_TRAZAS = ("on", "retain-on-failure", "off")
+
+_perfil_activo: Optional[PerfilEjecucion] = None
+
+
+def establecer_perfil_activo(nombre: str) -> PerfilEjecucion:
+    """
+    Selecciona el perfil de ejecución activo para el proceso actual.
+
+    Args:
+        nombre (str): Nombre del perfil a activar.
+
+    Returns:
+        PerfilEjecucion: El perfil activado.
+
+    Raises:
+        ValueError: Si el nombre no corresponde a ningún perfil definido.
+    """
+    global _perfil_activo
+    nombre_normalizado = (nombre or "").strip().lower()
+    if nombre_normalizado not in PERFILES:
+        raise ValueError(f"\nEl perfil de ejecución '{nombre}' no existe. Perfiles disponibles: {list(PERFILES)}")
+    _perfil_activo = PERFILES[nombre_normalizado]
+    return _perfil_activo
+
+
+def obtener_perfil_activo() -> PerfilEjecucion:
+    """
+    Devuelve el perfil activo. Si no se ha establecido ninguno explícitamente,
+    usa el definido por la variable de entorno PERFIL_EJECUCION (por defecto 'demo').
+
+    Returns:
+        PerfilEjecucion: El perfil de ejecución activo.
+    """
+    if _perfil_activo is None:
+        return establecer_perfil_activo(PERFIL_EJECUCION)
+    return _perfil_activo
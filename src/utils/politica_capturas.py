@@ -0,0 +1,142 @@
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from .config import POLITICA_CAPTURAS, CAPTURAS_CADA_N, CAPTURAS_TAMANO_BUFFER
+from .perfiles_ejecucion import obtener_perfil_activo
+from .formato_capturas import OpcionesCaptura, OPCIONES_CAPTURA_FALLO, crear_opciones_captura_pasos
+
+# Políticas de capturas disponibles:
+# siempre: se guardan todas las capturas (comportamiento histórico).
+# solo-fallos: solo se guardan las capturas que documentan un fallo.
+# cada-n: se guarda una de cada N capturas de pasos exitosos, además de todas las de fallo.
+# buffer-circular: las últimas K capturas de pasos exitosos se mantienen en memoria y solo se
+#                  escriben en disco, junto a la captura del fallo, cuando un paso falla.
+POLITICAS_CAPTURAS = ("siempre", "solo-fallos", "cada-n", "buffer-circular")
+
+# Decisiones que devuelve PoliticaCapturas.decidir
+GUARDAR = "guardar"
+OMITIR = "omitir"
+BUFFER = "buffer"
+
+_politica_activa: Optional[str] = None
+
+
+class PoliticaCapturas:
+    """
+    Motor de decisión de capturas de pantalla de un test. Decide, para cada captura
+    solicitada por las acciones, si se guarda en disco, se omite o se retiene en un
+    buffer circular en memoria que solo se persiste cuando falla un paso.
+    """
+
+    def __init__(self, nombre: str, cada_n: int = 5, tamano_buffer: int = 10,
+                 opciones_pasos: Optional[OpcionesCaptura] = None, opciones_fallo: Optional[OpcionesCaptura] = None):
+        """
+        Args:
+            nombre (str): Nombre de la política (ver `POLITICAS_CAPTURAS`).
+            cada_n (int): Para 'cada-n', se guarda una de cada `cada_n` capturas de pasos exitosos. Por defecto, 5.
+            tamano_buffer (int): Para 'buffer-circular', número de capturas retenidas en memoria. Por defecto, 10.
+            opciones_pasos (OpcionesCaptura, opcional): Formato de las capturas de pasos exitosos. Por defecto, PNG del viewport.
+            opciones_fallo (OpcionesCaptura, opcional): Formato de las capturas de fallo. Por defecto, PNG sin pérdida de página completa.
+
+        Raises:
+            ValueError: Si la política no existe o los parámetros numéricos no son positivos.
+        """
+        if nombre not in POLITICAS_CAPTURAS:
+            raise ValueError(f"\nLa política de capturas '{nombre}' no existe. Políticas disponibles: {list(POLITICAS_CAPTURAS)}")
+        if cada_n < 1 or tamano_buffer < 1:
+            raise ValueError(f"\n'cada_n' ({cada_n}) y 'tamano_buffer' ({tamano_buffer}) deben ser mayores que cero.")
+        self.nombre = nombre
+        self.cada_n = cada_n
+        self.tamano_buffer = tamano_buffer
+        self.opciones_pasos = opciones_pasos or OpcionesCaptura()
+        self.opciones_fallo = opciones_fallo or OPCIONES_CAPTURA_FALLO
+        self._contador_exitos = 0
+        self._buffer: Deque[Tuple[str, bytes]] = deque(maxlen=tamano_buffer)
+
+    def decidir(self, es_fallo: bool) -> str:
+        """
+        Decide qué hacer con una captura.
+
+        Args:
+            es_fallo (bool): Si la captura documenta un fallo.
+
+        Returns:
+            str: `GUARDAR`, `OMITIR` o `BUFFER`.
+        """
+        if es_fallo or self.nombre == "siempre":
+            return GUARDAR
+        if self.nombre == "solo-fallos":
+            return OMITIR
+        if self.nombre == "cada-n":
+            self._contador_exitos += 1
+            return GUARDAR if (self._contador_exitos - 1) % self.cada_n == 0 else OMITIR
+        return BUFFER
+
+    def opciones(self, es_fallo: bool) -> OpcionesCaptura:
+        """
+        Devuelve las opciones de formato que corresponden a una captura.
+
+        Args:
+            es_fallo (bool): Si la captura documenta un fallo.
+
+        Returns:
+            OpcionesCaptura: Opciones de fallo (sin pérdida) o de pasos exitosos.
+        """
+        return self.opciones_fallo if es_fallo else self.opciones_pasos
+
+    def agregar_al_buffer(self, ruta: str, datos: bytes) -> None:
+        """
+        Retiene una captura en el buffer circular; si está lleno se descarta la más antigua.
+
+        Args:
+            ruta (str): Ruta en la que se guardaría la captura si llega a persistirse.
+            datos (bytes): Bytes de la captura.
+        """
+        self._buffer.append((ruta, datos))
+
+    def extraer_buffer(self) -> List[Tuple[str, bytes]]:
+        """
+        Devuelve y vacía las capturas retenidas en el buffer, de la más antigua a la más reciente.
+
+        Returns:
+            List[Tuple[str, bytes]]: Pares (ruta, datos) pendientes de persistir.
+        """
+        capturas = list(self._buffer)
+        self._buffer.clear()
+        return capturas
+
+    def __repr__(self):
+        return (f"PoliticaCapturas(nombre='{self.nombre}', cada_n={self.cada_n}, tamano_buffer={self.tamano_buffer}, "
+                f"opciones_pasos={self.opciones_pasos!r})")
+
+
+def establecer_politica_activa(nombre: str) -> None:
+    """
+    Fija la política de capturas del proceso actual, con prioridad sobre la variable de entorno
+    y sobre la del perfil de ejecución (se usa desde la opción --politica-capturas).
+
+    Args:
+        nombre (str): Nombre de la política.
+
+    Raises:
+        ValueError: Si la política no existe.
+    """
+    global _politica_activa
+    if nombre not in POLITICAS_CAPTURAS:
+        raise ValueError(f"\nLa política de capturas '{nombre}' no existe. Políticas disponibles: {list(POLITICAS_CAPTURAS)}")
+    _politica_activa = nombre
+
+
+def crear_politica_capturas() -> PoliticaCapturas:
+    """
+    Crea el motor de política de capturas para un test nuevo. El nombre se resuelve en este orden:
+    opción --politica-capturas, variable de entorno POLITICA_CAPTURAS y política del perfil activo.
+
+    Las opciones de formato de los pasos exitosos se leen de las variables CAPTURAS_PASOS_*.
+
+    Returns:
+        PoliticaCapturas: Una instancia nueva (con contador y buffer vacíos).
+    """
+    nombre = _politica_activa or POLITICA_CAPTURAS or obtener_perfil_activo().politica_capturas
+    return PoliticaCapturas(nombre, cada_n=CAPTURAS_CADA_N, tamano_buffer=CAPTURAS_TAMANO_BUFFER,
+                            opciones_pasos=crear_opciones_captura_pasos())
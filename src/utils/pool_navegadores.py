@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import Dict, Optional
+
+from playwright.sync_api import Browser, Playwright
+
+
+class PoolNavegadores:
+    """
+    Pool de navegadores de Playwright con alcance de sesión.
+
+    Mantiene como máximo un proceso de navegador por motor (chromium, firefox, webkit)
+    dentro de cada worker de pytest-xdist. Cada test recibe un `BrowserContext` nuevo
+    creado sobre el navegador compartido, de modo que el aislamiento entre tests se
+    conserva (cookies, storage, caché) sin pagar el coste de lanzar un navegador por test.
+
+    También lleva la cuenta de lanzamientos y de reutilizaciones (hits) para poder
+    confirmar el ahorro al final de la sesión.
+    """
+
+    MOTORES_SOPORTADOS = ("chromium", "firefox", "webkit")
+
+    def __init__(self, playwright: Playwright, headless: bool = True, slow_mo: float = 500):
+        """
+        Inicializa el pool sin lanzar ningún navegador; los navegadores se crean bajo demanda.
+
+        Args:
+            playwright (Playwright): Instancia de Playwright de la sesión.
+            headless (bool): Si los navegadores se lanzan en modo headless. Por defecto, `True`.
+            slow_mo (float): Retardo en milisegundos aplicado a cada operación de Playwright.
+        """
+        self.playwright = playwright
+        self.headless = headless
+        self.slow_mo = slow_mo
+        # Identificador del worker de xdist ('gw0', 'gw1', ...) o 'master' si no se ejecuta en paralelo.
+        self.worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+        self._navegadores: Dict[str, Browser] = {}
+        self._lock = threading.Lock()
+        self.lanzamientos: Dict[str, int] = {}
+        self.hits: Dict[str, int] = {}
+
+    def obtener_navegador(self, motor: str) -> Browser:
+        """
+        Devuelve el navegador del motor indicado, lanzándolo solo si aún no existe
+        o si el proceso anterior se desconectó.
+
+        Args:
+            motor (str): Nombre del motor ('chromium', 'firefox' o 'webkit').
+
+        Returns:
+            Browser: El navegador compartido para ese motor en este worker.
+
+        Raises:
+            ValueError: Si el motor no es compatible.
+        """
+        if motor not in self.MOTORES_SOPORTADOS:
+            raise ValueError(f"\nEl tipo de navegador '{motor}' no es compatible.")
+
+        with self._lock:
+            navegador: Optional[Browser] = self._navegadores.get(motor)
+            if navegador is not None and navegador.is_connected():
+                self.hits[motor] = self.hits.get(motor, 0) + 1
+                return navegador
+
+            navegador = getattr(self.playwright, motor).launch(headless=self.headless, slow_mo=self.slow_mo)
+            self._navegadores[motor] = navegador
+            self.lanzamientos[motor] = self.lanzamientos.get(motor, 0) + 1
+            return navegador
+
+    def resumen(self) -> str:
+        """
+        Construye un resumen legible con los lanzamientos y reutilizaciones por motor.
+
+        Returns:
+            str: Texto con las estadísticas del pool para este worker.
+        """
+        motores = sorted(set(self.lanzamientos) | set(self.hits))
+        total_lanzamientos = sum(self.lanzamientos.values())
+        total_hits = sum(self.hits.values())
+        detalle = ", ".join(
+            f"{motor}: {self.lanzamientos.get(motor, 0)} lanzamiento(s) / {self.hits.get(motor, 0)} hit(s)"
+            for motor in motores
+        )
+        return (
+            f"[PoolNavegadores {self.worker_id}] Lanzamientos: {total_lanzamientos}, "
+            f"Hits: {total_hits}. {detalle}"
+        )
+
+    def cerrar(self) -> None:
+        """
+        Cierra todos los navegadores del pool. Se invoca una sola vez al final de la sesión.
+        """
+        with self._lock:
+            for motor, navegador in self._navegadores.items():
+                try:
+                    if navegador.is_connected():
+                        navegador.close()
+                except Exception as e:
+                    print(f"\nError al cerrar el navegador '{motor}' del pool: {e}")
+            self._navegadores.clear()
@@ -0,0 +1,144 @@
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from playwright.sync_api import Locator, Page
+
+# Devuelve un selector CSS estable (id, data-testid o name) para el único elemento que coincide
+# con el locator, o null si no coincide exactamente un elemento o no hay un selector único.
+_SCRIPT_SELECTOR_ESTABLE = """
+(elementos) => {
+    if (elementos.length !== 1) return {coincidencias: elementos.length, selector: null};
+    const elemento = elementos[0];
+    const etiqueta = elemento.tagName.toLowerCase();
+    const candidatos = [];
+    if (elemento.id) candidatos.push("#" + CSS.escape(elemento.id));
+    const testId = elemento.getAttribute("data-testid");
+    if (testId) candidatos.push(`[data-testid="${CSS.escape(testId)}"]`);
+    const nombre = elemento.getAttribute("name");
+    if (nombre) candidatos.push(`${etiqueta}[name="${CSS.escape(nombre)}"]`);
+    for (const candidato of candidatos) {
+        const encontrados = document.querySelectorAll(candidato);
+        if (encontrados.length === 1 && encontrados[0] === elemento) return {coincidencias: 1, selector: candidato};
+    }
+    return {coincidencias: 1, selector: null};
+}
+"""
+
+
+class RegistroLocators:
+    """
+    Registro de los locators de una clase de localizadores (HomeLocatorsPage, RegistroLocatorsPage, ...).
+
+    Cada locator se construye una sola vez por instancia de la página, la primera vez que se
+    accede a él (ver `locator_cacheado`), en lugar de crear un `get_by_role(...)` o una cadena
+    `filter(...).nth(...)` nueva en cada acceso. Opcionalmente, `pre_resolver` busca cada locator
+    en la página una vez y, si coincide con un único elemento que tiene un id, data-testid o
+    name únicos, lo sustituye por ese selector CSS estable, más barato de resolver que las
+    consultas por rol o por texto. El registro guarda el coste de construcción y de resolución
+    de cada locator.
+    """
+
+    def __init__(self, page: Page, propietario: Any):
+        """
+        Args:
+            page (Page): Página de Playwright sobre la que se construyen los locators.
+            propietario (Any): Instancia de la clase de localizadores que usa este registro.
+        """
+        self.page = page
+        self.propietario = propietario
+        self._locators: Dict[str, Locator] = {}
+        self._originales: Dict[str, Locator] = {}
+        self.costes: Dict[str, Dict[str, Any]] = {}
+
+    def obtener(self, nombre: str, fabrica: Callable[[], Locator]) -> Locator:
+        """
+        Devuelve el locator `nombre`, construyéndolo con `fabrica` solo la primera vez.
+        """
+        locator = self._locators.get(nombre)
+        if locator is None:
+            inicio = time.perf_counter()
+            locator = fabrica()
+            self._locators[nombre] = locator
+            self.costes.setdefault(nombre, {})["construccion"] = time.perf_counter() - inicio
+        return locator
+
+    def nombres(self) -> List[str]:
+        """Nombres de todos los locators declarados con `locator_cacheado` en la clase propietaria."""
+        return [nombre for clase in reversed(type(self.propietario).__mro__)
+                for nombre, valor in vars(clase).items() if isinstance(valor, locator_cacheado)]
+
+    def pre_resolver(self, nombres: Optional[List[str]] = None,
+                     registrar_metrica: Optional[Callable[..., None]] = None) -> Dict[str, Optional[str]]:
+        """
+        Resuelve cada locator en la página actual (una llamada al navegador por locator) y mide
+        cuánto tarda. Si el locator coincide con un único elemento que tiene un selector CSS
+        estable y único (id, data-testid o name), el registro devuelve a partir de entonces un
+        locator con ese selector. Los locators que no coinciden con exactamente un elemento, o que
+        no tienen un selector estable, se mantienen sin cambios.
+
+        Args:
+            nombres (Optional[List[str]]): Locators a resolver. Por defecto, todos los de la clase.
+            registrar_metrica (Optional[Callable]): Función con la firma de `BasePage.registrar_metrica`
+                                                    para registrar el coste de resolución de cada locator.
+
+        Returns:
+            Dict[str, Optional[str]]: {nombre: selector CSS estable, o `None` si no se sustituyó}.
+        """
+        resultado = {}
+        for nombre in nombres or self.nombres():
+            locator = self._originales[nombre] if nombre in self._originales else getattr(self.propietario, nombre)
+            inicio = time.perf_counter()
+            datos = locator.evaluate_all(_SCRIPT_SELECTOR_ESTABLE)
+            duracion = time.perf_counter() - inicio
+
+            coste = self.costes.setdefault(nombre, {})
+            coste.update(resolucion=duracion, coincidencias=datos["coincidencias"], selector_estable=datos["selector"])
+            if registrar_metrica is not None:
+                registrar_metrica("resolver_locator", duracion, medicion=nombre, locator=locator)
+
+            if datos["selector"]:
+                self._originales.setdefault(nombre, locator)
+                self._locators[nombre] = self.page.locator(datos["selector"])
+            resultado[nombre] = datos["selector"]
+        return resultado
+
+    def restablecer(self, nombres: Optional[List[str]] = None) -> None:
+        """
+        Vuelve a los locators originales (por rol, texto, ...) de los locators pre-resueltos,
+        por ejemplo, tras navegar a una versión de la página en la que los selectores CSS
+        estables podrían no ser válidos.
+        """
+        for nombre in list(nombres or self._originales):
+            original = self._originales.pop(nombre, None)
+            if original is not None:
+                self._locators[nombre] = original
+                self.costes.get(nombre, {}).pop("selector_estable", None)
+
+    def reporte(self) -> List[Dict[str, Any]]:
+        """
+        Devuelve el coste de cada locator (construcción y, si se pre-resolvió, resolución,
+        número de coincidencias y selector estable), ordenado de mayor a menor coste de resolución.
+        """
+        filas = [{"nombre": nombre, **coste} for nombre, coste in self.costes.items()]
+        return sorted(filas, key=lambda fila: fila.get("resolucion") or 0.0, reverse=True)
+
+
+class locator_cacheado:
+    """
+    Decorador para los locators de las clases de localizadores. Se usa como `@property`, pero el
+    locator se construye una sola vez por instancia y se guarda en su `RegistroLocators`
+    (atributo `locators`), que además puede pre-resolverlo a un selector CSS estable.
+    """
+
+    def __init__(self, fabrica: Callable[[Any], Locator]):
+        self.fabrica = fabrica
+        self.nombre = fabrica.__name__
+        self.__doc__ = fabrica.__doc__
+
+    def __set_name__(self, propietario, nombre):
+        self.nombre = nombre
+
+    def __get__(self, instancia, propietario=None):
+        if instancia is None:
+            return self
+        return instancia.locators.obtener(self.nombre, lambda: self.fabrica(instancia))
@@ -0,0 +1,206 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pytest
+
+from .metricas import RegistroMetricas, obtener_registro_metricas
+
+# Modos del control de regresión: 'warn' solo informa, 'fail' marca la sesión como fallida, 'off' no compara.
+MODOS_REGRESION_RENDIMIENTO = ("warn", "fail", "off")
+
+# Percentil que se guarda en la línea base y se compara en cada ejecución.
+PERCENTIL_BASELINE = 95
+
+
+def clave_paso(nombre: str, etiquetas: Dict[str, str]) -> str:
+    """
+    Construye la clave estable de un paso: temporizador, navegador y dispositivo. El locator no
+    forma parte de la clave para que un cambio de selector no invalide la línea base.
+
+    Args:
+        nombre (str): Nombre del temporizador (por ejemplo, 'hacer_clic_en_elemento.total').
+        etiquetas (Dict[str, str]): Etiquetas de la serie.
+
+    Returns:
+        str: Clave con el formato '<nombre>|<navegador>|<dispositivo>'.
+    """
+    return f"{nombre}|{etiquetas.get('navegador', '')}|{etiquetas.get('dispositivo', '')}"
+
+
+def percentiles_por_paso(registro: RegistroMetricas, percentil: float = PERCENTIL_BASELINE) -> Dict[str, Dict]:
+    """
+    Agrupa las series del registro por paso y calcula el percentil indicado de cada uno.
+    Los temporizadores de CPU ('.cpu') se excluyen: la línea base compara latencia de la UI.
+
+    Args:
+        registro (RegistroMetricas): Registro con las muestras de la ejecución.
+        percentil (float): Percentil a calcular. Por defecto, 95.
+
+    Returns:
+        Dict[str, Dict]: Por clave de paso, su nombre, navegador, dispositivo, percentil y conteo.
+    """
+    agrupadas = RegistroMetricas()
+    for serie in registro.series():
+        if serie.nombre.endswith(".cpu"):
+            continue
+        etiquetas = {clave: serie.etiquetas[clave] for clave in ("navegador", "dispositivo") if clave in serie.etiquetas}
+        agrupadas.combinar_muestras([{"nombre": serie.nombre, "etiquetas": etiquetas, "muestras": serie.muestras}])
+
+    pasos = {}
+    for serie in agrupadas.series():
+        pasos[clave_paso(serie.nombre, serie.etiquetas)] = {
+            "nombre": serie.nombre,
+            "navegador": serie.etiquetas.get("navegador", ""),
+            "dispositivo": serie.etiquetas.get("dispositivo", ""),
+            f"p{int(percentil)}": round(serie.percentil(percentil), 6),
+            "conteo": len(serie.muestras),
+        }
+    return pasos
+
+
+def escribir_baseline(ruta: str, pasos: Dict[str, Dict]) -> str:
+    """
+    Escribe la línea base de rendimiento en JSON.
+
+    Args:
+        ruta (str): Ruta del archivo de línea base.
+        pasos (Dict[str, Dict]): Resultado de `percentiles_por_paso`.
+
+    Returns:
+        str: La ruta escrita.
+    """
+    os.makedirs(os.path.dirname(ruta), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"generado": datetime.now().isoformat(timespec="seconds"), "percentil": PERCENTIL_BASELINE,
+                   "pasos": pasos}, archivo, indent=2, ensure_ascii=False)
+    return ruta
+
+
+def cargar_baseline(ruta: str) -> Optional[Dict[str, Dict]]:
+    """
+    Carga los pasos de una línea base de rendimiento.
+
+    Args:
+        ruta (str): Ruta del archivo de línea base.
+
+    Returns:
+        Optional[Dict[str, Dict]]: Pasos de la línea base, o `None` si el archivo no existe.
+    """
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo).get("pasos", {})
+
+
+def comparar_con_baseline(actuales: Dict[str, Dict], baseline: Dict[str, Dict], umbral: float,
+                          umbral_absoluto: float = 0.0) -> List[Dict]:
+    """
+    Compara el p95 de cada paso de la ejecución actual con el de la línea base.
+
+    Args:
+        actuales (Dict[str, Dict]): Pasos de la ejecución actual (`percentiles_por_paso`).
+        baseline (Dict[str, Dict]): Pasos de la línea base.
+        umbral (float): Aumento relativo máximo permitido (0.20 = 20 %).
+        umbral_absoluto (float): Aumento mínimo en segundos para considerar una regresión.
+
+    Returns:
+        List[Dict]: Pasos con regresión (clave, p95 base, p95 actual y aumento relativo), de mayor a menor aumento.
+    """
+    columna = f"p{PERCENTIL_BASELINE}"
+    regresiones = []
+    for clave, actual in actuales.items():
+        base = baseline.get(clave)
+        if not base or base.get(columna, 0) <= 0:
+            continue
+        p95_base, p95_actual = base[columna], actual[columna]
+        if p95_actual > p95_base * (1 + umbral) and (p95_actual - p95_base) >= umbral_absoluto:
+            regresiones.append({"paso": clave, "p95_base": p95_base, "p95_actual": p95_actual,
+                                "aumento": round(p95_actual / p95_base - 1, 4)})
+    return sorted(regresiones, key=lambda r: r["aumento"], reverse=True)
+
+
+class PluginRegresionRendimiento:
+    """
+    Plugin de pytest que convierte la suite funcional en una suite de regresión de latencia.
+
+    Con `--perf-baseline` escribe el p95 de cada paso de la ejecución como nueva línea base.
+    En cualquier otra ejecución compara el p95 actual de cada paso con la línea base e informa
+    (modo 'warn') o marca la sesión como fallida (modo 'fail') si alguno supera el umbral.
+    Con pytest-xdist, cada worker envía sus muestras al controlador, que hace la comparación.
+    """
+
+    def __init__(self, ruta_baseline: str, escribir: bool, modo: str, umbral: float, umbral_absoluto: float):
+        """
+        Args:
+            ruta_baseline (str): Ruta del archivo de línea base.
+            escribir (bool): Si esta ejecución escribe la línea base en lugar de compararse con ella.
+            modo (str): 'warn', 'fail' u 'off'.
+            umbral (float): Aumento relativo del p95 a partir del cual hay regresión.
+            umbral_absoluto (float): Aumento mínimo en segundos para considerar una regresión.
+        """
+        self.ruta_baseline = ruta_baseline
+        self.escribir = escribir
+        self.modo = modo
+        self.umbral = umbral
+        self.umbral_absoluto = umbral_absoluto
+        self.registro_sesion = RegistroMetricas()
+        self.regresiones: List[Dict] = []
+        self.mensaje: Optional[str] = None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        """
+        (Controlador de xdist) Incorpora las muestras enviadas por un worker al terminar.
+        """
+        muestras = getattr(node, "workeroutput", {}).get("muestras_rendimiento")
+        if muestras:
+            self.registro_sesion.combinar_muestras(muestras)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        """
+        En un worker, envía sus muestras al controlador. En el controlador (o sin xdist),
+        escribe la línea base o compara contra ella.
+        """
+        config = session.config
+        if hasattr(config, "workeroutput"):
+            config.workeroutput["muestras_rendimiento"] = obtener_registro_metricas().exportar_muestras()
+            return
+        if not self.registro_sesion.series():
+            # Ejecución sin xdist: las muestras están en el registro de este proceso.
+            self.registro_sesion.combinar_muestras(obtener_registro_metricas().exportar_muestras())
+
+        actuales = percentiles_por_paso(self.registro_sesion)
+        if not actuales:
+            return
+        if self.escribir:
+            escribir_baseline(self.ruta_baseline, actuales)
+            self.mensaje = f"Línea base de rendimiento escrita en {self.ruta_baseline} ({len(actuales)} pasos)."
+            return
+        if self.modo == "off":
+            return
+        baseline = cargar_baseline(self.ruta_baseline)
+        if baseline is None:
+            self.mensaje = f"No existe línea base de rendimiento en {self.ruta_baseline}; ejecuta con --perf-baseline para crearla."
+            return
+        self.regresiones = comparar_con_baseline(actuales, baseline, self.umbral, self.umbral_absoluto)
+        self.mensaje = (f"{len(self.regresiones)} paso(s) con regresión de p{PERCENTIL_BASELINE} > {self.umbral:.0%} "
+                        f"respecto a la línea base ({len(actuales)} pasos comparados).")
+        if self.regresiones and self.modo == "fail" and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """
+        Muestra el resultado de la comparación (o de la escritura de la línea base) al final de la sesión.
+        """
+        if not self.mensaje:
+            return
+        terminalreporter.section("Regresión de rendimiento")
+        terminalreporter.write_line(self.mensaje)
+        for regresion in self.regresiones:
+            terminalreporter.write_line(
+                f"  {regresion['paso']}: p{PERCENTIL_BASELINE} {regresion['p95_base']:.4f}s -> "
+                f"{regresion['p95_actual']:.4f}s (+{regresion['aumento']:.0%})",
+                red=self.modo == "fail", yellow=self.modo == "warn")
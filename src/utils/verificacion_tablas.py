@@ -0,0 +1,266 @@
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .instantanea_tabla import InstantaneaTabla
+
+# Columnas cuyo valor esperado es el estado de un checkbox y no el texto de la celda.
+COLUMNAS_CASILLA = ("Select",)
+
+
+
+def _es_float(valor: Any) -> bool:
+    """`True` si `float()` acepta el valor (incluye 'nan', '1_000' y dígitos no ASCII, que pandas rechaza)."""
+    try:
+        float(valor)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+class ReporteVerificacion:
+    """
+    Discrepancias encontradas por `VerificadorTabla`. Cada discrepancia indica la verificación
+    que falló y sus coordenadas: fila (empezando en 1, como en los logs y nombres de captura)
+    y columna (nombre del encabezado), junto con el valor encontrado y el esperado.
+    """
+
+    def __init__(self):
+        self.discrepancias: List[Dict[str, Any]] = []
+
+    def agregar(self, verificacion: str, fila: Optional[int], columna: Optional[str], valor: Any, esperado: Any) -> None:
+        """
+        Registra una discrepancia.
+
+        Args:
+            verificacion (str): Nombre de la verificación ('numerica', 'regex', 'unica', 'orden', 'fila_esperada', ...).
+            fila (Optional[int]): Fila de la tabla (empezando en 1), o `None` si afecta a toda la tabla.
+            columna (Optional[str]): Nombre de la columna, o `None` si afecta a toda la fila o tabla.
+            valor (Any): Valor encontrado.
+            esperado (Any): Valor o condición esperada.
+        """
+        self.discrepancias.append({"verificacion": verificacion, "fila": fila, "columna": columna,
+                                   "valor": valor, "esperado": esperado})
+
+    @property
+    def ok(self) -> bool:
+        """`True` si no se encontró ninguna discrepancia."""
+        return not self.discrepancias
+
+    def filas_con_fallo(self) -> List[int]:
+        """Filas (empezando en 1) con al menos una discrepancia, ordenadas."""
+        return sorted({d["fila"] for d in self.discrepancias if d["fila"] is not None})
+
+    def de_fila(self, fila: int) -> List[Dict[str, Any]]:
+        """Discrepancias de una fila (empezando en 1)."""
+        return [d for d in self.discrepancias if d["fila"] == fila]
+
+    def a_dataframe(self) -> pd.DataFrame:
+        """Devuelve las discrepancias como DataFrame (una fila por discrepancia)."""
+        return pd.DataFrame(self.discrepancias, columns=["verificacion", "fila", "columna", "valor", "esperado"])
+
+    def texto(self, max_lineas: int = 50) -> str:
+        """
+        Devuelve el reporte como texto legible, una línea por discrepancia.
+
+        Args:
+            max_lineas (int): Número máximo de discrepancias listadas; el resto se resume en una línea.
+        """
+        if self.ok:
+            return "Sin discrepancias."
+        lineas = [f"{len(self.discrepancias)} discrepancia(s):"]
+        for d in self.discrepancias[:max_lineas]:
+            coordenadas = ", ".join(parte for parte in (
+                f"fila {d['fila']}" if d["fila"] is not None else "",
+                f"columna '{d['columna']}'" if d["columna"] is not None else "") if parte) or "tabla"
+            lineas.append(f"  [{d['verificacion']}] {coordenadas}: se encontró {d['valor']!r}, se esperaba {d['esperado']}")
+        if len(self.discrepancias) > max_lineas:
+            lineas.append(f"  ... y {len(self.discrepancias) - max_lineas} más.")
+        return "\n".join(lineas)
+
+    def __len__(self):
+        return len(self.discrepancias)
+
+    def __str__(self):
+        return self.texto()
+
+
+class VerificadorTabla:
+    """
+    Motor de verificación de tablas sobre una `InstantaneaTabla` cargada en DataFrames de pandas.
+
+    Cada verificación es una operación vectorizada sobre una columna completa (o sobre toda la
+    tabla); solo las celdas que fallan se recorren para anotarlas en el reporte. Los métodos
+    devuelven el propio verificador para poder encadenarlos:
+
+        reporte = VerificadorTabla(instantanea).numerica("Price").unica("ID").ordenada("Name").reporte
+    """
+
+    def __init__(self, instantanea: InstantaneaTabla):
+        """
+        Args:
+            instantanea (InstantaneaTabla): Instantánea de la tabla a verificar.
+        """
+        self.instantanea = instantanea
+        self.datos = instantanea.a_dataframe()
+        self.casillas = instantanea.a_dataframe(casillas=True)
+        self.reporte = ReporteVerificacion()
+
+    def _indice(self, columna: Union[str, int]) -> int:
+        """Índice de una columna por nombre o posición (-1 si no existe)."""
+        if isinstance(columna, int):
+            return columna if 0 <= columna < self.instantanea.num_columnas else -1
+        indice = self.instantanea.indice_columna(columna)
+        if indice == -1 and columna in self.datos.columns:
+            # Columnas sin encabezado ('columna_<n>').
+            indice = list(self.datos.columns).index(columna)
+        return indice
+
+    def _columna(self, columna: Union[str, int], verificacion: str, casillas: bool = False) -> Optional[pd.Series]:
+        """
+        Devuelve la columna como Serie o, si no existe, registra la discrepancia y devuelve `None`.
+        """
+        indice = self._indice(columna)
+        if indice == -1:
+            self.reporte.agregar(verificacion, None, str(columna), None, f"columna existente en {self.instantanea.encabezados}")
+            return None
+        origen = self.casillas if casillas else self.datos
+        return origen.iloc[:, indice]
+
+    def _registrar(self, verificacion: str, mascara: pd.Series, serie: pd.Series, esperado: Union[str, pd.Series]) -> None:
+        """
+        Registra en el reporte una discrepancia por cada posición `True` de la máscara.
+        """
+        for posicion in np.flatnonzero(mascara.to_numpy(dtype=bool)):
+            valor_esperado = esperado.iloc[posicion] if isinstance(esperado, pd.Series) else esperado
+            self.reporte.agregar(verificacion, int(posicion) + 1, str(serie.name), serie.iloc[posicion], valor_esperado)
+
+    def numerica(self, columna: Union[str, int], permitir_vacias: bool = False) -> "VerificadorTabla":
+        """
+        Verifica que todas las celdas de la columna sean números válidos, con el mismo criterio
+        que `float()`: 'nan', 'inf', '1_000' o '١٢' son números; '1,5' o una celda vacía no.
+        `pd.to_numeric` resuelve la columna completa y solo las celdas que rechaza se vuelven a
+        comprobar con `float()`, porque acepta un subconjunto estricto de lo que acepta `float()`.
+
+        Args:
+            columna (Union[str, int]): Nombre o índice de la columna.
+            permitir_vacias (bool): Si es `True`, las celdas vacías no se consideran un error.
+        """
+        serie = self._columna(columna, "numerica")
+        if serie is None:
+            return self
+        invalidas = pd.to_numeric(serie, errors="coerce").isna() & serie.notna()
+        if invalidas.any():
+            invalidas[invalidas] = ~serie[invalidas].map(_es_float).astype(bool)
+        invalidas |= serie.isna()
+        if permitir_vacias:
+            invalidas &= serie.fillna("").astype(str).str.len() > 0
+        self._registrar("numerica", invalidas, serie, "un número válido")
+        return self
+
+    def regex(self, columna: Union[str, int], patron: str, flags: int = 0) -> "VerificadorTabla":
+        """
+        Verifica que todas las celdas de la columna coincidan por completo con una expresión regular.
+
+        Args:
+            columna (Union[str, int]): Nombre o índice de la columna.
+            patron (str): Expresión regular que debe coincidir con el texto completo de la celda.
+            flags (int): Flags del módulo `re` (por ejemplo, `re.IGNORECASE`).
+        """
+        serie = self._columna(columna, "regex")
+        if serie is None:
+            return self
+        coincide = serie.fillna("").astype(str).str.fullmatch(patron, flags=flags).fillna(False).astype(bool)
+        self._registrar("regex", ~coincide | serie.isna(), serie, f"coincidencia con /{patron}/")
+        return self
+
+    def unica(self, columnas: Union[str, Sequence[str]]) -> "VerificadorTabla":
+        """
+        Verifica que los valores de una columna (o la combinación de varias) no se repitan.
+        Se reportan todas las filas que participan en un duplicado.
+
+        Args:
+            columnas (Union[str, Sequence[str]]): Columna o lista de columnas que forman la clave.
+        """
+        nombres = [columnas] if isinstance(columnas, (str, int)) else list(columnas)
+        series = [self._columna(nombre, "unica") for nombre in nombres]
+        if any(serie is None for serie in series):
+            return self
+        clave = pd.concat(series, axis=1, ignore_index=True)
+        duplicadas = clave.duplicated(keep=False)
+        etiqueta = " + ".join(str(serie.name) for serie in series)
+        for posicion in np.flatnonzero(duplicadas.to_numpy(dtype=bool)):
+            valor = tuple(clave.iloc[posicion]) if len(series) > 1 else clave.iloc[posicion, 0]
+            self.reporte.agregar("unica", int(posicion) + 1, etiqueta, valor, "un valor único")
+        return self
+
+    def ordenada(self, columna: Union[str, int], ascendente: bool = True, numerica: Optional[bool] = None) -> "VerificadorTabla":
+        """
+        Verifica que la columna esté ordenada. Se reporta cada fila cuyo valor rompe el orden
+        respecto a la fila anterior.
+
+        Args:
+            columna (Union[str, int]): Nombre o índice de la columna.
+            ascendente (bool): Orden esperado. Por defecto, ascendente.
+            numerica (Optional[bool]): Si se compara como número. Por defecto (`None`) se compara
+                                       como número si todas las celdas lo son y como texto si no.
+        """
+        serie = self._columna(columna, "orden")
+        if serie is None:
+            return self
+        numeros = pd.to_numeric(serie, errors="coerce")
+        if numerica is None:
+            numerica = bool(len(serie)) and not numeros.isna().any()
+        valores = numeros if numerica else serie.fillna("").astype(str)
+        anteriores = valores.shift()
+        rompe_orden = (valores < anteriores) if ascendente else (valores > anteriores)
+        rompe_orden = rompe_orden.fillna(False).astype(bool)
+        rompe_orden.iloc[:1] = False
+        comparador = ">=" if ascendente else "<="
+        esperado = anteriores.map(lambda anterior: f"un valor {comparador} {anterior!r} (fila anterior)")
+        self._registrar("orden", rompe_orden, serie, esperado)
+        return self
+
+    def filas_esperadas(self, esperadas: List[Dict[str, Any]], columnas_casilla: Sequence[str] = COLUMNAS_CASILLA) -> "VerificadorTabla":
+        """
+        Compara la tabla con una lista de filas esperadas (diccionarios {columna: valor}).
+        El texto se compara sin espacios alrededor; en las columnas de `columnas_casilla` un
+        valor booleano se compara con el estado del checkbox de la celda y cualquier otro valor
+        solo exige que el checkbox exista.
+
+        Args:
+            esperadas (List[Dict[str, Any]]): Filas esperadas, en el orden de la tabla.
+            columnas_casilla (Sequence[str]): Columnas que contienen checkboxes. Por defecto, ('Select',).
+        """
+        num_filas = self.instantanea.num_filas
+        if len(esperadas) != num_filas:
+            self.reporte.agregar("num_filas", None, None, num_filas, f"{len(esperadas)} filas")
+        n = min(len(esperadas), num_filas)
+
+        # Columnas esperadas en el orden en que aparecen por primera vez.
+        nombres = list(dict.fromkeys(nombre for fila in esperadas for nombre in fila))
+        for nombre in nombres:
+            valores_esperados = pd.Series([fila.get(nombre) for fila in esperadas[:n]], dtype=object)
+            definidos = valores_esperados.notna()
+            if self._indice(nombre) == -1:
+                for posicion in np.flatnonzero(definidos.to_numpy(dtype=bool)):
+                    self.reporte.agregar("columna_inexistente", int(posicion) + 1, nombre, None,
+                                         f"columna existente en {self.instantanea.encabezados}")
+                continue
+
+            actuales = self._columna(nombre, "fila_esperada").iloc[:n].reset_index(drop=True)
+            sin_celda = definidos & actuales.isna()
+            self._registrar("celda_inexistente", sin_celda, actuales, "una celda")
+
+            if nombre in columnas_casilla:
+                estados = self._columna(nombre, "fila_esperada", casillas=True).iloc[:n].reset_index(drop=True)
+                sin_checkbox = definidos & actuales.notna() & estados.isna()
+                self._registrar("checkbox_inexistente", sin_checkbox, estados, "un checkbox")
+                esperados_bool = valores_esperados.map(lambda valor: isinstance(valor, bool)).astype(bool)
+                distintos = definidos & esperados_bool & estados.notna() & (estados != valores_esperados)
+                self._registrar("checkbox", distintos, estados, valores_esperados.map(lambda v: "marcado" if v else "desmarcado"))
+            else:
+                textos_esperados = valores_esperados.map(lambda valor: None if valor is None else str(valor).strip())
+                distintos = definidos & actuales.notna() & (actuales.astype(str) != textos_esperados)
+                self._registrar("fila_esperada", distintos, actuales, textos_esperados.map(repr))
+        return self